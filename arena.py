@@ -0,0 +1,335 @@
+"""AST en forma de arena: arreglos paralelos en lugar de objetos.
+
+Para analizar miles de archivos conviene una forma plana del AST: cada
+nodo es un índice y sus datos están repartidos en arreglos (`array`) del
+mismo largo, uno por atributo:
+
+- `clases`: código de la clase del nodo (posición en CLASES; 0 es una
+  lista, como el cuerpo de un while o los argumentos de una llamada);
+- `primero`: índice del primer nodo de su subárbol;
+- `inicio` y `largo`: la posición en el código (ver nodos.py). Las listas
+  no tienen posición: inicio -1 y largo 0;
+- `desde`: los campos del nodo i son hijos[desde[i]:desde[i + 1]], en el
+  orden de su clase (Nodo.campos) o de la lista.
+
+Cada entrada de `hijos` es el índice de un nodo (>= 0) o, si es negativa,
+-(k + 1) para el valor constantes[k]: nombres, operadores, textos de los
+literales, None... Las constantes están sin repetir.
+
+Los nodos se numeran en orden posterior, el mismo en que el parser los
+reduce: los hijos siempre tienen índices menores que su padre, la raíz es
+el último y el subárbol del nodo i es range(primero[i], i + 1). Un recorrido
+de abajo hacia arriba es un `for i in range(len(arena))`, sin recursión.
+
+Para mandarla a otro proceso, `a_bytes()` la reduce a un bloque de bytes
+(los arreglos tal cual y las constantes en JSON) y `desde_bytes()` la
+reconstruye; pickle también usa esa forma (ver Arena.__reduce__), así que
+no se serializa ningún objeto por nodo. Los bytes están en el orden nativo
+de la máquina.
+
+`desde_nodos` y `a_nodos` convierten desde y hacia los nodos que arma el
+parser, y `desde_tuplas` y `a_tuplas` desde y hacia su forma de tuplas
+(nodos.como_tupla), para que el código que trabaja sobre esas formas la
+siga usando tal cual.
+"""
+import json
+import re
+import struct
+import sys
+import zlib
+from array import array
+from operator import attrgetter
+
+import nodos
+
+# Clases en el orden de sus códigos. FIRMA depende de las clases y de sus
+# campos: si cambian, desde_bytes() rechaza los bytes de la versión anterior.
+CLASES = (
+    list,
+    nodos.Entero, nodos.Flotante, nodos.Cadena, nodos.Simbolo, nodos.Booleano, nodos.Nulo,
+    nodos.Numero, nodos.Regexp, nodos.Variable,
+    nodos.OperacionBinaria, nodos.Comparacion, nodos.Logica, nodos.Rango,
+    nodos.MenosUnario, nodos.Negacion,
+    nodos.Arreglo, nodos.Hash, nodos.Par, nodos.Indice, nodos.LlamadaFuncion, nodos.LlamadaMetodo,
+    nodos.Programa, nodos.Imprimir, nodos.Asignacion, nodos.Entrada, nodos.AsignacionIndice,
+    nodos.Mientras, nodos.Para, nodos.Si, nodos.SinoSi, nodos.Break, nodos.Next, nodos.Retorno,
+    nodos.Parametro, nodos.Funcion, nodos.Clase, nodos.ErrorSemantico, nodos.Llaves,
+)
+CODIGOS = {clase: codigo for codigo, clase in enumerate(CLASES)}
+LISTA = CODIGOS[list]
+
+FIRMA = b'AST1' + struct.pack('<I', zlib.crc32(repr([(c.__name__, getattr(c, 'campos', ())) for c in CLASES]).encode()))
+_CABECERA = struct.Struct('<8sQQQ')
+
+# Tipos de los arreglos: índices de 32 bits, posiciones de 64
+_TIPOS = {'clases': 'B', 'primero': 'i', 'desde': 'i', 'inicio': 'q', 'largo': 'q', 'hijos': 'i'}
+
+
+class Arena:
+    __slots__ = tuple(_TIPOS) + ('constantes',)
+
+    def __init__(self):
+        for nombre, tipo in _TIPOS.items():
+            setattr(self, nombre, array(tipo))
+        self.desde.append(0)
+        self.constantes = []
+
+    def __len__(self):
+        return len(self.clases)
+
+    @property
+    def raiz(self):
+        return len(self.clases) - 1
+
+    def clase(self, i):
+        return CLASES[self.clases[i]]
+
+    def subarbol(self, i):
+        """Índices del subárbol del nodo i (él incluido, al final)."""
+        return range(self.primero[i], i + 1)
+
+    def hijos_de(self, i):
+        """Índices de los nodos hijos de i, en orden (las listas son nodos)."""
+        return [h for h in self.hijos[self.desde[i]:self.desde[i + 1]] if h >= 0]
+
+    def campo(self, i, nombre):
+        """Entrada de `hijos` del campo `nombre` del nodo i: un índice de nodo
+        (>= 0) o una constante codificada (ver valor)."""
+        return self.hijos[self.desde[i] + CLASES[self.clases[i]].campos.index(nombre)]
+
+    def valor(self, entrada):
+        """Constante de una entrada negativa de `hijos`."""
+        return self.constantes[-entrada - 1]
+
+    def indices(self, *clases):
+        """Índices de los nodos de esas clases (o de sus subclases), en orden."""
+        codigos = bytes(codigo for codigo, clase in enumerate(CLASES) if issubclass(clase, clases))
+        return [i for i, codigo in enumerate(self.clases) if codigo in codigos]
+
+    def tamano(self):
+        """Bytes de los arreglos y de la lista de constantes (sin contar los
+        valores, como nodos.tamano)."""
+        return sum(sys.getsizeof(getattr(self, nombre)) for nombre in _TIPOS) + sys.getsizeof(self.constantes)
+
+    def a_bytes(self):
+        constantes = json.dumps(self.constantes, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        partes = [_CABECERA.pack(FIRMA, len(self.clases), len(self.hijos), len(constantes))]
+        partes.extend(getattr(self, nombre).tobytes() for nombre in _TIPOS)
+        partes.append(constantes)
+        return b''.join(partes)
+
+    def __reduce__(self):
+        return desde_bytes, (self.a_bytes(),)
+
+
+def desde_bytes(datos):
+    """Arena a partir del resultado de Arena.a_bytes()."""
+    datos = memoryview(datos)
+    firma, cantidad, cantidad_hijos, largo_constantes = _CABECERA.unpack_from(datos)
+    if firma != FIRMA:
+        raise ValueError('los bytes no son de una arena de esta versión de nodos.py')
+    arena = Arena()
+    posicion = _CABECERA.size
+    for nombre, tipo in _TIPOS.items():
+        arreglo = array(tipo)
+        elementos = {'desde': cantidad + 1, 'hijos': cantidad_hijos}.get(nombre, cantidad)
+        fin = posicion + elementos * arreglo.itemsize
+        arreglo.frombytes(datos[posicion:fin])
+        setattr(arena, nombre, arreglo)
+        posicion = fin
+    arena.constantes = json.loads(bytes(datos[posicion:posicion + largo_constantes]).decode('utf-8'))
+    return arena
+
+
+# --------------------------------------------------
+# Nodos
+# --------------------------------------------------
+def _lector(clase):
+    """Función que devuelve la tupla de campos de un nodo de `clase`."""
+    if clase is list:
+        return tuple
+    if not clase.campos:
+        return lambda nodo: ()
+    if len(clase.campos) == 1:
+        return lambda nodo, leer=attrgetter(clase.campos[0]): (leer(nodo),)
+    return attrgetter(*clase.campos)
+
+
+_LECTORES = {clase: _lector(clase) for clase in CLASES}
+
+
+def desde_nodos(raiz):
+    """Arena de un AST de nodos (o de una lista de nodos). Sin AST (None, un
+    error de sintaxis) la arena queda vacía y a_nodos devuelve None."""
+    arena = Arena()
+    if raiz is None:
+        return arena
+    clases, primero, desde = arena.clases, arena.primero, arena.desde
+    inicio, largo, hijos = arena.inicio, arena.largo, arena.hijos
+    constantes = arena.constantes
+    indices_constantes = {}
+    # pendientes: (valor, componentes, primer índice del subárbol o -1 si
+    # todavía no se apilaron sus hijos, cantidad de hijos nodo o lista);
+    # resultados: índices de los nodos ya cerrados cuyo padre aún no se cerró
+    pendientes = [(raiz, _LECTORES[type(raiz)](raiz), -1, 0)]
+    resultados = []
+    while pendientes:
+        valor, componentes, abierto, cantidad = pendientes.pop()
+        if abierto < 0:
+            abiertos = len(pendientes)
+            pendientes.append(None)
+            for componente in reversed(componentes):
+                tipo = type(componente)
+                if tipo in CODIGOS:
+                    pendientes.append((componente, _LECTORES[tipo](componente), -1, 0))
+            pendientes[abiertos] = (valor, componentes, len(clases), len(pendientes) - abiertos - 1)
+            continue
+        cerrados = iter(resultados[len(resultados) - cantidad:])
+        if cantidad:
+            del resultados[-cantidad:]
+        for componente in componentes:
+            if type(componente) in CODIGOS:
+                hijos.append(next(cerrados))
+                continue
+            clave = (type(componente), componente)
+            entrada = indices_constantes.get(clave)
+            if entrada is None:
+                constantes.append(componente)
+                entrada = indices_constantes[clave] = -len(constantes)
+            hijos.append(entrada)
+        resultados.append(len(clases))
+        tipo = type(valor)
+        clases.append(CODIGOS[tipo])
+        primero.append(abierto)
+        if tipo is list:
+            inicio.append(-1)
+            largo.append(0)
+        else:
+            inicio.append(valor.inicio)
+            largo.append(valor.largo)
+        desde.append(len(hijos))
+    return arena
+
+
+def a_nodos(arena):
+    """AST de nodos de una arena (la raíz: un nodo o una lista)."""
+    objetos = []
+    constantes, hijos, desde = arena.constantes, arena.hijos, arena.desde
+    for i, codigo in enumerate(arena.clases):
+        campos = [objetos[h] if h >= 0 else constantes[-h - 1] for h in hijos[desde[i]:desde[i + 1]]]
+        if codigo == LISTA:
+            objetos.append(campos)
+        else:
+            objetos.append(CLASES[codigo](*campos, arena.inicio[i], arena.largo[i]))
+    return objetos[-1] if objetos else None
+
+
+# --------------------------------------------------
+# Tuplas
+# --------------------------------------------------
+_LITERALES = frozenset(codigo for codigo, clase in enumerate(CLASES) if issubclass(clase, nodos.Literal))
+_PARAMETRO = CODIGOS[nodos.Parametro]
+
+
+def a_tuplas(arena, posiciones=False):
+    """La forma de tuplas de nodos.como_tupla, armada directamente desde la arena."""
+    formas = []
+    constantes, hijos, desde = arena.constantes, arena.hijos, arena.desde
+    for i, codigo in enumerate(arena.clases):
+        campos = [formas[h] if h >= 0 else constantes[-h - 1] for h in hijos[desde[i]:desde[i + 1]]]
+        if codigo == LISTA:
+            formas.append(campos)
+            continue
+        if codigo in _LITERALES:
+            formas.append((campos[0], arena.inicio[i], arena.largo[i]) if posiciones else campos[0])
+            continue
+        forma = tuple(campos) if codigo == _PARAMETRO else (CLASES[codigo].etiqueta, *campos)
+        formas.append(forma + (arena.inicio[i], arena.largo[i]) if posiciones else forma)
+    return formas[-1] if formas else None
+
+
+# Campos que en la forma de tuplas no son valores sueltos: expresiones (una
+# tupla, o el valor de un literal), listas de expresiones, la lista de
+# parámetros de un def y la clave de un par (una expresión o el texto de
+# un SYMBOL o de un nombre).
+_EXPRESION, _LISTA, _PARAMETROS, _CLAVE = range(4)
+_CAMPOS = {
+    nodos._Binaria: {'izquierda': _EXPRESION, 'derecha': _EXPRESION},
+    nodos._Unaria: {'valor': _EXPRESION},
+    nodos.Arreglo: {'elementos': _LISTA},
+    nodos.Hash: {'pares': _LISTA},
+    nodos.Par: {'clave': _CLAVE, 'valor': _EXPRESION},
+    nodos.Indice: {'objeto': _EXPRESION, 'indice': _EXPRESION},
+    nodos.LlamadaFuncion: {'argumentos': _LISTA},
+    nodos.LlamadaMetodo: {'objeto': _EXPRESION, 'argumentos': _LISTA},
+    nodos.Programa: {'sentencias': _LISTA},
+    nodos.Imprimir: {'valor': _EXPRESION},
+    nodos.Asignacion: {'variable': _EXPRESION, 'valor': _EXPRESION},
+    nodos.Entrada: {'variable': _EXPRESION},
+    nodos.AsignacionIndice: {'destino': _EXPRESION, 'valor': _EXPRESION},
+    nodos.Mientras: {'condicion': _EXPRESION, 'cuerpo': _LISTA},
+    nodos.Para: {'iterable': _EXPRESION, 'cuerpo': _LISTA},
+    nodos.Si: {'condicion': _EXPRESION, 'cuerpo': _LISTA, 'ramas_elsif': _LISTA, 'rama_else': _LISTA},
+    nodos.SinoSi: {'condicion': _EXPRESION, 'cuerpo': _LISTA},
+    nodos.Retorno: {'valor': _EXPRESION},
+    nodos.Parametro: {'defecto': _EXPRESION},
+    nodos.Funcion: {'parametros': _PARAMETROS, 'cuerpo': _LISTA},
+    nodos.Clase: {'cuerpo': _LISTA},
+    nodos.Llaves: {'sentencias': _LISTA},
+}
+_TIPOS_CAMPOS = {
+    clase: tuple(next((_CAMPOS[base] for base in clase.__mro__ if base in _CAMPOS), {}).get(campo)
+                 for campo in clase.campos)
+    for clase in CLASES[1:]
+}
+_POR_ETIQUETA = {clase.etiqueta: clase for clase in CLASES[1:] if clase.etiqueta}
+_FLOTANTE = re.compile(r'\d+\.\d+(?:[eE][+-]?\d+)?$')
+
+
+def _clase_literal(valor):
+    """Clase del literal con ese valor de token (en las tuplas no se guarda)."""
+    if isinstance(valor, int):
+        return nodos.Entero
+    if valor in ('true', 'false'):
+        return nodos.Booleano
+    if valor == 'nil':
+        return nodos.Nulo
+    if valor.startswith(':'):
+        return nodos.Simbolo
+    if _FLOTANTE.match(valor):
+        return nodos.Flotante
+    return nodos.Cadena
+
+
+def _nodo_desde_tupla(forma, tipo, posiciones):
+    if tipo is None or forma is None:
+        return forma
+    if tipo == _LISTA:
+        return [_nodo_desde_tupla(elemento, _EXPRESION, posiciones) for elemento in forma]
+    if tipo == _PARAMETROS:
+        return [_armar(nodos.Parametro, parametro, posiciones) for parametro in forma]
+    if not isinstance(forma, tuple):
+        if tipo == _CLAVE:
+            return forma
+        return _clase_literal(forma)(forma, -1, 0)
+    if posiciones and len(forma) == 3:
+        return _clase_literal(forma[0])(*forma)
+    return _armar(_POR_ETIQUETA[forma[0]], forma[1:], posiciones)
+
+
+def _armar(clase, forma, posiciones):
+    tramo = forma[-2:] if posiciones else (-1, 0)
+    campos = [_nodo_desde_tupla(valor, tipo, posiciones) for valor, tipo in zip(forma, _TIPOS_CAMPOS[clase])]
+    return clase(*campos, *tramo)
+
+
+def desde_tuplas(forma, posiciones=False):
+    """Arena de un AST en forma de tuplas (la de nodos.como_tupla, con las
+    mismas `posiciones`). Las tuplas no guardan la clase de los literales:
+    sale del valor del token (ver _clase_literal), así que el cuerpo de un
+    heredoc que parece otro literal cambia de clase, y sin posiciones una
+    clave literal de un par queda como valor suelto. Sin posiciones, inicio
+    es -1 y largo 0 en todos los nodos."""
+    if isinstance(forma, list):
+        return desde_nodos(_nodo_desde_tupla(forma, _LISTA, posiciones))
+    return desde_nodos(_nodo_desde_tupla(forma, _EXPRESION, posiciones))
@@ -0,0 +1,488 @@
+"""Benchmarks del analizador, por fase.
+
+Mide por separado el análisis léxico, el sintáctico y el semántico, y el pico
+de memoria, sobre los ejemplos de algoritmos/*.rb y sobre programas
+sintéticos (de 1 KB a 100 MB) armados con construcciones que la gramática
+acepta. El resultado es un JSON; con --comparar se contrasta con uno guardado
+antes y se marcan las regresiones (el código de salida es 1 si hay alguna).
+
+    python benchmark.py                                  # ejemplos + 1K..1M
+    python benchmark.py --tamanos 1K,10M,100M --salida base.json
+    python benchmark.py --comparar base.json
+    python benchmark.py --solo-arranque                  # sólo import y primer uso
+    python benchmark.py --escalamiento 1K,10K,100K,1M    # listas de N elementos
+
+También se mide el arranque en frío, en intérpretes nuevos: lo que tarda
+`import main` y lo que tarda después el primer análisis en construir el lexer
+y el parser (con las tablas ya en caché). Pasar PRESUPUESTO_ARRANQUE cuenta
+como regresión aunque no haya JSON base.
+
+Con --escalamiento se mide el parseo de listas de N elementos (N sentencias
+seguidas y un literal de arreglo de N elementos) y se comprueba que el tiempo
+por elemento no crezca con N: construir las listas copiándolas en cada
+reducción lo vuelve cuadrático. Un crecimiento mayor que CRECIMIENTO_MAXIMO
+entre la N más chica y la más grande cuenta como regresión.
+
+Cada fase se mide por separado, tiempo y pico de memoria: tokenizar,
+parsear (las acciones del parser sólo arman el AST) y la pasada semántica
+sobre el AST (SesionAnalisis.verificar). Además se informa el tamaño del
+AST que queda (nodos.tamano) junto al de su forma de tuplas
+(nodos.como_tupla), sin y con posiciones, y al de la arena (arena.py) con
+lo que ocupa en bytes.
+"""
+import argparse
+import contextlib
+import gc
+import glob
+import json
+import os
+import platform
+import signal
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import arena
+import main
+import nodos
+
+# Unidades del programa sintético; cada una usa sólo sus propias variables
+PLANTILLAS = (
+    'a{i} = {i} + 7 * 3 - 4 / 2 % 5 ** 2\nb{i} = a{i} * 2.5\n',
+    's{i} = "hola {i}"\nt{i} = s{i} + " mundo"\nn{i} = "12".to_i\n',
+    'l{i} = [1, 2, [3, {i}]]\nl{i}[0] = l{i}[1]\nh{i} = {{ :a => 1, "b" => 2, c: {i} }}\n',
+    'w{i} = 3\nwhile w{i} > 0 do\n  w{i} -= 1\nend\n',
+    'for k{i} in 1..3\n  puts k{i}\nend\n',
+    'x{i} = {i}\nif x{i} > 1\n  puts "mayor"\nend\n',
+    'def f{i}(x, y = 2)\n  return x + y\nend\nr{i} = f{i}(1, 2)\n',
+    'm{i} = [1, 2].length\nputs m{i}.to_s + "a"\n',
+    '# comentario {i}\nLIMITE_{i} = {i}\n',
+)
+
+TAMANOS_POR_DEFECTO = '1K,10K,100K,1M'
+UNIDADES = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+# Desde este tamaño los tokens se guardan en una TablaTokens (un LexToken
+# por token no entra en memoria para un programa de 100 MB)
+UMBRAL_COMPACTO = main.UMBRAL_FLUJO
+
+# Cada caso se repite hasta `repeticiones` veces o hasta acumular este
+# tiempo, y se informa el mínimo de cada fase
+PRESUPUESTO_SEGUNDOS = 1.0
+
+# Una métrica es regresión si empeora más que la tolerancia y además más que
+# estos mínimos absolutos (por debajo es ruido de medición)
+TOLERANCIA = 0.10
+MINIMO_SEGUNDOS = 0.005
+MINIMO_BYTES = 64 * 1024
+
+# Segundos máximos del arranque en frío: `import main` y el primer uso
+# (construir lexer, parser y sesión desde las tablas en caché)
+PRESUPUESTO_ARRANQUE = {'importacion': 0.10, 'primer_uso': 0.05}
+
+# Listas para --escalamiento: una sentencia por elemento, o un único arreglo
+LISTAS = {
+    'sentencias': lambda n: 'x = 1\n' * n,
+    'arreglo': lambda n: 'x = [' + '1, ' * (n - 1) + '1]\n',
+}
+TAMANOS_ESCALAMIENTO = '1K,10K,100K,1M'
+# Cuánto puede crecer el tiempo por elemento de la N menor a la mayor (con
+# crecimiento lineal se queda cerca de 1; con uno cuadrático se multiplica por N)
+CRECIMIENTO_MAXIMO = 3.0
+
+# Se corre en un intérprete nuevo para que ningún módulo esté ya importado
+_SCRIPT_ARRANQUE = '''
+import json, time
+inicio = time.perf_counter()
+import main
+importado = time.perf_counter()
+main.obtener_sesion_global()
+listo = time.perf_counter()
+print(json.dumps({'importacion': importado - inicio, 'primer_uso': listo - importado}))
+'''
+
+
+class TiempoExcedido(Exception):
+    pass
+
+
+def leer_tamano(texto):
+    """Bytes de un tamaño como '512', '10K' o '100M'."""
+    texto = texto.strip().upper()
+    if texto[-1:] in UNIDADES:
+        return int(float(texto[:-1]) * UNIDADES[texto[-1]])
+    return int(texto)
+
+
+def generar_programa(tamano):
+    """Programa Ruby de al menos `tamano` bytes (y menos de una unidad más)."""
+    partes = []
+    total = 0
+    i = 0
+    while total < tamano:
+        unidad = PLANTILLAS[i % len(PLANTILLAS)].format(i=i)
+        partes.append(unidad)
+        total += len(unidad)  # las plantillas son ASCII
+        i += 1
+    return ''.join(partes)
+
+
+@contextlib.contextmanager
+def limite_tiempo(segundos):
+    """Corta el bloque con TiempoExcedido pasados `segundos` (sólo donde hay
+    SIGALRM; en otros sistemas no se limita)."""
+    if not segundos or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+
+    def cortar(signum, frame):
+        raise TiempoExcedido()
+    anterior = signal.signal(signal.SIGALRM, cortar)
+    signal.setitimer(signal.ITIMER_REAL, segundos)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, anterior)
+
+
+def _sesion(motor, compacto):
+    # sin límite de errores léxicos: se mide el análisis completo
+    return main.SesionAnalisis(motor_lexico=motor, compacto=compacto, max_errores_lexicos=None)
+
+
+def medir_tiempos(codigo, motor='ply', compacto=False):
+    """Segundos de cada fase en una pasada, y cantidad de tokens."""
+    sesion = _sesion(motor, compacto)
+    reloj = time.perf_counter
+    gc.collect()
+    inicio = reloj()
+    buffer_tokens = sesion.tokenizar(codigo)
+    fin_lexico = reloj()
+    ast = sesion.parsear(buffer_tokens)
+    fin_parseo = reloj()
+    sesion.verificar(ast, buffer_tokens.indice)
+    fin_semantico = reloj()
+    tiempos = {
+        'lexico': fin_lexico - inicio,
+        'sintactico': fin_parseo - fin_lexico,
+        'semantico': fin_semantico - fin_parseo,
+    }
+    tiempos['total'] = fin_semantico - inicio
+    return tiempos, len(buffer_tokens)
+
+
+def medir_memoria(codigo, motor='ply', compacto=False):
+    """Pico de memoria (bytes, según tracemalloc) del léxico, del parseo y de
+    la pasada semántica. Cada pico incluye lo que dejó la fase anterior (los
+    tokens mientras se parsea, el AST durante la pasada semántica)."""
+    sesion = _sesion(motor, compacto)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        buffer_tokens = sesion.tokenizar(codigo)
+        pico_lexico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        ast = sesion.parsear(buffer_tokens)
+        pico_parseo = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        sesion.verificar(ast, buffer_tokens.indice)
+        pico_semantico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'lexico': pico_lexico, 'parseo': pico_parseo, 'semantico': pico_semantico}
+
+
+def medir_memoria_ast(codigo, motor='ply', compacto=False):
+    """Bytes de la estructura del AST (nodos.tamano) en la forma de nodos,
+    en la de tuplas que usaba el parser antes (nodos.como_tupla, sin
+    posiciones), en la de tuplas con las mismas posiciones que los nodos y
+    en la de arena, más el largo de la arena serializada (Arena.a_bytes)."""
+    ast = _sesion(motor, compacto).analizar(codigo)
+    plano = arena.desde_nodos(ast)
+    return {
+        'nodos': nodos.tamano(ast),
+        'tuplas': nodos.tamano(nodos.como_tupla(ast)),
+        'tuplas_con_posiciones': nodos.tamano(nodos.como_tupla(ast, posiciones=True), posiciones=True),
+        'arena': plano.tamano(),
+        'arena_bytes': len(plano.a_bytes()),
+    }
+
+
+def medir_caso(codigo, repeticiones=3, motor='ply', memoria=True, tiempo_maximo=None):
+    """Mediciones de un programa: tiempos mínimos por fase y pico de memoria."""
+    compacto = len(codigo) >= UMBRAL_COMPACTO
+    caso = {'bytes': len(codigo.encode('utf-8')), 'compacto': compacto}
+    # los mensajes de error del análisis no interesan aquí
+    with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+        try:
+            with limite_tiempo(tiempo_maximo):
+                mejores = None
+                acumulado = 0.0
+                for _ in range(max(repeticiones, 1)):
+                    tiempos, cantidad = medir_tiempos(codigo, motor, compacto)
+                    if mejores is None:
+                        mejores = tiempos
+                    else:
+                        mejores = {fase: min(mejores[fase], tiempos[fase]) for fase in mejores}
+                    acumulado += tiempos['total']
+                    if acumulado >= PRESUPUESTO_SEGUNDOS:
+                        break
+                caso['tokens'] = cantidad
+                caso['tiempos'] = mejores
+            if memoria:
+                with limite_tiempo(tiempo_maximo):
+                    caso['memoria_pico'] = medir_memoria(codigo, motor, compacto)
+                with limite_tiempo(tiempo_maximo):
+                    caso['memoria_ast'] = medir_memoria_ast(codigo, motor, compacto)
+            caso['estado'] = 'ok'
+        except TiempoExcedido:
+            caso['estado'] = 'excedido'
+        except RecursionError:
+            caso['estado'] = 'recursion'
+    return caso
+
+
+def casos_de_ejemplo():
+    for ruta in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'algoritmos', '*.rb'))):
+        with open(ruta, encoding='utf-8') as f:
+            yield os.path.splitext(os.path.basename(ruta))[0], f.read()
+
+
+def casos_sinteticos(tamanos):
+    for etiqueta in tamanos:
+        yield f'sintetico-{etiqueta}', generar_programa(leer_tamano(etiqueta))
+
+
+def medir_arranque(repeticiones=5):
+    """Mínimo de `repeticiones` arranques en frío, cada uno en un intérprete
+    nuevo: segundos de `import main` y del primer uso. Antes se construyen las
+    tablas (main.precompilar_tablas), para no medir su generación."""
+    main.precompilar_tablas()
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    mediciones = []
+    for _ in range(max(1, repeticiones)):
+        salida = subprocess.run([sys.executable, '-c', _SCRIPT_ARRANQUE], cwd=directorio,
+                                capture_output=True, text=True, check=True).stdout
+        mediciones.append(json.loads(salida.splitlines()[-1]))
+    tiempos = {fase: min(m[fase] for m in mediciones) for fase in PRESUPUESTO_ARRANQUE}
+    return {
+        'tiempos': tiempos,
+        'presupuesto': dict(PRESUPUESTO_ARRANQUE),
+        'excedido': [fase for fase, limite in PRESUPUESTO_ARRANQUE.items() if tiempos[fase] > limite],
+    }
+
+
+def leer_cantidad(texto):
+    """Cantidad de elementos como '500', '10K' o '1M' (en potencias de 10)."""
+    texto = texto.strip().upper()
+    multiplicadores = {'K': 10 ** 3, 'M': 10 ** 6}
+    if texto[-1:] in multiplicadores:
+        return int(float(texto[:-1]) * multiplicadores[texto[-1]])
+    return int(texto)
+
+
+def medir_escalamiento(cantidades, repeticiones=3, motor='ply', tiempo_maximo=None):
+    """Segundos de análisis (léxico + parseo) de cada lista de LISTAS con
+    cada cantidad de elementos, y el crecimiento del tiempo por elemento."""
+    resultado = {}
+    for nombre, generar in LISTAS.items():
+        filas = []
+        por_elemento = None
+        for n in cantidades:
+            codigo = generar(n)
+            fila = {'elementos': n}
+            # el límite crece con N: lo que tardaría escalando linealmente
+            # desde la primera medición, con el margen de CRECIMIENTO_MAXIMO
+            limite = tiempo_maximo
+            if tiempo_maximo and por_elemento is not None:
+                limite = max(tiempo_maximo, por_elemento * n * CRECIMIENTO_MAXIMO)
+            with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+                try:
+                    with limite_tiempo(limite):
+                        mejor = None
+                        for _ in range(max(repeticiones, 1)):
+                            segundos = medir_tiempos(codigo, motor)[0]['total']
+                            mejor = segundos if mejor is None else min(mejor, segundos)
+                            if segundos >= PRESUPUESTO_SEGUNDOS:
+                                break
+                    fila['segundos'] = mejor
+                    fila['por_elemento'] = mejor / n
+                    fila['estado'] = 'ok'
+                    if por_elemento is None:
+                        por_elemento = fila['por_elemento']
+                except TiempoExcedido:
+                    fila['estado'] = 'excedido'
+                except RecursionError:
+                    fila['estado'] = 'recursion'
+            del codigo
+            filas.append(fila)
+            print(_resumen_escalamiento(nombre, fila), file=sys.stderr)
+        medidas = [fila for fila in filas if fila['estado'] == 'ok']
+        crecimiento = None
+        if len(medidas) >= 2:
+            crecimiento = medidas[-1]['por_elemento'] / medidas[0]['por_elemento']
+        resultado[nombre] = {
+            'filas': filas,
+            'crecimiento': crecimiento,
+            'lineal': len(medidas) == len(filas) and (crecimiento is None or crecimiento <= CRECIMIENTO_MAXIMO),
+        }
+    return resultado
+
+
+def _resumen_escalamiento(nombre, fila):
+    if fila['estado'] != 'ok':
+        return f"{nombre:<22} {fila['elementos']:>9} elementos  {fila['estado']}"
+    return (f"{nombre:<22} {fila['elementos']:>9} elementos  {fila['segundos']:.4f}s  "
+            f"{fila['por_elemento'] * 1e6:.2f} µs/elemento")
+
+
+def ejecutar(tamanos, ejemplos=True, repeticiones=3, motor='ply', memoria=True, tiempo_maximo=None,
+             arranque=True, escalamiento=()):
+    """Corre todos los casos y devuelve el resultado listo para json.dump."""
+    resultado = {
+        'entorno': {
+            'python': platform.python_version(),
+            'implementacion': platform.python_implementation(),
+            'plataforma': platform.platform(),
+            'motor_lexico': motor,
+        },
+        'casos': {},
+    }
+    if arranque:
+        resultado['arranque'] = medir_arranque(max(repeticiones, 5))
+        t = resultado['arranque']['tiempos']
+        print(f"{'arranque':<22} import main {t['importacion']:.4f}s  primer uso {t['primer_uso']:.4f}s",
+              file=sys.stderr)
+    fuentes = []
+    if ejemplos:
+        fuentes.append(casos_de_ejemplo())
+    fuentes.append(casos_sinteticos(tamanos))
+    for fuente in fuentes:
+        for nombre, codigo in fuente:
+            caso = medir_caso(codigo, repeticiones, motor, memoria, tiempo_maximo)
+            resultado['casos'][nombre] = caso
+            print(_resumen(nombre, caso), file=sys.stderr)
+    if escalamiento:
+        resultado['escalamiento'] = medir_escalamiento(escalamiento, repeticiones, motor, tiempo_maximo)
+    return resultado
+
+
+def comparar(actual, base, tolerancia=TOLERANCIA):
+    """Regresiones de `actual` respecto de `base` (dos resultados de ejecutar)."""
+    regresiones = []
+    arranque, previo = actual.get('arranque'), base.get('arranque')
+    if arranque and previo:
+        for fase, valor in arranque['tiempos'].items():
+            anterior = previo['tiempos'].get(fase)
+            if anterior and valor > anterior * (1 + tolerancia) and valor - anterior > MINIMO_SEGUNDOS:
+                regresiones.append({'caso': 'arranque', 'metrica': f'tiempos.{fase}', 'base': anterior,
+                                    'actual': valor, 'cambio': valor / anterior - 1})
+    for nombre, caso in actual['casos'].items():
+        previo = base['casos'].get(nombre)
+        if previo is None or previo.get('estado') != 'ok':
+            continue
+        if caso.get('estado') != 'ok':
+            regresiones.append({'caso': nombre, 'metrica': 'estado',
+                                'base': previo['estado'], 'actual': caso.get('estado')})
+            continue
+        for grupo, minimo in (('tiempos', MINIMO_SEGUNDOS), ('memoria_pico', MINIMO_BYTES),
+                              ('memoria_ast', MINIMO_BYTES)):
+            for fase, valor in caso.get(grupo, {}).items():
+                anterior = previo.get(grupo, {}).get(fase)
+                if anterior is None:
+                    continue
+                if valor > anterior * (1 + tolerancia) and valor - anterior > minimo:
+                    regresiones.append({'caso': nombre, 'metrica': f'{grupo}.{fase}', 'base': anterior,
+                                        'actual': valor, 'cambio': valor / anterior - 1 if anterior else None})
+    return regresiones
+
+
+def _resumen(nombre, caso):
+    if caso['estado'] != 'ok':
+        return f"{nombre:<22} {caso['bytes']:>11} B  {caso['estado']}"
+    t = caso['tiempos']
+    linea = (f"{nombre:<22} {caso['bytes']:>11} B  {caso['tokens']:>9} tokens  "
+             f"léxico {t['lexico']:.4f}s  sintáctico {t['sintactico']:.4f}s  semántico {t['semantico']:.4f}s")
+    memoria = caso.get('memoria_pico')
+    if memoria:
+        linea += (f"  memoria {memoria['lexico'] / 2**20:.1f}/{memoria['parseo'] / 2**20:.1f}/"
+                  f"{memoria.get('semantico', 0) / 2**20:.1f} MiB")
+    ast = caso.get('memoria_ast')
+    if ast:
+        linea += (f"  AST {ast['nodos'] / 2**20:.2f} MiB (tuplas {ast['tuplas'] / 2**20:.2f}, "
+                  f"con posiciones {ast['tuplas_con_posiciones'] / 2**20:.2f}, arena {ast['arena'] / 2**20:.2f})")
+    return linea
+
+
+def _argumentos(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks del analizador por fase (léxico, sintáctico, semántico).')
+    parser.add_argument('--tamanos', default=TAMANOS_POR_DEFECTO,
+                        help='tamaños de los programas sintéticos, separados por comas (p. ej. 1K,10M,100M)')
+    parser.add_argument('--sin-ejemplos', action='store_true', help='no medir algoritmos/*.rb')
+    parser.add_argument('--repeticiones', type=int, default=3, help='repeticiones por caso (se informa el mínimo)')
+    parser.add_argument('--motor', choices=('ply', 'escaner'), default='ply', help='lexer a usar')
+    parser.add_argument('--sin-memoria', action='store_true', help='no medir el pico de memoria (tracemalloc es lento)')
+    parser.add_argument('--tiempo-maximo', type=float, default=10.0,
+                        help='segundos por caso antes de darlo por excedido (0 = sin límite)')
+    parser.add_argument('--sin-arranque', action='store_true', help='no medir el arranque en frío')
+    parser.add_argument('--solo-arranque', action='store_true', help='medir sólo el arranque en frío')
+    parser.add_argument('--escalamiento', metavar='CANTIDADES', nargs='?', const=TAMANOS_ESCALAMIENTO,
+                        help='medir el parseo de listas de N elementos (p. ej. 1K,10K,100K,1M) y '
+                             'comprobar que escala linealmente')
+    parser.add_argument('--salida', help='archivo donde guardar el JSON (por defecto, la salida estándar)')
+    parser.add_argument('--comparar', metavar='BASE', help='JSON guardado antes contra el cual buscar regresiones')
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help='empeoramiento relativo permitido antes de marcar una regresión')
+    return parser.parse_args(argv)
+
+
+def principal(argv=None):
+    args = _argumentos(argv)
+    tamanos = [] if args.solo_arranque else [t for t in args.tamanos.split(',') if t.strip()]
+    ejemplos = not (args.sin_ejemplos or args.solo_arranque)
+    escalamiento = [leer_cantidad(t) for t in (args.escalamiento or '').split(',') if t.strip()]
+    resultado = ejecutar(tamanos, ejemplos, args.repeticiones, args.motor,
+                         not args.sin_memoria, args.tiempo_maximo, not args.sin_arranque, escalamiento)
+
+    regresiones = []
+    for fase in resultado.get('arranque', {}).get('excedido', ()):
+        regresiones.append({'caso': 'arranque', 'metrica': f'presupuesto.{fase}',
+                            'base': PRESUPUESTO_ARRANQUE[fase],
+                            'actual': resultado['arranque']['tiempos'][fase], 'cambio': None})
+    for nombre, lista in resultado.get('escalamiento', {}).items():
+        fallidas = [fila for fila in lista['filas'] if fila['estado'] != 'ok']
+        if fallidas:
+            regresiones.append({'caso': f"escalamiento-{nombre}-{fallidas[0]['elementos']}", 'metrica': 'estado',
+                                'base': 'ok', 'actual': fallidas[0]['estado']})
+        elif not lista['lineal']:
+            regresiones.append({'caso': f'escalamiento-{nombre}', 'metrica': 'crecimiento',
+                                'base': CRECIMIENTO_MAXIMO, 'actual': lista['crecimiento'], 'cambio': None})
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            base = json.load(f)
+        regresiones += comparar(resultado, base, args.tolerancia)
+        if not regresiones:
+            print('Sin regresiones respecto de', args.comparar, file=sys.stderr)
+    if args.comparar or regresiones:
+        resultado['regresiones'] = regresiones
+    for r in regresiones:
+        if r['metrica'] == 'estado':
+            print(f"REGRESIÓN {r['caso']}: {r['base']} -> {r['actual']}", file=sys.stderr)
+        else:
+            cambio = f" (+{r['cambio']:.0%})" if r['cambio'] is not None else ''
+            print(f"REGRESIÓN {r['caso']} {r['metrica']}: {r['base']:.6g} -> {r['actual']:.6g}{cambio}",
+                  file=sys.stderr)
+
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            f.write(texto + '\n')
+    else:
+        print(texto)
+    return 1 if regresiones else 0
+
+
+if __name__ == '__main__':
+    sys.exit(principal())
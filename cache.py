@@ -0,0 +1,391 @@
+"""Caché de resultados de análisis por contenido.
+
+El resultado de analizar un código depende sólo del texto, de la
+configuración de la sesión (etapa, motor léxico, máximos de errores) y de
+la versión del analizador. La clave de una entrada es un sha256 de esas
+tres cosas, y la versión (`version()`) es a su vez un sha256 del código
+fuente de los módulos que deciden el resultado (lexico.py con sus reglas,
+main.py con la gramática, semantica.py...) más las versiones de PLY y de
+Python: al cambiar cualquier regla cambian todas las claves, sin tener que
+invalidar nada a mano.
+
+Cada entrada guarda un Resultado: el AST, las cuatro listas de
+diagnósticos, la tabla de símbolos, si la entrada fue rechazada y la
+cantidad de tokens por tipo. Se serializa con pickle, con el AST como
+arena (arena.py: arreglos planos, sin un objeto por nodo); la tabla de
+símbolos sólo tiene tipos y valores resumidos (constantes.py).
+
+Hay dos niveles:
+
+  - en memoria, un LRU de los bytes serializados, limitado en bytes y en
+    cantidad de entradas. Se guardan bytes y no objetos para que cada
+    acierto devuelva un AST nuevo: quien lo recibe puede modificarlo (el
+    modo incremental desplaza nodos en el lugar) sin tocar la caché;
+  - en disco, un archivo comprimido por entrada en
+    <directorio>/analizador-ruby/<versión>/<clave>, que sobrevive entre
+    ejecuciones y se comparte entre procesos (cada archivo se escribe aparte
+    y se renombra, así nadie lee uno a medias). Un archivo ilegible cuenta
+    como fallo y se borra. Al pasar de `max_bytes_disco` se borran los
+    menos usados y las carpetas de otras versiones.
+
+Todo lo que la caché escribe o borra queda dentro de la subcarpeta
+analizador-ruby, y ahí sólo toca carpetas con nombre de versión y archivos
+con nombre de clave (sha256 en hexadecimal): el directorio puede ser uno
+compartido, como ~/.cache, sin que se pierda nada ajeno.
+
+Las entradas se leen con pickle, que puede ejecutar código: quien pudiera
+escribir en la caché podría hacer correr lo que quisiera al analizador.
+Por eso la subcarpeta tiene que ser privada del usuario (se crea con
+permisos 0700; si es de otro usuario o la pueden escribir otros, la caché
+queda sólo en memoria) y cada entrada lleva un HMAC-SHA256 con una clave
+aleatoria guardada ahí mismo, en un archivo 0600: una entrada cuyo HMAC
+no coincide se descarta sin deserializarla.
+
+El directorio por defecto es la variable de entorno ANALIZADOR_CACHE o
+.cache junto a este módulo.
+"""
+import collections
+import hashlib
+import hmac
+import os
+import pickle
+import re
+import sys
+import tempfile
+import zlib
+
+import ply
+
+import arena
+
+DIRECTORIO_PAQUETE = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO = os.environ.get('ANALIZADOR_CACHE') or os.path.join(DIRECTORIO_PAQUETE, '.cache')
+# Subcarpeta de `directorio` con lo que es de la caché
+SUBCARPETA = 'analizador-ruby'
+# Nombres de las carpetas de versión y de los archivos de entrada (sha256)
+_ES_HASH = re.compile(r'[0-9a-f]{64}\Z')
+_PREFIJO_TEMPORAL = '.tmp-'
+# Archivo de la clave HMAC de las entradas, dentro de SUBCARPETA
+ARCHIVO_CLAVE = 'clave'
+_LARGO_CLAVE = 32
+
+# Módulos cuyo código decide el resultado de un análisis (también los del
+# modo por flujo y del incremental, que arman los tokens y el AST en esos caminos)
+MODULOS = ('lexico', 'escaner', 'flujo', 'incremental', 'main', 'recuperacion', 'reparseo', 'nodos', 'semantica',
+           'constantes', 'simbolos', 'grafo', 'reglas', 'arena', 'cache')
+
+MAX_BYTES_MEMORIA = 64 * 1024 * 1024
+MAX_ENTRADAS_MEMORIA = 512
+MAX_BYTES_DISCO = 512 * 1024 * 1024
+# Cada cuántas escrituras en disco se revisa su tamaño
+PODAR_CADA = 64
+
+_FIRMA = b'RCA2'
+_LARGO_HMAC = hashlib.sha256().digest_size
+
+_version = None
+
+
+def version():
+    """Versión del analizador: sha256 del código de MODULOS y de las
+    versiones de PLY y de Python (se calcula una vez por proceso)."""
+    global _version
+    if _version is None:
+        h = hashlib.sha256()
+        h.update(f'{ply.__version__} {sys.version_info[0]}.{sys.version_info[1]}'.encode())
+        for modulo in MODULOS:
+            with open(os.path.join(DIRECTORIO_PAQUETE, modulo + '.py'), 'rb') as f:
+                h.update(f.read())
+        _version = h.hexdigest()
+    return _version
+
+
+def clave(codigo, *configuracion):
+    """Clave de la entrada de `codigo` analizado con `configuracion` (una
+    tupla de valores con repr estable: etapa, motor, máximos...)."""
+    h = hashlib.sha256(version().encode())
+    h.update(repr(configuracion).encode())
+    h.update(b'\0')
+    h.update(codigo.encode('utf-8', 'surrogatepass'))
+    return h.hexdigest()
+
+
+class Resultado:
+    """Lo que deja un análisis: `ast` (None si no se armó), los mensajes
+    `lexicos`, `sintacticos`, `semanticos` y `advertencias`, la `tabla` de
+    símbolos, `rechazado`, y `tokens` y `conteo` (tokens por tipo, en orden
+    de primera aparición)."""
+    __slots__ = ('ast', 'lexicos', 'sintacticos', 'semanticos', 'advertencias', 'tabla', 'rechazado',
+                 'tokens', 'conteo')
+
+    def __init__(self, ast, lexicos, sintacticos, semanticos, advertencias, tabla, rechazado, tokens, conteo):
+        self.ast = ast
+        self.lexicos = lexicos
+        self.sintacticos = sintacticos
+        self.semanticos = semanticos
+        self.advertencias = advertencias
+        self.tabla = tabla
+        self.rechazado = rechazado
+        self.tokens = tokens
+        self.conteo = conteo
+
+
+def a_bytes(resultado):
+    """Bytes de un Resultado (ver desde_bytes)."""
+    datos = (arena.desde_nodos(resultado.ast), resultado.lexicos, resultado.sintacticos, resultado.semanticos,
+             resultado.advertencias, resultado.tabla, resultado.rechazado, resultado.tokens, resultado.conteo)
+    return pickle.dumps(datos, pickle.HIGHEST_PROTOCOL)
+
+
+def desde_bytes(datos):
+    forma, lexicos, sintacticos, semanticos, advertencias, tabla, rechazado, tokens, conteo = pickle.loads(datos)
+    return Resultado(arena.a_nodos(forma), lexicos, sintacticos, semanticos, advertencias, tabla, rechazado,
+                     tokens, conteo)
+
+
+class CacheResultados:
+    """Caché de Resultado por clave (ver el módulo). Con `directorio=None`
+    queda sólo en memoria. `aciertos_memoria`, `aciertos_disco` y `fallos`
+    cuentan las búsquedas."""
+
+    def __init__(self, directorio=DIRECTORIO, max_bytes_memoria=MAX_BYTES_MEMORIA,
+                 max_entradas_memoria=MAX_ENTRADAS_MEMORIA, max_bytes_disco=MAX_BYTES_DISCO):
+        self.directorio = directorio
+        self.max_bytes_memoria = max_bytes_memoria
+        self.max_entradas_memoria = max_entradas_memoria
+        self.max_bytes_disco = max_bytes_disco
+        self.memoria = collections.OrderedDict()
+        self.bytes_memoria = 0
+        self.escrituras = 0
+        self.aciertos_memoria = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        # clave HMAC de las entradas en disco: None sin cargar, False si no se puede usar el disco
+        self._clave_hmac = None
+
+    @property
+    def raiz(self):
+        """Subcarpeta propia de la caché dentro de `directorio`."""
+        return os.path.join(self.directorio, SUBCARPETA)
+
+    @property
+    def carpeta(self):
+        """Carpeta de las entradas de esta versión."""
+        return os.path.join(self.raiz, version())
+
+    def buscar(self, clave):
+        """Resultado guardado con `clave`, o None."""
+        datos = self.memoria.get(clave)
+        if datos is not None:
+            self.memoria.move_to_end(clave)
+            self.aciertos_memoria += 1
+            return desde_bytes(datos)
+        if self.directorio is not None:
+            resultado = self._leer(clave)
+            if resultado is not None:
+                self.aciertos_disco += 1
+                return resultado
+        self.fallos += 1
+        return None
+
+    def guardar(self, clave, resultado):
+        """Guarda `resultado` con `clave`."""
+        datos = a_bytes(resultado)
+        self._a_memoria(clave, datos)
+        if self.directorio is not None:
+            self._escribir(clave, datos)
+
+    def vaciar(self):
+        """Descarta todas las entradas, en memoria y en disco."""
+        self.memoria.clear()
+        self.bytes_memoria = 0
+        if self.directorio is not None:
+            for nombre in _versiones(self.raiz):
+                self._borrar_carpeta(os.path.join(self.raiz, nombre))
+
+    # ---------- memoria ----------
+    def _a_memoria(self, clave, datos):
+        if len(datos) > self.max_bytes_memoria:
+            return
+        anterior = self.memoria.pop(clave, None)
+        if anterior is not None:
+            self.bytes_memoria -= len(anterior)
+        self.memoria[clave] = datos
+        self.bytes_memoria += len(datos)
+        while self.bytes_memoria > self.max_bytes_memoria or len(self.memoria) > self.max_entradas_memoria:
+            _, viejo = self.memoria.popitem(last=False)
+            self.bytes_memoria -= len(viejo)
+
+    # ---------- disco ----------
+    def _clave(self):
+        """Clave HMAC de la subcarpeta, o None si no es privada (ver el módulo)."""
+        if self._clave_hmac is None:
+            self._clave_hmac = _cargar_clave(self.raiz) or False
+        return self._clave_hmac or None
+
+    def _leer(self, clave):
+        clave_hmac = self._clave()
+        if clave_hmac is None:
+            return None
+        ruta = os.path.join(self.carpeta, clave)
+        try:
+            with open(ruta, 'rb') as f:
+                contenido = f.read()
+        except OSError:
+            return None
+        try:
+            if contenido[:len(_FIRMA)] != _FIRMA:
+                raise ValueError('firma desconocida')
+            inicio = len(_FIRMA) + _LARGO_HMAC
+            comprimido = contenido[inicio:]
+            if not hmac.compare_digest(contenido[len(_FIRMA):inicio], _hmac(clave_hmac, clave, comprimido)):
+                raise ValueError('HMAC inválido')
+            datos = zlib.decompress(comprimido)
+            resultado = desde_bytes(datos)
+        except Exception:  # cualquier archivo ilegible es un fallo, no un error
+            _borrar(ruta)
+            return None
+        try:
+            os.utime(ruta)  # la fecha de modificación hace de último uso
+        except OSError:
+            pass
+        self._a_memoria(clave, datos)
+        return resultado
+
+    def _escribir(self, clave, datos):
+        clave_hmac = self._clave()
+        if clave_hmac is None:
+            return
+        carpeta = self.carpeta
+        try:
+            os.makedirs(carpeta, mode=0o700, exist_ok=True)
+            descriptor, temporal = tempfile.mkstemp(dir=carpeta, prefix=_PREFIJO_TEMPORAL)
+            try:
+                comprimido = zlib.compress(datos, 1)
+                with os.fdopen(descriptor, 'wb') as f:
+                    f.write(_FIRMA)
+                    f.write(_hmac(clave_hmac, clave, comprimido))
+                    f.write(comprimido)
+                os.replace(temporal, os.path.join(carpeta, clave))
+            except BaseException:
+                _borrar(temporal)
+                raise
+        except OSError:
+            return  # directorio de sólo lectura o disco lleno: queda en memoria
+        self.escrituras += 1
+        if self.escrituras % PODAR_CADA == 1:
+            self.podar()
+
+    def podar(self):
+        """Borra las carpetas de otras versiones y, si las entradas de esta
+        pasan de `max_bytes_disco`, las usadas hace más tiempo."""
+        if self.directorio is None:
+            return
+        actual = version()
+        for nombre in _versiones(self.raiz):
+            if nombre != actual:
+                self._borrar_carpeta(os.path.join(self.raiz, nombre))
+        entradas = []
+        total = 0
+        try:
+            with os.scandir(self.carpeta) as archivos:
+                for archivo in archivos:
+                    if not _es_de_la_cache(archivo.name):
+                        continue
+                    try:
+                        datos = archivo.stat()
+                    except OSError:
+                        continue
+                    entradas.append((datos.st_mtime, datos.st_size, archivo.path))
+                    total += datos.st_size
+        except OSError:
+            return
+        if total <= self.max_bytes_disco:
+            return
+        entradas.sort()
+        for _, tamano, ruta in entradas:
+            if total <= self.max_bytes_disco:
+                break
+            _borrar(ruta)
+            total -= tamano
+
+    def _borrar_carpeta(self, carpeta):
+        try:
+            archivos = os.listdir(carpeta)
+        except OSError:
+            return
+        for nombre in archivos:
+            if _es_de_la_cache(nombre):
+                _borrar(os.path.join(carpeta, nombre))
+        try:
+            os.rmdir(carpeta)
+        except OSError:
+            pass
+
+
+def _hmac(clave_hmac, clave, comprimido):
+    # la clave de la entrada entra en el HMAC: no se puede copiar una entrada válida bajo otro nombre
+    return hmac.new(clave_hmac, clave.encode() + b'\0' + comprimido, hashlib.sha256).digest()
+
+
+def _privada(ruta):
+    """True si `ruta` es del usuario y nadie más puede leerla ni escribirla;
+    si es del usuario pero tiene permisos de más, se los quita. Sin dueños
+    POSIX (Windows) se confía en los permisos del sistema."""
+    if not hasattr(os, 'getuid'):
+        return True
+    datos = os.stat(ruta)
+    if datos.st_uid != os.getuid():
+        return False
+    if datos.st_mode & 0o077:
+        os.chmod(ruta, datos.st_mode & 0o700)
+    return True
+
+
+def _cargar_clave(raiz):
+    """Clave HMAC guardada en `raiz` (la crea, y crea `raiz`, si falta), o
+    None si `raiz` o la clave no son privadas o no se pueden escribir."""
+    ruta = os.path.join(raiz, ARCHIVO_CLAVE)
+    try:
+        os.makedirs(raiz, mode=0o700, exist_ok=True)
+        if not _privada(raiz):
+            return None
+        if not os.path.exists(ruta):
+            # se escribe aparte y se enlaza: otro proceso nunca ve una clave a medias
+            descriptor, temporal = tempfile.mkstemp(dir=raiz, prefix=_PREFIJO_TEMPORAL)
+            try:
+                with os.fdopen(descriptor, 'wb') as f:
+                    f.write(os.urandom(_LARGO_CLAVE))
+                os.link(temporal, ruta)
+            except FileExistsError:
+                pass  # la creó otro proceso al mismo tiempo
+            finally:
+                _borrar(temporal)
+        if not _privada(ruta):
+            return None
+        with open(ruta, 'rb') as f:
+            clave = f.read()
+    except OSError:
+        return None
+    return clave if len(clave) == _LARGO_CLAVE else None
+
+
+def _versiones(raiz):
+    """Carpetas de versión que hay en `raiz` (sólo las de nombre sha256)."""
+    try:
+        nombres = os.listdir(raiz)
+    except OSError:
+        return []
+    return [n for n in nombres if _ES_HASH.match(n) and os.path.isdir(os.path.join(raiz, n))]
+
+
+def _es_de_la_cache(nombre):
+    """True para los archivos que escribe la caché: entradas y temporales."""
+    return bool(_ES_HASH.match(nombre)) or nombre.startswith(_PREFIJO_TEMPORAL)
+
+
+def _borrar(ruta):
+    try:
+        os.remove(ruta)
+    except OSError:
+        pass
@@ -0,0 +1,83 @@
+"""Propagación de constantes sobre la tabla de símbolos.
+
+Cada entrada de la tabla guarda, en lugar del subárbol de la expresión
+asignada, un resumen de su valor en un retículo de tres niveles:
+
+    INDEFINIDO   la variable no tenía valor (`x = x` sin asignación previa)
+    Constante    un literal conocido, con su texto (sin comillas)
+    VARIABLE     cualquier otra cosa: una operación, una llamada, gets...
+
+El resumen se calcula al registrar la asignación (valor_de) con la tabla
+de ese momento, así que `y = x` copia el valor que x tiene ahí: es lo que
+hace Ruby, y una consulta posterior nunca recorre cadenas de alias. Por
+lo mismo no puede haber ciclos: en `x = x` o en `a = b` seguido de
+`b = a` cada lado toma el valor ya resuelto del otro, y la tabla no
+retiene nodos del AST.
+
+Los valores son objetos chicos e inmutables (comparables con == y que
+pickle guarda por nombre en el caso de INDEFINIDO y VARIABLE), de modo que
+la tabla se puede comparar entre análisis (ver reparseo.py) y guardar en
+la caché de resultados (cache.py).
+"""
+import nodos
+
+
+class _Extremo:
+    """INDEFINIDO y VARIABLE: los extremos del retículo."""
+    __slots__ = ('nombre',)
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+
+    def __repr__(self):
+        return self.nombre
+
+    def __reduce__(self):
+        return self.nombre
+
+
+INDEFINIDO = _Extremo('INDEFINIDO')
+VARIABLE = _Extremo('VARIABLE')
+
+
+class Constante:
+    """Valor conocido: `texto` es el literal sin comillas."""
+    __slots__ = ('texto',)
+
+    def __init__(self, texto):
+        self.texto = texto
+
+    def __eq__(self, otro):
+        return type(otro) is Constante and otro.texto == self.texto
+
+    def __hash__(self):
+        return hash(self.texto)
+
+    def __repr__(self):
+        return f'Constante({self.texto!r})'
+
+
+def sin_comillas(valor):
+    if (valor.startswith('"') and valor.endswith('"')) or \
+            (valor.startswith("'") and valor.endswith("'")):
+        return valor[1:-1]
+    return valor
+
+
+def valor_de(nodo, tabla):
+    """Valor de la expresión `nodo` con la tabla de símbolos `tabla` (una
+    simbolos.TablaSimbolos, en el ámbito donde está la expresión)."""
+    clase = type(nodo)
+    if clase is nodos.Variable:
+        entrada = tabla.buscar(nodo.nombre)
+        return entrada['valor'] if entrada is not None else INDEFINIDO
+    if isinstance(nodo, (nodos.Literal, nodos.Regexp)):
+        # "..." / '...' sin comillas, símbolos, flotantes con su texto...
+        valor = nodo.valor
+        return Constante(sin_comillas(valor) if isinstance(valor, str) else str(valor))
+    return VARIABLE
+
+
+def texto(valor):
+    """Texto de un valor constante, o None si no lo es."""
+    return valor.texto if type(valor) is Constante else None
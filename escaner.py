@@ -0,0 +1,374 @@
+"""Escáner léxico escrito a mano, alternativo al lexer de PLY.
+
+PLY une las reglas de lexico.py en una sola regex maestra que se prueba en
+cada posición, y llama a una función de Python por cada token aunque sea un
+operador trivial. Aquí se decide por el primer carácter:
+
+- operadores: trie de operadores con coincidencia más larga;
+- identificadores y palabras reservadas: un único camino (una regex para la
+  palabra y una consulta a `reserved`);
+- números: sólo si tras los dígitos sigue un carácter que puede formar
+  RATIONAL, COMPLEX o FLOAT se prueban esas reglas, en el orden de PLY;
+- literales (strings, símbolos, regexp, interpolación): se usan las mismas
+  regex de las reglas de lexico.py.
+
+El resultado es exactamente el mismo flujo de tokens que produce PLY con las
+reglas de lexico.py, incluidas sus particularidades: las reglas se prueban en
+orden de definición (la primera que coincide gana, no la más larga), por eso
+`<<` gana siempre a t_HEREDOC, `/` intenta primero REGEXP y un `=begin` sólo
+se cierra con un `=end` que no venga después de una línea en blanco. Los
+errores pasan por lexico.t_error igual que con PLY.
+
+El objeto EscanerRuby tiene la interfaz del lexer de PLY que usan el parser,
+BufferTokens, el modo incremental y el lexer en flujo (input, token, lexpos,
+lexdata, begin, clone, skip...).
+"""
+import copy
+import re
+
+from ply.lex import LexError, LexToken
+
+import lexico
+
+
+def _regex_de(regla):
+    # PLY compila las reglas con re.VERBOSE
+    return re.compile(regla.__doc__, re.VERBOSE)
+
+
+_STR = _regex_de(lexico.t_STR)
+_SYMBOL = _regex_de(lexico.t_SYMBOL)
+_REGEXP = _regex_de(lexico.t_REGEXP)
+_CONSTANT = _regex_de(lexico.t_CONSTANT)
+_CLASS_VAR = _regex_de(lexico.t_CLASS_VAR)
+_INSTANCE_VAR = _regex_de(lexico.t_INSTANCE_VAR)
+_GLOBAL_VAR = _regex_de(lexico.t_GLOBAL_VAR)
+# en el orden en que PLY las prueba; INTEGER (la última) siempre coincide
+_NUMEROS = (
+    ('RATIONAL', _regex_de(lexico.t_RATIONAL)),
+    ('COMPLEX', _regex_de(lexico.t_COMPLEX)),
+    ('FLOAT', _regex_de(lexico.t_FLOAT)),
+    ('INTEGER', _regex_de(lexico.t_INTEGER)),
+)
+
+_ESPACIOS = re.compile(r'[ \t\n]+')
+_PALABRA = re.compile(r'[A-Za-z_]\w*')
+_LOCAL_VAR = _regex_de(lexico.t_LOCAL_VAR)
+_BEGIN = re.compile(r'=begin[^\n]*\n')
+# cierre de =begin (t_MLC_end). Las rachas de saltos de línea se consumen
+# enteras (t_MLC_ignore_newline), así que sólo cierra un \n=end que empiece
+# una racha, o el que está justo donde se reanuda el escaneo.
+_CIERRE = _regex_de(lexico.t_MLC_end)
+_END = re.compile(r'(?<!\n)' + lexico.t_MLC_end.__doc__)
+
+_MINUSCULAS = frozenset('abcdefghijklmnopqrstuvwxyz')
+_MAYUSCULAS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_SEGUNDA_CONSTANTE = _MINUSCULAS | _MAYUSCULAS | {'_'}
+_RESERVADAS = lexico.reserved
+# dígitos no seguidos de un carácter que pueda formar RATIONAL, COMPLEX o
+# FLOAT: es un INTEGER sin probar esas reglas
+_ENTERO = re.compile(r'\d+(?![/r.+\-i\d])')
+
+# Entre estos operadores la coincidencia más larga da el mismo resultado que el
+# orden de las reglas en PLY (=== antes que ==, <=> antes que <=, **= antes que **).
+OPERADORES = {
+    '===': 'EQQ', '==': 'EQ', '!=': 'NE', '<=>': 'CMP', '=~': 'MATCH', '!~': 'NMATCH',
+    '<=': 'LE', '>=': 'GE', '...': 'RANGE_EXCL', '..': 'RANGE_INCL', '&&': 'ANDAND',
+    '||': 'OROR', '=>': 'ARROW', '+=': 'PLUSEQLS', '-=': 'MINUSEQLS', '*=': 'MULTEQLS',
+    '**=': 'POWEREQLS', '/=': 'DIVEQLS', '%=': 'MODEQLS', '>>': 'B_RIGHT_SHIFT',
+    '<<': 'B_LEFT_SHIFT', '**': 'POWER',
+    '<': 'LT', '>': 'GT', '!': 'BANG', '.': 'DOT', '(': 'LPAREN', ')': 'RPAREN',
+    '[': 'LBRACKET', ']': 'RBRACKET', '{': 'LBRACE', '}': 'RBRACE', ',': 'COMMA',
+    ':': 'COLON', ';': 'SEMICOLON', '+': 'PLUS', '-': 'MINUS', '*': 'MULT', '/': 'DIV',
+    '%': 'MOD', '=': 'EQLS', '&': 'B_AND', '|': 'B_OR', '^': 'B_XOR', '~': 'B_ONES',
+    '?': 'QUESTION',
+}
+
+
+def _construir_trie(operadores):
+    """Trie {carácter: [tipo o None, hijos]} de los operadores."""
+    raiz = {}
+    for texto, tipo in operadores.items():
+        hijos = raiz
+        for i, c in enumerate(texto):
+            nodo = hijos.setdefault(c, [None, {}])
+            if i == len(texto) - 1:
+                nodo[0] = tipo
+            hijos = nodo[1]
+    return raiz
+
+
+TRIE_OPERADORES = _construir_trie(OPERADORES)
+
+# operadores de un carácter que ninguna otra regla puede empezar
+_SIMPLES = {c: OPERADORES[c] for c in '()[]{},;^~?'}
+
+# Clase de cada carácter inicial
+(_ESPACIO, _MINUSCULA, _MAYUSCULA, _GUION_BAJO, _DIGITO, _SIMPLE, _OPERADOR, _NUMERAL, _COMILLA,
+ _ARROBA, _DOLAR) = range(11)
+_CLASES = {c: _ESPACIO for c in ' \t\n'}
+_CLASES.update(dict.fromkeys(_MINUSCULAS, _MINUSCULA))
+_CLASES.update(dict.fromkeys(_MAYUSCULAS, _MAYUSCULA))
+_CLASES.update(dict.fromkeys('0123456789', _DIGITO))
+_CLASES.update(dict.fromkeys(TRIE_OPERADORES, _OPERADOR))
+_CLASES.update(dict.fromkeys(_SIMPLES, _SIMPLE))
+_CLASES.update({'_': _GUION_BAJO, '#': _NUMERAL, '"': _COMILLA, "'": _COMILLA, '@': _ARROBA, '$': _DOLAR})
+
+
+class EscanerRuby:
+    """Lexer de Ruby con la misma interfaz y los mismos tokens que lexico.lexer."""
+
+    def __init__(self, errores_lexicos=None):
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.lexstate = 'INITIAL'
+        self.lexstatestack = []
+        self.lexerrorf = lexico.t_error
+        self.errores_lexicos = errores_lexicos if errores_lexicos is not None else lexico.errores_lexicos
+
+    def clone(self):
+        c = copy.copy(self)
+        c.lexstatestack = list(self.lexstatestack)
+        return c
+
+    def input(self, s):
+        self.lexdata = s
+        self.lexpos = 0
+        self.lexlen = len(s)
+
+    def begin(self, state):
+        if state not in ('INITIAL', 'MLC'):
+            raise ValueError('Undefined state')
+        self.lexstate = state
+
+    def push_state(self, state):
+        self.lexstatestack.append(self.lexstate)
+        self.begin(state)
+
+    def pop_state(self):
+        self.begin(self.lexstatestack.pop())
+
+    def current_state(self):
+        return self.lexstate
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+    def _token(self, tipo, valor, pos, fin):
+        tok = LexToken()
+        tok.type = tipo
+        tok.value = valor
+        tok.lineno = self.lineno
+        tok.lexpos = pos
+        self.lexpos = fin
+        return tok
+
+    def token(self):
+        data = self.lexdata
+        pos = self.lexpos
+        n = self.lexlen
+        if self.lexstate == 'MLC' and pos < n:
+            pos = self._saltar_comentario(pos)
+
+        while pos < n:
+            c = data[pos]
+            try:
+                clase = _CLASES[c]
+            except KeyError:
+                clase = None
+
+            if clase == _ESPACIO:
+                pos += 1
+                if pos < n and data[pos] in ' \t\n':
+                    pos = _ESPACIOS.match(data, pos).end()
+                continue
+
+            # Los caminos frecuentes (identificador, operador, entero) crean el
+            # LexToken en el lugar en vez de llamar a _token.
+            if clase == _MINUSCULA:
+                valor = _LOCAL_VAR.match(data, pos).group()
+                tok = LexToken()
+                tok.type = _RESERVADAS.get(valor, 'LOCAL_VAR')
+                tok.value = valor
+                tok.lineno = self.lineno
+                tok.lexpos = pos
+                self.lexpos = pos + len(valor)
+                return tok
+
+            if clase == _SIMPLE:
+                tok = LexToken()
+                tok.type = _SIMPLES[c]
+                tok.value = c
+                tok.lineno = self.lineno
+                tok.lexpos = pos
+                self.lexpos = pos + 1
+                return tok
+
+            if clase == _OPERADOR:
+                # operador más largo del trie (todo carácter inicial es ya un operador)
+                tipo, hijos = TRIE_OPERADORES[c]
+                fin = k = pos + 1
+                while hijos and k < n:
+                    nodo = hijos.get(data[k])
+                    if nodo is None:
+                        break
+                    k += 1
+                    if nodo[0] is not None:
+                        tipo, fin = nodo[0], k
+                    hijos = nodo[1]
+                if fin == pos + 1 and c in '/%:' or c == '=' and data.startswith('=begin', pos):
+                    tok = self._especial(data, pos, c)
+                    if tok is not None:
+                        return tok
+                    if self.lexstate == 'MLC':
+                        pos = self._saltar_comentario(self.lexpos)
+                        continue
+                tok = LexToken()
+                tok.type = tipo
+                tok.value = data[pos:fin]
+                tok.lineno = self.lineno
+                tok.lexpos = pos
+                self.lexpos = fin
+                return tok
+
+            if clase == _DIGITO or clase is None and c.isdecimal():
+                m = _ENTERO.match(data, pos)
+                if m is not None:
+                    valor = m.group()
+                    tok = LexToken()
+                    tok.type = 'INTEGER'
+                    tok.value = int(valor)
+                    tok.largo = len(valor)
+                    tok.lineno = self.lineno
+                    tok.lexpos = pos
+                    self.lexpos = pos + len(valor)
+                    return tok
+                # sigue un carácter que puede formar RATIONAL, COMPLEX o FLOAT
+                for tipo, regex in _NUMEROS:
+                    m = regex.match(data, pos)
+                    if m is not None:
+                        break
+                valor = m.group()
+                if tipo != 'INTEGER':
+                    return self._token(tipo, valor, pos, m.end())
+                tok = self._token(tipo, int(valor), pos, m.end())
+                tok.largo = len(valor)
+                return tok
+
+            if clase == _MAYUSCULA:
+                if data[pos + 1:pos + 2] in _SEGUNDA_CONSTANTE:
+                    m = _PALABRA.match(data, pos)
+                    valor = m.group()
+                    return self._token(_RESERVADAS.get(valor, 'CONSTANT'), valor, pos, m.end())
+                m = _LOCAL_VAR.match(data, pos)
+                valor = m.group()
+                return self._token(_RESERVADAS.get(valor, 'LOCAL_VAR'), valor, pos, m.end())
+
+            if clase == _GUION_BAJO:
+                m = _CONSTANT.match(data, pos)
+                if m is not None:
+                    valor = m.group()
+                    return self._token(_RESERVADAS.get(valor, 'CONSTANT'), valor, pos, m.end())
+                m = _LOCAL_VAR.match(data, pos)
+                valor = m.group()
+                return self._token(_RESERVADAS.get(valor, 'LOCAL_VAR'), valor, pos, m.end())
+
+            if clase == _NUMERAL:
+                if data.startswith('#{', pos):
+                    cierre = data.find('}', pos + 2)
+                    if cierre != -1:
+                        return self._token('INTERPOLATION', data[pos:cierre + 1], pos, cierre + 1)
+                # comentario de una línea
+                fin = data.find('\n', pos)
+                pos = n if fin == -1 else fin
+                continue
+
+            if clase == _COMILLA:
+                m = _STR.match(data, pos)
+                if m is not None:
+                    return self._token('STR', m.group(), pos, m.end())
+
+            elif clase == _ARROBA:
+                m = _CLASS_VAR.match(data, pos)
+                if m is not None:
+                    return self._token('CLASS_VAR', m.group(), pos, m.end())
+                m = _INSTANCE_VAR.match(data, pos)
+                if m is not None:
+                    return self._token('INSTANCE_VAR', m.group(), pos, m.end())
+
+            elif clase == _DOLAR:
+                m = _GLOBAL_VAR.match(data, pos)
+                if m is not None:
+                    return self._token('GLOBAL_VAR', m.group(), pos, m.end())
+
+            # ninguna regla coincide: t_error, como en PLY
+            tok = LexToken()
+            tok.value = data[pos:]
+            tok.lineno = self.lineno
+            tok.type = 'error'
+            tok.lexer = self
+            tok.lexpos = pos
+            self.lexpos = pos
+            nuevo = self.lexerrorf(tok)
+            if pos == self.lexpos:
+                raise LexError("Scanning error. Illegal character '%s'" % (data[pos]), data[pos:])
+            pos = self.lexpos
+            if nuevo:
+                return nuevo
+
+        self.lexpos = pos + 1
+        if self.lexdata is None:
+            raise RuntimeError('No input string given with input()')
+        return None
+
+    def _especial(self, data, pos, c):
+        """Reglas que PLY prueba antes del operador de un carácter /, %, = o :.
+        Devuelve el token, o None si no hay (o si se entró a un =begin)."""
+        if c == '/':
+            m = _REGEXP.match(data, pos)
+            if m is not None:
+                return self._token('REGEXP', m.group(), pos, m.end())
+        elif c == '%':
+            if data[pos + 1:pos + 2] in ('q', 'Q'):
+                m = _STR.match(data, pos)
+                if m is not None:
+                    return self._token('STR', m.group(), pos, m.end())
+        elif c == ':':
+            m = _SYMBOL.match(data, pos)
+            if m is not None:
+                return self._token('SYMBOL', m.group(), pos, m.end())
+        else:
+            m = _BEGIN.match(data, pos)
+            if m is not None:
+                self.push_state('MLC')
+                self.lexpos = m.end()
+        return None
+
+    def _saltar_comentario(self, pos):
+        """Avanza dentro de un =begin: hasta después del =end que lo cierra, o
+        hasta el final de la entrada (quedando en el estado MLC)."""
+        data = self.lexdata
+        if data.startswith('\n=end', pos):
+            m = _CIERRE.match(data, pos)
+        else:
+            m = _END.search(data, pos + 1)
+        if m is None:
+            return self.lexlen
+        self.pop_state()
+        return m.end()
+
+
+def escaner(errores_lexicos=None):
+    """Nuevo EscanerRuby (equivalente a lexico.lexer.clone())."""
+    return EscanerRuby(errores_lexicos)
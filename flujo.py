@@ -0,0 +1,403 @@
+"""Análisis léxico en flujo para archivos grandes.
+
+El archivo se lee por bloques (mediante mmap cuando se puede) y los tokens se
+entregan con un generador: nunca se tiene el archivo completo como str ni la
+lista de todos sus LexToken, así que la memoria depende del tamaño del bloque.
+
+Se tokeniza una ventana (lo que quedó pendiente + el bloque nuevo) y sólo se
+entregan los tokens ya definitivos, es decir, los que un lexer sobre el archivo
+completo produciría igual:
+
+- los que terminan antes del último salto de línea de la ventana: los
+  patrones de una sola línea nunca miran más allá de un salto de línea;
+- si la ventana no tiene saltos de línea (una línea minificada, un string
+  enorme), los que terminan a más de MARGEN_SIN_SALTO caracteres del final y
+  antes de una cola de dígitos: fuera de los números complejos y racionales,
+  que recorren dígitos, ningún patrón mira más que unos pocos caracteres
+  después de su token. Un heredoc o un =begin sí esperan el salto de línea;
+- siempre que ninguna apertura anterior (/regexp/, "...", '...', %q(...),
+  :"...", #{...}) haya fallado sólo por falta de texto. Para saberlo se busca
+  su cierre en el resto del archivo mapeado, sin copiarlo.
+
+Lo demás (incluido un =begin sin su =end o un heredoc sin su línea de cierre)
+se vuelve a tokenizar junto con el bloque siguiente, desde el fin del último
+token entregado, que siempre es un punto seguro en el estado INITIAL.
+
+Como no hay índice de líneas del archivo completo, cada token sale con
+`lineno` y `columna` ya anotados (ver lexico.posicion_token).
+"""
+import codecs
+import mmap
+import re
+from bisect import bisect_left, bisect_right
+
+import lexico
+
+TAM_BLOQUE = 1 << 18
+
+# Sin saltos de línea en la ventana, caracteres del final que se vuelven a
+# tokenizar con el bloque siguiente (ver _corte_sin_salto)
+MARGEN_SIN_SALTO = 64
+_COLA_NUMERICA = '0123456789.+-/'
+
+# Las aperturas se prueban sobre los bytes del mmap, buscando su cierre con
+# find/search (en C y sin copiar el archivo): aplicar el patrón completo de la
+# regla a todo el resto del archivo usaría memoria proporcional a lo recorrido.
+# Los delimitadores son ASCII, así que en UTF-8 valen igual que sobre el texto.
+_DELIMITADORES = {cierre: re.compile(b'[' + re.escape(cierre) + rb'\\]') for cierre in (b'/', b'"', b"'")}
+_CIERRES_PORCENTAJE = {b'{': b'}', b'(': b')', b'[': b']', b'<': b'>'}
+_COMILLA = re.compile('["\']')
+
+
+def _cierre_con_escapes(mm, desde, cierre):
+    """Offset tras el `cierre` de un literal como /.../, "..." o '...' cuyo
+    contenido empieza en `desde` (\\x escapa cualquier carácter salvo el salto
+    de línea), o None si no cierra. Para "..." devuelve además dónde cortó."""
+    delimitador = _DELIMITADORES[cierre]
+    pos = desde
+    while True:
+        m = delimitador.search(mm, pos)
+        if m is None:
+            return None, None
+        if mm[m.start():m.end()] == cierre:
+            return m.end(), None
+        if mm[m.end():m.end() + 1] in (b'', b'\n'):
+            return None, m.start()
+        pos = m.end() + 1
+
+
+def _cierre_regexp(mm, inicio):
+    return _cierre_con_escapes(mm, inicio + 1, b'/')[0]
+
+
+def _cierre_str(mm, inicio):
+    apertura = mm[inicio:inicio + 1]
+    if apertura == b'%':
+        cierre = _CIERRES_PORCENTAJE.get(mm[inicio + 2:inicio + 3])
+        if cierre is None:
+            return None
+        pos = mm.find(cierre, inicio + 3)
+        return pos + 1 if pos != -1 else None
+    fin, corte = _cierre_con_escapes(mm, inicio + 1, apertura)
+    if corte is not None and apertura == b'"' and mm.find(b'#{', inicio, corte) != -1:
+        # una interpolación #{...} puede saltar la barra invertida final:
+        # sin analizar más, se espera a tener el archivo entero
+        return len(mm)
+    return fin
+
+
+def _cierre_symbol(mm, inicio):
+    return _cierre_con_escapes(mm, inicio + 2, b'"')[0]
+
+
+def _cierre_interpolation(mm, inicio):
+    pos = mm.find(b'}', inicio + 2)
+    return pos + 1 if pos != -1 else None
+
+
+class FlujoTokens:
+    """Tokens de un archivo, leído por bloques de `tam_bloque` bytes.
+
+    Se recorre con `for tok in flujo` o, para el parser, con
+    `parser.parse(lexer=flujo.lexer, tokenfunc=flujo.tokenfunc())`. Los lexpos
+    son offsets (en caracteres) dentro del archivo completo. Los errores
+    léxicos se imprimen y se agregan a `lexer.errores_lexicos` como en
+    t_error, con su línea y columna en el archivo; al llegar al máximo de
+    errores del lexer (lexico.limite_errores) se deja de leer y `rechazado`
+    queda en True.
+
+    Con `usar_mmap=False` (o si el archivo no se puede mapear) se lee con
+    read(); entonces una apertura sin cierre obliga a leer hasta el final del
+    archivo antes de decidir, así que la memoria ya no queda acotada en ese caso."""
+
+    def __init__(self, ruta, tam_bloque=TAM_BLOQUE, lexer_base=None, usar_mmap=True, encoding='utf-8'):
+        self.ruta = ruta
+        self.tam_bloque = tam_bloque
+        self.lexer = lexer_base if lexer_base is not None else lexico.lexer
+        self.usar_mmap = usar_mmap
+        self.encoding = encoding
+        self.cantidad = 0
+        self.errores = 0
+        self.rechazado = False
+
+    def __iter__(self):
+        with open(self.ruta, 'rb') as f:
+            mm = None
+            if self.usar_mmap:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # archivo vacío o que no se puede mapear (pipe, etc.)
+                    mm = None
+            try:
+                yield from self._tokens(f, mm)
+            finally:
+                if mm is not None:
+                    mm.close()
+
+    def tokenfunc(self):
+        """Función sin argumentos que entrega el siguiente token o None, para
+        el hook tokenfunc de PLY."""
+        siguiente = iter(self).__next__
+
+        def token():
+            try:
+                return siguiente()
+            except StopIteration:
+                return None
+        return token
+
+    def _tokens(self, f, mm):
+        tam = self.tam_bloque
+        decodificador = codecs.getincrementaldecoder(self.encoding)()
+        leidos = 0          # bytes leídos del archivo
+        ventana = ''        # texto pendiente + bloques nuevos
+        base = 0            # offset (caracteres) de ventana[0] en el archivo
+        base_bytes = 0      # offset (bytes) de ventana[0] en el archivo
+        linea_base = 1      # línea y columna de ventana[0]
+        columna_base = 1
+        fin = False
+        requerido = 0       # bytes que debe abarcar la ventana antes de decidir
+        self.errores = 0
+        self.rechazado = False
+
+        while not fin:
+            # leer al menos un bloque, y lo que haga falta para cerrar una apertura
+            while True:
+                datos = mm[leidos:leidos + tam] if mm is not None else f.read(tam)
+                leidos += len(datos)
+                fin = len(datos) < tam
+                ventana += decodificador.decode(datos, final=fin)
+                if fin or leidos >= requerido:
+                    break
+            # bytes de ventana que ya están decodificados
+            fin_bytes = leidos - len(decodificador.getstate()[0])
+
+            tokens, fines, errores = self._tokenizar(ventana)
+
+            if fin:
+                listos, hasta = len(tokens), len(ventana)
+            else:
+                corte = ventana.rfind('\n') + 1
+                if not corte:
+                    corte = _corte_sin_salto(ventana, tokens)
+                listos = bisect_left(fines, corte)
+                limite = corte
+                pendiente = self._apertura_pendiente(mm, ventana, tokens, fines, errores,
+                                                     limite, base_bytes, fin_bytes)
+                if pendiente is not None:
+                    limite, requerido = pendiente
+                    listos = min(listos, bisect_left(tokens, limite, key=_lexpos))
+                hasta = fines[listos - 1] if listos else 0
+
+            # anotar posiciones absolutas y entregar
+            indice = lexico.IndiceLineas(ventana)
+            e = 0
+            for i in range(listos):
+                tok = tokens[i]
+                while e < len(errores) and errores[e] < tok.lexpos:
+                    self._reportar(ventana, indice, errores[e], base, linea_base, columna_base)
+                    e += 1
+                    if self.rechazado:
+                        return
+                pos = tok.lexpos
+                tok.lineno, tok.columna = _absoluta(indice, pos, linea_base, columna_base)
+                tok.lexpos = pos + base
+                self.cantidad += 1
+                yield tok
+            while e < len(errores) and errores[e] < hasta:
+                self._reportar(ventana, indice, errores[e], base, linea_base, columna_base)
+                e += 1
+                if self.rechazado:
+                    return
+
+            # descartar lo entregado
+            if hasta:
+                linea_base, columna_base = _absoluta(indice, hasta, linea_base, columna_base)
+                base_bytes += len(ventana[:hasta].encode(self.encoding))
+                base += hasta
+                ventana = ventana[hasta:]
+
+    def _tokenizar(self, ventana):
+        """Tokens, fines y offsets de error de `ventana`, sin reportar errores."""
+        lx = self.lexer
+        errores = []
+        lx.posiciones_error = errores
+        lx.diferir_errores = True
+        lx.begin('INITIAL')
+        lx.input(ventana)
+        tokens, fines = [], []
+        try:
+            for tok in iter(lx.token, None):
+                tokens.append(tok)
+                fines.append(lx.lexpos)
+        finally:
+            lx.posiciones_error = None
+            lx.diferir_errores = False
+        return tokens, fines, errores
+
+    def _apertura_pendiente(self, mm, ventana, tokens, fines, errores, limite, base_bytes, fin_bytes):
+        """(offset, bytes) de la primera apertura anterior a `limite` que falló
+        en la ventana pero cerraría más adelante en el archivo, junto con los
+        bytes que debe abarcar la ventana para incluir el cierre; o None."""
+        candidatos = []
+        for tok in tokens:
+            pos = tok.lexpos
+            if pos >= limite:
+                break
+            if tok.type == 'DIV':
+                candidatos.append((pos, _cierre_regexp))
+            elif tok.type == 'MOD' and ventana[pos + 1:pos + 2] in ('q', 'Q'):
+                candidatos.append((pos, _cierre_str))
+            elif tok.type == 'COLON' and ventana[pos + 1:pos + 2] == '"':
+                candidatos.append((pos, _cierre_symbol))
+        for pos in errores:
+            if pos >= limite:
+                break
+            # las comillas sin cerrar quedan dentro de una racha de error
+            for comilla in _COMILLA.finditer(ventana, pos, lexico.fin_error_lexico(ventana, pos)):
+                candidatos.append((comilla.start(), _cierre_str))
+        # '#{' fuera de todo token: quedó como comentario de una línea
+        pos = ventana.find('#{', 0, limite)
+        while pos != -1:
+            k = bisect_left(tokens, pos + 1, key=_lexpos) - 1
+            if k < 0 or fines[k] <= pos:
+                candidatos.append((pos, _cierre_interpolation))
+                break
+            pos = ventana.find('#{', fines[k], limite)
+
+        for pos, cierre in sorted(candidatos, key=_primero):
+            if mm is None:
+                # sin mmap no se puede probar sin leer: esperar al final del archivo
+                return pos, float('inf')
+            inicio = base_bytes + len(ventana[:pos].encode(self.encoding))
+            fin = cierre(mm, inicio)
+            if fin is not None and fin > fin_bytes:
+                return pos, fin
+        return None
+
+    def _reportar(self, ventana, indice, pos, base, linea_base, columna_base):
+        """Reporta el error en `pos`; al llegar al máximo de errores del lexer
+        marca el archivo como rechazado (y _tokens deja de entregar tokens)."""
+        linea, columna = _absoluta(indice, pos, linea_base, columna_base)
+        racha = ventana[pos:lexico.fin_error_lexico(ventana, pos)]
+        mensajes = [lexico.mensaje_error_lexico(racha, linea, columna)]
+        self.errores += 1
+        maximo = lexico.limite_errores(self.lexer)
+        if maximo is not None and self.errores >= maximo:
+            self.rechazado = True
+            mensajes.append(lexico.mensaje_rechazo(maximo))
+        for mensaje_error in mensajes:
+            print(mensaje_error)
+            self.lexer.errores_lexicos.append(mensaje_error)
+
+
+def _corte_sin_salto(ventana, tokens):
+    """Offset hasta el que los tokens de una ventana sin saltos de línea ya
+    son definitivos: MARGEN_SIN_SALTO caracteres antes de la cola de dígitos
+    del final (ahí un complejo o un racional puede seguir en el bloque
+    siguiente) y no después de un heredoc o un =begin, que sin el salto de
+    línea se tokenizan distinto."""
+    corte = len(ventana.rstrip(_COLA_NUMERICA)) - MARGEN_SIN_SALTO
+    for tok in tokens:
+        pos = tok.lexpos
+        if pos >= corte:
+            break
+        if ventana.startswith('=begin', pos) or (tok.type == 'STR' and ventana.startswith('<<', pos)):
+            return pos
+    return max(corte, 0)
+
+
+def _lexpos(tok):
+    return tok.lexpos
+
+
+def _primero(par):
+    return par[0]
+
+
+def _absoluta(indice, pos, linea_base, columna_base):
+    """(línea, columna) en el archivo de la posición `pos` de la ventana."""
+    linea, columna = indice.posicion(pos)
+    if linea == 1:
+        return linea_base, columna_base + columna - 1
+    return linea_base + linea - 1, columna
+
+
+class IndiceArchivo:
+    """Como lexico.IndiceLineas (posicion y fragmento a partir de offsets en
+    caracteres), pero para un archivo que no se tiene entero en memoria.
+
+    La primera consulta recorre el archivo por bloques y anota, al final de
+    cada bloque, dónde empieza la línea siguiente: su offset en caracteres y
+    en bytes y su número de línea. Después cada consulta lee y decodifica
+    sólo el tramo entre dos de esas marcas (el último queda en caché)."""
+
+    def __init__(self, ruta, tam_bloque=TAM_BLOQUE, encoding='utf-8'):
+        self.ruta = ruta
+        self.tam_bloque = tam_bloque
+        self.encoding = encoding
+        self._caracteres = None     # offset (caracteres) de cada marca
+        self._marcas = None         # (offset en bytes, línea) de cada marca
+        self._tramo = (None, '')    # (marca, texto) del último tramo leído
+
+    def _indexar(self):
+        caracteres, marcas = [0], [(0, 1)]
+        pendiente = bytearray()
+        base_bytes, linea = 0, 1
+        with open(self.ruta, 'rb') as f:
+            for bloque in iter(lambda: f.read(self.tam_bloque), b''):
+                pendiente += bloque
+                corte = pendiente.rfind(b'\n') + 1
+                if not corte:
+                    continue
+                # un salto de línea nunca está en medio de un carácter UTF-8
+                texto = pendiente[:corte].decode(self.encoding)
+                del pendiente[:corte]
+                base_bytes += corte
+                linea += texto.count('\n')
+                caracteres.append(caracteres[-1] + len(texto))
+                marcas.append((base_bytes, linea))
+        self._caracteres, self._marcas = caracteres, marcas
+
+    def _marca(self, offset):
+        if self._marcas is None:
+            self._indexar()
+        return bisect_right(self._caracteres, offset) - 1
+
+    def _texto(self, i):
+        """Texto desde la marca i hasta la siguiente (o hasta el final)."""
+        if self._tramo[0] != i:
+            desde = self._marcas[i][0]
+            with open(self.ruta, 'rb') as f:
+                f.seek(desde)
+                if i + 1 < len(self._marcas):
+                    datos = f.read(self._marcas[i + 1][0] - desde)
+                else:
+                    datos = f.read()
+            self._tramo = (i, datos.decode(self.encoding))
+        return self._tramo[1]
+
+    def posicion(self, offset):
+        """(línea, columna) del offset, ambas desde 1."""
+        i = self._marca(offset)
+        texto = self._texto(i)
+        relativo = offset - self._caracteres[i]
+        linea = self._marcas[i][1] + texto.count('\n', 0, relativo)
+        return linea, relativo - texto.rfind('\n', 0, relativo)
+
+    def fragmento(self, desde, hasta):
+        """Texto entre dos offsets."""
+        partes = []
+        i = self._marca(desde)
+        while True:
+            base = self._caracteres[i]
+            partes.append(self._texto(i)[max(desde - base, 0):hasta - base])
+            i += 1
+            if i == len(self._caracteres) or self._caracteres[i] >= hasta:
+                return ''.join(partes)
+
+
+def tokens_de_archivo(ruta, tam_bloque=TAM_BLOQUE, lexer_base=None, usar_mmap=True):
+    """FlujoTokens de `ruta`: los tokens se producen a medida que se recorren."""
+    return FlujoTokens(ruta, tam_bloque, lexer_base, usar_mmap)
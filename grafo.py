@@ -0,0 +1,456 @@
+"""Grafo de flujo de control y análisis de flujo de datos.
+
+construir() arma un Grafo por unidad de código: el programa (o la
+sentencia de nivel superior que se está verificando), cada `def` y cada
+`class`. Un def o una class que aparece como sentencia es opaco para la
+unidad que lo contiene y tiene su propio grafo, como su propio ámbito en
+la tabla de símbolos (simbolos.py).
+
+Los bloques básicos tienen una lista de elementos en orden de ejecución:
+sentencias simples, las condiciones de if/elsif/while, el iterable de un
+for, los parámetros de un def (al entrar) y el propio nodo Para al
+empezar cada vuelta (asigna la variable del for); las sentencias de un
+grupo entre llaves van como si no lo estuvieran. Las aristas salen de
+if/elsif/else, while, for, break, next y return. Cada grafo tiene un
+bloque de entrada y uno de salida vacíos y sin aristas hacia la entrada
+ni desde la salida. Un break o un next sin bucle que lo contenga en su
+misma unidad no tiene adónde ir: queda en `sueltos` y el flujo sigue como
+si no estuviera. Lo que sigue a un break, next o return va a un bloque
+sin predecesores (código inalcanzable).
+
+El armado no es recursivo: cada sentencia compuesta es un generador que
+pide con `yield` el resultado de sus cuerpos, y _correr los ejecuta con
+una pila.
+
+Los análisis de flujo de datos (resolver) trabajan con conjuntos de bits
+en enteros de Python: un bit por definición o por variable local. Son de
+la forma gen/kill, hacia adelante o hacia atrás, con unión o con
+intersección, y se resuelven con una lista de trabajo recorriendo los
+bloques en postorden inverso, así que en funciones sin bucles anidados
+en exceso alcanzan el punto fijo en una o dos pasadas:
+
+  - definiciones_alcanzantes: qué asignaciones pueden llegar a cada bloque;
+  - asignadas: qué variables están asignadas en todos los caminos;
+  - vivas: qué variables se leen después sin asignarse antes.
+
+Sólo cuentan las variables locales: las globales, de instancia y las
+constantes no son de la unidad.
+"""
+from collections import deque
+
+import nodos
+import simbolos
+
+# Sentencias que son un elemento del bloque donde aparecen
+_COMPUESTAS = (nodos.Si, nodos.Mientras, nodos.Para)
+_BUCLES = (nodos.Mientras, nodos.Para)
+_SALTOS = (nodos.Break, nodos.Next)
+
+
+class Bloque:
+    __slots__ = ('indice', 'elementos', 'sucesores', 'predecesores')
+
+    def __init__(self, indice):
+        self.indice = indice
+        self.elementos = []
+        self.sucesores = []
+        self.predecesores = []
+
+    def __repr__(self):
+        return f'Bloque({self.indice}, {len(self.elementos)} elementos, -> {self.sucesores})'
+
+
+class Grafo:
+    """Grafo de flujo de control de una unidad: `nodo` es el Funcion o la
+    Clase, o None para el programa. Los sucesores y predecesores de cada
+    bloque son índices en `bloques`."""
+
+    def __init__(self, nodo=None):
+        self.nodo = nodo
+        self.bloques = []
+        self.entrada = self.nuevo_bloque()
+        self.salida = self.nuevo_bloque()
+
+    def nuevo_bloque(self):
+        bloque = Bloque(len(self.bloques))
+        self.bloques.append(bloque)
+        return bloque
+
+    def enlazar(self, desde, hasta):
+        if desde is not None and hasta.indice not in desde.sucesores:
+            desde.sucesores.append(hasta.indice)
+            hasta.predecesores.append(desde.indice)
+
+    def postorden(self):
+        """Índices de los bloques alcanzables desde la entrada, en postorden."""
+        bloques = self.bloques
+        visto = bytearray(len(bloques))
+        orden = []
+        visto[self.entrada.indice] = 1
+        pila = [(self.entrada.indice, iter(self.entrada.sucesores))]
+        while pila:
+            indice, sucesores = pila[-1]
+            for siguiente in sucesores:
+                if not visto[siguiente]:
+                    visto[siguiente] = 1
+                    pila.append((siguiente, iter(bloques[siguiente].sucesores)))
+                    break
+            else:
+                pila.pop()
+                orden.append(indice)
+        return orden
+
+
+# --------------------------------------------------
+# Armado
+# --------------------------------------------------
+class _Bucle:
+    __slots__ = ('continuar', 'salir')
+
+    def __init__(self, continuar, salir):
+        self.continuar = continuar
+        self.salir = salir
+
+
+def _correr(tarea):
+    """Ejecuta un generador de armado y los que pida con yield, sin recursión."""
+    pila = [tarea]
+    valor = None
+    while pila:
+        try:
+            pedida = pila[-1].send(valor)
+        except StopIteration as fin:
+            pila.pop()
+            valor = fin.value
+            continue
+        pila.append(pedida)
+        valor = None
+    return valor
+
+
+class _Armado:
+    def __init__(self):
+        self.grafos = []
+        self.sueltos = []
+        # defs y clases por armar, cada uno con su grafo
+        self.unidades = []
+
+    def unidad(self, nodo, sentencias, iniciales=()):
+        grafo = Grafo(nodo)
+        self.grafos.append(grafo)
+        bucles = []
+        actual = grafo.nuevo_bloque()
+        grafo.enlazar(grafo.entrada, actual)
+        actual.elementos.extend(iniciales)
+        actual = _correr(self._lista(grafo, bucles, sentencias, actual))
+        grafo.enlazar(actual, grafo.salida)
+
+    def _lista(self, grafo, bucles, sentencias, actual):
+        for sentencia in sentencias:
+            if actual is None:
+                # después de un break, next o return: inalcanzable
+                actual = grafo.nuevo_bloque()
+            tipo = type(sentencia)
+            if tipo is nodos.Si:
+                actual = yield self._si(grafo, bucles, sentencia, actual)
+            elif tipo is nodos.Mientras or tipo is nodos.Para:
+                actual = yield self._bucle(grafo, bucles, sentencia, actual)
+            elif tipo is nodos.Llaves:
+                actual = yield self._lista(grafo, bucles, sentencia.sentencias, actual)
+            elif tipo is nodos.Break or tipo is nodos.Next:
+                if not bucles:
+                    self.sueltos.append(sentencia)
+                    continue
+                bucle = bucles[-1]
+                grafo.enlazar(actual, bucle.salir if tipo is nodos.Break else bucle.continuar)
+                actual = None
+            elif tipo is nodos.Retorno:
+                actual.elementos.append(sentencia)
+                grafo.enlazar(actual, grafo.salida)
+                actual = None
+            else:
+                if tipo is nodos.Funcion:
+                    self.unidades.append((sentencia, sentencia.cuerpo, sentencia.parametros))
+                elif tipo is nodos.Clase:
+                    self.unidades.append((sentencia, sentencia.cuerpo, ()))
+                actual.elementos.append(sentencia)
+        return actual
+
+    def _si(self, grafo, bucles, nodo, actual):
+        fin = grafo.nuevo_bloque()
+        ramas = [(nodo.condicion, nodo.cuerpo)]
+        ramas.extend((rama.condicion, rama.cuerpo) for rama in nodo.ramas_elsif)
+        condicion = actual
+        for i, (expresion, cuerpo) in enumerate(ramas):
+            if i:
+                # el elsif se evalúa si la condición anterior fue falsa
+                siguiente = grafo.nuevo_bloque()
+                grafo.enlazar(condicion, siguiente)
+                condicion = siguiente
+            condicion.elementos.append(expresion)
+            rama = grafo.nuevo_bloque()
+            grafo.enlazar(condicion, rama)
+            grafo.enlazar((yield self._lista(grafo, bucles, cuerpo, rama)), fin)
+        if nodo.rama_else is None:
+            grafo.enlazar(condicion, fin)
+        else:
+            rama = grafo.nuevo_bloque()
+            grafo.enlazar(condicion, rama)
+            grafo.enlazar((yield self._lista(grafo, bucles, nodo.rama_else, rama)), fin)
+        return fin
+
+    def _bucle(self, grafo, bucles, nodo, actual):
+        cabecera = grafo.nuevo_bloque()
+        cuerpo = grafo.nuevo_bloque()
+        salida = grafo.nuevo_bloque()
+        if type(nodo) is nodos.Mientras:
+            cabecera.elementos.append(nodo.condicion)
+        else:
+            # el iterable se evalúa una vez; la variable se asigna en cada vuelta
+            actual.elementos.append(nodo.iterable)
+            cuerpo.elementos.append(nodo)
+        grafo.enlazar(actual, cabecera)
+        grafo.enlazar(cabecera, cuerpo)
+        grafo.enlazar(cabecera, salida)
+        bucles.append(_Bucle(cabecera, salida))
+        grafo.enlazar((yield self._lista(grafo, bucles, nodo.cuerpo, cuerpo)), cabecera)
+        bucles.pop()
+        return salida
+
+
+def construir(raiz):
+    """Grafos de `raiz` (un Programa o una sentencia de nivel superior) y de
+    cada def y class que contiene, en orden de aparición (el de la unidad
+    que contiene a otra va antes), y la lista de los break y next sueltos."""
+    armado = _Armado()
+    sentencias = raiz.sentencias if type(raiz) is nodos.Programa else [raiz]
+    armado.unidad(None, sentencias)
+    siguiente = 0
+    while siguiente < len(armado.unidades):
+        nodo, cuerpo, parametros = armado.unidades[siguiente]
+        siguiente += 1
+        armado.unidad(nodo, cuerpo, parametros)
+    return armado.grafos, armado.sueltos
+
+
+# --------------------------------------------------
+# Lecturas y escrituras de cada elemento
+# --------------------------------------------------
+def _es_local(nombre):
+    return simbolos.tipo_de_nombre(nombre) == simbolos.LOCAL
+
+
+def _lecturas(expresion):
+    """Variables locales (nodos Variable) que lee una expresión, en orden."""
+    if expresion is None:
+        return []
+    encontradas = []
+    pendientes = [expresion]
+    while pendientes:
+        nodo = pendientes.pop()
+        tipo = type(nodo)
+        if tipo is nodos.Variable:
+            if _es_local(nodo.nombre):
+                encontradas.append(nodo)
+        elif tipo is list:
+            pendientes.extend(reversed(nodo))
+        elif isinstance(nodo, nodos.Nodo) and tipo not in nodos.HOJAS:
+            for campo in reversed(nodo.campos):
+                valor = getattr(nodo, campo)
+                if isinstance(valor, (nodos.Nodo, list)):
+                    pendientes.append(valor)
+    return encontradas
+
+
+def efectos(elemento):
+    """(lecturas, nombre asignado o None) de un elemento de bloque: las
+    lecturas son nodos Variable de variables locales, en orden, y todas
+    ocurren antes de la asignación."""
+    tipo = type(elemento)
+    if tipo is nodos.Asignacion or tipo is nodos.Entrada:
+        variable = elemento.variable
+        nombre = variable.nombre if type(variable) is nodos.Variable and _es_local(variable.nombre) else None
+        if tipo is nodos.Entrada:
+            return [], nombre
+        lecturas = _lecturas(elemento.valor)
+        if nombre is not None and elemento.operador != '=':
+            # x += ... lee x antes de asignarla
+            lecturas.insert(0, variable)
+        return lecturas, nombre
+    if tipo is nodos.Parametro:
+        return _lecturas(elemento.defecto), elemento.nombre
+    if tipo is nodos.Para:
+        return [], elemento.variable if _es_local(elemento.variable) else None
+    if tipo is nodos.Funcion or tipo is nodos.Clase or tipo is nodos.ErrorSemantico:
+        return [], None
+    return _lecturas(elemento), None
+
+
+class Efectos:
+    """Lecturas y asignaciones de cada bloque de un grafo, con las
+    variables locales y las definiciones (sitios de asignación) numeradas
+    para los conjuntos de bits."""
+
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self.variables = {}
+        # definiciones[i]: (nombre, elemento) de la definición i
+        self.definiciones = []
+        # por bloque: lista de (lecturas, variable asignada o -1, definición o -1)
+        self.pasos = []
+        for bloque in grafo.bloques:
+            pasos = []
+            for elemento in bloque.elementos:
+                lecturas, nombre = efectos(elemento)
+                variable = definicion = -1
+                if nombre is not None:
+                    variable = self.variables.setdefault(nombre, len(self.variables))
+                    definicion = len(self.definiciones)
+                    self.definiciones.append((nombre, elemento))
+                pasos.append((lecturas, variable, definicion))
+            self.pasos.append(pasos)
+
+    @property
+    def todas_las_variables(self):
+        return (1 << len(self.variables)) - 1
+
+
+# --------------------------------------------------
+# Resolución
+# --------------------------------------------------
+def resolver(grafo, gen, kill, adelante=True, interseccion=False, frontera=0, universo=0):
+    """Punto fijo de un análisis gen/kill sobre `grafo`: para cada bloque
+    i, salida = gen[i] | (entrada & ~kill[i]), y la entrada junta las
+    salidas de los predecesores (de los sucesores si `adelante` es False)
+    con | o, si `interseccion`, con &. `frontera` es el valor en la entrada
+    del grafo (en su salida hacia atrás) y `universo` el conjunto completo,
+    con el que empiezan los análisis de intersección. Devuelve las listas
+    (entradas, salidas) por bloque, en el sentido del análisis."""
+    bloques = grafo.bloques
+    n = len(bloques)
+    if adelante:
+        anteriores = [b.predecesores for b in bloques]
+        siguientes = [b.sucesores for b in bloques]
+        borde = grafo.entrada.indice
+        orden = grafo.postorden()[::-1]
+    else:
+        anteriores = [b.sucesores for b in bloques]
+        siguientes = [b.predecesores for b in bloques]
+        borde = grafo.salida.indice
+        orden = grafo.postorden()
+    inicial = universo if interseccion else 0
+    entradas = [inicial] * n
+    salidas = [inicial] * n
+    # los bloques inalcanzables quedan en el valor inicial
+    pendientes = deque(orden)
+    en_cola = bytearray(n)
+    for i in orden:
+        en_cola[i] = 1
+    while pendientes:
+        i = pendientes.popleft()
+        en_cola[i] = 0
+        previos = anteriores[i]
+        if i == borde:
+            valor = frontera
+        elif not previos:
+            valor = inicial
+        else:
+            valor = salidas[previos[0]]
+            if interseccion:
+                for p in previos[1:]:
+                    valor &= salidas[p]
+            else:
+                for p in previos[1:]:
+                    valor |= salidas[p]
+        entradas[i] = valor
+        nuevo = gen[i] | (valor & ~kill[i])
+        if nuevo != salidas[i]:
+            salidas[i] = nuevo
+            for s in siguientes[i]:
+                if not en_cola[s]:
+                    en_cola[s] = 1
+                    pendientes.append(s)
+    return entradas, salidas
+
+
+def definiciones_alcanzantes(efectos_grafo):
+    """(entradas, salidas) por bloque: bits de las definiciones (índices en
+    efectos_grafo.definiciones) que pueden llegar a ese punto."""
+    de_variable = {}
+    for i, (nombre, _) in enumerate(efectos_grafo.definiciones):
+        de_variable[nombre] = de_variable.get(nombre, 0) | 1 << i
+    gen, kill = [], []
+    for pasos in efectos_grafo.pasos:
+        g = k = 0
+        for _, variable, definicion in pasos:
+            if definicion >= 0:
+                todas = de_variable[efectos_grafo.definiciones[definicion][0]]
+                g = (g & ~todas) | 1 << definicion
+                k |= todas
+        gen.append(g)
+        kill.append(k)
+    return resolver(efectos_grafo.grafo, gen, kill)
+
+
+def asignadas(efectos_grafo):
+    """(entradas, salidas) por bloque: bits de las variables (índices en
+    efectos_grafo.variables) asignadas en todos los caminos hasta ahí."""
+    gen = []
+    for pasos in efectos_grafo.pasos:
+        g = 0
+        for _, variable, _ in pasos:
+            if variable >= 0:
+                g |= 1 << variable
+        gen.append(g)
+    kill = [0] * len(gen)
+    return resolver(efectos_grafo.grafo, gen, kill, interseccion=True,
+                    universo=efectos_grafo.todas_las_variables)
+
+
+def vivas(efectos_grafo):
+    """(salidas, entradas) por bloque, hacia atrás: bits de las variables
+    que se leen más adelante sin volver a asignarse antes."""
+    variables = efectos_grafo.variables
+    gen, kill = [], []
+    for pasos in efectos_grafo.pasos:
+        usadas = asignadas_bloque = 0
+        for lecturas, variable, _ in pasos:
+            for lectura in lecturas:
+                bit = 1 << variables[lectura.nombre] if lectura.nombre in variables else 0
+                if not asignadas_bloque & bit:
+                    usadas |= bit
+            if variable >= 0:
+                asignadas_bloque |= 1 << variable
+        gen.append(usadas)
+        kill.append(asignadas_bloque)
+    return resolver(efectos_grafo.grafo, gen, kill, adelante=False)
+
+
+def lecturas_sin_asignar(efectos_grafo):
+    """Lecturas (nodos Variable) de variables que la unidad asigna en algún
+    lugar pero que no están asignadas en todos los caminos que llegan a la
+    lectura. No cuenta las que están antes de toda asignación de su
+    variable en el texto: para Ruby ésas no son la variable sino una
+    llamada a un método con ese nombre."""
+    variables = efectos_grafo.variables
+    primeras = {}
+    for nombre, elemento in efectos_grafo.definiciones:
+        if nombre not in primeras or elemento.inicio < primeras[nombre]:
+            primeras[nombre] = elemento.inicio
+    entradas, _ = asignadas(efectos_grafo)
+    alcanzables = set(efectos_grafo.grafo.postorden())
+    encontradas = []
+    for indice, pasos in enumerate(efectos_grafo.pasos):
+        if indice not in alcanzables:
+            continue
+        actuales = entradas[indice]
+        for lecturas, variable, _ in pasos:
+            for lectura in lecturas:
+                nombre = lectura.nombre
+                if nombre in variables and not actuales >> variables[nombre] & 1 \
+                        and lectura.inicio > primeras[nombre]:
+                    encontradas.append(lectura)
+            if variable >= 0:
+                actuales |= 1 << variable
+    encontradas.sort(key=lambda lectura: lectura.inicio)
+    return encontradas
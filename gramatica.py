@@ -0,0 +1,155 @@
+"""Métricas de las tablas LALR de la gramática de main.py.
+
+Genera las tablas desde cero (sin pasar por la caché) y reporta el tamaño
+del autómata: estados, entradas de las tablas de acciones y de gotos,
+bytes de la caché que se carga al arrancar (main.ARCHIVO_TABLAS_PARSER) y
+lo que tarda en cargarse, junto con los conflictos shift/reduce y
+reduce/reduce y las reglas sin usar. PLY no cuenta como conflicto el que
+resuelve una precedencia, así que se informan aparte los que resuelve
+FIN_SENTENCIA (ver main.precedence). Sirve de control para que la
+gramática siga sin conflictos y las tablas no crezcan sin que nadie lo
+note: el código de salida es 1 si se pasa alguno de los LIMITES.
+
+    python gramatica.py
+    python gramatica.py --json metricas.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from ply import yacc
+
+import main
+
+# Máximos permitidos. Los conflictos deben quedar en cero; los que resuelve
+# FIN_SENTENCIA (una sentencia seguida de otra que empieza con `-`, `(` o
+# `[`) no pueden crecer. El resto deja algo de margen sobre el tamaño actual
+# de las tablas.
+LIMITES = {
+    'conflictos_shift_reduce': 0,
+    'conflictos_reduce_reduce': 0,
+    'conflictos_fin_sentencia': 26,
+    'reglas_sin_usar': 0,
+    'estados': 260,
+    'entradas_accion': 8000,
+    'entradas_goto': 600,
+    'bytes_tablas': 120 * 1024,
+}
+
+
+class _Registro:
+    """Logger para yacc.yacc(): guarda los totales que PLY sólo informa por
+    log (conflictos, reglas sin usar) y los errores de la gramática."""
+
+    def __init__(self):
+        self.totales = {'conflictos_shift_reduce': 0, 'conflictos_reduce_reduce': 0, 'reglas_sin_usar': 0}
+        self.errores = []
+
+    def warning(self, msg, *args, **kwargs):
+        for texto, clave in (('shift/reduce conflict', 'conflictos_shift_reduce'),
+                             ('reduce/reduce conflict', 'conflictos_reduce_reduce'),
+                             ('unused rule', 'reglas_sin_usar')):
+            if texto in msg:
+                self.totales[clave] = args[0] if args else 1
+
+    def error(self, msg, *args, **kwargs):
+        self.errores.append(msg % args)
+
+    critical = error
+
+    def debug(self, msg, *args, **kwargs):
+        pass
+
+    info = debug
+
+
+def _conflictos_fin_sentencia():
+    """Conflictos shift/reduce que resuelve el %prec FIN_SENTENCIA de las
+    reglas: los que PLY contaría si FIN_SENTENCIA no tuviera precedencia."""
+    info = yacc.ParserReflect(dict(vars(main)), log=yacc.NullLogger())
+    info.get_all()
+    if info.validate_all():
+        raise yacc.YaccError('la gramática de main.py tiene errores')
+    gramatica = yacc.Grammar(info.tokens)
+    for terminal, asociatividad, nivel in info.preclist:
+        if terminal == 'FIN_SENTENCIA':
+            # lo que PLY supone para una regla sin precedencia
+            asociatividad, nivel = 'right', 0
+        gramatica.set_precedence(terminal, asociatividad, nivel)
+    for funcion, (archivo, linea, nombre, simbolos) in info.grammar:
+        gramatica.add_production(nombre, simbolos, funcion, archivo, linea)
+    gramatica.set_start(info.start)
+    return len(yacc.LRGeneratedTable(gramatica, 'LALR', yacc.NullLogger()).sr_conflicts)
+
+
+def _segundos_carga(repeticiones=5):
+    """Mínimo de lo que tarda PLY en cargar las tablas desde la caché."""
+    main.obtener_parser()
+    modulo = sys.modules['main']
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        yacc.yacc(module=modulo, debug=False, picklefile=main.ARCHIVO_TABLAS_PARSER)
+        transcurrido = time.perf_counter() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor
+
+
+def metricas():
+    """Diccionario con el tamaño de las tablas y los conflictos de la gramática."""
+    registro = _Registro()
+    try:
+        # un tabmodule que no existe obliga a generar las tablas, sin escribirlas;
+        # PLY sólo cuenta los conflictos con debug (el detalle va a debuglog,
+        # que aquí se descarta en lugar de escribir parser.out)
+        parser = yacc.yacc(module=sys.modules['main'], debug=True, debuglog=yacc.NullLogger(),
+                           write_tables=False, tabmodule='_tablas_inexistentes', errorlog=registro)
+    except yacc.YaccError as e:
+        raise yacc.YaccError('\n'.join(registro.errores) or str(e)) from e
+    resultado = {
+        'producciones': len(parser.productions) - 1,
+        'estados': len(parser.action),
+        'entradas_accion': sum(len(acciones) for acciones in parser.action.values()),
+        'entradas_goto': sum(len(gotos) for gotos in parser.goto.values()),
+    }
+    resultado.update(registro.totales)
+    resultado['conflictos_fin_sentencia'] = _conflictos_fin_sentencia()
+    resultado['segundos_carga'] = _segundos_carga()
+    resultado['bytes_tablas'] = os.path.getsize(main.ARCHIVO_TABLAS_PARSER)
+    return resultado
+
+
+def excedidos(resultado, limites=LIMITES):
+    """Métricas de `resultado` que superan su límite: [(nombre, valor, límite)]."""
+    return [(nombre, resultado[nombre], limite) for nombre, limite in limites.items()
+            if resultado.get(nombre) is not None and resultado[nombre] > limite]
+
+
+def informe(resultado):
+    lineas = [f"{'Métrica':<26} {'Valor':>12} {'Límite':>10}"]
+    lineas.append('-' * len(lineas[0]))
+    for nombre, valor in resultado.items():
+        limite = LIMITES.get(nombre, '')
+        if nombre == 'segundos_carga':
+            valor = f'{valor * 1000:.2f} ms'
+        lineas.append(f'{nombre:<26} {valor:>12} {limite:>10}')
+    return '\n'.join(lineas)
+
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description='Tamaño y conflictos de las tablas LALR de main.py.')
+    argumentos.add_argument('--json', metavar='RUTA', help='guardar además las métricas en JSON')
+    args = argumentos.parse_args()
+
+    resultado = metricas()
+    print(informe(resultado))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+    problemas = excedidos(resultado)
+    for nombre, valor, limite in problemas:
+        print(f'EXCEDIDO {nombre}: {valor} (límite {limite})', file=sys.stderr)
+    sys.exit(1 if problemas else 0)
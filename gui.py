@@ -7,9 +7,9 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 try:
-    from lexico import lexer, errores_lexicos, tokens
     import main
-    from main import errores_sintacticos, errores_semanticos, advertencias_semanticas, analizar_desde_gui
+    import cache
+    from main import SesionAnalisis, analizar_desde_gui
 except ImportError as e:
     print(f"Error importando módulos: {e}")
     sys.exit(1)
@@ -23,6 +23,12 @@ class AnalizadorRubyGUI:
         self.root.title("Analizador Ruby - Sistema Completo")
         self.root.geometry("1400x800")
 
+        # Sesión propia del editor; en modo incremental recuerda los tokens
+        # del último análisis y sólo re-tokeniza lo que se editó. Con la caché
+        # de resultados un código ya analizado (aquí o por lote.py) no se
+        # vuelve a analizar
+        self.sesion = SesionAnalisis(incremental=True, cache=cache.CacheResultados())
+
         # Estilo
         style = ttk.Style()
         style.theme_use('clam')
@@ -80,11 +86,8 @@ class AnalizadorRubyGUI:
         self.resultados_text.pack(fill=tk.BOTH, expand=True)
 
     def limpiar_errores_globales(self):
-        """Limpia los errores globales de los módulos"""
-        errores_lexicos.clear()
-        errores_sintacticos.clear()
-        errores_semanticos.clear()
-        advertencias_semanticas.clear()
+        """Descarta errores y tabla de símbolos del análisis anterior"""
+        self.sesion.reiniciar()
 
     def analizar_codigo(self):
         """Ejecuta el análisis completo del código"""
@@ -111,6 +114,11 @@ class AnalizadorRubyGUI:
 
     def realizar_analisis_completo(self, codigo):
         """Realiza el análisis completo (léxico, sintáctico, semántico)"""
+        sesion = self.sesion
+        errores_lexicos = sesion.errores_lexicos
+        errores_sintacticos = sesion.errores_sintacticos
+        errores_semanticos = sesion.errores_semanticos
+        advertencias_semanticas = sesion.advertencias_semanticas
         resultado = ""
 
         # ========== ANÁLISIS LÉXICO ==========
@@ -119,24 +127,21 @@ class AnalizadorRubyGUI:
         resultado += "=" * 70 + "\n\n"
 
         try:
-            # Reinicializar lexer completamente
-            lexer.lineno = 1
-            lexer.lexpos = 0
-            lexer.input(codigo)
-
-            tokens_encontrados = []
-            while True:
-                tok = lexer.token()
-                if not tok:
-                    break
-                tokens_encontrados.append({
-                    'tipo': tok.type,
-                    'valor': tok.value,
-                    'linea': tok.lineno
-                })
-
-            # Mostrar tokens encontrados (opcional)
-            resultado += f"✅ Se encontraron {len(tokens_encontrados)} tokens\n"
+            en_cache = sesion.buscar_en_cache(codigo)
+            if en_cache is not None:
+                # mismo código que un análisis anterior: ya están todos los resultados
+                buffer_tokens = None
+                cantidad, conteo = en_cache.tokens, en_cache.conteo
+            else:
+                # Una sola pasada del lexer: el parser reutiliza este buffer
+                buffer_tokens = sesion.tokenizar(codigo)
+                cantidad, conteo = len(buffer_tokens), buffer_tokens.conteo_por_tipo()
+
+            resultado += f"✅ Se encontraron {cantidad} tokens\n"
+            if conteo:
+                resumen_tipos = ", ".join(f"{tipo}={cant}" for tipo, cant in
+                                          sorted(conteo.items(), key=lambda par: -par[1]))
+                resultado += f"   Tipos: {resumen_tipos}\n"
 
         except Exception as e:
             resultado += f"❌ Error en análisis léxico: {str(e)}\n"
@@ -147,6 +152,8 @@ class AnalizadorRubyGUI:
             resultado += "❌ ERRORES LÉXICOS ENCONTRADOS:\n"
             for error in errores_lexicos:
                 resultado += f"   - {error}\n"
+            if sesion.rechazado:
+                resultado += "\n⛔ Archivo rechazado: se alcanzó el máximo de errores léxicos.\n"
             resultado += "\n⚠️ No se continúa con análisis sintáctico debido a errores léxicos.\n"
             return resultado
         else:
@@ -158,8 +165,12 @@ class AnalizadorRubyGUI:
         resultado += "=" * 70 + "\n\n"
 
         try:
-            # Usar la función del main para análisis sintáctico
-            resultado_parser = analizar_desde_gui(codigo)
+            if en_cache is not None:
+                resultado += "♻️ Resultado tomado de la caché (el código no cambió)\n"
+            else:
+                # Usar la función del main para análisis sintáctico
+                resultado_parser = analizar_desde_gui(codigo, buffer_tokens, sesion)
+                sesion.guardar_en_cache(codigo, resultado_parser, buffer_tokens)
 
             if errores_sintacticos:
                 resultado += "❌ ERRORES SINTÁCTICOS DETECTADOS:\n"
@@ -0,0 +1,197 @@
+"""Análisis léxico incremental.
+
+Cuando se edita una zona del código no hace falta tokenizar todo desde
+lexpos = 0: se conservan los tokens que terminan antes de la edición, se vuelve
+a tokenizar desde ahí y se para en cuanto un token nuevo coincide (misma
+posición desplazada, mismo tipo y valor) con un token viejo posterior a la
+edición. Desde ese punto el texto es idéntico, así que el resto de los tokens
+viejos se reutiliza desplazando su lexpos.
+
+Los tokens sólo se emiten en el estado INITIAL (el estado exclusivo MLC de
+=begin/=end nunca devuelve tokens), por eso el fin de cualquier token es un
+punto seguro para reanudar el lexer. Los heredoc de t_HEREDOC quedan cubiertos
+porque su token abarca todo el cuerpo hasta la línea de cierre.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+from lexico import BufferTokens, entrada_rechazada, fin_error_lexico, tokenizar
+
+_lexpos = attrgetter('lexpos')
+_COMILLA = re.compile('["\']')
+
+# Caracteres que pueden cambiar el resultado de una apertura que antes no
+# encontró su cierre (/regexp/, "...", '...', %q(...), :"...", #{...}): cierres,
+# interpolaciones y, al borrarse, barras invertidas y saltos de línea que
+# cortaban el escaneo. Si la edición los toca, se re-tokeniza desde la primera
+# de esas aperturas.
+SENSIBLES_INSERTADO = frozenset('/"\'})]>#{')
+SENSIBLES_ELIMINADO = SENSIBLES_INSERTADO | frozenset('\\\n')
+
+
+def calcular_edicion(viejo, nuevo):
+    """Edición (offset, eliminado, insertado) que transforma `viejo` en `nuevo`,
+    tomando el prefijo y el sufijo comunes más largos."""
+    largo_minimo = min(len(viejo), len(nuevo))
+    # búsqueda binaria comparando rebanadas: las comparaciones corren en C
+    lo, hi = 0, largo_minimo
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if viejo[lo:mid] == nuevo[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefijo = lo
+
+    lv, ln = len(viejo), len(nuevo)
+    lo, hi = 0, largo_minimo - prefijo
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if viejo[lv - mid:lv - lo] == nuevo[ln - mid:ln - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    sufijo = lo
+
+    return prefijo, lv - sufijo - prefijo, nuevo[prefijo:ln - sufijo]
+
+
+def _primera_apertura_fallida(buffer, limite):
+    """Offset de la primera apertura anterior a `limite` cuyo patrón largo no
+    encontró cierre, o None. Es una aproximación conservadora: reanudar antes
+    de lo necesario sólo cuesta tiempo, nunca da un resultado distinto."""
+    codigo, tokens, fines = buffer.codigo, buffer.tokens, buffer.fines
+    candidatos = []
+
+    # '/' que quedó como DIV: REGEXP no encontró la barra de cierre.
+    # '%' que quedó como MOD delante de q/Q: %q(...) no encontró cierre.
+    for tok in tokens:
+        pos = tok.lexpos
+        if pos >= limite:
+            break
+        if tok.type == 'DIV' or (tok.type == 'MOD' and codigo[pos + 1:pos + 2] in ('q', 'Q')):
+            candidatos.append(pos)
+            break
+
+    # comillas sin cerrar: quedaron dentro de una racha de error léxico
+    for pos in buffer.errores:
+        if pos >= limite:
+            break
+        comilla = _COMILLA.search(codigo, pos, fin_error_lexico(codigo, pos))
+        if comilla is not None:
+            candidatos.append(comilla.start())
+            break
+
+    # '#{' fuera de todo token: INTERPOLATION no encontró '}' y quedó como comentario
+    pos = codigo.find('#{', 0, limite)
+    while pos != -1:
+        k = bisect_right(tokens, pos, key=_lexpos) - 1
+        if k < 0 or fines[k] <= pos:
+            candidatos.append(pos)
+            break
+        pos = codigo.find('#{', fines[k], limite)
+
+    return min(candidatos) if candidatos else None
+
+
+def relexer(buffer, offset, eliminado, insertado):
+    """BufferTokens del texto editado, re-tokenizando sólo la zona afectada.
+
+    La edición reemplaza `eliminado` caracteres desde `offset` por `insertado`.
+    Los tokens viejos posteriores a la edición se reutilizan desplazando su
+    lexpos en el lugar, así que `buffer` no debe usarse después de esta llamada."""
+    viejo = buffer.codigo
+    nuevo = viejo[:offset] + insertado + viejo[offset + eliminado:]
+    if buffer.rechazado:
+        # el lexer se detuvo en el máximo de errores: lo posterior no existe
+        return tokenizar(nuevo, buffer.lexer)
+    delta = len(insertado) - eliminado
+    tokens, fines, errores = buffer.tokens, buffer.fines, buffer.errores
+
+    # Los patrones de una sola línea (números, identificadores, operadores)
+    # pueden haber mirado más allá del fin de su token al descartar otras
+    # alternativas (p. ej. FLOAT o COMPLEX tras un INTEGER), pero nunca
+    # pasan de un salto de línea: se reanuda desde el inicio de la línea.
+    limite = viejo.rfind('\n', 0, offset) + 1
+    if (not SENSIBLES_INSERTADO.isdisjoint(insertado)
+            or not SENSIBLES_ELIMINADO.isdisjoint(viejo[offset:offset + eliminado])):
+        apertura = _primera_apertura_fallida(buffer, limite)
+        if apertura is not None:
+            # :"... empieza un carácter antes de la comilla
+            limite = min(limite, max(apertura - 1, 0))
+
+    # los tokens que terminan antes de `limite` no pudieron cambiar
+    # (fin < limite: el carácter que cortó su match tampoco cambió)
+    i0 = bisect_left(fines, limite)
+    desde = fines[i0 - 1] if i0 else 0
+
+    lx = buffer.lexer
+    errores_previos = lx.errores_lexicos
+    nuevos_errores = []
+    lx.errores_lexicos = []
+    lx.posiciones_error = nuevos_errores
+    lx.begin('INITIAL')
+    lx.input(nuevo)
+    lx.lexpos = desde
+
+    nuevos, nuevos_fines = [], []
+    fin_edicion = offset + len(insertado)
+    n = len(tokens)
+    j = n
+    try:
+        for tok in iter(lx.token, None):
+            pos = tok.lexpos
+            if pos >= fin_edicion:
+                # ¿coincide con un token viejo de la parte no editada?
+                pos_vieja = pos - delta
+                k = bisect_left(tokens, pos_vieja, lo=i0, key=_lexpos)
+                if k < n:
+                    viejo_tok = tokens[k]
+                    if (viejo_tok.lexpos == pos_vieja and viejo_tok.type == tok.type
+                            and viejo_tok.value == tok.value
+                            and fines[k] - pos_vieja == lx.lexpos - pos):
+                        j = k
+                        break
+            nuevos.append(tok)
+            nuevos_fines.append(lx.lexpos)
+    finally:
+        lx.posiciones_error = None
+        lx.errores_lexicos = errores_previos
+
+    resultado = BufferTokens(nuevo, lx, llenar=False)
+    e_ini = bisect_left(errores, desde)
+    if j < n:
+        e_fin = bisect_left(errores, tokens[j].lexpos)
+        sufijo_errores = [pos + delta for pos in errores[e_fin:]]
+        if delta:
+            for tok in tokens[j:]:
+                tok.lexpos += delta
+            sufijo_fines = [fin + delta for fin in fines[j:]]
+        else:
+            sufijo_fines = fines[j:]
+    else:
+        sufijo_errores, sufijo_fines = [], []
+
+    resultado.tokens = tokens[:i0] + nuevos + tokens[j:]
+    resultado.fines = fines[:i0] + nuevos_fines + sufijo_fines
+    resultado.errores = errores[:e_ini] + nuevos_errores + sufijo_errores
+    resultado.retokenizados = len(nuevos)
+    if entrada_rechazada(resultado.errores, lx):
+        # con el máximo de errores el lexer completo se detiene en el error
+        # que llega al límite; se repite la pasada para cortar en el mismo lugar
+        return tokenizar(nuevo, lx)
+    # el anterior ya no sirve para reparsear: se corta la cadena de buffers
+    buffer.origen = None
+    resultado.origen = (buffer, i0, i0 + len(nuevos), delta)
+    return resultado
+
+
+def retokenizar(buffer, codigo):
+    """Tokeniza `codigo` reutilizando `buffer` (el de la versión anterior) si lo hay."""
+    if buffer is None:
+        return tokenizar(codigo)
+    if buffer.codigo == codigo:
+        return buffer
+    offset, eliminado, insertado = calcular_edicion(buffer.codigo, codigo)
+    return relexer(buffer, offset, eliminado, insertado)
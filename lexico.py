@@ -1,8 +1,12 @@
 import re
 import ply.lex as lex
 import os
-from datetime import datetime
-from zoneinfo import ZoneInfo
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
 
 
 #cambio hecho por elias rubio git emrubio_85...
@@ -196,7 +200,7 @@ def t_comment_single(t):
     pass 
 
 def t_STR(t):
-    r'"([^"\\]|\\.|\#\{[^}]*\})*"|\'([^\'\\]|\\.)*\'|%[Qq](\{[^}]*\}|\([^)]*\)|\[[^\]]*\]|<[^>]*>)'
+    r'"([^"\\]|\\.|\#\{[^}]*\})*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\'|%[Qq](\{[^}]*\}|\([^)]*\)|\[[^\]]*\]|<[^>]*>)'
     return t
 
 # Heredoc básico: <<LABEL, <<-LABEL, <<~LABEL
@@ -231,25 +235,23 @@ def t_HEREDOC(t):
         t.value = data[content_start:content_end]
         t.type = 'STR'
         t.lexer.lexpos = m_end.end()
-        # sumar líneas consumidas (contenido + línea del terminador)
-        t.lexer.lineno += t.value.count('\n') + 1
         return t
     else:
         # sin terminador: consumir hasta el final
         t.value = data[content_start:]
         t.type = 'STR'
         t.lexer.lexpos = len(data)
-        t.lexer.lineno += t.value.count('\n')
         return t
 
 # Símbolos :ident o :"string con espacios"
 def t_SYMBOL(t):
-    r':([A-Za-z_]\w*|"(?:[^"\\]|\\.)*")'
+    r':([A-Za-z_]\w*|"[^"\\]*(?:\\.[^"\\]*)*")'
     return t
 
 # Expresiones regulares /.../flags  (colocar antes de DIVIDE)
+# (bucle desenrollado: el motor de re no guarda estado por cada carácter recorrido)
 def t_REGEXP(t):
-    r'/([^/\\]|\\.)*/[imxounse]*'
+    r'/[^/\\]*(?:\\.[^/\\]*)*/[imxounse]*'
     return t
 
 
@@ -302,6 +304,9 @@ def t_FLOAT(t):
 
 def t_INTEGER(t):
     r'\d+'
+    # el valor ya no es el texto (`007` vale 7): el largo en el código se
+    # guarda aparte (ver largo_token)
+    t.largo = t.lexer.lexpos - t.lexpos
     t.value = int(t.value)
     return t
 
@@ -326,9 +331,9 @@ def t_MLC_any(t):
     r'.'
     pass
 
-def t_MLC_newline(t):
-    r'\n+'
-    t.lexer.lineno += len(t.value)
+# Los saltos de línea se descartan sin llamar a una función: las líneas y
+# columnas se calculan después con IndiceLineas a partir de lexpos.
+t_MLC_ignore_newline = r'\n+'
 
     #Salto de línea
 
@@ -341,23 +346,476 @@ def t_MLC_newline(t):
 
 
 
-# Define a rule so we can track line numbers
-def t_newline(t):
-    r'\n+'
-    t.lexer.lineno += len(t.value)
+# Salto de línea (ver IndiceLineas para el número de línea)
+t_ignore_newline = r'\n+'
 
 # A string containing ignored characters (spaces and tabs)
 t_ignore  = ' \t'
 
+# Máximo de errores léxicos (rachas) por entrada: al llegar a él se deja de
+# tokenizar y la entrada queda rechazada. Se configura por lexer con el
+# atributo `max_errores_lexicos` (None = sin límite).
+MAX_ERRORES_LEXICOS = 100
+
+# Largo máximo del texto de una racha que se muestra en el mensaje
+_MAX_TEXTO_RACHA = 20
+
+
+def mensaje_error_lexico(texto, linea, columna):
+    """Mensaje de un error léxico; `texto` es la racha de caracteres inválidos."""
+    if len(texto) == 1:
+        return f"Componente léxico {texto} no existe en Ruby en la línea {linea}, columna {columna}"
+    muestra = texto if len(texto) <= _MAX_TEXTO_RACHA else texto[:_MAX_TEXTO_RACHA] + '...'
+    return (f"Componentes léxicos {muestra} no existen en Ruby en la línea {linea}, "
+            f"columnas {columna}-{columna + len(texto) - 1}")
+
+
+def mensaje_rechazo(maximo):
+    return f"Análisis léxico detenido: se alcanzó el máximo de {maximo} errores léxicos, el archivo se rechaza"
+
+
+def limite_errores(lx):
+    """Máximo de errores léxicos del lexer `lx`, o None si no tiene límite."""
+    return getattr(lx, 'max_errores_lexicos', MAX_ERRORES_LEXICOS)
+
+
+def fin_error_lexico(texto, pos):
+    """Fin de la racha de caracteres inválidos que empieza en `pos`: avanza
+    mientras ninguna regla del estado INITIAL (ni t_ignore) pueda empezar en
+    ese carácter, es decir, exactamente por donde el lexer volvería a llamar
+    a t_error carácter a carácter. Nunca cruza un salto de línea."""
+    reglas = _REGLAS_INITIAL if _REGLAS_INITIAL is not None else _reglas_initial()
+    fin = pos + 1
+    n = len(texto)
+    while fin < n and texto[fin] not in t_ignore:
+        for regla in reglas:
+            if regla.match(texto, fin):
+                return fin
+        fin += 1
+    return fin
+
+
 # Error handling rule
 def t_error(t):
-    mensaje_error =f"Componente léxico {t.value[0]} no existe en Ruby en la línea {t.lexer.lineno}"
+    lx = t.lexer
+    datos = lx.lexdata
+    inicio = t.lexpos
+    # una racha de caracteres inválidos da un solo error, con su extensión
+    fin = fin_error_lexico(datos, inicio)
+    # BufferTokens y el lexer en flujo registran el offset de cada error
+    posiciones = getattr(lx, 'posiciones_error', None)
+    if posiciones is not None:
+        posiciones.append(inicio)
+    # en flujo el mensaje (y el límite de errores) se resuelve después, con la
+    # posición en el archivo completo
+    if getattr(lx, 'diferir_errores', False):
+        lx.skip(fin - inicio)
+        return
+    linea, columna = indice_de(lx).posicion(inicio)
+    mensaje_error = mensaje_error_lexico(datos[inicio:fin], linea, columna)
     print(mensaje_error)
-    errores_lexicos.append(mensaje_error)
-    t.lexer.skip(1)
+    # cada lexer (o clon de una sesión) lleva su propia lista de errores
+    lx.errores_lexicos.append(mensaje_error)
+    # el límite se cuenta sobre los errores registrados de esta entrada
+    if posiciones is not None and entrada_rechazada(posiciones, lx):
+        mensaje_error = mensaje_rechazo(limite_errores(lx))
+        print(mensaje_error)
+        lx.errores_lexicos.append(mensaje_error)
+        lx.lexpos = len(datos)
+    else:
+        lx.skip(fin - inicio)
 
 def t_MLC_error(t):
     t.lexer.skip(1)
 
-lexer = lex.lex()
 
+# ----------------------------------------------------------
+# Construcción del lexer: se hace al primer uso (lexico.lexer u
+# obtener_lexer()), no al importar. PLY valida las reglas leyendo
+# este archivo y compilando cada regex por separado; eso sólo hace
+# falta cuando las reglas cambian. Tras validarlas se guardan las
+# tablas en un lextab cuyo nombre lleva la firma de las reglas, y
+# mientras exista se carga desde ahí (optimize=1, sin validar).
+# Con ANALIZADOR_DEPURAR=1 en el entorno se valida siempre.
+# ----------------------------------------------------------
+DEPURAR = os.environ.get('ANALIZADOR_DEPURAR') == '1'
+DIRECTORIO_TABLAS = os.path.dirname(os.path.abspath(__file__))
+
+_lexer = None
+# patrones maestros del estado INITIAL, para delimitar las rachas de errores
+_REGLAS_INITIAL = None
+
+
+def firma_lexer():
+    """Firma de la especificación del lexer: tokens, estados, palabras
+    reservadas y el patrón de cada regla t_*, en orden de definición."""
+    partes = [repr(tokens), repr(states), repr(sorted(reserved.items())), repr(t_ignore)]
+    for nombre, valor in vars(sys.modules[__name__]).items():
+        if nombre.startswith('t_'):
+            patron = valor.__doc__ if callable(valor) else valor
+            partes.append(f'{nombre}={patron!r}')
+    return format(zlib.crc32('\n'.join(partes).encode('utf-8')), '08x')
+
+
+def construir_lexer(depurar=DEPURAR):
+    """Lexer de PLY con las reglas de este módulo (uno nuevo en cada llamada)."""
+    modulo = sys.modules[__name__]
+    if depurar:
+        return lex.lex(module=modulo)
+    lextab = 'lextab_' + firma_lexer()
+    if os.path.exists(os.path.join(DIRECTORIO_TABLAS, lextab + '.py')):
+        return lex.lex(module=modulo, optimize=True, lextab=lextab)
+    # reglas nuevas: construir validando y guardar las tablas para la próxima
+    lx = lex.lex(module=modulo)
+    try:
+        lx.writetab(lextab, DIRECTORIO_TABLAS)
+    except OSError:
+        return lx  # directorio de sólo lectura: se valida en cada arranque
+    for viejo in os.listdir(DIRECTORIO_TABLAS):
+        if viejo.startswith('lextab_') and viejo.endswith('.py') and viejo != lextab + '.py':
+            try:
+                os.remove(os.path.join(DIRECTORIO_TABLAS, viejo))
+            except OSError:
+                pass
+    return lx
+
+
+def obtener_lexer():
+    """El lexer del módulo (lexico.lexer), construido la primera vez que se pide."""
+    global _lexer
+    if _lexer is None:
+        lx = construir_lexer()
+        lx.errores_lexicos = errores_lexicos
+        lx.max_errores_lexicos = MAX_ERRORES_LEXICOS
+        _lexer = lx
+    return _lexer
+
+
+def _reglas_initial():
+    global _REGLAS_INITIAL
+    _REGLAS_INITIAL = [regla for regla, _ in obtener_lexer().lexstatere['INITIAL']]
+    return _REGLAS_INITIAL
+
+
+def __getattr__(nombre):
+    # `lexico.lexer` se resuelve al primer acceso
+    if nombre == 'lexer':
+        return obtener_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+# ----------------------------------------------------------
+# Índice de líneas: offsets de inicio de cada línea, calculados una
+# sola vez por entrada. Los tokens sólo guardan lexpos; la línea y la
+# columna se resuelven con bisect cuando un mensaje las necesita.
+# ----------------------------------------------------------
+class IndiceLineas:
+    """Convierte offsets (lexpos) en (línea, columna), ambas desde 1."""
+
+    def __init__(self, texto):
+        self.texto = texto
+        # inicios[i] = offset donde empieza la línea i+1; split y accumulate
+        # recorren el texto en C, sin un paso de Python por carácter
+        largos = map(len, texto.split('\n'))
+        self.inicios = [0]
+        self.inicios.extend(accumulate(map((1).__add__, largos)))
+        self.inicios.pop()
+
+    def __len__(self):
+        return len(self.inicios)
+
+    def linea(self, lexpos):
+        return bisect_right(self.inicios, lexpos)
+
+    def columna(self, lexpos):
+        return lexpos - self.inicios[self.linea(lexpos) - 1] + 1
+
+    def posicion(self, lexpos):
+        linea = bisect_right(self.inicios, lexpos)
+        return linea, lexpos - self.inicios[linea - 1] + 1
+
+    def fragmento(self, desde, hasta):
+        """Texto entre dos offsets."""
+        return self.texto[desde:hasta]
+
+
+def indice_de(lx):
+    """IndiceLineas de la entrada actual del lexer `lx` (se construye al primer uso)."""
+    indice = getattr(lx, 'indice_lineas', None)
+    if indice is None or indice.texto is not lx.lexdata:
+        indice = IndiceLineas(lx.lexdata)
+        lx.indice_lineas = indice
+    return indice
+
+
+def posicion_token(lx, tok):
+    """(línea, columna) de un token. Los tokens del lexer en flujo ya traen la
+    posición anotada (no hay índice del archivo completo); el resto la resuelve
+    con el índice de la entrada actual de `lx`."""
+    columna = getattr(tok, 'columna', None)
+    if columna is not None:
+        return tok.lineno, columna
+    return indice_de(lx).posicion(tok.lexpos)
+
+
+def largo_token(tok):
+    """Largo del token en el código. Es el de su valor, salvo en los INTEGER:
+    su valor ya está convertido y el lexer anota el largo del texto."""
+    largo = getattr(tok, 'largo', None)
+    if largo is not None:
+        return largo
+    return len(str(tok.value))
+
+
+def entrada_rechazada(errores, lx):
+    """True si los `errores` (offsets) de una entrada llegaron al máximo de `lx`."""
+    maximo = limite_errores(lx)
+    return maximo is not None and len(errores) >= maximo
+
+
+def mensajes_error_lexico(codigo, indice, errores, lx):
+    """Mensajes de los errores léxicos (offsets de inicio de cada racha) de
+    `codigo`, más el de rechazo si se llegó al máximo; los mismos que t_error."""
+    mensajes = [mensaje_error_lexico(codigo[pos:fin_error_lexico(codigo, pos)], *indice.posicion(pos))
+                for pos in errores]
+    if entrada_rechazada(errores, lx):
+        mensajes.append(mensaje_rechazo(limite_errores(lx)))
+    return mensajes
+
+
+# ----------------------------------------------------------
+# Buffer de tokens: el análisis léxico se hace una sola vez y
+# el parser consume los mismos tokens mediante tokenfunc.
+# ----------------------------------------------------------
+class BufferTokens:
+    """Guarda los tokens de una entrada tras una única pasada del lexer.
+
+    El parser los lee con `parser.parse(lexer=buf.lexer, tokenfunc=buf.tokenfunc())`
+    y los reportes obtienen de aquí el conteo y los tipos de token.
+    `tok.lineno` ya no se mantiene: usar `posicion(tok)`.
+
+    Además del token se guarda dónde termina (`fines`, el lexpos del lexer al
+    devolverlo) y el offset de cada error léxico; con eso el módulo incremental
+    puede re-tokenizar sólo la zona editada.
+
+    `origen` es None salvo en los buffers de incremental.relexer:
+    (buffer anterior, i0, i1, delta), con tokens[:i0] iguales a los del
+    anterior y tokens[i1:] los del anterior desplazados `delta` caracteres.
+    Es lo que usa el reparseo incremental (reparseo.py)."""
+
+    def __init__(self, codigo, lexer_base=None, llenar=True):
+        self.codigo = codigo
+        self.lexer = lexer_base if lexer_base is not None else obtener_lexer()
+        self.tokens = []
+        self.fines = []
+        self.errores = []
+        self.origen = None
+        self._indice = None
+        if llenar:
+            self._llenar()
+
+    def _llenar(self):
+        lx = self.lexer
+        lx.lineno = 1
+        lx.begin('INITIAL')
+        lx.input(self.codigo)
+        lx.posiciones_error = self.errores
+        tokens, fines = self.tokens, self.fines
+        try:
+            for tok in iter(lx.token, None):
+                tokens.append(tok)
+                fines.append(lx.lexpos)
+        finally:
+            lx.posiciones_error = None
+
+    def mensajes_error(self):
+        """Mensajes de error léxico, con la posición resuelta sobre el texto actual."""
+        return mensajes_error_lexico(self.codigo, self.indice, self.errores, self.lexer)
+
+    @property
+    def rechazado(self):
+        """True si se llegó al máximo de errores léxicos y se dejó de tokenizar."""
+        return entrada_rechazada(self.errores, self.lexer)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    @property
+    def indice(self):
+        if self._indice is None:
+            lx = self.lexer
+            self._indice = indice_de(lx) if lx.lexdata is self.codigo else IndiceLineas(self.codigo)
+        return self._indice
+
+    def posicion(self, tok):
+        """(línea, columna) del token."""
+        return self.indice.posicion(tok.lexpos)
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __getitem__(self, indice):
+        return self.tokens[indice]
+
+    def tokenfunc(self):
+        """Devuelve una función sin argumentos que entrega el siguiente token
+        (o None al final), tal como espera el hook tokenfunc de PLY.
+        Cada llamada crea un cursor nuevo, así el buffer puede parsearse varias veces."""
+        siguiente = iter(self.tokens).__next__
+
+        def token():
+            try:
+                return siguiente()
+            except StopIteration:
+                return None
+        return token
+
+    def conteo_por_tipo(self):
+        """Cantidad de tokens por tipo, en orden de primera aparición."""
+        conteo = {}
+        for tok in self.tokens:
+            conteo[tok.type] = conteo.get(tok.type, 0) + 1
+        return conteo
+
+    def compactar(self):
+        """TablaTokens con los mismos tokens, para soltar los LexToken."""
+        tabla = TablaTokens(self.codigo, self.lexer, llenar=False)
+        for tok, fin in zip(self.tokens, self.fines):
+            tabla._agregar(tok, fin)
+        tabla.errores.extend(self.errores)
+        tabla._indice = self._indice
+        return tabla
+
+
+def tokenizar(codigo, lexer_base=None):
+    """Ejecuta el análisis léxico una sola vez y devuelve el BufferTokens resultante."""
+    return BufferTokens(codigo, lexer_base)
+
+
+# ----------------------------------------------------------
+# Tabla compacta de tokens: en lugar de un LexToken por token
+# se guardan arreglos paralelos (tipo, inicio, fin) y el valor
+# se recorta del código sólo cuando se pide.
+# ----------------------------------------------------------
+TIPOS = tokens
+ID_TIPO = {tipo: i for i, tipo in enumerate(TIPOS)}
+_ID_INTEGER = ID_TIPO['INTEGER']
+_ID_STR = ID_TIPO['STR']
+
+
+class TablaTokens:
+    """Tokens de una entrada guardados en arreglos: `tipos` (array('B'), índice
+    en TIPOS), `inicios` y `fines` (array('I'), offsets en el código). Ocupa
+    9 bytes por token en lugar de un LexToken con su diccionario.
+
+    El valor se obtiene recortando el código; sólo los que no salen así (el
+    cuerpo de un heredoc) se guardan aparte. INTEGER se convierte con int()
+    al leerlo, igual que en t_INTEGER. Para el parser, `tokenfunc()` arma un
+    LexToken por token a medida que se piden, sin guardarlos."""
+
+    def __init__(self, codigo, lexer_base=None, llenar=True):
+        self.codigo = codigo
+        self.lexer = lexer_base if lexer_base is not None else obtener_lexer()
+        self.tipos = array('B')
+        self.inicios = array('I')
+        self.fines = array('I')
+        self.errores = array('I')
+        self.valores_especiales = {}
+        self._indice = None
+        if llenar:
+            self._llenar()
+
+    def _agregar(self, tok, fin):
+        if tok.type == 'STR' and self.codigo.startswith('<<', tok.lexpos):
+            self.valores_especiales[len(self.tipos)] = tok.value
+        self.tipos.append(ID_TIPO[tok.type])
+        self.inicios.append(tok.lexpos)
+        self.fines.append(fin)
+
+    def _llenar(self):
+        lx = self.lexer
+        lx.lineno = 1
+        lx.begin('INITIAL')
+        lx.input(self.codigo)
+        errores = []
+        lx.posiciones_error = errores
+        agregar = self._agregar
+        try:
+            # cada LexToken se suelta apenas se guarda su fila
+            for tok in iter(lx.token, None):
+                agregar(tok, lx.lexpos)
+        finally:
+            lx.posiciones_error = None
+        self.errores.extend(errores)
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def tipo(self, i):
+        return TIPOS[self.tipos[i]]
+
+    def valor(self, i):
+        especial = self.valores_especiales.get(i)
+        if especial is not None:
+            return especial
+        texto = self.codigo[self.inicios[i]:self.fines[i]]
+        return int(texto) if self.tipos[i] == _ID_INTEGER else texto
+
+    def token(self, i):
+        """LexToken equivalente al que produjo el lexer para el token i."""
+        tok = lex.LexToken()
+        tok.type = TIPOS[self.tipos[i]]
+        tok.value = self.valor(i)
+        tok.lineno = 1
+        tok.lexpos = self.inicios[i]
+        if self.tipos[i] == _ID_INTEGER:
+            tok.largo = self.fines[i] - self.inicios[i]
+        return tok
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.token(k) for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self.token(i)
+
+    def __iter__(self):
+        return map(self.token, range(len(self)))
+
+    def tokenfunc(self):
+        """Igual que BufferTokens.tokenfunc, creando cada LexToken al pedirlo."""
+        siguiente = iter(self).__next__
+
+        def token():
+            try:
+                return siguiente()
+            except StopIteration:
+                return None
+        return token
+
+    @property
+    def indice(self):
+        if self._indice is None:
+            lx = self.lexer
+            self._indice = indice_de(lx) if lx.lexdata is self.codigo else IndiceLineas(self.codigo)
+        return self._indice
+
+    def posicion(self, i):
+        """(línea, columna) del token i."""
+        return self.indice.posicion(self.inicios[i])
+
+    def mensajes_error(self):
+        return mensajes_error_lexico(self.codigo, self.indice, self.errores, self.lexer)
+
+    @property
+    def rechazado(self):
+        return entrada_rechazada(self.errores, self.lexer)
+
+    def conteo_por_tipo(self):
+        """Cantidad de tokens por tipo, en orden de primera aparición."""
+        return {TIPOS[i]: n for i, n in Counter(self.tipos).items()}
+
+
+def tabla_tokens(codigo, lexer_base=None):
+    """Como tokenizar(), pero devuelve una TablaTokens (sin guardar LexToken)."""
+    return TablaTokens(codigo, lexer_base)
@@ -0,0 +1,369 @@
+"""Análisis por lotes desde la consola.
+
+Recibe archivos, carpetas (se recorren buscando *.rb), patrones glob y
+listas de archivos, los analiza en paralelo con un pool de procesos y junta
+los diagnósticos de todos en un solo informe:
+
+    python main.py algoritmos/ otros/*.rb --jobs 4
+    python main.py --lista entregas.txt --etapa sintactico --json informe.json
+    python main.py algoritmos/ --cache
+    python main.py algoritmos/ --sin-regla lecturas_sin_asignar --perfil-reglas
+
+El código de salida es 0 si ningún archivo tiene errores (las advertencias
+no cuentan), 1 si alguno tiene errores léxicos, sintácticos o semánticos, fue
+rechazado o no se pudo analizar (o alguna entrada no corresponde a ningún
+archivo), y 2 si no hay archivos que analizar.
+
+Cada proceso del pool crea una sola SesionAnalisis y la reutiliza para todos
+sus archivos; lo que vuelve al proceso principal es un dict con los mensajes
+(sin AST), así que pasar resultados entre procesos cuesta poco. Los archivos
+se reparten de mayor a menor tamaño, de a varios por tarea, para que ningún
+proceso se quede con los más grandes al final.
+
+Con --cache los resultados se guardan en disco (cache.py) y un archivo que
+no cambió desde la corrida anterior, ni cambió el analizador, no se vuelve
+a analizar; los procesos comparten el mismo directorio.
+
+--sin-regla apaga una regla de la pasada semántica (reglas.py) en todas las
+sesiones, y --perfil-reglas agrega al informe cuántas veces corrió cada
+regla y cuánto tardó, sumando lo de todos los procesos.
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import cache
+import main
+import reglas
+
+# Extensión que se busca al recorrer carpetas
+EXTENSION = '.rb'
+
+# Estados de un archivo en el informe
+ESTADO_OK = 'ok'
+ESTADO_ERRORES = 'errores'
+ESTADO_RECHAZADO = 'rechazado'
+ESTADO_FALLO = 'fallo'
+
+# Tipos de diagnóstico que cuentan como error (las advertencias no)
+TIPOS_ERROR = ('lexicos', 'sintacticos', 'semanticos')
+
+# Archivos por tarea del pool, como máximo: con pocos archivos por proceso
+# conviene repartir de a uno; con muchos, agruparlos ahorra viajes al pool
+MAX_POR_TAREA = 16
+
+
+# -------------------------------------------------
+# Entradas
+# -------------------------------------------------
+def _es_patron(entrada):
+    return any(c in entrada for c in '*?[')
+
+
+def _archivos_de_carpeta(carpeta):
+    encontrados = []
+    for raiz, carpetas, archivos in os.walk(carpeta):
+        carpetas.sort()
+        for nombre in sorted(archivos):
+            if nombre.endswith(EXTENSION):
+                encontrados.append(os.path.join(raiz, nombre))
+    return encontrados
+
+
+def _leer_lista(ruta):
+    """Rutas de un archivo de lista (una por línea; '-' lee la entrada
+    estándar). Se ignoran las líneas vacías y las que empiezan con '#'."""
+    if ruta == '-':
+        lineas = sys.stdin.read().splitlines()
+    else:
+        with open(ruta, encoding='utf-8') as f:
+            lineas = f.read().splitlines()
+    return [l.strip() for l in lineas if l.strip() and not l.lstrip().startswith('#')]
+
+
+def expandir_entradas(entradas, listas=()):
+    """Lista de archivos a analizar, sin repetidos y en el orden en que
+    aparecen. Cada entrada puede ser un archivo, una carpeta (todos sus
+    *.rb, recursivamente), un patrón glob (admite **) o '@lista', que
+    equivale a pasar `lista` en `listas`. Devuelve (archivos, faltantes):
+    las entradas que no corresponden a ningún archivo van en faltantes."""
+    pendientes = list(entradas)
+    for lista in listas:
+        pendientes.extend(_leer_lista(lista))
+
+    archivos = []
+    vistos = set()
+    faltantes = []
+    while pendientes:
+        entrada = pendientes.pop(0)
+        if entrada.startswith('@') and len(entrada) > 1:
+            pendientes[:0] = _leer_lista(entrada[1:])
+            continue
+        if os.path.isdir(entrada):
+            encontrados = _archivos_de_carpeta(entrada)
+        elif os.path.isfile(entrada):
+            encontrados = [entrada]
+        elif _es_patron(entrada):
+            encontrados = []
+            for ruta in sorted(glob.glob(entrada, recursive=True)):
+                if os.path.isdir(ruta):
+                    encontrados.extend(_archivos_de_carpeta(ruta))
+                elif os.path.isfile(ruta):
+                    encontrados.append(ruta)
+        else:
+            encontrados = []
+        if not encontrados:
+            faltantes.append(entrada)
+        for ruta in encontrados:
+            clave = os.path.normpath(ruta)
+            if clave not in vistos:
+                vistos.add(clave)
+                archivos.append(ruta)
+    return archivos, faltantes
+
+
+# -------------------------------------------------
+# Análisis de un archivo (en el proceso que toque)
+# -------------------------------------------------
+# Sesión del proceso: una por proceso, reutilizada entre archivos
+_sesion = None
+_etapa = main.ETAPA_COMPLETA
+
+
+def _nueva_sesion(directorio_cache, reglas_inactivas=()):
+    if directorio_cache is None:
+        return main.SesionAnalisis(reglas_inactivas=reglas_inactivas)
+    return main.SesionAnalisis(cache=cache.CacheResultados(directorio_cache), reglas_inactivas=reglas_inactivas)
+
+
+def _iniciar_proceso(etapa, directorio_cache=None, reglas_inactivas=()):
+    global _sesion, _etapa
+    _sesion = _nueva_sesion(directorio_cache, reglas_inactivas)
+    _etapa = etapa
+
+
+def analizar_archivo(ruta, sesion, etapa=main.ETAPA_COMPLETA):
+    """Analiza `ruta` con `sesion` y devuelve el resultado como dict:
+    ruta, estado (ESTADO_*), las listas de mensajes 'lexicos',
+    'sintacticos', 'semanticos' y 'advertencias', 'fallo' (el motivo si no
+    se pudo analizar), 'cache' (True si salió de la caché de la sesión),
+    'reglas' (las estadísticas de las reglas semánticas en este archivo,
+    como reglas.Reglas.como_dict; las de la sesión se ponen en cero) y
+    'segundos'. Lo que el análisis imprime se descarta: los mensajes ya
+    quedan en el resultado."""
+    inicio = time.perf_counter()
+    resultado = {'ruta': ruta, 'estado': ESTADO_OK, 'fallo': None}
+    sesion.reiniciar()
+    sesion.reglas.reiniciar()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if os.path.getsize(ruta) > main.UMBRAL_FLUJO:
+                sesion.parsear_archivo(ruta, etapa=etapa)
+            else:
+                with open(ruta, encoding='utf-8') as f:
+                    codigo = f.read()
+                sesion.analizar(codigo, etapa)
+    except Exception as e:  # un archivo que falla no corta el lote
+        resultado['estado'] = ESTADO_FALLO
+        resultado['fallo'] = f"{type(e).__name__}: {e}"
+
+    resultado['lexicos'] = list(sesion.errores_lexicos)
+    resultado['sintacticos'] = list(sesion.errores_sintacticos)
+    resultado['semanticos'] = list(sesion.errores_semanticos)
+    resultado['advertencias'] = list(sesion.advertencias_semanticas)
+    resultado['cache'] = sesion.desde_cache
+    resultado['reglas'] = sesion.reglas.como_dict()
+    if resultado['estado'] == ESTADO_OK:
+        if sesion.rechazado:
+            resultado['estado'] = ESTADO_RECHAZADO
+        elif any(resultado[tipo] for tipo in TIPOS_ERROR):
+            resultado['estado'] = ESTADO_ERRORES
+    resultado['segundos'] = time.perf_counter() - inicio
+    return resultado
+
+
+def _analizar_en_proceso(tarea):
+    indice, ruta = tarea
+    return indice, analizar_archivo(ruta, _sesion, _etapa)
+
+
+def _tamano(ruta):
+    try:
+        return os.path.getsize(ruta)
+    except OSError:
+        return 0
+
+
+def analizar_lote(archivos, trabajos=None, etapa=main.ETAPA_COMPLETA, directorio_cache=None, reglas_inactivas=()):
+    """Resultados de analizar_archivo para cada archivo, en el mismo orden.
+    `trabajos` es la cantidad de procesos (None: uno por CPU); con 1, o con
+    un solo archivo, se analiza en este proceso sin crear el pool. Con
+    `directorio_cache` las sesiones usan una caché de resultados en ese
+    directorio; las reglas semánticas de `reglas_inactivas` no corren."""
+    main._validar_etapa(etapa)
+    trabajos = trabajos or os.cpu_count() or 1
+    trabajos = min(trabajos, len(archivos)) or 1
+
+    if trabajos == 1:
+        sesion = _nueva_sesion(directorio_cache, reglas_inactivas)
+        return [analizar_archivo(ruta, sesion, etapa) for ruta in archivos]
+
+    # los más grandes primero: el último en terminar es uno chico
+    tareas = sorted(enumerate(archivos), key=lambda t: _tamano(t[1]), reverse=True)
+    por_tarea = max(1, min(MAX_POR_TAREA, len(tareas) // (trabajos * 4)))
+    # con fork los procesos heredan las tablas LALR ya cargadas
+    main.obtener_parser()
+    resultados = [None] * len(archivos)
+    with multiprocessing.Pool(trabajos, _iniciar_proceso, (etapa, directorio_cache, reglas_inactivas)) as pool:
+        for indice, resultado in pool.imap_unordered(_analizar_en_proceso, tareas, por_tarea):
+            resultados[indice] = resultado
+    return resultados
+
+
+# -------------------------------------------------
+# Informe
+# -------------------------------------------------
+def totales(resultados):
+    """Cantidad de archivos por estado y de mensajes por tipo."""
+    cuenta = {'archivos': len(resultados)}
+    for estado in (ESTADO_OK, ESTADO_ERRORES, ESTADO_RECHAZADO, ESTADO_FALLO):
+        cuenta[estado] = sum(1 for r in resultados if r['estado'] == estado)
+    for tipo in TIPOS_ERROR + ('advertencias',):
+        cuenta[tipo] = sum(len(r[tipo]) for r in resultados)
+    cuenta['cache'] = sum(1 for r in resultados if r.get('cache'))
+    return cuenta
+
+
+def hay_errores(resultados):
+    return any(r['estado'] != ESTADO_OK for r in resultados)
+
+
+def informe_texto(resultados, segundos=None, trabajos=None, solo_resumen=False):
+    """Informe legible: los mensajes de cada archivo con diagnósticos y una
+    línea final con los totales."""
+    lineas = []
+    if not solo_resumen:
+        for r in resultados:
+            mensajes = r['lexicos'] + r['sintacticos'] + r['semanticos'] + r['advertencias']
+            if r['estado'] == ESTADO_OK and not mensajes:
+                continue
+            lineas.append(f"{r['ruta']}: {r['estado']}")
+            if r['fallo']:
+                lineas.append(f"  No se pudo analizar: {r['fallo']}")
+            if r['estado'] == ESTADO_RECHAZADO:
+                lineas.append("  Rechazado: se alcanzó el máximo de errores léxicos o de sintaxis")
+            for mensaje in mensajes:
+                lineas.append(f"  {mensaje}")
+
+    cuenta = totales(resultados)
+    resumen = (f"{cuenta['archivos']} archivos, {cuenta['archivos'] - cuenta[ESTADO_OK]} con errores "
+               f"({cuenta[ESTADO_RECHAZADO]} rechazados, {cuenta[ESTADO_FALLO]} sin analizar): "
+               f"{cuenta['lexicos']} léxicos, {cuenta['sintacticos']} sintácticos, "
+               f"{cuenta['semanticos']} semánticos, {cuenta['advertencias']} advertencias")
+    if cuenta['cache']:
+        resumen += f" ({cuenta['cache']} desde la caché)"
+    if segundos is not None:
+        resumen += f" en {segundos:.2f} s"
+        if trabajos:
+            resumen += f" con {trabajos} proceso{'s' if trabajos > 1 else ''}"
+    if lineas:
+        lineas.append('')
+    lineas.append(resumen)
+    return '\n'.join(lineas)
+
+
+def perfil_reglas(resultados, reglas_inactivas=()):
+    """reglas.Reglas con las estadísticas de todos los resultados sumadas."""
+    perfil = reglas.Reglas(reglas_inactivas)
+    for r in resultados:
+        if r.get('reglas'):
+            perfil.acumular(r['reglas'])
+    return perfil
+
+
+def guardar_json(resultados, ruta, segundos=None, trabajos=None, etapa=None):
+    datos = {
+        'etapa': etapa,
+        'procesos': trabajos,
+        'segundos': segundos,
+        'totales': totales(resultados),
+        'archivos': resultados,
+    }
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+
+
+# -------------------------------------------------
+# Consola
+# -------------------------------------------------
+def _trabajos(valor):
+    n = int(valor)
+    if n < 1:
+        raise argparse.ArgumentTypeError("debe ser 1 o más")
+    return n
+
+
+def construir_argumentos():
+    argumentos = argparse.ArgumentParser(
+        description='Analiza archivos Ruby en paralelo y junta los diagnósticos en un informe.')
+    argumentos.add_argument('entradas', nargs='*', metavar='ENTRADA',
+                            help='archivo, carpeta (se buscan *.rb), patrón glob o @lista')
+    argumentos.add_argument('--lista', action='append', default=[], metavar='ARCHIVO',
+                            help="archivo con una ruta por línea ('-' para la entrada estándar)")
+    argumentos.add_argument('-j', '--jobs', type=_trabajos, default=None, metavar='N',
+                            help='procesos en paralelo (por defecto, uno por CPU)')
+    argumentos.add_argument('--etapa', choices=main.ETAPAS, default=main.ETAPA_COMPLETA,
+                            help='hasta qué etapa analizar')
+    argumentos.add_argument('--json', metavar='RUTA', help='guardar además el informe en JSON')
+    argumentos.add_argument('--resumen', action='store_true', help='mostrar sólo los totales')
+    argumentos.add_argument('--cache', nargs='?', const=cache.DIRECTORIO, default=None, metavar='DIR',
+                            help='reutilizar los resultados de archivos sin cambios, guardados en DIR '
+                                 '(por defecto $ANALIZADOR_CACHE o .cache junto al analizador)')
+    argumentos.add_argument('--sin-regla', action='append', default=[], choices=list(reglas.CATALOGO),
+                            metavar='REGLA', help='no correr esta regla semántica (se puede repetir; opciones: '
+                                                  f"{', '.join(reglas.CATALOGO)})")
+    argumentos.add_argument('--perfil-reglas', action='store_true',
+                            help='mostrar cuántas veces corrió cada regla semántica y cuánto tardó')
+    return argumentos
+
+
+def principal(argv=None):
+    """Punto de entrada de la consola; devuelve el código de salida."""
+    argumentos = construir_argumentos()
+    args = argumentos.parse_args(argv)
+    if not args.entradas and not args.lista:
+        argumentos.error('indique al menos un archivo, carpeta, patrón o --lista')
+
+    try:
+        archivos, faltantes = expandir_entradas(args.entradas, args.lista)
+    except OSError as e:
+        print(f"[ERROR] No se pudo leer la lista: {e}", file=sys.stderr)
+        return 2
+    for entrada in faltantes:
+        print(f"[ERROR] No se encontraron archivos para: {entrada}", file=sys.stderr)
+    if not archivos:
+        print("[ERROR] No hay archivos que analizar", file=sys.stderr)
+        return 2
+
+    trabajos = min(args.jobs or os.cpu_count() or 1, len(archivos))
+    inicio = time.perf_counter()
+    resultados = analizar_lote(archivos, trabajos, args.etapa, args.cache, args.sin_regla)
+    segundos = time.perf_counter() - inicio
+
+    print(informe_texto(resultados, segundos, trabajos, args.resumen))
+    if args.perfil_reglas:
+        print()
+        print(perfil_reglas(resultados, args.sin_regla).tabla())
+    if args.json:
+        guardar_json(resultados, args.json, segundos, trabajos, args.etapa)
+    return 1 if hay_errores(resultados) or faltantes else 0
+
+
+if __name__ == '__main__':
+    sys.exit(principal())
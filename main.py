@@ -1,12 +1,61 @@
 import ply.yacc as yacc
-from lexico import tokens
+import lexico
+import incremental
+import flujo
+import nodos
+import semantica
+import recuperacion
+import reparseo
+import cache
+import reglas
+import simbolos
+from lexico import tokenizar
+import copy
 import os
+import sys
 import datetime
 
+# Primer parámetro de un def sin paréntesis (`def foo a, b`): un LOCAL_VAR
+# en la misma línea que el nombre del def. Lo marca _parametros_sueltos
+# antes de que llegue al parser, que no ve los saltos de línea: sin la
+# marca, `def foo` seguido de `x = 1` en la línea siguiente se leería como
+# un parámetro con valor por defecto.
+PARAMETRO = 'PARAMETRO'
+
+# Un `return` seguido en su misma línea por su valor. Lo marca
+# _retornos_con_valor por lo mismo: sin la marca, un `return` al final de la
+# línea tomaría como valor la expresión de la línea siguiente.
+RETORNO_CON_VALOR = 'RETORNO_CON_VALOR'
+
+# Tokens con que empieza una expresión (los que siguen a RETORNO_CON_VALOR en
+# las tablas del parser)
+_INICIO_EXPRESION = frozenset((
+    'INTEGER', 'FLOAT', 'RATIONAL', 'COMPLEX', 'STR', 'SYMBOL', 'REGEXP', 'TRUE', 'FALSE', 'NIL',
+    'GLOBAL_VAR', 'LOCAL_VAR', 'INSTANCE_VAR', 'CLASS_VAR', 'CONSTANT',
+    'LBRACE', 'LBRACKET', 'LPAREN', 'MINUS', 'NOT',
+))
+
+# Los tokens del lexer más los que entregan la recuperación de errores,
+# _parametros_sueltos y _retornos_con_valor
+tokens = lexico.tokens + (recuperacion.SINCRONIA, PARAMETRO, RETORNO_CON_VALOR)
+
 # -----------------------------
-# PRECEDENCIA (por si usas expr)
+# PRECEDENCIA
 # -----------------------------
+# El lexer descarta los saltos de línea, así que una sentencia puede terminar
+# justo donde otra podría seguirla (`x = a` seguido de `-1`, de `[1]` o de
+# `(1)`). FIN_SENTENCIA es la precedencia de las reglas que cierran una
+# construcción en esos puntos: es la más baja, por lo que siempre se prefiere
+# seguir la expresión en curso (`x = a - 1`, `a[1]`, `f(1)`), como antes
+# hacía PLY por defecto. PLY no cuenta como conflicto lo que resuelve una
+# precedencia: gramatica.py informa cuántos resuelve FIN_SENTENCIA. Fuera de
+# los operadores ningún token tiene precedencia; donde una sentencia podía
+# terminar o seguir con cualquier otro (el valor de un `return`), lo deciden
+# las reglas.
 precedence = (
+    ('nonassoc', 'FIN_SENTENCIA'),
+    ('right', 'NOT'),
+    ('nonassoc', 'RANGE_INCL', 'RANGE_EXCL'),
     ('left', 'OROR', 'OR'),
     ('left', 'ANDAND', 'AND'),
     ('left', 'EQ', 'NE', 'EQQ', 'MATCH', 'NMATCH', 'LT', 'LE', 'GT', 'GE'),
@@ -14,201 +63,28 @@ precedence = (
     ('left', 'MULT', 'DIV', 'MOD'),
     ('right', 'POWER'),
     ('right', 'UMINUS'),
+    ('left', 'LBRACKET', 'LPAREN'),
 )
 
-errores_sintacticos = []
-# Errores encontrados en la fase semántica (añadidos por comprobaciones en reglas)
-errores_semanticos = []
-# Tabla de símbolos global: {nombre_var: {tipo: 'integer'|'float'|'string'|..., valor: ...}}
-tabla_simbolos = {}
-# Advertencias semánticas (castings indebidos, operaciones sospechosas)
-advertencias_semanticas = []
-contexto_bucles = 0
-
-contexto_if = 0
-def es_string_numerico_entero(valor_str):
-    """Verifica si un string es 100% numérico entero (ej: '123', '-45').
-    Devuelve True/False."""
-    if not isinstance(valor_str, str):
-        return False
-    valor_limpio = valor_str.strip()
-    if not valor_limpio:
-        return False
-    # permitir signo negativo al inicio
-    if valor_limpio[0] in ('+', '-'):
-        valor_limpio = valor_limpio[1:]
-    return valor_limpio.isdigit()
-
-
-def es_string_numerico_flotante(valor_str):
-    """Verifica si un string es 100% numérico flotante (ej: '3.14', '-2.5', '1e-5').
-    Devuelve True/False."""
-    if not isinstance(valor_str, str):
-        return False
-    valor_limpio = valor_str.strip()
-    if not valor_limpio:
-        return False
-    try:
-        float(valor_limpio)
-        return True
-    except ValueError:
-        return False
-
+# Las reglas sólo arman el AST: las comprobaciones semánticas son una
+# pasada aparte sobre él (semantica.py). El estado del análisis (errores,
+# tabla de símbolos) vive en SesionAnalisis, definida al final del módulo
+# junto al parser.
 
-def obtener_valor_string(node):
-    """Extrae el valor de string de un nodo AST.
-    Devuelve el string sin comillas, o None si no es un string literal."""
-    if node is None:
-        return None
 
-    if isinstance(node, tuple):
-        if node[0] == 'lit' and len(node) > 1:
-            valor = node[1]
-            if isinstance(valor, str):
-                # Remover comillas si existen
-                if (valor.startswith('"') and valor.endswith('"')) or \
-                        (valor.startswith("'") and valor.endswith("'")):
-                    return valor[1:-1]
-                return valor
-        elif node[0] == 'var' and len(node) > 1:
-            # Si es una variable, buscar su valor en la tabla de símbolos
-            var_name = node[1]
-            if var_name in tabla_simbolos:
-                valor_info = tabla_simbolos[var_name].get('valor')
-                # Recursivamente obtener el valor
-                return obtener_valor_string(valor_info)
-    elif isinstance(node, str):
-        # Si es un string directo
-        if (node.startswith('"') and node.endswith('"')) or \
-                (node.startswith("'") and node.endswith("'")):
-            return node[1:-1]
-        return node
-
-    return None
-
-
-def inferir_tipo_nodo(node):
-    """Inferir tipo simple a partir del nodo AST usado por el parser.
-    Devuelve 'integer', 'float', 'string', 'symbol', 'boolean', 'array', 'hash' o 'desconocido'.
-    """
-    if node is None:
-        return 'nil'
-    # literales numéricos: ('num', valor)
-    if isinstance(node, tuple):
-        tag = node[0]
-        if tag == 'num':
-            v = node[1]
-            if isinstance(v, int):
-                return 'integer'
-            if isinstance(v, float):
-                return 'float'
-            # t_FLOAT in lexer returns string like '3.14'
-            if isinstance(v, str):
-                if '.' in v or 'e' in v or 'E' in v:
-                    return 'float'
-                # fallback: digits only
-                if v.isdigit():
-                    return 'integer'
-                return 'desconocido'
-        if tag == 'lit':
-            val = node[1]
-            # STR tokens come as quoted strings or heredoc content
-            if isinstance(val, str):
-                if val.startswith(':'):
-                    return 'symbol'
-                # regexp like /.../ also as str, but treat as string for ops
-                return 'string'
-        if tag == 'str':
-            return 'string'
-        if tag == 'sym':
-            return 'symbol'
-        if tag == 'bool':
-            return 'boolean'
-        if tag == 'array':
-            return 'array'
-        if tag == 'hash':
-            return 'hash'
-        if tag == 'var':
-            # consultar tabla de símbolos
-            nombre = node[1]
-            if nombre in tabla_simbolos:
-                return tabla_simbolos[nombre].get('tipo', 'desconocido')
-            return 'desconocido'
-        if tag == 'call':
-            # ('call', objeto, método, args) -- soporte para llamadas a métodos
-            # .to_i, .to_f, .to_s, .to_a, etc.
-            metodo = node[2] if len(node) > 2 else ''
-            obj = node[1] if len(node) > 1 else None
-
-            # Validar conversiones indebidas (castings inseguros)
-            if metodo == 'to_i':
-                # Verificar si el objeto es un string y validar su contenido
-                obj_tipo = inferir_tipo_nodo(obj)
-                if obj_tipo == 'string':
-                    # Intentar extraer el valor del string
-                    valor_string = obtener_valor_string(obj)
-                    if valor_string is not None:
-                        if not es_string_numerico_entero(valor_string):
-                            aviso = f"Error semántico: Casting indebido - '{valor_string}' no es 100% numérico. .to_i convertirá a 0 o valor parcial"
-                            errores_semanticos.append(aviso)
-                            print(aviso)
-                return 'integer'
-
-            if metodo == 'to_f':
-                obj_tipo = inferir_tipo_nodo(obj)
-                if obj_tipo == 'string':
-                    valor_string = obtener_valor_string(obj)
-                    if valor_string is not None:
-                        if not es_string_numerico_flotante(valor_string):
-                            aviso = f"Error semántico: Casting indebido - '{valor_string}' no es 100% numérico. .to_f convertirá a 0.0 o valor parcial"
-                            errores_semanticos.append(aviso)
-                            print(aviso)
-                return 'float'
-
-            if metodo == 'to_s' or metodo == 'to_str':
-                return 'string'
-            if metodo == 'to_a' or metodo == 'to_ary':
-                return 'array'
-            if metodo == 'to_h' or metodo == 'to_hash':
-                return 'hash'
-            # fallback: devolver tipo del objeto si no es conversión conocida
-            if node:
-                return inferir_tipo_nodo(node[1])
-            return 'desconocido'
-        if tag == 'func_call':
-            # ('func_call', nombre, args) -- soporte para llamadas a funciones
-            # Por defecto retornamos desconocido (habría que analizar definición)
-            return 'desconocido'
-        if tag == 'binop':
-            # inferir desde operandos
-            left_node = node[1] if len(node) > 1 else None
-            right_node = node[2] if len(node) > 2 else None
-            l = inferir_tipo_nodo(left_node)
-            r = inferir_tipo_nodo(right_node)
-            op = node[1] if len(node) > 1 else '?'
-            # el segundo índice es el operador, tercero es left, cuarto es right
-            # reordenar: node es ('binop', op, left, right)
-            if len(node) >= 4:
-                op = node[1]
-                l = inferir_tipo_nodo(node[2])
-                r = inferir_tipo_nodo(node[3])
-            if l == 'string' and r == 'string':
-                return 'string'
-            if l in ('integer', 'float') and r in ('integer', 'float'):
-                return 'float' if 'float' in (l, r) else 'integer'
-            return 'desconocido'
-    # si es literal simple
-    if isinstance(node, int):
-        return 'integer'
-    if isinstance(node, float):
-        return 'float'
-    if isinstance(node, str):
-        # comillas indican string literal
-        if node.startswith('"') or node.startswith("'"):
-            return 'string'
-        if node.startswith(':'):
-            return 'symbol'
-    return 'desconocido'
+def _tramo(p, primero, ultimo):
+    """(inicio, largo) de los símbolos `primero` a `ultimo` de la producción:
+    los dos últimos argumentos de cualquier nodo (ver nodos.py). Cada
+    símbolo es un token (su lexpos y su largo en el código) o un nodo."""
+    simbolos = p.slice
+    simbolo = simbolos[primero]
+    valor = simbolo.value
+    inicio = valor.inicio if isinstance(valor, nodos.Nodo) else simbolo.lexpos
+    simbolo = simbolos[ultimo]
+    valor = simbolo.value
+    if isinstance(valor, nodos.Nodo):
+        return inicio, valor.inicio + valor.largo - inicio
+    return inicio, simbolo.lexpos + lexico.largo_token(simbolo) - inicio
 
 
 # Lo comente porque me daba error cuando queria probar el algoritmo4
@@ -222,74 +98,69 @@ def inferir_tipo_nodo(node):
 # --------------------------------------------------
 def p_program(p):
     'program : statement_list'
-    p[0] = ('program', p[1])
+    sentencias = p[1]
+    inicio = sentencias[0].inicio if sentencias else 0
+    fin = sentencias[-1].fin if sentencias else 0
+    p[0] = nodos.Programa(sentencias, inicio, fin - inicio)
 
 
+# Las listas de sentencias pueden ser vacías (programa o cuerpo vacío).
+# statement_list admite además un elsif/else suelto (ver invalid_branch);
+# stmt_block, el cuerpo de las ramas de un if, no: ahí ELSIF y ELSE siempre
+# abren la rama siguiente del if. Las dos son la misma lista de sentencias.
 def p_statement_list_multi(p):
-    'statement_list : statement_list statement'
-    p[0] = p[1] + [p[2]]
+    '''statement_list : statement_list statement
+                      | statement_list invalid_branch
+       stmt_block : stmt_block statement'''
+    # se agrega en el sitio: copiar la lista en cada reducción haría
+    # cuadrático un archivo con muchas sentencias
+    p[1].append(p[2])
+    p[0] = p[1]
 
 
-def p_statement_list_single(p):
-    'statement_list : statement'
-    p[0] = [p[1]]
+# Tramo descartado por la recuperación de errores (ver recuperacion.py): la
+# sentencia rota no deja nodo, la lista sigue con las que vengan después
+def p_statement_list_error(p):
+    '''statement_list : statement_list error SINCRONIA
+       stmt_block : stmt_block error SINCRONIA'''
+    p[0] = p[1]
+
+
+# Un `then` suelto no deja nodo: el de `if x then` y `elsif x then` (los
+# cuerpos pueden empezar con él) o uno de más entre dos sentencias
+def p_statement_list_then(p):
+    '''statement_list : statement_list THEN
+       stmt_block : stmt_block THEN'''
+    p[0] = p[1]
+
+
+def p_statement_list_empty(p):
+    '''statement_list : %prec FIN_SENTENCIA
+       stmt_block : %prec FIN_SENTENCIA'''
+    p[0] = []
 
 
 # Jusepere BREAK
 def p_statement_break(p):
     'statement : BREAK'
-    linea = p.lineno(1)
-    if contexto_bucles <= 0:
-        errores_semanticos.append(f"Error: break fuera de estructura iterativa. (línea {linea})")
-    p[0] = ('break', linea)
+    p[0] = nodos.Break(p.lexpos(1), 5)
 
 
 # Jusepere NEXT
 def p_statement_next(p):
     'statement : NEXT'
-    linea = p.lineno(1)
-    if contexto_bucles <= 0:
-        errores_semanticos.append(f"Error: next fuera de estructura iterativa. (línea {linea})")
-    p[0] = ('next', linea)
-
-
-def p_stmt_block_single(p):
-    'stmt_block : statement'
-    # Representamos bloque como lista de sentencias
-    p[0] = [p[1]]
-
-def p_stmt_block_multiple(p):
-    "stmt_block : stmt_block statement"
-    p[0] = p[1] + [p[2]]
-
-def p_stmt_block_multi(p):
-    'stmt_block : LBRACE statement_list RBRACE'
-    # Si usas llaves para agrupar bloques
-    p[0] = p[2]
-
-
-def p_stmt_block_list(p):
-    'stmt_block : statement_list'
-    p[0] = p[1]
+    p[0] = nodos.Next(p.lexpos(1), 4)
 
 
 # --------------------------------------------------
 # STATEMENTS ASIGNADOS
+# Cada tipo de sentencia (print, asignación, while, for, def, if, class)
+# es directamente una alternativa de `statement`: sin un no terminal
+# intermedio que sólo pase el nodo hacia arriba (una reducción menos por
+# sentencia).
 # --------------------------------------------------
 def p_statement(p):
-    '''statement : print_stmt
-                 | input_stmt
-                 | assignment
-                 | while_stmt
-                 | for_stmt
-                 | hash_literal
-                 | function_def
-                 | if_stmt
-                 | optional_then
-                 | stmt_block
-                 | elsif_list
-                 | else_part
-                 | expression'''
+    'statement : expression %prec FIN_SENTENCIA'
     p[0] = p[1]
 
 
@@ -297,20 +168,10 @@ def p_statement(p):
 # IMPRESIÓN (print / puts expr)
 # --------------------------------------------------
 def p_print_stmt(p):
-    '''print_stmt : PRINT expression
-                  | PUTS expression'''
-    # ('print', 'print', nodo_expr) o ('print', 'puts', nodo_expr)
-    p[0] = ('print', p[1], p[2])
-
-
-# --------------------------------------------------
-# INGRESO DE DATOS POR TECLADO
-# patrón típico: nombre = gets
-# --------------------------------------------------
-def p_input_stmt(p):
-    'input_stmt : variable EQLS LOCAL_VAR'
-    # ('input', ('var', nombre), 'gets')
-    p[0] = ('input', p[1], p[3])
+    '''statement : PRINT expression %prec FIN_SENTENCIA
+                 | PUTS expression %prec FIN_SENTENCIA'''
+    # Imprimir('print', expr) o Imprimir('puts', expr)
+    p[0] = nodos.Imprimir(p[1], p[2], *_tramo(p, 1, 2))
 
 
 # --------------------------------------------------
@@ -318,260 +179,103 @@ def p_input_stmt(p):
 # --------------------------------------------------
 def p_variable(p):
     '''variable : GLOBAL_VAR
-                | LOCAL_VAR
+                | LOCAL_VAR %prec FIN_SENTENCIA
                 | INSTANCE_VAR
                 | CLASS_VAR
                 | CONSTANT'''
-    p[0] = ('var', p[1])
+    # nombres internados: las apariciones de una variable comparten el texto
+    p[0] = nodos.Variable(sys.intern(p[1]), p.lexpos(1), len(p[1]))
 
 
 def p_assignment(p):
-    '''assignment : variable EQLS expression
-                  | variable PLUSEQLS expression
-                  | variable MINUSEQLS expression
-                  | variable MULTEQLS expression
-                  | variable DIVEQLS expression
-                  | variable MODEQLS expression
-                  | variable POWEREQLS expression'''
-
-    var_node = p[1]
-    if isinstance(var_node, tuple) and var_node[0] == 'var':
-        var_name = var_node[1]
-
-        # VERIFICACIÓN DE REASIGNACIÓN DE CONSTANTE
-        if var_name.isupper() or var_name.startswith('__') and var_name.endswith('__'):
-            # Es una constante (mayúsculas o __CONSTANT__)
-            if var_name in tabla_simbolos:
-                # La constante ya existe, es una reasignación
-                linea = p.lineno(2)  # Línea donde está el operador de asignación
-                advertencia = f"Advertencia semántica: Reasignación de constante '{var_name}' en línea {linea}"
-                advertencias_semanticas.append(advertencia)
-                print(advertencia)
-
-        # Registrar tipo en tabla de símbolos
-        expr_tipo = inferir_tipo_nodo(p[3])
-        tabla_simbolos[var_name] = {
-            'tipo': expr_tipo,
-            'valor': p[3],
-            'operador': p[2]
-        }
-
-    p[0] = ('assign', p[1], p[2], p[3])
+    '''statement : variable EQLS expression %prec FIN_SENTENCIA
+                 | variable PLUSEQLS expression %prec FIN_SENTENCIA
+                 | variable MINUSEQLS expression %prec FIN_SENTENCIA
+                 | variable MULTEQLS expression %prec FIN_SENTENCIA
+                 | variable DIVEQLS expression %prec FIN_SENTENCIA
+                 | variable MODEQLS expression %prec FIN_SENTENCIA
+                 | variable POWEREQLS expression %prec FIN_SENTENCIA'''
+
+    # --------------------------------------------------
+    # INGRESO DE DATOS POR TECLADO
+    # patrón típico: nombre = gets  ->  Entrada(Variable(nombre), 'gets')
+    # --------------------------------------------------
+    valor = p[3]
+    if p[2] == '=' and type(valor) is nodos.Variable and valor.nombre == 'gets':
+        p[0] = nodos.Entrada(p[1], 'gets', *_tramo(p, 1, 3))
+        return
+    p[0] = nodos.Asignacion(p[1], p[2], p[3], *_tramo(p, 1, 3))
 
 
 # --------------------------------------------------
 # ESTRUCTURA DE CONTROL: while ... end
 # while <cond> do ... end  o  while <cond> ... end
 # --------------------------------------------------
-# Jusepere Validar el uso correcto de break y next dentro de bucles.
 def p_while_stmt(p):
-    '''while_stmt : WHILE expression_logic while_enter DO statement_list END_S while_exit
-                  | WHILE expression_logic while_enter statement_list END_S while_exit'''
-    p[0] = ('while', p[2], p[5])
-
-
-def p_while_enter(p):
-    'while_enter :'
-    global contexto_bucles
-    contexto_bucles += 1
-
-
-def p_while_exit(p):
-    'while_exit :'
-    global contexto_bucles
-    contexto_bucles -= 1
+    '''statement : WHILE expression_logic DO statement_list END_S
+                 | WHILE expression_logic statement_list END_S'''
+    p[0] = nodos.Mientras(p[2], p[len(p) - 2], *_tramo(p, 1, len(p) - 1))
 
 
 # regla para una sentencia simple
 
-try:
-    contexto_if
-except NameError:
-    contexto_if = 0
-
-
-def semantica_if_inicio():
-    global contexto_if
-    contexto_if += 1
-
-
-def semantica_if_fin():
-    global contexto_if
-    if contexto_if > 0:
-        contexto_if -= 1
-
-
-def semantica_elsif_check(lineno=None):
-    if contexto_if == 0:
-        msg = "Error semántico: 'elsif' fuera de un 'if'."
-        if lineno:
-            msg = f"Línea {lineno}: {msg}"
-        errores_semanticos.append(msg)
-
-
-def semantica_else_check(lineno=None):
-    if contexto_if == 0:
-        msg = "Error semántico: 'else' fuera de un 'if'."
-        if lineno:
-            msg = f"Línea {lineno}: {msg}"
-        errores_semanticos.append(msg)
-
-
 # ---------------------------
 # Reglas sintácticas
 # ---------------------------
 
 #
+# El `then` de `if x then` no tiene regla propia: es un `then` suelto al
+# principio del cuerpo (ver p_statement_list_then)
 def p_if_stmt(p):
-    """if_stmt : IF expression_logic optional_then stmt_block elsif_list else_part END_S"""
-    # marca inicio de contexto IF
-    semantica_if_inicio()
-    try:
+    """statement : IF expression_logic stmt_block elsif_list else_part END_S"""
+    p[0] = nodos.Si(p[2], p[3], p[4], p[5], *_tramo(p, 1, 6))
 
-        p[0] = ('if', p[2], p[4], p[5], p[6])
-    finally:
-
-        semantica_if_fin()
-
-
-# optional THEN
-def p_optional_then_present(p):
-    "optional_then : THEN"
-    p[0] = 'THEN'
-
-
-def p_optional_then_empty(p):
-    "optional_then : empty"
-    p[0] = None
 
 # elsif_list left-recursive
+# Cada elemento: SinoSi(condicion, bloque)
 def p_elsif_list_empty(p):
-    "elsif_list : empty"
+    "elsif_list :"
     p[0] = []
 
 def p_elsif_list_left_recursive(p):
-    """elsif_list : elsif_list ELSIF expression_logic optional_then stmt_block"""
-    this = ('elsif', p[3], p[5])
-    p[0] = p[1] + [this]
+    """elsif_list : elsif_list ELSIF expression_logic stmt_block"""
+    bloque = p[4]
+    inicio, largo = _tramo(p, 2, 3)
+    if bloque:
+        largo = bloque[-1].fin - inicio
+    p[1].append(nodos.SinoSi(p[3], bloque, inicio, largo))
+    p[0] = p[1]
 
 # else opcional
 def p_else_part_empty(p):
-    "else_part : empty"
+    "else_part :"
     p[0] = None
 
 def p_else_part(p):
-    "else_part : ELSE stmt_block"
-    # si ELSE aparece, comprobamos contexto semántico (por si aparece fuera de if)
-    try:
-        lineno = p.lineno(1)
-    except Exception:
-        lineno = None
-    semantica_else_check(lineno)
+    "else_part : ELSE statement_list"
     p[0] = p[2]
 
 # ---------------------------
-# Reglas para detectar ELSIF / ELSE sueltos como statement
+# Reglas para detectar ELSIF / ELSE sueltos como sentencia. Sólo la palabra
+# clave (y la condición del elsif): las sentencias que la siguen se analizan
+# como sentencias normales del bloque donde apareció.
 # ---------------------------
 
 
-def p_statement_invalid_elsif_full(p):
-    "statement : ELSIF expression_logic optional_then stmt_block"
-    try:
-        lineno = p.lineno(1)
-    except Exception:
-        lineno = None
-    semantica_elsif_check(lineno)
-    p[0] = ('semantic_error', "elsif_fuera_de_if")
-
-def p_statement_invalid_elsif_short(p):
-    "statement : ELSIF expression"
-    try:
-        lineno = p.lineno(1)
-    except Exception:
-        lineno = None
-    semantica_elsif_check(lineno)
-    p[0] = ('semantic_error', "elsif_fuera_de_if")
-
-def p_statement_invalid_else_full(p):
-    "statement : ELSE stmt_block"
-    try:
-        lineno = p.lineno(1)
-    except Exception:
-        lineno = None
-    semantica_else_check(lineno)
-    p[0] = ('semantic_error', "else_fuera_de_if")
-
-def p_statement_invalid_else_short(p):
-    "statement : ELSE"
-    try:
-        lineno = p.lineno(1)
-    except Exception:
-        lineno = None
-    semantica_else_check(lineno)
-    p[0] = ('semantic_error', "else_fuera_de_if")
+def p_invalid_branch_elsif(p):
+    "invalid_branch : ELSIF expression_logic"
+    p[0] = nodos.ErrorSemantico("elsif_fuera_de_if", *_tramo(p, 1, 2))
+
+def p_invalid_branch_else(p):
+    "invalid_branch : ELSE"
+    p[0] = nodos.ErrorSemantico("else_fuera_de_if", p.lexpos(1), 4)
 # --------------------------------------------------
 # Jusepere ESTRUCTURA DE CONTROL: for ... in ... do ... end
 # --------------------------------------------------
 def p_for_stmt(p):
-    '''for_stmt : FOR LOCAL_VAR IN expression for_enter DO statement_list END_S for_exit
-                | FOR LOCAL_VAR IN expression for_enter statement_list END_S for_exit'''
-    p[0] = ('for', p[2], p[4], p[7])
-
-
-def p_for_enter(p):
-    'for_enter :'
-    global contexto_bucles
-    contexto_bucles += 1
-
-
-def p_for_exit(p):
-    'for_exit :'
-    global contexto_bucles
-    contexto_bucles -= 1
-
-
-# elias rubio
-def p_if_stmt_basic(p):
-    'if_stmt : IF expression_logic stmt_block END_S'
-    p[0] = ('if', p[2], p[3], [], None)
-
-
-def p_if_stmt_else(p):
-    'if_stmt : IF expression_logic stmt_block ELSE stmt_block END_S'
-    p[0] = ('if', p[2], p[3], [], ('else', p[5]))
-
-
-def p_if_stmt_elsif(p):
-    'if_stmt : IF expression_logic stmt_block elsif_list END_S'
-    p[0] = ('if', p[2], p[3], p[4], None)
-
-
-def p_if_stmt_elsif_else(p):
-    'if_stmt : IF expression_logic stmt_block elsif_list ELSE stmt_block END_S'
-    p[0] = ('if', p[2], p[3], p[4], ('else', p[6]))
-
-
-# --------------------------------------------------
-# Lista de ELSIF: right-recursive,
-# Cada elemento: ('elsif', condicion, bloque)
-# --------------------------------------------------
-def p_elsif_list_single(p):
-    'elsif_list : ELSIF expression stmt_block'
-    p[0] = [('elsif', p[2], p[3])]
-
-
-def p_elsif_list_more(p):
-    'elsif_list : ELSIF expression stmt_block elsif_list'
-    # colocamos el primero al inicio de la lista
-    p[0] = [('elsif', p[2], p[3])] + p[5]
-
-
-# --------------------------------------------------
-# else_block
-# --------------------------------------------------
-def p_else_block(p):
-    'else_block : ELSE stmt_block'
-    p[0] = ('else', p[2])
+    '''statement : FOR LOCAL_VAR IN expression DO statement_list END_S
+                 | FOR LOCAL_VAR IN expression statement_list END_S'''
+    p[0] = nodos.Para(p[2], p[4], p[len(p) - 2], *_tramo(p, 1, len(p) - 1))
 
 
 # --------------------------------------------------
@@ -582,31 +286,32 @@ def p_expression_logic_chain(p):
                         | expression_logic OROR expression_logic
                         | expression_logic AND expression_logic
                         | expression_logic OR expression_logic'''
-    p[0] = ('logic', p[2], p[1], p[3])
+    p[0] = nodos.Logica(p[2], p[1], p[3], *_tramo(p, 1, 3))
 
 
+# La condición también puede ser una expresión sola (`if activo`, `elsif x`)
 def p_expression_logic_simple(p):
-    'expression_logic : expression_compare'
+    'expression_logic : expression %prec FIN_SENTENCIA'
     p[0] = p[1]
 
 
 def p_expression_compare(p):
-    '''expression_compare : expression LT expression
-                          | expression LE expression
-                          | expression GT expression
-                          | expression GE expression
-                          | expression EQ expression
-                          | expression NE expression
-                          | expression EQQ expression
-                          | expression MATCH expression
-                          | expression NMATCH expression'''
-    p[0] = ('cmp', p[2], p[1], p[3])
+    '''expression_logic : expression LT expression
+                        | expression LE expression
+                        | expression GT expression
+                        | expression GE expression
+                        | expression EQ expression
+                        | expression NE expression
+                        | expression EQQ expression
+                        | expression MATCH expression
+                        | expression NMATCH expression'''
+    p[0] = nodos.Comparacion(p[2], p[1], p[3], *_tramo(p, 1, 3))
 
 
 def p_expression_not(p):
     'expression : NOT expression'
-    # ('not', expr)
-    p[0] = ('not', p[2])
+    # Negacion(expr)
+    p[0] = nodos.Negacion(p[2], *_tramo(p, 1, 2))
 
 
 # --------------------------------------------------
@@ -614,24 +319,17 @@ def p_expression_not(p):
 # Soporta: { key => value, ... }  y  { key: value, ... }
 # --------------------------------------------------
 def p_hash_literal(p):
-    'hash_literal : LBRACE hash_pairs_opt RBRACE'
-    # ('hash', [ ('pair', key, val), ... ])
-    p[0] = ('hash', p[2])
-
-
-def p_hash_pairs_opt_empty(p):
-    'hash_pairs_opt : '
-    p[0] = []
-
-
-def p_hash_pairs_opt_list(p):
-    'hash_pairs_opt : hash_pairs'
-    p[0] = p[1]
+    '''expression : LBRACE hash_pairs RBRACE
+                  | LBRACE RBRACE'''
+    # Hash([Par(clave, valor), ...])
+    pares = p[2] if len(p) == 4 else []
+    p[0] = nodos.Hash(pares, *_tramo(p, 1, len(p) - 1))
 
 
 def p_hash_pairs_multi(p):
     'hash_pairs : hash_pairs COMMA hash_pair'
-    p[0] = p[1] + [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 
 def p_hash_pairs_one(p):
@@ -642,23 +340,36 @@ def p_hash_pairs_one(p):
 def p_hash_pair_arrow(p):
     'hash_pair : expression ARROW expression'
     # { expr => expr }
-    p[0] = ('pair', p[1], p[3])
+    p[0] = nodos.Par(p[1], p[3], *_tramo(p, 1, 3))
 
 
 def p_hash_pair_symbolstyle(p):
     'hash_pair : SYMBOL COLON expression'
     # { :sym: expr } o { nombre: expr }
-    p[0] = ('pair', p[1], p[3])
+    p[0] = nodos.Par(p[1], p[3], *_tramo(p, 1, 3))
 
 
 def p_hash_pair_keywordstyle(p):
     'hash_pair : LOCAL_VAR COLON expression'
-    p[0] = ('pair', p[1], p[3])
+    p[0] = nodos.Par(p[1], p[3], *_tramo(p, 1, 3))
 
 
-def p_expression_hash(p):
-    'expression : hash_literal'
-    p[0] = p[1]
+# Sentencias agrupadas entre llaves: `{ x = 1 }`. El cuerpo no puede ser
+# vacío (`{}` es un hash) y una expresión sola adentro sólo es un par del
+# hash si la sigue `=>`.
+def p_brace_block(p):
+    'statement : LBRACE brace_body RBRACE'
+    p[0] = nodos.Llaves(p[2], *_tramo(p, 1, 3))
+
+
+def p_brace_body(p):
+    '''brace_body : statement
+                  | brace_body statement'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 # --------------------------------------------------
@@ -667,91 +378,102 @@ def p_expression_hash(p):
 def p_expression_range(p):
     '''expression : expression RANGE_INCL expression
                   | expression RANGE_EXCL expression'''
-    p[0] = ('range', p[2], p[1], p[3])
+    p[0] = nodos.Rango(p[2], p[1], p[3], *_tramo(p, 1, 3))
 
 
 # -------------------------
 # array emrubio
 # --------------------------
-# 1) Lista de expresiones (para separar elementos del array) — right-recursive
+# 1) Lista de expresiones (para separar elementos del array) — left-recursive:
+#    cada elemento se reduce apenas se lee su coma, así la pila del parser no
+#    crece con el largo del literal, y la lista se extiende en el sitio
 def p_expr_list_single(p):
     'expr_list : expression'
     p[0] = [p[1]]
 
 
 def p_expr_list_more(p):
-    'expr_list : expression COMMA expr_list'
-    p[0] = [p[1]] + p[3]
+    'expr_list : expr_list COMMA expression'
+    p[1].append(p[3])
+    p[0] = p[1]
 
 
 # 2) Array literal: vacío o con elementos
-def p_array_literal_empty(p):
-    'array_literal : LBRACKET RBRACKET'
-    p[0] = ('array', [])
+def p_array_literal(p):
+    '''expr_postfix : LBRACKET expr_list RBRACKET
+                    | LBRACKET RBRACKET'''
+    elementos = p[2] if len(p) == 4 else []
+    p[0] = nodos.Arreglo(elementos, *_tramo(p, 1, len(p) - 1))
+
+
+# 3) Primary (núcleo): literales, variables y paréntesis. Son directamente
+#    expr_postfix (sin un no terminal `primary` que sólo pase el valor).
+LITERALES = {
+    'INTEGER': nodos.Entero,
+    'FLOAT': nodos.Flotante,
+    'STR': nodos.Cadena,
+    'SYMBOL': nodos.Simbolo,
+    'TRUE': nodos.Booleano,
+    'FALSE': nodos.Booleano,
+    'NIL': nodos.Nulo,
+}
 
 
-def p_array_literal_elems(p):
-    'array_literal : LBRACKET expr_list RBRACKET'
-    p[0] = ('array', p[2])
+def p_primary(p):
+    '''expr_postfix : INTEGER
+                    | FLOAT
+                    | STR
+                    | SYMBOL
+                    | TRUE
+                    | FALSE
+                    | NIL'''
+    tok = p.slice[1]
+    p[0] = LITERALES[tok.type](tok.value, tok.lexpos, lexico.largo_token(tok))
+
+
+def p_primary_variable(p):
+    'expr_postfix : variable'
+    p[0] = p[1]
 
 
-# 3) Primary (núcleo) — incluimos array_literal como primitivo
-def p_primary(p):
-    '''primary : INTEGER
-               | FLOAT
-               | STR
-               | SYMBOL
-               | variable
-               | TRUE
-               | FALSE
-               | NIL
-               | LPAREN expression RPAREN
-               | array_literal'''
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        # caso LPAREN expression RPAREN
-        p[0] = p[2]
+def p_primary_group(p):
+    'expr_postfix : LPAREN expression RPAREN'
+    p[0] = p[2]
 
 
 # 3b) Function call: variable_local(args)
 def p_function_call_expression(p):
     '''expr_postfix : LOCAL_VAR LPAREN RPAREN
                     | LOCAL_VAR LPAREN expr_list RPAREN'''
-    # ('func_call', nombre, [args])
+    # LlamadaFuncion(nombre, [args])
     func_name = p[1]
     if len(p) == 4:
         # func()
-        p[0] = ('func_call', func_name, [])
+        p[0] = nodos.LlamadaFuncion(func_name, [], *_tramo(p, 1, 3))
     else:
         # func(args)
-        p[0] = ('func_call', func_name, p[3])
+        p[0] = nodos.LlamadaFuncion(func_name, p[3], *_tramo(p, 1, 4))
 
 
 # 4) Postfix: permite indexado repetido (ej: a[0][1])
 #    Usamos left-recursion para encadenar índices: expr_postfix -> expr_postfix [ expr ]
 def p_expr_postfix_index(p):
     'expr_postfix : expr_postfix LBRACKET expression RBRACKET'
-    # ('index', base_expr, index_expr)
-    p[0] = ('index', p[1], p[3])
-
-
-def p_expr_postfix_primary(p):
-    'expr_postfix : primary'
-    p[0] = p[1]
-
-
-# 5) Conectar postfix con expr_arith
-def p_expr_arith_postfix(p):
-    'expr_arith : expr_postfix'
-    p[0] = p[1]
+    # Indice(base_expr, index_expr)
+    p[0] = nodos.Indice(p[1], p[3], *_tramo(p, 1, 4))
 
 
 def p_assignment_index(p):
-    'assignment : expr_postfix EQLS expression'
-    # ('array_assign', left_index_expr, value)
-    # left_index_expr puede ser ('index', base, idx) o un índice anidado ('index', ('index', base, i0), i1)
-    p[0] = ('array_assign', p[1], p[3])
+    '''statement : expr_postfix LBRACKET expression RBRACKET EQLS expression %prec FIN_SENTENCIA
+                 | expr_postfix DOT LOCAL_VAR EQLS expression %prec FIN_SENTENCIA'''
+    # AsignacionIndice(destino, valor)
+    # el destino puede ser Indice(base, idx) o un índice anidado Indice(Indice(base, i0), i1),
+    # o LlamadaMetodo(objeto, atributo, []) para obj.atributo = valor
+    if len(p) == 7:
+        destino = nodos.Indice(p[1], p[3], *_tramo(p, 1, 4))
+    else:
+        destino = nodos.LlamadaMetodo(p[1], p[3], [], *_tramo(p, 1, 3))
+    p[0] = nodos.AsignacionIndice(destino, p[len(p) - 1], *_tramo(p, 1, len(p) - 1))
 
 
 # --------------------------------------------------
@@ -759,21 +481,33 @@ def p_assignment_index(p):
 # Ruby ya es así: def nombre ... end
 # --------------------------------------------------
 def p_function_def(p):
-    '''function_def : DEF LOCAL_VAR statement_list END_S
-                    | DEF LOCAL_VAR LPAREN param_list RPAREN statement_list END_S'''
-    if len(p) == 5:
-        # def foo ... end
-        p[0] = ('def', p[2], [], p[3])
-    else:
-        # def foo(a, b) ... end
-        p[0] = ('def', p[2], p[4], p[6])
+    '''statement : DEF LOCAL_VAR optional_params statement_list END_S'''
+    # def foo ... end  /  def foo(a, b) ... end: Funcion sin anotación de retorno
+    p[0] = nodos.Funcion(p[2], p[3], None, p[4], *_tramo(p, 1, 5))
 
 
-# Jusepere Parámetros opcionales
+# Jusepere Parámetros opcionales, entre paréntesis o sin ellos. Sin
+# paréntesis el primero llega como PARAMETRO (ver _parametros_sueltos): un
+# LOCAL_VAR sería el comienzo del cuerpo.
 def p_optional_params(p):
-    '''optional_params : param_list
-                       | empty'''
-    p[0] = p[1]
+    '''optional_params : LPAREN param_list RPAREN
+                       | LPAREN RPAREN'''
+    p[0] = p[2] if len(p) == 4 else []
+
+
+def p_optional_params_sueltos(p):
+    '''optional_params : first_param
+                       | first_param COMMA param_list'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[3].insert(0, p[1])
+        p[0] = p[3]
+
+
+def p_optional_params_empty(p):
+    'optional_params : %prec FIN_SENTENCIA'
+    p[0] = []
 
 
 def p_param_list(p):
@@ -782,269 +516,75 @@ def p_param_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 
 def p_parameter(p):
     '''parameter : LOCAL_VAR
-                 | LOCAL_VAR EQLS expression'''
+                 | LOCAL_VAR EQLS expression %prec FIN_SENTENCIA
+       first_param : PARAMETRO
+                   | PARAMETRO EQLS expression %prec FIN_SENTENCIA'''
     if len(p) == 2:
-        p[0] = (p[1], None)
+        p[0] = nodos.Parametro(p[1], None, p.lexpos(1), len(p[1]))
     else:
-        p[0] = (p[1], p[3])
-
-
-def p_empty(p):
-    'empty :'
-    p[0] = None
+        p[0] = nodos.Parametro(p[1], p[3], *_tramo(p, 1, 3))
 
 
 # Elias Rubio
 # --------------------------------------------------
 # RETORNO (return expr)
 # --------------------------------------------------
-# pila para contexto de funciones: cada elemento es dict { 'name': str, 'expected_return': tipo|None, 'returns': [tipo|None] }
-func_context_stack = []
-
-
-# --- util: normalizar/inferrar tipos sencillos desde nodos AST de expresion/literales ---
-def infer_type_from_expr(expr):
-    # expr puede ser un literal simple o un AST más complejo; adaptarlo a tu AST real
-    # Ejemplos manejados aquí: ('num', 42), ('str', "hola"), ('nil', None), ('bool', True), ('ident', 'a'), ('binop', op, left, right)
-    if expr is None:
-        return 'nil'
-    if isinstance(expr, tuple):
-        tag = expr[0]
-        if tag == 'num':  # número literal
-            return 'number'
-        if tag == 'str':
-            return 'string'
-        if tag == 'nil':
-            return 'nil'
-        if tag == 'bool':
-            return 'boolean'
-        if tag == 'ident':
-            # no podemos inferir el tipo de una variable simple aqui; devolver unknown
-            return 'unknown'
-        if tag == 'binop':
-            # ejemplo simplificado: si ambos operandos son number => number; si uno unknown => unknown
-            _, op, left, right = expr
-            lt = infer_type_from_expr(left)
-            rt = infer_type_from_expr(right)
-            if lt == 'number' and rt == 'number':
-                return 'number'
-            # otras heurísticas mínimas:
-            if lt == 'string' or rt == 'string':
-                # concatenación u otras operaciones con strings no manejadas aquí
-                return 'string'
-            return 'unknown'
-    # por defecto
-    return 'unknown'
-
-
-# --- helpers de contexto ---
-def func_enter(name, expected_return_type=None):
-    func_context_stack.append({
-        'name': name,
-        'expected_return': expected_return_type,  # 'number','string','boolean','nil' o None
-        'returns': []  # lista de tipos inferidos de cada return en el cuerpo
-    })
-
-
-def func_exit():
-    ctx = func_context_stack.pop() if func_context_stack else None
-    return ctx
-
-
-def func_current():
-    return func_context_stack[-1] if func_context_stack else None
-
-
-def check_return_against_expected(ret_type, lineno=None):
-    ctx = func_current()
-    if ctx is None:
-        # return fuera de función: podría ser un  semantico error
-        msg = "Error semántico: 'return' fuera de una función."
-        if lineno:
-            msg = f"Línea {lineno}: {msg}"
-        errores_semanticos.append(msg)
-        return
-
-    ctx['returns'].append(ret_type)
-
-    expected = ctx['expected_return']
-    if expected is None:
-        # si no hay anotación, intentamos inferir consistencia: si ya hay otros returns no-unknown,
-        # forzamos que coincidan entre sí
-        non_unknown = [t for t in ctx['returns'] if t and t != 'unknown']
-        if len(non_unknown) >= 2 and len(set(non_unknown)) > 1:
-            # tipos distintos inferidos entre distintos returns
-            msg = f"Error: tipos de retorno inconsistentes en función '{ctx['name']}'."
-            if lineno:
-                msg = f"Línea {lineno}: {msg}"
-            errores_semanticos.append(msg)
-    else:
-        #  comprobar compatibilidad básica
-        # permitimos que 'nil'
-        compatible = False
-        if ret_type == expected:
-            compatible = True
-        elif ret_type == 'unknown':
-
-            compatible = True
-        elif ret_type == 'nil' and expected != 'number' and expected != 'string':
-
-            compatible = True
-
-        if not compatible:
-            msg = f"Error: Tipo de retorno no coincide con expectativas {expected}."
-            if lineno:
-                msg = f"Línea {lineno}: {msg}"
-            errores_semanticos.append(msg)
+def p_function_def_with_ret(p):
+    '''statement : DEF LOCAL_VAR optional_params optional_ret statement_list END_S'''
+    # p[2] nombre; p[3] params; p[4] anotacion de retorno (tipo string); p[5] cuerpo
+    p[0] = nodos.Funcion(p[2], p[3], p[4], p[5], *_tramo(p, 1, 6))
 
 
-def p_function_def_with_ret(p):
-    '''function_def : DEF LOCAL_VAR optional_params optional_ret statement_list END_S'''
-    # p[2] nombre; p[3] params; p[4] anotacion de retorno (tipo string) o None; p[5] cuerpo
-    name = p[2]
-    params = p[3] or []
-    ret_annot = p[4]  # por ejemplo 'number','string', None
-    # al entrar en la función, registramos contexto
-    func_enter(name, ret_annot)
-    # NOTA: si quieres hacer checks mientras parseas los statement (ej. returns), las reglas de statement deben llamar a check_return...
-    # Aquí, construimos el AST y salimos del contexto
-    body = p[5]
-    ctx = func_exit()
-    p[0] = ('def', name, params, ret_annot, body)
-
-
-# regla para anotación de retorno opcional (ej: ':' TYPE)
+# regla para la anotación de retorno (ej: ':' TYPE); sin ella la función
+# es la de p_function_def
 def p_optional_ret(p):
-    '''optional_ret : COLON TYPE
-                    | empty'''
-    if len(p) == 3:
-
-        p[0] = p[2]
-    else:
-        p[0] = None
+    '''optional_ret : COLON TYPE'''
+    p[0] = p[2]
 
 
 # ---------------------------------------------------
-# Return: en la regla p_return_stmt se hace la comprobación semántica
+# Return: el tipo se compara con la anotación del def en la pasada
+# semántica (semantica.Verificador)
 # ---------------------------------------------------
+# (el de `return valor` llega como RETORNO_CON_VALOR, ver _retornos_con_valor)
 def p_return_stmt(p):
     '''statement : RETURN
-                 | RETURN expression'''
+                 | RETORNO_CON_VALOR expression %prec FIN_SENTENCIA'''
     if len(p) == 2:
-        # return sin expresión => tipo 'nil'
-        ret_type = 'nil'
-        try:
-            lineno = p.lineno(1)
-        except Exception:
-            lineno = None
-        check_return_against_expected(ret_type, lineno)
-        p[0] = ('return', None)
+        # return sin expresión
+        p[0] = nodos.Retorno(None, p.lexpos(1), 6)
     else:
-        expr = p[2]
-        ret_type = infer_type_from_expr(expr)
-        try:
-            lineno = p.lineno(1)
-        except Exception:
-            lineno = None
-        check_return_against_expected(ret_type, lineno)
-        p[0] = ('return', expr)
-
-
-# ---------------------------------------------------
-# Ejemplo simplificado de reglas de expresión para permitir inferencia
-# ---------------------------------------------------
-
-
-def p_expression_nil(p):
-    "expression : NIL"
-    p[0] = ('nil', None)
-
-
-def p_expression_bool_true(p):
-    "expression : TRUE"
-    p[0] = ('bool', True)
-
-
-def p_expression_bool_false(p):
-    "expression : FALSE"
-    p[0] = ('bool', False)
+        p[0] = nodos.Retorno(p[2], *_tramo(p, 1, 2))
 
 
 # class_def admite:
 #  - class Nombre ... end
 #  - class Nombre < Padre ... end
-# El cuerpo de la clase es un stmt_block
+# El cuerpo de la clase es una lista de sentencias; los def del cuerpo son
+# sentencias como los de nivel superior, y una variable de instancia o de
+# clase sola (@x, @@y) es una expresión más.
 def p_class_def(p):
-    '''class_def : CLASS CONSTANT stmt_block END_S
-                 | CLASS CONSTANT opt_inherit stmt_block END_S'''
-    # ('class', class_name, parent_or_None, body_list)
-    if len(p) == 5:
-        # class C <--- p[2] es CONSTANT, p[3] es stmt_block, p[4] es END_S
-        p[0] = ('class', p[2], None, p[3])
-    else:
-        # class C < Parent ... end
-        p[0] = ('class', p[2], p[3], p[5])
+    '''statement : CLASS CONSTANT opt_inherit statement_list END_S'''
+    # Clase(nombre, padre_o_None, cuerpo)
+    p[0] = nodos.Clase(p[2], p[3], p[4], *_tramo(p, 1, 5))
 
 
 # opt_inherit: opcionalmente ' < CONSTANT ' (herencia simple)
 def p_opt_inherit(p):
     '''opt_inherit : LT CONSTANT
-                   | empty'''
+                   | '''
     if len(p) == 3:
         p[0] = p[2]
     else:
         p[0] = None
 
 
-def p_statement_class(p):
-    'statement : class_def'
-    p[0] = p[1]
-
-
-# --------------------------------------------------
-# PROPIEDADES (variables de instancia / de clase)
-# --------------------------------------------------
-# En Ruby, normalmente dentro de la clase se usan assignments como:
-#   @name = "Elías"
-
-def p_property_decl(p):
-    '''property_decl : INSTANCE_VAR
-                     | CLASS_VAR'''
-    # ('prop', tipo, nombre_lexema)
-    p[0] = ('prop', p[1])
-
-
-# permitimos que property_decl sea un statement dentro de la clase (opcional)
-def p_statement_property(p):
-    'statement : property_decl'
-    p[0] = p[1]
-
-
-# --------------------------------------------------
-# MÉTODOS
-# --------------------------------------------------
-
-def p_method_from_def(p):
-    'method_def : function_def'
-    node = p[1]
-    if isinstance(node, tuple) and node and node[0] == 'def':
-        _, name, params, body = node
-        p[0] = ('method', name, params, body)
-    else:
-        p[0] = node
-
-
-# Permitimos que method_def sea una statement
-def p_statement_method(p):
-    'statement : method_def'
-    p[0] = p[1]
-
-
 # --------------------------------------------------
 # EXPRESIONES (números, strings, vars, operaciones)
 # --------------------------------------------------
@@ -1055,67 +595,24 @@ def p_expression_binop(p):
                   | expression DIV expression
                   | expression MOD expression
                   | expression POWER expression'''
-    # comprobaciones semánticas básicas relacionadas con strings y conversiones
-    op = p[2]
-    left = p[1]
-    right = p[3]
-    left_t = inferir_tipo_nodo(left)
-    right_t = inferir_tipo_nodo(right)
-
-    # Regla: concatenación '+' sólo válida entre strings
-    if op == '+':
-        if left_t == 'string' and right_t == 'string':
-            pass  # válido
-        elif left_t == 'string' and right_t != 'string':
-            msg = f"Error semántico: No se puede concatenar String con {right_t}"
-            print(msg)
-            errores_semanticos.append(msg)
-        elif right_t == 'string' and left_t != 'string':
-            msg = f"Error semántico: No se puede concatenar {left_t} con String"
-            print(msg)
-            errores_semanticos.append(msg)
-
-    # Regla: operaciones aritméticas no válidas con strings
-    if op in ('-', '*', '/', '%', 'POWER'):
-        if left_t == 'string' or right_t == 'string':
-            msg = f"Error semántico: Operación '{op}' no permitida entre {left_t} y {right_t}"
-            print(msg)
-            errores_semanticos.append(msg)
-
-    # Regla: permitir conversiones numéricas implícitas entre integer y float
-    # No se hace nada aquí (aceptable): integer + float -> float
-    # Nota: conversiones explícitas (.to_i, .to_f) se manejan en p_method_call
-
-    p[0] = ('binop', p[2], p[1], p[3])
-
-
-def p_expression_group(p):
-    'expression : LPAREN expression RPAREN'
-    p[0] = p[2]
+    p[0] = nodos.OperacionBinaria(p[2], p[1], p[3], *_tramo(p, 1, 3))
 
 
+# Los enteros, flotantes, strings, símbolos, variables, true/false/nil y los
+# paréntesis llegan por expr_postfix (ver p_primary)
 def p_expression_number(p):
-    '''expression : INTEGER
-                  | FLOAT
-                  | RATIONAL
+    '''expression : RATIONAL
                   | COMPLEX'''
-    p[0] = ('num', p[1])
+    p[0] = nodos.Numero(p[1], p.lexpos(1), len(p[1]))
 
 
 def p_expression_literal(p):
-    '''expression : STR
-                  | SYMBOL
-                  | REGEXP'''
-    p[0] = ('lit', p[1])
-
-
-def p_expression_variable(p):
-    'expression : variable'
-    p[0] = p[1]
+    '''expression : REGEXP'''
+    p[0] = nodos.Regexp(p[1], p.lexpos(1), len(p[1]))
 
 
 def p_expression_postfix(p):
-    'expression : expr_postfix'
+    'expression : expr_postfix %prec FIN_SENTENCIA'
     p[0] = p[1]
 
 
@@ -1125,54 +622,458 @@ def p_expression_postfix(p):
 # Ej: "123".to_i, x.to_f, [1,2].length
 # --------------------------------------------------
 def p_method_call(p):
-    '''expr_postfix : expr_postfix DOT LOCAL_VAR
+    '''expr_postfix : expr_postfix DOT LOCAL_VAR %prec FIN_SENTENCIA
                     | expr_postfix DOT LOCAL_VAR LPAREN RPAREN
                     | expr_postfix DOT LOCAL_VAR LPAREN expr_list RPAREN'''
-    # ('call', objeto, método, [args] o None)
+    # LlamadaMetodo(objeto, método, [args])
     obj = p[1]
     metodo = p[3]
+    tramo = _tramo(p, 1, len(p) - 1)
     if len(p) == 4:
         # expression.metodo
-        p[0] = ('call', obj, metodo, [])
+        p[0] = nodos.LlamadaMetodo(obj, metodo, [], *tramo)
     elif len(p) == 6:
         # expression.metodo()
-        p[0] = ('call', obj, metodo, [])
+        p[0] = nodos.LlamadaMetodo(obj, metodo, [], *tramo)
     else:
         # expression.metodo(args)
-        p[0] = ('call', obj, metodo, p[5])
+        p[0] = nodos.LlamadaMetodo(obj, metodo, p[5], *tramo)
 
 
 def p_expression_uminus(p):
     '''expression : MINUS expression %prec UMINUS'''
-    p[0] = ('uminus', p[2])
+    p[0] = nodos.MenosUnario(p[2], *_tramo(p, 1, 2))
 
 
-def p_valor_numero(p):
-    'valor : INTEGER'
-    p[0] = p[1]
+def p_error(p):
+    return reportar_error_sintactico(p, obtener_sesion_global())
 
 
-def p_valor_variable(p):
-    'valor : LOCAL_VAR'
-    p[0] = p[1]
+def reportar_error_sintactico(p, sesion):
+    """p_error de `sesion`: durante un parse de la sesión lo resuelve su
+    recuperacion.Recuperacion; fuera de él sólo anota el mensaje."""
+    if sesion.recuperacion is not None:
+        return sesion.recuperacion.error(p)
+    mensaje = recuperacion.mensaje_error_sintactico(p)
+    print(mensaje)
+    sesion.errores_sintacticos.append(mensaje)
+
+
+def _parametros_sueltos(siguiente, lexer):
+    """Envuelve la función de tokens `siguiente` para entregar como PARAMETRO
+    el LOCAL_VAR que sigue a `def nombre` en su misma línea. Es una copia del
+    token: los de un BufferTokens se reutilizan en otros parses."""
+    despues_de_def = False
+    nombre = None
+
+    def token():
+        nonlocal despues_de_def, nombre
+        tok = siguiente()
+        if tok is None:
+            return None
+        if nombre is not None:
+            if tok.type == 'LOCAL_VAR' and \
+                    lexico.posicion_token(lexer, tok)[0] == lexico.posicion_token(lexer, nombre)[0]:
+                tok = copy.copy(tok)
+                tok.type = PARAMETRO
+            nombre = None
+        elif despues_de_def:
+            if tok.type == 'LOCAL_VAR':
+                nombre = tok
+            despues_de_def = False
+        elif tok.type == 'DEF':
+            despues_de_def = True
+        return tok
+    return token
+
+
+def _retornos_con_valor(siguiente, lexer):
+    """Envuelve la función de tokens `siguiente` para entregar como
+    RETORNO_CON_VALOR el `return` seguido en su misma línea por un token con
+    que empieza una expresión. Como en _parametros_sueltos, es una copia."""
+    pendientes = []
+
+    def token():
+        if pendientes:
+            return pendientes.pop()
+        tok = siguiente()
+        if tok is None or tok.type != 'RETURN':
+            return tok
+        proximo = siguiente()
+        if proximo is not None:
+            pendientes.append(proximo)
+            if proximo.type in _INICIO_EXPRESION and \
+                    lexico.posicion_token(lexer, proximo)[0] == lexico.posicion_token(lexer, tok)[0]:
+                tok = copy.copy(tok)
+                tok.type = RETORNO_CON_VALOR
+        return tok
+    return token
 
 
-def p_error(p):
-    if p:
-        mensaje = f"Error de sintaxis con el token '{p.value}' en la línea {p.lineno}"
-    else:
-        mensaje = "Error de sintaxis al final de la entrada"
-    print(mensaje)
-    errores_sintacticos.append(mensaje)
+# -------------------------------------------------
+# Construcción del parser: al primer uso (main.parser u obtener_parser()),
+# no al importar. Las tablas LALR se guardan en ARCHIVO_TABLAS_PARSER
+# junto con la firma de la gramática; PLY las carga directamente (sin
+# validar la gramática ni escribir parser.out) mientras la firma coincida
+# y las regenera si cambió alguna regla. Con ANALIZADOR_DEPURAR=1 se
+# regeneran siempre y se escribe parser.out con los estados y conflictos.
+# -------------------------------------------------
+ARCHIVO_TABLAS_PARSER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsetab.pickle')
+
+_parser = None
+_sesion_global = None
+
+
+def construir_parser(depurar=lexico.DEPURAR):
+    """Parser LALR de la gramática de este módulo (uno nuevo en cada llamada)."""
+    modulo = sys.modules[__name__]
+    if depurar:
+        # sin tabla que leer: PLY regenera y deja parser.out
+        return yacc.yacc(module=modulo, debug=True, write_tables=False, tabmodule='parsetab_depuracion')
+    return yacc.yacc(module=modulo, debug=False, picklefile=ARCHIVO_TABLAS_PARSER)
+
+
+def obtener_parser():
+    """El parser del módulo (main.parser), construido la primera vez que se pide."""
+    global _parser
+    if _parser is None:
+        _parser = construir_parser()
+    return _parser
 
 
-# Build the parser
-parser = yacc.yacc()
+def precompilar_tablas():
+    """Construye el lexer y el parser, dejando sus tablas en caché para los
+    arranques siguientes (p. ej. como paso previo en CI)."""
+    lexico.obtener_lexer()
+    obtener_parser()
+
+
+def nuevo_lexer(motor='ply'):
+    """Lexer nuevo (sin estado compartido) del motor indicado."""
+    if motor == 'ply':
+        return lexico.lexer.clone()
+    if motor == 'escaner':
+        import escaner
+        return escaner.EscanerRuby()
+    raise ValueError(f"Motor léxico desconocido: {motor!r} (se espera 'ply' o 'escaner')")
+
+
+# -------------------------------------------------
+# Etapas del análisis (ver SesionAnalisis.analizar): hasta dónde se llega.
+# 'lexico' sólo tokeniza, 'sintactico' arma además el AST (basta para saber
+# si el código es sintácticamente válido) y 'completo' le agrega la pasada
+# semántica.
+# -------------------------------------------------
+ETAPA_LEXICA = 'lexico'
+ETAPA_SINTACTICA = 'sintactico'
+ETAPA_COMPLETA = 'completo'
+ETAPAS = (ETAPA_LEXICA, ETAPA_SINTACTICA, ETAPA_COMPLETA)
+
 
+def _validar_etapa(etapa):
+    if etapa not in ETAPAS:
+        raise ValueError(f"Etapa desconocida: {etapa!r} (se espera una de {', '.join(ETAPAS)})")
 
-def analizar_semantica(nombre_archivo, usuario):
-    global errores_semanticos
-    errores_semanticos = []  # reiniciar errores cada análisis
+
+# -------------------------------------------------
+# Sesión de análisis: cada sesión tiene su propio lexer, parser,
+# tabla de símbolos y listas de diagnósticos, de modo que varios
+# análisis pueden correr en hilos distintos sin pisarse.
+# -------------------------------------------------
+class SesionAnalisis:
+    """Estado completo de un análisis léxico/sintáctico/semántico.
+
+    Cada sesión trabaja con su propio clon del lexer y su propia copia del
+    parser (las tablas LALR se comparten, la pila no). El parser sólo arma
+    el AST; verificar() le aplica la pasada semántica (semantica.py), que
+    deja los diagnósticos y la tabla de símbolos en la sesión.
+
+    Con `incremental=True` la sesión recuerda el último BufferTokens y, al
+    tokenizar una versión editada del mismo código, sólo re-tokeniza la zona
+    que cambió (ver incremental.py). Recuerda también el último análisis
+    (`estado_incremental`): parsear() vuelve a parsear sólo las sentencias de
+    nivel superior que tocan la edición y verificar() retoma la pasada
+    semántica desde ahí (ver reparseo.py). En este modo los diagnósticos
+    sintácticos y semánticos y la tabla de símbolos se reemplazan en cada
+    análisis, y editar() analiza una edición sin comparar los textos.
+
+    Con `compacto=True` tokenizar() devuelve una lexico.TablaTokens en lugar
+    de un BufferTokens: mucha menos memoria por token para corpus grandes (no
+    se combina con el modo incremental, que necesita los LexToken).
+
+    `motor_lexico` elige el lexer: 'ply' (las reglas de lexico.py) o
+    'escaner' (escaner.py, mismos tokens y bastante más rápido).
+
+    `max_errores_lexicos` es el máximo de errores léxicos por entrada (None
+    para no limitar): al llegar a él se deja de tokenizar, la entrada queda
+    rechazada (`rechazado`) y no se parsea.
+
+    Los errores de sintaxis se recuperan en modo pánico (recuperacion.py):
+    cada uno deja un mensaje y el parser sigue desde la próxima sentencia o
+    `end`. `max_errores_sintacticos` es el máximo por entrada (None para no
+    limitar); al alcanzarlo se deja de parsear y la entrada queda rechazada.
+
+    Con `perfilar_lexico=True` el lexer de la sesión se reemplaza por uno
+    instrumentado y `perfil_lexico` (perfil_lexico.PerfilLexico) acumula, por
+    regla t_*, aciertos, tiempo y caracteres consumidos; sólo con motor 'ply'.
+
+    `cache` es una cache.CacheResultados (o None): analizar() busca ahí el
+    resultado del mismo código con la misma configuración y, si está, lo
+    carga sin tokenizar, parsear ni verificar (`desde_cache` queda en True
+    y los mensajes no se vuelven a imprimir); si no, guarda el que obtiene.
+
+    `reglas` (reglas.Reglas) son las reglas de la pasada semántica: las de
+    `reglas_inactivas` no corren, y cada una acumula sus ejecuciones y su
+    tiempo (`reglas.tabla()`)."""
+
+    def __init__(self, lexer_base=None, parser_base=None, errores_lexicos=None, incremental=False,
+                 compacto=False, motor_lexico='ply', max_errores_lexicos=lexico.MAX_ERRORES_LEXICOS,
+                 perfilar_lexico=False, max_errores_sintacticos=recuperacion.MAX_ERRORES_SINTACTICOS,
+                 cache=None, reglas_inactivas=()):
+        self.motor_lexico = motor_lexico
+        self.max_errores_lexicos = max_errores_lexicos
+        self.lexer = lexer_base if lexer_base is not None else nuevo_lexer(motor_lexico)
+        self.perfil_lexico = None
+        if perfilar_lexico:
+            import perfil_lexico
+            self.perfil_lexico = perfil_lexico.PerfilLexico(self.lexer)
+            self.lexer = self.perfil_lexico.lexer
+        self.parser = parser_base if parser_base is not None else copy.copy(obtener_parser())
+        self.errores_lexicos = errores_lexicos if errores_lexicos is not None else []
+        self.lexer.errores_lexicos = self.errores_lexicos
+        self.lexer.max_errores_lexicos = max_errores_lexicos
+        # p_error sólo recibe el token (y ninguno al final de la entrada)
+        self.parser.errorfunc = lambda tok: reportar_error_sintactico(tok, self)
+
+        self.errores_sintacticos = []
+        self.max_errores_sintacticos = max_errores_sintacticos
+        # Recuperacion del parse en curso (None fuera de parsear)
+        self.recuperacion = None
+        # Errores encontrados en la fase semántica (ver semantica.Verificador)
+        self.errores_semanticos = []
+        # Advertencias semánticas (castings indebidos, operaciones sospechosas)
+        self.advertencias_semanticas = []
+        # Tabla de símbolos por ámbitos (simbolos.py): nombre_var -> {tipo: 'integer'|'float'|'string'|...,
+        # valor: constante o no (constantes.py), operador: ...}; al terminar queda el ámbito del programa
+        self.tabla_simbolos = simbolos.TablaSimbolos()
+        self.func_context_stack = []
+        self.reglas = reglas.Reglas(reglas_inactivas)
+        self.incremental = incremental
+        self.compacto = compacto
+        self.ultimo_buffer = None
+        # reparseo.Estado del último análisis en modo incremental
+        self.estado_incremental = None
+        self.rechazado = False
+        self.cache = cache
+        # True si el último análisis salió de la caché
+        self.desde_cache = False
+
+    def reiniciar(self):
+        """Vacía diagnósticos, tabla de símbolos y contextos (en el lugar,
+        para que quien tenga referencias a las listas vea el estado nuevo)."""
+        self.errores_lexicos.clear()
+        self.errores_sintacticos.clear()
+        self.errores_semanticos.clear()
+        self.advertencias_semanticas.clear()
+        self.tabla_simbolos.clear()
+        self.func_context_stack.clear()
+        self.rechazado = False
+        self.desde_cache = False
+
+    def tokenizar(self, codigo):
+        if not self.incremental:
+            if self.compacto:
+                buffer_tokens = lexico.tabla_tokens(codigo, self.lexer)
+            else:
+                buffer_tokens = tokenizar(codigo, self.lexer)
+        elif self.ultimo_buffer is None:
+            buffer_tokens = tokenizar(codigo, self.lexer)
+        else:
+            buffer_tokens = incremental.retokenizar(self.ultimo_buffer, codigo)
+            # los errores de la zona reutilizada no pasan por t_error otra vez
+            self.errores_lexicos[:] = buffer_tokens.mensajes_error()
+        if self.incremental:
+            self.ultimo_buffer = buffer_tokens
+        self.rechazado = buffer_tokens.rechazado
+        return buffer_tokens
+
+    def parsear(self, buffer_tokens):
+        """AST de los tokens, sin comprobaciones semánticas (ver verificar)."""
+        if buffer_tokens.rechazado:
+            # demasiados errores léxicos: los tokens están incompletos
+            self.rechazado = True
+            return None
+        if self.incremental:
+            return reparseo.parsear(self, buffer_tokens)
+        recuperador = recuperacion.Recuperacion(self, lambda: buffer_tokens.indice, self.max_errores_sintacticos)
+        return self._parse(buffer_tokens.tokenfunc(), recuperador)
+
+    def _parse(self, tokenfunc, recuperador):
+        """Corre el parser sobre `tokenfunc` con la recuperación de errores
+        de `recuperador` (una recuperacion.Recuperacion de esta sesión)."""
+        self.recuperacion = recuperador
+        try:
+            ast = recuperador.parsear(_retornos_con_valor(_parametros_sueltos(tokenfunc, self.lexer), self.lexer))
+        finally:
+            self.recuperacion = None
+        # cortado por el máximo de errores de sintaxis: el AST quedó a medias
+        return None if recuperador.cortado else ast
+
+    def verificar(self, ast, fuente):
+        """Pasada semántica sobre `ast`. `fuente` da la línea y la columna de
+        los mensajes: el `indice` del BufferTokens o TablaTokens del código,
+        o un flujo.IndiceArchivo."""
+        if ast is None:
+            return
+        estado = self.estado_incremental
+        if estado is not None and estado.ast is ast:
+            reparseo.verificar(self, estado, fuente)
+        else:
+            semantica.verificar(ast, self, fuente)
+
+    def analizar(self, codigo, etapa=ETAPA_COMPLETA):
+        """Análisis de `codigo` hasta `etapa` (ver ETAPAS); devuelve el AST,
+        o None si no se llegó a armarlo (etapa léxica, entrada rechazada o
+        error de sintaxis sin recuperación)."""
+        _validar_etapa(etapa)
+        self.reiniciar()
+        if self.cache is None:
+            return self._analizar_tokens(self.tokenizar(codigo), etapa)
+        resultado = self.buscar_en_cache(codigo, etapa)
+        if resultado is not None:
+            return resultado.ast
+        buffer_tokens = self.tokenizar(codigo)
+        ast = self._analizar_tokens(buffer_tokens, etapa)
+        self.guardar_en_cache(codigo, ast, buffer_tokens, etapa)
+        return ast
+
+    def _clave_cache(self, codigo, etapa):
+        return cache.clave(codigo, etapa, self.motor_lexico, self.max_errores_lexicos, self.max_errores_sintacticos,
+                           self.reglas.inactivas())
+
+    def buscar_en_cache(self, codigo, etapa=ETAPA_COMPLETA):
+        """Si la caché tiene el análisis de `codigo` hasta `etapa`, lo carga
+        en la sesión (diagnósticos, tabla de símbolos, `rechazado`) y devuelve
+        el cache.Resultado; si no (o sin caché), None."""
+        if self.cache is None:
+            return None
+        resultado = self.cache.buscar(self._clave_cache(codigo, etapa))
+        if resultado is None:
+            return None
+        self.errores_lexicos[:] = resultado.lexicos
+        self.errores_sintacticos[:] = resultado.sintacticos
+        self.errores_semanticos[:] = resultado.semanticos
+        self.advertencias_semanticas[:] = resultado.advertencias
+        self.tabla_simbolos.clear()
+        self.tabla_simbolos.update(resultado.tabla)
+        self.rechazado = resultado.rechazado
+        self.desde_cache = True
+        if self.ultimo_buffer is not None and self.ultimo_buffer.codigo != codigo:
+            # editar() se refiere al último código analizado, que no es el del buffer
+            self.ultimo_buffer = None
+            self.estado_incremental = None
+        return resultado
+
+    def guardar_en_cache(self, codigo, ast, buffer_tokens, etapa=ETAPA_COMPLETA):
+        """Guarda en la caché el análisis recién hecho de `codigo` hasta
+        `etapa` (`ast` y los tokens de `buffer_tokens`, con los diagnósticos
+        y la tabla de símbolos de la sesión)."""
+        if self.cache is None:
+            return
+        resultado = cache.Resultado(ast, list(self.errores_lexicos), list(self.errores_sintacticos),
+                                    list(self.errores_semanticos), list(self.advertencias_semanticas),
+                                    dict(self.tabla_simbolos.items()), self.rechazado, len(buffer_tokens),
+                                    buffer_tokens.conteo_por_tipo())
+        self.cache.guardar(self._clave_cache(codigo, etapa), resultado)
+
+    def editar(self, offset, eliminado, insertado, etapa=ETAPA_COMPLETA):
+        """Como analizar() sobre el código del último análisis con la edición
+        hecha: `eliminado` caracteres desde `offset` reemplazados por
+        `insertado`. Sólo en modo incremental y después de un análisis."""
+        _validar_etapa(etapa)
+        if self.ultimo_buffer is None:
+            raise ValueError("editar() necesita una sesión incremental con un análisis previo")
+        self.reiniciar()
+        buffer_tokens = incremental.relexer(self.ultimo_buffer, offset, eliminado, insertado)
+        self.errores_lexicos[:] = buffer_tokens.mensajes_error()
+        self.ultimo_buffer = buffer_tokens
+        self.rechazado = buffer_tokens.rechazado
+        return self._analizar_tokens(buffer_tokens, etapa)
+
+    def _analizar_tokens(self, buffer_tokens, etapa):
+        if etapa == ETAPA_LEXICA:
+            return None
+        ast = self.parsear(buffer_tokens)
+        if etapa == ETAPA_COMPLETA:
+            self.verificar(ast, buffer_tokens.indice)
+        return ast
+
+    def parsear_archivo(self, ruta, tam_bloque=flujo.TAM_BLOQUE, etapa=ETAPA_COMPLETA):
+        """Analiza un archivo hasta `etapa` leyéndolo en flujo: los tokens se
+        producen por bloques a medida que el parser los pide, sin cargar el
+        archivo entero; la pasada semántica resuelve las posiciones de sus
+        mensajes con un flujo.IndiceArchivo.
+
+        Si el archivo resulta rechazado por errores léxicos o de sintaxis el
+        parser ya consumió una parte: se descarta el AST y se marca `rechazado`."""
+        _validar_etapa(etapa)
+        tokens = flujo.tokens_de_archivo(ruta, tam_bloque, self.lexer)
+        if etapa == ETAPA_LEXICA:
+            for _ in tokens:
+                pass
+            self.rechazado = tokens.rechazado
+            return None
+        indice = flujo.IndiceArchivo(ruta, tam_bloque)
+        ast = self._parse(tokens.tokenfunc(), recuperacion.Recuperacion(self, lambda: indice, self.max_errores_sintacticos))
+        if tokens.rechazado:
+            self.rechazado = True
+            return None
+        if etapa == ETAPA_COMPLETA:
+            self.verificar(ast, indice)
+        return ast
+
+
+# Sesión usada por las funciones de módulo (menú de consola y GUI antiguo).
+# Reutiliza el lexer y la lista de errores léxicos del módulo lexico.
+# Se crea al primer uso, como el lexer y el parser.
+def obtener_sesion_global():
+    global _sesion_global
+    if _sesion_global is None:
+        _sesion_global = SesionAnalisis(lexico.lexer, obtener_parser(), lexico.errores_lexicos)
+    return _sesion_global
+
+
+# Nombres de módulo que se resuelven al primer acceso: main.parser,
+# main.sesion_global y las listas/tabla de la sesión global.
+_ATRIBUTOS_SESION_GLOBAL = ('errores_sintacticos', 'errores_semanticos', 'advertencias_semanticas', 'tabla_simbolos')
+
+
+def __getattr__(nombre):
+    if nombre == 'parser':
+        return obtener_parser()
+    if nombre == 'sesion_global':
+        return obtener_sesion_global()
+    if nombre in _ATRIBUTOS_SESION_GLOBAL:
+        return getattr(obtener_sesion_global(), nombre)
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+def parsear_buffer(buffer_tokens, sesion=None):
+    """Parsea los tokens ya producidos por el lexer, sin volver a tokenizar,
+    y aplica la pasada semántica al AST."""
+    sesion = sesion or obtener_sesion_global()
+    ast = sesion.parsear(buffer_tokens)
+    sesion.verificar(ast, buffer_tokens.indice)
+    return ast
+
+
+# A partir de este tamaño (bytes) analizar_semantica lee el archivo en flujo
+UMBRAL_FLUJO = 16 * 1024 * 1024
+
+
+def analizar_semantica(nombre_archivo, usuario, sesion=None):
+    sesion = sesion or obtener_sesion_global()
+    sesion.reiniciar()  # reiniciar errores y tabla de símbolos cada análisis
 
     # Crear carpetas si no existen
     os.makedirs("algoritmos", exist_ok=True)
@@ -1180,16 +1081,21 @@ def analizar_semantica(nombre_archivo, usuario):
 
     ruta_archivo = os.path.join("algoritmos", nombre_archivo)
 
-    # Leer archivo Ruby
-    try:
-        with open(ruta_archivo, "r", encoding="utf-8") as f:
-            data = f.read()
-    except FileNotFoundError:
+    if not os.path.isfile(ruta_archivo):
         print(f"[ERROR] No se encontró el archivo: {ruta_archivo}")
         return
 
     print(f"Analizando sintaxis de: {ruta_archivo}")
-    parser.parse(data)
+    if os.path.getsize(ruta_archivo) > UMBRAL_FLUJO:
+        # archivos grandes (p. ej. generados): lexer en flujo, memoria acotada
+        sesion.parsear_archivo(ruta_archivo)
+    else:
+        # Leer archivo Ruby
+        with open(ruta_archivo, "r", encoding="utf-8") as f:
+            data = f.read()
+        sesion.analizar(data)
+    if sesion.rechazado:
+        print(f"[RECHAZADO] {ruta_archivo}: demasiados errores léxicos o de sintaxis")
 
     # Crear log
     ahora = datetime.datetime.now().strftime("%d%m%Y-%Hh%M")
@@ -1202,16 +1108,19 @@ def analizar_semantica(nombre_archivo, usuario):
         log.write(f"Fecha y hora: {ahora}\n")
         log.write("=" * 50 + "\n")
 
-        if errores_semanticos:
+        if sesion.rechazado:
+            log.write("Archivo rechazado: se alcanzó el máximo de errores léxicos o de sintaxis.\n")
+
+        if sesion.errores_semanticos:
             log.write("Errores semánticos encontrados:\n")
-            for e in errores_semanticos:
+            for e in sesion.errores_semanticos:
                 log.write(f"- {e}\n")
         else:
             log.write("Sin errores semánticos.\n")
 
-        if advertencias_semanticas:
+        if sesion.advertencias_semanticas:
             log.write("Advertencias semánticas encontradas:\n")
-            for a in advertencias_semanticas:
+            for a in sesion.advertencias_semanticas:
                 log.write(f"- {a}\n")
         else:
             log.write("Sin advertencias semánticas.\n")
@@ -1219,54 +1128,33 @@ def analizar_semantica(nombre_archivo, usuario):
     print(f"Log generado en: {ruta_log}")
 
 
-# -------------------------------------------------
-# Ejecución principal con selección de usuario/archivo
-# -------------------------------------------------
-if __name__ == "__main__":
-    print("Seleccione el algoritmo a analizar:")
-    print("1 - algoritmo1E.rb (emrubio85)")
-    print("2 - algoritmo2B.rb (BrayanBriones)")
-    print("3 - algoritmo3J.rb (Juseperez)")
-    print("4 - algoritmo4B.rb (BrayanBriones)")
-    print("5 - algoritmo5J.rb (Juseperez)")
-    print("6 - algoritmo6E.rb (Emrubio85) ")
-    print("7 - algoritmo7B.rb (BrayanBriones) ")
-    print("8 - algoritmo8J.rb (Juseperez) ")
-    opcion = input("Ingrese su opción: ").strip()
-
-    if opcion == "1":
-        analizar_semantica("algoritmo1E.rb", "emrubio85")
-    elif opcion == "2":
-        analizar_semantica("algoritmo2B.rb", "BrayanBriones")
-    elif opcion == "3":
-        analizar_semantica("algoritmo3J.rb", "Juseperez")
-    elif opcion == "4":
-        analizar_semantica("algoritmo4B.rb", "BrayanBriones")
-    elif opcion == "5":
-        analizar_semantica("algoritmo5J.rb", "Juseperez")
-    elif opcion == "6":
-        analizar_semantica("algoritmo6E.rb", "emrubio85")
-    elif opcion == "7":
-        analizar_semantica("algoritmo7B.rb", "BrayanBriones")
-    elif opcion == "8":
-        analizar_semantica("algoritmo8J.rb", "Juseperez")
-    else:
-        print("Opción no válida.")
-
-
-def analizar_desde_gui(codigo):
-    """Función para que el GUI pueda analizar código directamente"""
-    global errores_sintacticos, errores_semanticos, advertencias_semanticas
+def analizar_desde_gui(codigo, buffer_tokens=None, sesion=None):
+    """Función para que el GUI pueda analizar código directamente.
+    Si se pasa el BufferTokens de la fase léxica, el parser lo reutiliza
+    en lugar de tokenizar el código otra vez."""
+    sesion = sesion or obtener_sesion_global()
 
-    # Limpiar errores previos
-    errores_sintacticos.clear()
-    errores_semanticos.clear()
-    advertencias_semanticas.clear()
+    # Limpiar errores previos (la tabla de símbolos también, para que no crezca entre corridas)
+    sesion.errores_sintacticos.clear()
+    sesion.errores_semanticos.clear()
+    sesion.advertencias_semanticas.clear()
+    sesion.tabla_simbolos.clear()
 
     try:
         # Analizar el código
-        resultado = parser.parse(codigo)
+        if buffer_tokens is None:
+            buffer_tokens = sesion.tokenizar(codigo)
+        resultado = sesion.parsear(buffer_tokens)
+        sesion.verificar(resultado, buffer_tokens.indice)
         return resultado
     except Exception as e:
-        errores_sintacticos.append(f"Error durante el análisis: {str(e)}")
-        return None
\ No newline at end of file
+        sesion.errores_sintacticos.append(f"Error durante el análisis: {str(e)}")
+        return None
+
+
+# -------------------------------------------------
+# Ejecución principal: análisis por lotes (ver lote.py)
+# -------------------------------------------------
+if __name__ == "__main__":
+    import lote
+    sys.exit(lote.principal())
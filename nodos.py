@@ -0,0 +1,562 @@
+"""Nodos del AST que construye el parser de main.py.
+
+Cada clase de nodo declara `__slots__` con sus campos (sin __dict__ por
+instancia) más la posición en el código: `inicio` es el offset (lexpos) de
+su primer token y `fin` el offset justo después del último. Se guarda el
+largo en lugar del fin: casi siempre es un entero chico, que Python no
+vuelve a crear, mientras que `inicio` es el mismo objeto que el lexpos del
+token. El fin de un literal se calcula con el largo de su valor, así que en
+un heredoc abarca sólo el contenido.
+
+`como_tupla()` devuelve la forma de tuplas que usaba el parser antes,
+('etiqueta', campo1, campo2, ...), con los literales como el valor del
+token y los parámetros como (nombre, defecto); sirve para comparar
+resultados y para medir la memoria de las dos formas (ver tamano). Con
+`posiciones=True` cada tupla lleva además inicio y largo al final (y los
+literales pasan a ser (valor, inicio, largo)): la misma información que
+los nodos, para comparar su tamaño en igualdad de condiciones.
+"""
+import sys
+
+
+class Nodo:
+    """Base de los nodos: `etiqueta` es la de la forma de tuplas y `campos`
+    los nombres de los slots propios de la clase, en orden."""
+    __slots__ = ('inicio', 'largo')
+    etiqueta = None
+    campos = ()
+
+    @property
+    def fin(self):
+        return self.inicio + self.largo
+
+    def valores(self):
+        return tuple(getattr(self, campo) for campo in self.campos)
+
+    def hijos(self):
+        """Nodos hijos, en orden (los de los campos que son listas también)."""
+        for campo in self.campos:
+            valor = getattr(self, campo)
+            if isinstance(valor, Nodo):
+                yield valor
+            elif isinstance(valor, list):
+                for elemento in valor:
+                    if isinstance(elemento, Nodo):
+                        yield elemento
+
+    def como_tupla(self, posiciones=False):
+        tupla = (self.etiqueta,) + tuple(_como_tupla(valor, posiciones) for valor in self.valores())
+        return tupla + (self.inicio, self.largo) if posiciones else tupla
+
+    def __repr__(self):
+        argumentos = ', '.join(f'{campo}={getattr(self, campo)!r}' for campo in self.campos)
+        return f'{type(self).__name__}({argumentos})'
+
+
+def _como_tupla(valor, posiciones):
+    if isinstance(valor, Nodo):
+        return valor.como_tupla(posiciones)
+    if isinstance(valor, list):
+        return [_como_tupla(elemento, posiciones) for elemento in valor]
+    return valor
+
+
+def como_tupla(valor, posiciones=False):
+    """Forma de tuplas de un nodo, de una lista de nodos o de un valor suelto."""
+    return _como_tupla(valor, posiciones)
+
+
+# --------------------------------------------------
+# Literales: en la forma de tuplas eran el valor del token sin envolver
+# --------------------------------------------------
+class Literal(Nodo):
+    __slots__ = ('valor',)
+    campos = ('valor',)
+
+    def __init__(self, valor, inicio, largo):
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+    def como_tupla(self, posiciones=False):
+        return (self.valor, self.inicio, self.largo) if posiciones else self.valor
+
+
+class Entero(Literal):
+    __slots__ = ()
+
+
+class Flotante(Literal):
+    """FLOAT: el valor es el texto del token ('3.14')."""
+    __slots__ = ()
+
+
+class Cadena(Literal):
+    """STR: el valor es el texto con sus comillas (o el cuerpo de un heredoc)."""
+    __slots__ = ()
+
+
+class Simbolo(Literal):
+    __slots__ = ()
+
+
+class Booleano(Literal):
+    """true / false: el valor es el texto de la palabra clave."""
+    __slots__ = ()
+
+
+class Nulo(Literal):
+    __slots__ = ()
+
+
+class Numero(Nodo):
+    """Racional o complejo (RATIONAL, COMPLEX), con su texto."""
+    __slots__ = ('valor',)
+    etiqueta = 'num'
+    campos = ('valor',)
+
+    def __init__(self, valor, inicio, largo):
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Regexp(Nodo):
+    __slots__ = ('valor',)
+    etiqueta = 'lit'
+    campos = ('valor',)
+
+    def __init__(self, valor, inicio, largo):
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+# --------------------------------------------------
+# Expresiones
+# --------------------------------------------------
+class Variable(Nodo):
+    __slots__ = ('nombre',)
+    etiqueta = 'var'
+    campos = ('nombre',)
+
+    def __init__(self, nombre, inicio, largo):
+        self.nombre = nombre
+        self.inicio = inicio
+        self.largo = largo
+
+
+class _Binaria(Nodo):
+    __slots__ = ('operador', 'izquierda', 'derecha')
+    campos = ('operador', 'izquierda', 'derecha')
+
+    def __init__(self, operador, izquierda, derecha, inicio, largo):
+        self.operador = operador
+        self.izquierda = izquierda
+        self.derecha = derecha
+        self.inicio = inicio
+        self.largo = largo
+
+
+class OperacionBinaria(_Binaria):
+    __slots__ = ()
+    etiqueta = 'binop'
+
+
+class Comparacion(_Binaria):
+    __slots__ = ()
+    etiqueta = 'cmp'
+
+
+class Logica(_Binaria):
+    """and / or / && / || entre condiciones."""
+    __slots__ = ()
+    etiqueta = 'logic'
+
+
+class Rango(_Binaria):
+    """desde..hasta o desde...hasta: `operador` es '..' o '...'."""
+    __slots__ = ()
+    etiqueta = 'range'
+
+
+class _Unaria(Nodo):
+    __slots__ = ('valor',)
+    campos = ('valor',)
+
+    def __init__(self, valor, inicio, largo):
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+class MenosUnario(_Unaria):
+    __slots__ = ()
+    etiqueta = 'uminus'
+
+
+class Negacion(_Unaria):
+    __slots__ = ()
+    etiqueta = 'not'
+
+
+class Arreglo(Nodo):
+    __slots__ = ('elementos',)
+    etiqueta = 'array'
+    campos = ('elementos',)
+
+    def __init__(self, elementos, inicio, largo):
+        self.elementos = elementos
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Hash(Nodo):
+    __slots__ = ('pares',)
+    etiqueta = 'hash'
+    campos = ('pares',)
+
+    def __init__(self, pares, inicio, largo):
+        self.pares = pares
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Par(Nodo):
+    """Par de un hash: la clave es una expresión, o el texto de un SYMBOL o
+    un nombre en la forma `clave: valor`."""
+    __slots__ = ('clave', 'valor')
+    etiqueta = 'pair'
+    campos = ('clave', 'valor')
+
+    def __init__(self, clave, valor, inicio, largo):
+        self.clave = clave
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Indice(Nodo):
+    """objeto[indice]"""
+    __slots__ = ('objeto', 'indice')
+    etiqueta = 'index'
+    campos = ('objeto', 'indice')
+
+    def __init__(self, objeto, indice, inicio, largo):
+        self.objeto = objeto
+        self.indice = indice
+        self.inicio = inicio
+        self.largo = largo
+
+
+class LlamadaFuncion(Nodo):
+    __slots__ = ('nombre', 'argumentos')
+    etiqueta = 'func_call'
+    campos = ('nombre', 'argumentos')
+
+    def __init__(self, nombre, argumentos, inicio, largo):
+        self.nombre = nombre
+        self.argumentos = argumentos
+        self.inicio = inicio
+        self.largo = largo
+
+
+class LlamadaMetodo(Nodo):
+    """objeto.metodo u objeto.metodo(argumentos)"""
+    __slots__ = ('objeto', 'metodo', 'argumentos')
+    etiqueta = 'call'
+    campos = ('objeto', 'metodo', 'argumentos')
+
+    def __init__(self, objeto, metodo, argumentos, inicio, largo):
+        self.objeto = objeto
+        self.metodo = metodo
+        self.argumentos = argumentos
+        self.inicio = inicio
+        self.largo = largo
+
+
+# --------------------------------------------------
+# Sentencias
+# --------------------------------------------------
+class Programa(Nodo):
+    __slots__ = ('sentencias',)
+    etiqueta = 'program'
+    campos = ('sentencias',)
+
+    def __init__(self, sentencias, inicio, largo):
+        self.sentencias = sentencias
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Imprimir(Nodo):
+    """print / puts: `instruccion` es la palabra usada."""
+    __slots__ = ('instruccion', 'valor')
+    etiqueta = 'print'
+    campos = ('instruccion', 'valor')
+
+    def __init__(self, instruccion, valor, inicio, largo):
+        self.instruccion = instruccion
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Asignacion(Nodo):
+    __slots__ = ('variable', 'operador', 'valor')
+    etiqueta = 'assign'
+    campos = ('variable', 'operador', 'valor')
+
+    def __init__(self, variable, operador, valor, inicio, largo):
+        self.variable = variable
+        self.operador = operador
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Entrada(Nodo):
+    """nombre = gets"""
+    __slots__ = ('variable', 'metodo')
+    etiqueta = 'input'
+    campos = ('variable', 'metodo')
+
+    def __init__(self, variable, metodo, inicio, largo):
+        self.variable = variable
+        self.metodo = metodo
+        self.inicio = inicio
+        self.largo = largo
+
+
+class AsignacionIndice(Nodo):
+    """objeto[indice] = valor u objeto.atributo = valor: el destino es un
+    Indice o una LlamadaMetodo sin argumentos."""
+    __slots__ = ('destino', 'valor')
+    etiqueta = 'array_assign'
+    campos = ('destino', 'valor')
+
+    def __init__(self, destino, valor, inicio, largo):
+        self.destino = destino
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Mientras(Nodo):
+    __slots__ = ('condicion', 'cuerpo')
+    etiqueta = 'while'
+    campos = ('condicion', 'cuerpo')
+
+    def __init__(self, condicion, cuerpo, inicio, largo):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Para(Nodo):
+    """for variable in iterable ... end (la variable es su nombre)."""
+    __slots__ = ('variable', 'iterable', 'cuerpo')
+    etiqueta = 'for'
+    campos = ('variable', 'iterable', 'cuerpo')
+
+    def __init__(self, variable, iterable, cuerpo, inicio, largo):
+        self.variable = variable
+        self.iterable = iterable
+        self.cuerpo = cuerpo
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Si(Nodo):
+    """if: `ramas_elsif` es una lista de SinoSi y `rama_else` la lista de
+    sentencias del else, o None si no hay else."""
+    __slots__ = ('condicion', 'cuerpo', 'ramas_elsif', 'rama_else')
+    etiqueta = 'if'
+    campos = ('condicion', 'cuerpo', 'ramas_elsif', 'rama_else')
+
+    def __init__(self, condicion, cuerpo, ramas_elsif, rama_else, inicio, largo):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+        self.ramas_elsif = ramas_elsif
+        self.rama_else = rama_else
+        self.inicio = inicio
+        self.largo = largo
+
+
+class SinoSi(Nodo):
+    __slots__ = ('condicion', 'cuerpo')
+    etiqueta = 'elsif'
+    campos = ('condicion', 'cuerpo')
+
+    def __init__(self, condicion, cuerpo, inicio, largo):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Llaves(Nodo):
+    """{ sentencias }: sentencias agrupadas entre llaves (nunca vacías: `{}`
+    es un Hash)."""
+    __slots__ = ('sentencias',)
+    etiqueta = 'block'
+    campos = ('sentencias',)
+
+    def __init__(self, sentencias, inicio, largo):
+        self.sentencias = sentencias
+        self.inicio = inicio
+        self.largo = largo
+
+
+class _Salto(Nodo):
+    """break / next: la línea se calcula con `inicio` al informarlos."""
+    __slots__ = ()
+
+    def __init__(self, inicio, largo):
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Break(_Salto):
+    __slots__ = ()
+    etiqueta = 'break'
+
+
+class Next(_Salto):
+    __slots__ = ()
+    etiqueta = 'next'
+
+
+class Retorno(Nodo):
+    """return [valor]: `valor` es None si no hay expresión."""
+    __slots__ = ('valor',)
+    etiqueta = 'return'
+    campos = ('valor',)
+
+    def __init__(self, valor, inicio, largo):
+        self.valor = valor
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Parametro(Nodo):
+    """Parámetro de un def: `defecto` es la expresión del valor por defecto o None."""
+    __slots__ = ('nombre', 'defecto')
+    etiqueta = 'param'
+    campos = ('nombre', 'defecto')
+
+    def __init__(self, nombre, defecto, inicio, largo):
+        self.nombre = nombre
+        self.defecto = defecto
+        self.inicio = inicio
+        self.largo = largo
+
+    def como_tupla(self, posiciones=False):
+        tupla = (self.nombre, _como_tupla(self.defecto, posiciones))
+        return tupla + (self.inicio, self.largo) if posiciones else tupla
+
+
+class Funcion(Nodo):
+    """def: `retorno` es la anotación de tipo de retorno, o None sin ella."""
+    __slots__ = ('nombre', 'parametros', 'retorno', 'cuerpo')
+    etiqueta = 'def'
+    campos = ('nombre', 'parametros', 'retorno', 'cuerpo')
+
+    def __init__(self, nombre, parametros, retorno, cuerpo, inicio, largo):
+        self.nombre = nombre
+        self.parametros = parametros
+        self.retorno = retorno
+        self.cuerpo = cuerpo
+        self.inicio = inicio
+        self.largo = largo
+
+
+class Clase(Nodo):
+    """class Nombre [< Padre] ... end: `padre` es el nombre o None."""
+    __slots__ = ('nombre', 'padre', 'cuerpo')
+    etiqueta = 'class'
+    campos = ('nombre', 'padre', 'cuerpo')
+
+    def __init__(self, nombre, padre, cuerpo, inicio, largo):
+        self.nombre = nombre
+        self.padre = padre
+        self.cuerpo = cuerpo
+        self.inicio = inicio
+        self.largo = largo
+
+
+class ErrorSemantico(Nodo):
+    """elsif / else fuera de un if: `motivo` identifica el error."""
+    __slots__ = ('motivo',)
+    etiqueta = 'semantic_error'
+    campos = ('motivo',)
+
+    def __init__(self, motivo, inicio, largo):
+        self.motivo = motivo
+        self.inicio = inicio
+        self.largo = largo
+
+
+# Nodos sin hijos
+HOJAS = frozenset((Entero, Flotante, Cadena, Simbolo, Booleano, Nulo, Numero, Regexp, Variable,
+                   Break, Next, ErrorSemantico))
+
+
+def desplazar(nodo, delta):
+    """Suma `delta` al inicio de `nodo` y de todo su subárbol: el mismo
+    código, movido por una edición anterior a él (los nodos no guardan
+    líneas: salen del offset al informar)."""
+    pendientes = [nodo]
+    sacar, agregar, extender = pendientes.pop, pendientes.append, pendientes.extend
+    while pendientes:
+        actual = sacar()
+        actual.inicio += delta
+        if type(actual) in HOJAS:
+            continue
+        for campo in actual.campos:
+            valor = getattr(actual, campo)
+            if type(valor) is list:
+                extender(valor)
+            elif isinstance(valor, Nodo):
+                agregar(valor)
+
+
+# --------------------------------------------------
+# Memoria
+# --------------------------------------------------
+def tamano(raiz, posiciones=False):
+    """Bytes (sys.getsizeof) de la estructura de un AST: nodos, listas y
+    tuplas, y los offsets que no son enteros compartidos por Python. No
+    cuenta los valores de los tokens (nombres, textos de los literales), que
+    son los mismos objetos en la forma de nodos y en la de tuplas. Sirve
+    para cualquiera de las formas; en las tuplas se cuentan como offsets
+    los dos últimos elementos si `posiciones` (ver como_tupla)."""
+    vistos = set()
+    total = 0
+    pendientes = [raiz]
+    while pendientes:
+        valor = pendientes.pop()
+        if id(valor) in vistos:
+            continue
+        if isinstance(valor, Nodo):
+            vistos.add(id(valor))
+            total += sys.getsizeof(valor)
+            offsets = (valor.inicio, valor.largo)
+            pendientes.extend(valor.valores())
+        elif isinstance(valor, (list, tuple)):
+            vistos.add(id(valor))
+            total += sys.getsizeof(valor)
+            if posiciones and isinstance(valor, tuple):
+                offsets = valor[-2:]
+                pendientes.extend(valor[:-2])
+            else:
+                offsets = ()
+                pendientes.extend(valor)
+        else:
+            continue
+        for offset in offsets:
+            if not -5 <= offset <= 256 and id(offset) not in vistos:
+                vistos.add(id(offset))
+                total += sys.getsizeof(offset)
+    return total
@@ -1,188 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'leftORORORleftANDANDANDleftEQNEEQQMATCHNMATCHLTLEGTGEleftPLUSMINUSleftMULTDIVMODrightPOWERrightUMINUSALIAS AND ANDAND ARROW BANG BEGIN_S BEGIN_U BREAK B_AND B_LEFT_SHIFT B_ONES B_OR B_RIGHT_SHIFT B_XOR CASE CLASS CLASS_VAR CMP COLON COMMA COMPLEX CONSTANT DEF DEFINEDQ DIV DIVEQLS DO DOT ELSE ELSIF ENCODING END_S END_U ENSURE EQ EQLS EQQ FALSE FILE FLOAT FOR GE GLOBAL_VAR GT IF IN INSTANCE_VAR INTEGER INTERPOLATION LBRACE LBRACKET LE LINE LOCAL_VAR LPAREN LT MATCH MINUS MINUSEQLS MOD MODEQLS MODULE MULT MULTEQLS NE NEXT NIL NMATCH NOT OR OROR PLUS PLUSEQLS POWER POWEREQLS PRINT PUTS QUESTION RANGE_EXCL RANGE_INCL RATIONAL RBRACE RBRACKET REDO REGEXP RESCUE RETRY RETURN RPAREN SELF SEMICOLON STR SUPER SYMBOL THEN TRUE TYPE UNDEF UNLESS UNTIL WHEN WHILE YIELDprogram : statement_liststatement_list : statement_list statementstatement_list : statementstatement : BREAKstatement : NEXTstmt_block : statementstmt_block : stmt_block statementstmt_block : LBRACE statement_list RBRACEstmt_block : statement_liststatement : print_stmt\n                 | input_stmt\n                 | assignment\n                 | while_stmt\n                 | for_stmt\n                 | hash_literal\n                 | function_def\n                 | if_stmt\n                 | optional_then\n                 | stmt_block\n                 | elsif_list\n                 | else_part\n                 | expressionprint_stmt : PRINT expression\n                  | PUTS expressioninput_stmt : variable EQLS LOCAL_VARvariable : GLOBAL_VAR\n                | LOCAL_VAR\n                | INSTANCE_VAR\n                | CLASS_VAR\n                | CONSTANTassignment : variable EQLS expression\n                  | variable PLUSEQLS expression\n                  | variable MINUSEQLS expression\n                  | variable MULTEQLS expression\n                  | variable DIVEQLS expression\n                  | variable MODEQLS expression\n                  | variable POWEREQLS expressionwhile_stmt : WHILE expression_logic while_enter DO statement_list END_S while_exit\n                  | WHILE expression_logic while_enter statement_list END_S while_exitwhile_enter :while_exit :if_stmt : IF expression_logic optional_then stmt_block elsif_list else_part END_Soptional_then : THENoptional_then : emptyelsif_list : emptyelsif_list : elsif_list ELSIF expression_logic optional_then stmt_blockelse_part : emptyelse_part : ELSE stmt_blockstatement : ELSIF expression_logic optional_then stmt_blockstatement : ELSIF expressionstatement : ELSE stmt_blockstatement : ELSEfor_stmt : FOR LOCAL_VAR IN expression for_enter DO statement_list END_S for_exit\n                | FOR LOCAL_VAR IN expression for_enter statement_list END_S for_exitfor_enter :for_exit :if_stmt : IF expression_logic stmt_block END_Sif_stmt : IF expression_logic stmt_block ELSE stmt_block END_Sif_stmt : IF expression_logic stmt_block elsif_list END_Sif_stmt : IF expression_logic stmt_block elsif_list ELSE stmt_block END_Selsif_list : ELSIF expression stmt_blockelsif_list : ELSIF expression stmt_block elsif_listelse_block : ELSE stmt_blockexpression_logic : expression_logic ANDAND expression_logic\n                        | expression_logic OROR expression_logic\n                        | expression_logic AND expression_logic\n                        | expression_logic OR expression_logicexpression_logic : expression_compareexpression_compare : expression LT expression\n                          | expression LE expression\n                          | expression GT expression\n                          | expression GE expression\n                          | expression EQ expression\n                          | expression NE expression\n                          | expression EQQ expression\n                          | expression MATCH expression\n                          | expression NMATCH expressionexpression : NOT expressionhash_literal : LBRACE hash_pairs_opt RBRACEhash_pairs_opt : hash_pairs_opt : hash_pairshash_pairs : hash_pairs COMMA hash_pairhash_pairs : hash_pairhash_pair : expression ARROW expressionhash_pair : SYMBOL COLON expressionhash_pair : LOCAL_VAR COLON expressionexpression : hash_literalexpression : expression RANGE_INCL expression\n                  | expression RANGE_EXCL expressionexpr_list : expressionexpr_list : expression COMMA expr_listarray_literal : LBRACKET RBRACKETarray_literal : LBRACKET expr_list RBRACKETprimary : INTEGER\n               | FLOAT\n               | STR\n               | SYMBOL\n               | variable\n               | TRUE\n               | FALSE\n               | NIL\n               | LPAREN expression RPAREN\n               | array_literalexpr_postfix : LOCAL_VAR LPAREN RPAREN\n                    | LOCAL_VAR LPAREN expr_list RPARENexpr_postfix : expr_postfix LBRACKET expression RBRACKETexpr_postfix : primaryexpr_arith : expr_postfixassignment : expr_postfix EQLS expressionfunction_def : DEF LOCAL_VAR statement_list END_S\n                    | DEF LOCAL_VAR LPAREN param_list RPAREN statement_list END_Soptional_params : param_list\n                       | emptyparam_list : parameter\n                  | param_list COMMA parameterparameter : LOCAL_VAR\n                 | LOCAL_VAR EQLS expressionempty :function_def : DEF LOCAL_VAR optional_params optional_ret statement_list END_Soptional_ret : COLON TYPE\n                    | emptystatement : RETURN\n                 | RETURN expressionexpression : NILexpression : TRUEexpression : FALSEclass_def : CLASS CONSTANT stmt_block END_S\n                 | CLASS CONSTANT opt_inherit stmt_block END_Sopt_inherit : LT CONSTANT\n                   | emptystatement : class_defproperty_decl : INSTANCE_VAR\n                     | CLASS_VARstatement : property_declmethod_def : function_defstatement : method_defexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression MULT expression\n                  | expression DIV expression\n                  | expression MOD expression\n                  | expression POWER expressionexpression : LPAREN expression RPARENexpression : INTEGER\n                  | FLOAT\n                  | RATIONAL\n                  | COMPLEXexpression : STR\n                  | SYMBOL\n                  | REGEXPexpression : variableexpression : expr_postfixexpr_postfix : expr_postfix DOT LOCAL_VAR\n                    | expr_postfix DOT LOCAL_VAR LPAREN RPAREN\n                    | expr_postfix DOT LOCAL_VAR LPAREN expr_list RPARENexpression : MINUS expression %prec UMINUSvalor : INTEGERvalor : LOCAL_VAR'
-    
-_lr_action_items = {'BREAK':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[4,4,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,4,-20,-21,-22,4,-122,-131,-134,-136,-98,-27,-152,4,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,4,-2,-3,-118,4,-68,-87,-98,-152,-28,-29,4,-3,4,-123,-23,-24,-40,4,-22,-97,-27,4,4,-78,-156,4,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,4,-44,4,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,4,-79,-8,-27,4,-112,-118,-44,-114,-102,4,4,4,4,-44,-93,4,4,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,4,4,-55,-110,4,-121,4,-57,4,-20,-127,4,-129,4,4,-154,4,-41,4,-117,4,-115,-116,4,-120,-20,4,-59,4,-128,-155,-41,-39,4,4,4,-119,4,-58,4,-38,4,-56,-111,-42,4,-60,-56,-54,-53,]),'NEXT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[5,5,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,5,-20,-21,-22,5,-122,-131,-134,-136,-98,-27,-152,5,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,5,-2,-3,-118,5,-68,-87,-98,-152,-28,-29,5,-3,5,-123,-23,-24,-40,5,-22,-97,-27,5,5,-78,-156,5,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,5,-44,5,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,5,-79,-8,-27,5,-112,-118,-44,-114,-102,5,5,5,5,-44,-93,5,5,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,5,5,-55,-110,5,-121,5,-57,5,-20,-127,5,-129,5,5,-154,5,-41,5,-117,5,-115,-116,5,-120,-20,5,-59,5,-128,-155,-41,-39,5,5,5,-119,5,-58,5,-38,5,-56,-111,-42,5,-60,-56,-54,-53,]),'ELSIF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[19,19,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,19,61,-21,-22,19,-122,-131,-134,-136,-98,-27,-152,19,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,19,-2,-3,-118,19,-68,-87,-98,-152,-28,-29,19,-3,19,-123,-23,-24,-40,19,-22,-97,-27,19,19,-78,-156,19,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,19,-44,187,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,19,-79,-8,-27,19,-112,-118,-44,-114,-102,19,187,19,19,-44,-93,19,19,-64,-65,-66,-67,61,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,19,19,-55,-110,19,-121,187,-57,19,61,-127,19,-129,19,19,-154,19,-41,19,-117,19,-115,-116,19,-120,61,19,-59,19,-128,-155,-41,-39,19,19,19,-119,19,-58,19,-38,19,-56,-111,-42,19,-60,-56,-54,-53,]),'ELSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[20,20,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,20,-20,-21,-22,20,-122,-131,-134,-136,-98,-27,-152,20,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,20,-2,-3,-118,20,-68,-87,-98,-152,-28,-29,20,-3,20,-123,-23,-24,-40,20,-22,-97,-27,20,20,-78,-156,20,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,20,-44,20,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,20,-79,-8,-27,20,-112,-118,-44,-114,-102,20,219,20,20,-44,-93,20,20,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,20,20,-55,-110,20,-121,20,-57,20,241,-127,20,-129,20,20,-154,20,-41,20,-117,20,-115,-116,20,-120,252,20,-59,20,-128,-155,-41,-39,20,20,20,-119,20,-58,20,-38,20,-56,-111,-42,20,-60,-56,-54,-53,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[21,21,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,21,-20,-21,-22,21,-122,-131,-134,-136,-98,-27,-152,21,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,21,-2,-3,-118,21,-68,-87,-98,-152,-28,-29,21,-3,21,-123,-23,-24,-40,21,-22,-97,-27,21,21,-78,-156,21,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,21,-44,21,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,21,-79,-8,-27,21,-112,-118,-44,-114,-102,21,21,21,21,-44,-93,21,21,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,21,21,-55,-110,21,-121,21,-57,21,-20,-127,21,-129,21,21,-154,21,-41,21,-117,21,-115,-116,21,-120,-20,21,-59,21,-128,-155,-41,-39,21,21,21,-119,21,-58,21,-38,21,-56,-111,-42,21,-60,-56,-54,-53,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[25,25,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,25,-20,-21,-22,25,-122,-131,-134,-136,-98,-27,-152,25,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,25,-2,-3,-118,25,-68,-87,-98,-152,-28,-29,25,-3,25,-123,-23,-24,-40,25,-22,-97,-27,25,25,-78,-156,25,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,25,-44,25,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,25,-79,-8,-27,25,-112,-118,-44,-114,-102,25,25,25,25,-44,-93,25,25,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,25,25,-55,-110,25,-121,25,-57,25,-20,-127,25,-129,25,25,-154,25,-41,25,-117,25,-115,-116,25,-120,-20,25,-59,25,-128,-155,-41,-39,25,25,25,-119,25,-58,25,-38,25,-56,-111,-42,25,-60,-56,-54,-53,]),'PUTS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[26,26,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,26,-20,-21,-22,26,-122,-131,-134,-136,-98,-27,-152,26,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,26,-2,-3,-118,26,-68,-87,-98,-152,-28,-29,26,-3,26,-123,-23,-24,-40,26,-22,-97,-27,26,26,-78,-156,26,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,26,-44,26,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,26,-79,-8,-27,26,-112,-118,-44,-114,-102,26,26,26,26,-44,-93,26,26,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,26,26,-55,-110,26,-121,26,-57,26,-20,-127,26,-129,26,26,-154,26,-41,26,-117,26,-115,-116,26,-120,-20,26,-59,26,-128,-155,-41,-39,26,26,26,-119,26,-58,26,-38,26,-56,-111,-42,26,-60,-56,-54,-53,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[30,30,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,30,-20,-21,-22,30,-122,-131,-134,-136,-98,-27,-152,30,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,30,-2,-3,-118,30,-68,-87,-98,-152,-28,-29,30,-3,30,-123,-23,-24,-40,30,-22,-97,-27,30,30,-78,-156,30,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,30,-44,30,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,30,-79,-8,-27,30,-112,-118,-44,-114,-102,30,30,30,30,-44,-93,30,30,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,30,30,-55,-110,30,-121,30,-57,30,-20,-127,30,-129,30,30,-154,30,-41,30,-117,30,-115,-116,30,-120,-20,30,-59,30,-128,-155,-41,-39,30,30,30,-119,30,-58,30,-38,30,-56,-111,-42,30,-60,-56,-54,-53,]),'FOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[31,31,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,31,-20,-21,-22,31,-122,-131,-134,-136,-98,-27,-152,31,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,31,-2,-3,-118,31,-68,-87,-98,-152,-28,-29,31,-3,31,-123,-23,-24,-40,31,-22,-97,-27,31,31,-78,-156,31,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,31,-44,31,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,31,-79,-8,-27,31,-112,-118,-44,-114,-102,31,31,31,31,-44,-93,31,31,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,31,31,-55,-110,31,-121,31,-57,31,-20,-127,31,-129,31,31,-154,31,-41,31,-117,31,-115,-116,31,-120,-20,31,-59,31,-128,-155,-41,-39,31,31,31,-119,31,-58,31,-38,31,-56,-111,-42,31,-60,-56,-54,-53,]),'LBRACE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[32,32,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,32,-20,-21,-22,76,81,76,-131,-134,-136,76,76,-98,-27,-152,76,32,76,76,-43,-44,76,-101,-99,-100,76,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,76,-107,-103,32,-2,-3,76,76,76,76,76,76,76,76,76,-118,81,-68,-87,-98,-152,76,-28,-29,32,-3,32,-123,-23,-24,76,76,76,76,76,76,76,76,76,76,-40,32,-22,-97,-27,32,81,-78,-156,81,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,81,76,76,76,76,-44,32,76,76,76,76,76,76,76,76,76,76,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,32,76,-79,-8,76,76,76,76,-27,32,76,-112,-118,-44,-114,-102,81,32,32,81,-44,-93,76,81,32,-64,-65,-66,-67,76,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,76,32,32,-55,76,-110,32,-121,32,-57,81,-20,-127,32,-129,32,81,-154,32,-41,32,-117,32,-115,-116,32,-120,-20,32,-59,81,-128,-155,-41,-39,32,32,32,-119,81,-58,32,-38,32,-56,-111,-42,32,-60,-56,-54,-53,]),'DEF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[33,33,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,33,-20,-21,-22,33,-122,-131,-134,-136,-98,-27,-152,33,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,33,-2,-3,-118,33,-68,-87,-98,-152,-28,-29,33,-3,33,-123,-23,-24,-40,33,-22,-97,-27,33,33,-78,-156,33,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,33,-44,33,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,33,-79,-8,-27,33,-112,-118,-44,-114,-102,33,33,33,33,-44,-93,33,33,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,33,33,-55,-110,33,-121,33,-57,33,-20,-127,33,-129,33,33,-154,33,-41,33,-117,33,-115,-116,33,-120,-20,33,-59,33,-128,-155,-41,-39,33,33,33,-119,33,-58,33,-38,33,-56,-111,-42,33,-60,-56,-54,-53,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[35,35,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,35,-20,-21,-22,35,-122,-131,-134,-136,-98,-27,-152,35,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,35,-2,-3,-118,35,-68,-87,-98,-152,-28,-29,35,-3,35,-123,-23,-24,-40,35,-22,-97,-27,35,35,-78,-156,35,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,35,-44,35,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,35,-79,-8,-27,35,-112,-118,-44,-114,-102,35,35,35,35,-44,-93,35,35,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,35,35,-55,-110,35,-121,35,-57,35,-20,-127,35,-129,35,35,-154,35,-41,35,-117,35,-115,-116,35,-120,-20,35,-59,35,-128,-155,-41,-39,35,35,35,-119,35,-58,35,-38,35,-56,-111,-42,35,-60,-56,-54,-53,]),'THEN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[36,36,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,36,-20,-21,-22,36,-122,-131,-134,-136,-98,-27,-152,36,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,36,-2,-3,36,36,-68,-87,-98,-152,-28,-29,36,-3,36,-123,-23,-24,-40,36,-22,-97,-27,36,36,-78,-156,36,-92,36,-88,-89,-137,-138,-139,-140,-141,-142,36,-44,36,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,36,-79,-8,-27,36,-112,-118,-44,-114,-102,36,36,36,36,-44,-93,36,36,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,36,36,-55,-110,36,-121,36,-57,36,-20,-127,36,-129,36,36,-154,36,-41,36,-117,36,-115,-116,36,-120,-20,36,-59,36,-128,-155,-41,-39,36,36,36,-119,36,-58,36,-38,36,-56,-111,-42,36,-60,-56,-54,-53,]),'NOT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[38,38,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,38,-20,-21,-22,38,38,38,-131,-134,-136,38,38,-98,-27,-152,38,38,38,38,-43,-44,38,-101,-99,-100,38,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,38,-107,-103,38,-2,-3,38,38,38,38,38,38,38,38,38,-118,38,-68,-87,-98,-152,38,-28,-29,38,-3,38,-123,-23,-24,38,38,38,38,38,38,38,38,38,38,-40,38,-22,-97,-27,38,38,-78,-156,38,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,38,38,38,38,38,-44,38,38,38,38,38,38,38,38,38,38,38,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,38,38,-79,-8,38,38,38,38,-27,38,38,-112,-118,-44,-114,-102,38,38,38,38,-44,-93,38,38,38,-64,-65,-66,-67,38,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,38,38,38,-55,38,-110,38,-121,38,-57,38,-20,-127,38,-129,38,38,-154,38,-41,38,-117,38,-115,-116,38,-120,-20,38,-59,38,-128,-155,-41,-39,38,38,38,-119,38,-58,38,-38,38,-56,-111,-42,38,-60,-56,-54,-53,]),'NIL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[39,39,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,39,-20,-21,-22,39,39,39,-131,-134,-136,39,39,-98,-27,-152,39,39,39,39,-43,-44,39,-101,-99,-100,39,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,39,-107,-103,39,-2,-3,39,39,39,39,39,39,39,39,39,-118,39,-68,-87,-98,-152,39,-28,-29,39,-3,39,-123,-23,-24,39,39,39,39,39,39,39,39,39,39,-40,39,-22,-97,-27,39,39,-78,-156,39,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,39,39,39,39,39,-44,39,39,39,39,39,39,39,39,39,39,39,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,39,39,-79,-8,39,39,39,39,-27,39,39,-112,-118,-44,-114,-102,39,39,39,39,-44,-93,39,39,39,-64,-65,-66,-67,39,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,39,39,39,-55,39,-110,39,-121,39,-57,39,-20,-127,39,-129,39,39,-154,39,-41,39,-117,39,-115,-116,39,-120,-20,39,-59,39,-128,-155,-41,-39,39,39,39,-119,39,-58,39,-38,39,-56,-111,-42,39,-60,-56,-54,-53,]),'TRUE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[40,40,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,40,-20,-21,-22,40,40,40,-131,-134,-136,40,40,-98,-27,-152,40,40,40,40,-43,-44,40,-101,-99,-100,40,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,40,-107,-103,40,-2,-3,40,40,40,40,40,40,40,40,40,-118,40,-68,-87,-98,-152,40,-28,-29,40,-3,40,-123,-23,-24,40,40,40,40,40,40,40,40,40,40,-40,40,-22,-97,-27,40,40,-78,-156,40,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,40,40,40,40,40,-44,40,40,40,40,40,40,40,40,40,40,40,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,40,40,-79,-8,40,40,40,40,-27,40,40,-112,-118,-44,-114,-102,40,40,40,40,-44,-93,40,40,40,-64,-65,-66,-67,40,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,40,40,40,-55,40,-110,40,-121,40,-57,40,-20,-127,40,-129,40,40,-154,40,-41,40,-117,40,-115,-116,40,-120,-20,40,-59,40,-128,-155,-41,-39,40,40,40,-119,40,-58,40,-38,40,-56,-111,-42,40,-60,-56,-54,-53,]),'FALSE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[41,41,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,41,-20,-21,-22,41,41,41,-131,-134,-136,41,41,-98,-27,-152,41,41,41,41,-43,-44,41,-101,-99,-100,41,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,41,-107,-103,41,-2,-3,41,41,41,41,41,41,41,41,41,-118,41,-68,-87,-98,-152,41,-28,-29,41,-3,41,-123,-23,-24,41,41,41,41,41,41,41,41,41,41,-40,41,-22,-97,-27,41,41,-78,-156,41,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,41,41,41,41,41,-44,41,41,41,41,41,41,41,41,41,41,41,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,41,41,-79,-8,41,41,41,41,-27,41,41,-112,-118,-44,-114,-102,41,41,41,41,-44,-93,41,41,41,-64,-65,-66,-67,41,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,41,41,41,-55,41,-110,41,-121,41,-57,41,-20,-127,41,-129,41,41,-154,41,-41,41,-117,41,-115,-116,41,-120,-20,41,-59,41,-128,-155,-41,-39,41,41,41,-119,41,-58,41,-38,41,-56,-111,-42,41,-60,-56,-54,-53,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[34,34,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,34,-20,-21,-22,34,34,34,-131,-134,-136,34,34,-98,92,-152,34,34,34,34,-43,-44,34,-101,-99,-100,34,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,34,-107,-103,34,-2,-3,34,34,34,34,34,34,34,34,34,-118,34,-68,-87,-98,-152,34,-28,-29,34,-3,34,-123,-23,-24,34,34,34,34,34,34,34,34,34,34,-40,34,-22,-97,92,167,34,-78,-156,34,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,34,34,34,34,34,-44,34,34,34,34,34,34,34,34,34,34,34,-22,-97,92,-31,-32,-33,-34,-35,-36,-37,-104,-109,202,34,34,-79,-8,34,34,34,34,92,34,34,-112,-118,-44,-114,-102,34,34,34,34,-44,-93,34,34,34,-64,-65,-66,-67,34,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,34,34,34,-55,34,-110,34,-121,34,-57,34,-20,-127,34,-129,34,34,-154,34,-41,34,-117,34,-115,-116,34,-120,-20,34,-59,34,-128,-155,-41,-39,34,34,34,-119,34,-58,34,-38,34,-56,-111,-42,34,-60,-56,-54,-53,]),'INTEGER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[43,43,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,43,-20,-21,-22,43,43,43,-131,-134,-136,43,43,-98,-27,-152,43,43,43,43,-43,-44,43,-101,-99,-100,43,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,43,-107,-103,43,-2,-3,43,43,43,43,43,43,43,43,43,-118,43,-68,-87,-98,-152,43,-28,-29,43,-3,43,-123,-23,-24,43,43,43,43,43,43,43,43,43,43,-40,43,-22,-97,-27,43,43,-78,-156,43,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,43,43,43,43,43,-44,43,43,43,43,43,43,43,43,43,43,43,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,43,43,-79,-8,43,43,43,43,-27,43,43,-112,-118,-44,-114,-102,43,43,43,43,-44,-93,43,43,43,-64,-65,-66,-67,43,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,43,43,43,-55,43,-110,43,-121,43,-57,43,-20,-127,43,-129,43,43,-154,43,-41,43,-117,43,-115,-116,43,-120,-20,43,-59,43,-128,-155,-41,-39,43,43,43,-119,43,-58,43,-38,43,-56,-111,-42,43,-60,-56,-54,-53,]),'FLOAT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[44,44,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,44,-20,-21,-22,44,44,44,-131,-134,-136,44,44,-98,-27,-152,44,44,44,44,-43,-44,44,-101,-99,-100,44,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,44,-107,-103,44,-2,-3,44,44,44,44,44,44,44,44,44,-118,44,-68,-87,-98,-152,44,-28,-29,44,-3,44,-123,-23,-24,44,44,44,44,44,44,44,44,44,44,-40,44,-22,-97,-27,44,44,-78,-156,44,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,44,44,44,44,44,-44,44,44,44,44,44,44,44,44,44,44,44,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,44,44,-79,-8,44,44,44,44,-27,44,44,-112,-118,-44,-114,-102,44,44,44,44,-44,-93,44,44,44,-64,-65,-66,-67,44,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,44,44,44,-55,44,-110,44,-121,44,-57,44,-20,-127,44,-129,44,44,-154,44,-41,44,-117,44,-115,-116,44,-120,-20,44,-59,44,-128,-155,-41,-39,44,44,44,-119,44,-58,44,-38,44,-56,-111,-42,44,-60,-56,-54,-53,]),'RATIONAL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[45,45,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,45,-20,-21,-22,45,45,45,-131,-134,-136,45,45,-98,-27,-152,45,45,45,45,-43,-44,45,-101,-99,-100,45,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,45,-107,-103,45,-2,-3,45,45,45,45,45,45,45,45,45,-118,45,-68,-87,-98,-152,45,-28,-29,45,-3,45,-123,-23,-24,45,45,45,45,45,45,45,45,45,45,-40,45,-22,-97,-27,45,45,-78,-156,45,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,45,45,45,45,45,-44,45,45,45,45,45,45,45,45,45,45,45,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,45,45,-79,-8,45,45,45,45,-27,45,45,-112,-118,-44,-114,-102,45,45,45,45,-44,-93,45,45,45,-64,-65,-66,-67,45,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,45,45,45,-55,45,-110,45,-121,45,-57,45,-20,-127,45,-129,45,45,-154,45,-41,45,-117,45,-115,-116,45,-120,-20,45,-59,45,-128,-155,-41,-39,45,45,45,-119,45,-58,45,-38,45,-56,-111,-42,45,-60,-56,-54,-53,]),'COMPLEX':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[46,46,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,46,-20,-21,-22,46,46,46,-131,-134,-136,46,46,-98,-27,-152,46,46,46,46,-43,-44,46,-101,-99,-100,46,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,46,-107,-103,46,-2,-3,46,46,46,46,46,46,46,46,46,-118,46,-68,-87,-98,-152,46,-28,-29,46,-3,46,-123,-23,-24,46,46,46,46,46,46,46,46,46,46,-40,46,-22,-97,-27,46,46,-78,-156,46,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,46,46,46,46,46,-44,46,46,46,46,46,46,46,46,46,46,46,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,46,46,-79,-8,46,46,46,46,-27,46,46,-112,-118,-44,-114,-102,46,46,46,46,-44,-93,46,46,46,-64,-65,-66,-67,46,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,46,46,46,-55,46,-110,46,-121,46,-57,46,-20,-127,46,-129,46,46,-154,46,-41,46,-117,46,-115,-116,46,-120,-20,46,-59,46,-128,-155,-41,-39,46,46,46,-119,46,-58,46,-38,46,-56,-111,-42,46,-60,-56,-54,-53,]),'STR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[47,47,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,47,-20,-21,-22,47,47,47,-131,-134,-136,47,47,-98,-27,-152,47,47,47,47,-43,-44,47,-101,-99,-100,47,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,47,-107,-103,47,-2,-3,47,47,47,47,47,47,47,47,47,-118,47,-68,-87,-98,-152,47,-28,-29,47,-3,47,-123,-23,-24,47,47,47,47,47,47,47,47,47,47,-40,47,-22,-97,-27,47,47,-78,-156,47,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,47,47,47,47,47,-44,47,47,47,47,47,47,47,47,47,47,47,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,47,47,-79,-8,47,47,47,47,-27,47,47,-112,-118,-44,-114,-102,47,47,47,47,-44,-93,47,47,47,-64,-65,-66,-67,47,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,47,47,47,-55,47,-110,47,-121,47,-57,47,-20,-127,47,-129,47,47,-154,47,-41,47,-117,47,-115,-116,47,-120,-20,47,-59,47,-128,-155,-41,-39,47,47,47,-119,47,-58,47,-38,47,-56,-111,-42,47,-60,-56,-54,-53,]),'SYMBOL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[48,48,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,48,-20,-21,-22,48,48,48,-131,-134,-136,48,48,-98,-27,-152,48,104,48,48,-43,-44,48,-101,-99,-100,48,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,48,-107,-103,48,-2,-3,48,48,48,48,48,48,48,48,48,-118,48,-68,-87,-98,-152,104,-28,-29,48,-3,143,-123,-23,-24,48,48,48,48,48,48,48,48,48,48,-40,48,-22,-97,-27,48,48,-78,-156,48,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,48,48,48,48,48,-44,48,48,48,48,48,48,48,48,48,48,48,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,48,48,-79,-8,104,48,48,48,-27,48,48,-112,-118,-44,-114,-102,48,48,48,48,-44,-93,48,48,48,-64,-65,-66,-67,48,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,48,48,48,-55,48,-110,48,-121,48,-57,48,-20,-127,48,-129,48,48,-154,48,-41,48,-117,48,-115,-116,48,-120,-20,48,-59,48,-128,-155,-41,-39,48,48,48,-119,48,-58,48,-38,48,-56,-111,-42,48,-60,-56,-54,-53,]),'REGEXP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[49,49,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,49,-20,-21,-22,49,49,49,-131,-134,-136,49,49,-98,-27,-152,49,49,49,49,-43,-44,49,-101,-99,-100,49,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,49,-107,-103,49,-2,-3,49,49,49,49,49,49,49,49,49,-118,49,-68,-87,-98,-152,49,-28,-29,49,-3,49,-123,-23,-24,49,49,49,49,49,49,49,49,49,49,-40,49,-22,-97,-27,49,49,-78,-156,49,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,49,49,49,49,49,-44,49,49,49,49,49,49,49,49,49,49,49,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,49,49,-79,-8,49,49,49,49,-27,49,49,-112,-118,-44,-114,-102,49,49,49,49,-44,-93,49,49,49,-64,-65,-66,-67,49,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,49,49,49,-55,49,-110,49,-121,49,-57,49,-20,-127,49,-129,49,49,-154,49,-41,49,-117,49,-115,-116,49,-120,-20,49,-59,49,-128,-155,-41,-39,49,49,49,-119,49,-58,49,-38,49,-56,-111,-42,49,-60,-56,-54,-53,]),'MINUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,97,100,103,104,105,106,107,108,109,110,111,112,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,207,208,209,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[42,42,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,42,-20,-21,65,42,42,42,-131,-134,-136,42,42,-98,-27,-152,42,42,42,42,-43,-44,42,-101,-99,-100,42,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,42,-107,-103,42,-2,-3,42,42,42,42,42,42,42,42,42,-118,131,-68,-87,-98,-152,42,-28,-29,42,-3,42,65,65,65,42,42,42,42,42,42,42,42,42,42,-40,65,42,65,-97,-27,42,65,42,65,-156,42,-92,65,-118,65,65,-137,-138,-139,-140,-141,-142,42,42,42,42,42,-44,42,42,42,42,42,42,42,42,42,42,42,65,65,-97,-25,65,65,65,65,65,65,65,-104,65,65,-153,42,42,-79,-8,42,42,42,42,-27,42,42,-112,-118,-44,-114,-102,42,42,42,42,-44,-93,42,42,42,-64,-65,-66,-67,42,-20,-44,-138,65,65,65,65,65,65,65,65,65,-105,-106,42,42,42,65,65,65,65,42,-110,42,-121,42,-57,42,-20,-127,42,-129,42,131,-154,42,-41,42,65,42,-115,-116,42,-120,-20,42,-59,42,-128,-155,-41,-39,42,42,42,-119,42,-58,42,-38,42,-56,-111,-42,42,-60,-56,-54,-53,]),'CLASS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,81,82,83,84,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[50,50,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,50,-20,-21,-22,50,-122,-131,-134,-136,-98,-27,-152,50,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,50,-2,-3,-118,50,-68,-87,-98,-152,-28,-29,50,-3,50,-123,-23,-24,-40,50,-22,-97,-27,50,50,-78,-156,50,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,50,-44,50,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,50,-79,-8,-27,50,-112,-118,-44,-114,-102,50,50,50,50,-44,-93,50,50,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,50,50,-55,-110,50,-121,50,-57,50,-20,-127,50,-129,50,50,-154,50,-41,50,-117,50,-115,-116,50,-120,-20,50,-59,50,-128,-155,-41,-39,50,50,50,-119,50,-58,50,-38,50,-56,-111,-42,50,-60,-56,-54,-53,]),'INSTANCE_VAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[52,52,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,52,-20,-21,-22,77,52,77,-131,-134,-136,77,77,-98,-27,-152,77,52,77,77,-43,-44,77,-101,-99,-100,77,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,77,-107,-103,52,-2,-3,77,77,77,77,77,77,77,77,77,-118,52,-68,-87,-98,-152,77,-28,-29,52,-3,52,-123,-23,-24,77,77,77,77,77,77,77,77,77,77,-40,52,-22,-97,-27,52,52,-78,-156,52,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,52,77,77,77,77,-44,52,77,77,77,77,77,77,77,77,77,77,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,52,77,-79,-8,77,77,77,77,-27,52,77,-112,-118,-44,-114,-102,52,52,52,52,-44,-93,77,52,52,-64,-65,-66,-67,77,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,77,52,52,-55,77,-110,52,-121,52,-57,52,-20,-127,52,-129,52,52,-154,52,-41,52,-117,52,-115,-116,52,-120,-20,52,-59,52,-128,-155,-41,-39,52,52,52,-119,52,-58,52,-38,52,-56,-111,-42,52,-60,-56,-54,-53,]),'CLASS_VAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[53,53,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,53,-20,-21,-22,78,53,78,-131,-134,-136,78,78,-98,-27,-152,78,53,78,78,-43,-44,78,-101,-99,-100,78,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,78,-107,-103,53,-2,-3,78,78,78,78,78,78,78,78,78,-118,53,-68,-87,-98,-152,78,-28,-29,53,-3,53,-123,-23,-24,78,78,78,78,78,78,78,78,78,78,-40,53,-22,-97,-27,53,53,-78,-156,53,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,53,78,78,78,78,-44,53,78,78,78,78,78,78,78,78,78,78,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,53,78,-79,-8,78,78,78,78,-27,53,78,-112,-118,-44,-114,-102,53,53,53,53,-44,-93,78,53,53,-64,-65,-66,-67,78,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,78,53,53,-55,78,-110,53,-121,53,-57,53,-20,-127,53,-129,53,53,-154,53,-41,53,-117,53,-115,-116,53,-120,-20,53,-59,53,-128,-155,-41,-39,53,53,53,-119,53,-58,53,-38,53,-56,-111,-42,53,-60,-56,-54,-53,]),'GLOBAL_VAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[54,54,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,54,-20,-21,-22,54,54,54,-131,-134,-136,54,54,-98,-27,-152,54,54,54,54,-43,-44,54,-101,-99,-100,54,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,54,-107,-103,54,-2,-3,54,54,54,54,54,54,54,54,54,-118,54,-68,-87,-98,-152,54,-28,-29,54,-3,54,-123,-23,-24,54,54,54,54,54,54,54,54,54,54,-40,54,-22,-97,-27,54,54,-78,-156,54,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,54,54,54,54,54,-44,54,54,54,54,54,54,54,54,54,54,54,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,54,54,-79,-8,54,54,54,54,-27,54,54,-112,-118,-44,-114,-102,54,54,54,54,-44,-93,54,54,54,-64,-65,-66,-67,54,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,54,54,54,-55,54,-110,54,-121,54,-57,54,-20,-127,54,-129,54,54,-154,54,-41,54,-117,54,-115,-116,54,-120,-20,54,-59,54,-128,-155,-41,-39,54,54,54,-119,54,-58,54,-38,54,-56,-111,-42,54,-60,-56,-54,-53,]),'LOCAL_VAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,213,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[28,28,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,28,-20,-21,-22,28,28,28,-131,-134,-136,28,28,-98,-27,-152,28,98,105,106,28,28,-43,-44,28,-101,-99,-100,28,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,28,-107,-103,28,-2,-3,28,28,28,28,28,28,28,28,28,-118,28,-68,-87,-98,-152,105,-28,-29,28,-3,105,-123,-23,-24,144,28,28,28,28,28,28,28,28,28,156,-40,28,-22,-97,-27,165,28,-78,-156,28,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,28,28,28,28,28,-44,28,28,28,28,28,28,28,28,28,28,28,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,28,28,-79,-8,105,28,28,28,-27,28,165,-112,-118,-44,-114,-102,28,28,28,28,-44,-93,28,28,28,-64,-65,-66,-67,28,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,28,28,28,-55,28,-110,235,28,-121,28,-57,28,-20,-127,28,-129,28,28,-154,28,-41,28,-117,28,-115,-116,28,-120,-20,28,-59,28,-128,-155,-41,-39,28,28,28,-119,28,-58,28,-38,28,-56,-111,-42,28,-60,-56,-54,-53,]),'CONSTANT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[51,51,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,51,-20,-21,-22,51,51,51,-131,-134,-136,51,51,-98,-27,-152,51,51,51,51,-43,-44,51,-101,-99,-100,51,-94,-95,-146,-147,-96,-97,-150,111,-30,-28,-29,-26,51,-107,-103,51,-2,-3,51,51,51,51,51,51,51,51,51,-118,51,-68,-87,-98,-152,51,-28,-29,51,-3,51,-123,-23,-24,51,51,51,51,51,51,51,51,51,51,-40,51,-22,-97,-27,51,51,-78,-156,51,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,51,51,51,51,51,-44,51,51,51,51,51,51,51,51,51,51,51,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,51,51,-79,-8,51,51,51,51,-27,51,51,-112,-118,-44,-114,-102,51,51,51,51,223,-44,-93,51,51,51,-64,-65,-66,-67,51,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,51,51,51,-55,51,-110,51,-121,51,-57,51,-20,-127,51,-129,51,51,-154,51,-41,51,-117,51,-115,-116,51,-120,-20,51,-59,51,-128,-155,-41,-39,51,51,51,-119,51,-58,51,-38,51,-56,-111,-42,51,-60,-56,-54,-53,]),'LBRACKET':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,96,100,103,104,105,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,142,143,144,145,146,147,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,210,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,258,259,260,261,262,263,264,],[55,55,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,55,-20,-21,-22,55,55,55,-131,-134,-136,55,55,-98,-27,94,55,55,55,55,-43,-44,55,-101,-99,-100,55,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,55,-107,-103,55,-2,-3,55,55,55,55,55,55,55,55,55,-118,55,-68,-87,-98,94,55,-28,-29,55,-3,55,-123,-23,-24,55,55,55,55,55,55,55,55,55,55,-40,55,-22,-97,-27,55,55,-78,-156,55,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,55,55,55,55,55,-44,55,55,55,55,55,55,55,55,55,55,55,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,55,55,-79,-8,55,55,55,55,-27,55,55,-112,-118,-44,-114,-102,55,55,55,55,-44,-93,55,55,55,-64,-65,-66,-67,55,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,55,55,55,-55,55,-110,55,-121,55,-57,55,-20,-127,55,-129,55,55,-154,55,-41,55,-117,55,-115,-116,55,-120,-20,55,-59,55,-128,-155,-41,-39,55,55,55,-119,55,-58,55,-38,55,-56,-111,-42,55,-60,-56,-54,-53,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,82,83,84,109,110,112,115,116,117,118,119,120,121,122,123,124,129,130,144,145,146,147,148,149,150,151,152,154,156,159,160,172,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,211,218,221,225,226,227,230,240,242,243,244,245,249,253,255,257,258,259,261,262,263,264,],[-118,0,-1,-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-52,-122,-131,-134,-136,-98,-27,-152,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,-9,-2,-3,-118,-50,-68,-87,-98,-152,-28,-29,-19,-3,-123,-23,-24,-78,-156,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,-118,-44,-19,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,-79,-8,-102,-93,-118,-19,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-110,-57,-127,-19,-50,-154,-41,-59,-128,-155,-41,-39,-119,-58,-38,-56,-111,-42,-60,-56,-54,-53,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,32,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,99,100,101,102,103,104,105,109,110,112,115,116,117,118,119,120,121,122,123,124,129,130,142,143,144,145,146,147,148,149,150,151,152,154,156,159,160,172,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,206,207,208,209,211,218,221,225,226,227,230,240,242,243,244,245,249,253,255,257,258,259,261,262,263,264,],[-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-52,-122,-131,-134,-136,-98,-27,-152,-80,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,-9,-2,-3,-118,-50,-68,-87,-98,-152,-80,-28,-29,-19,-3,-80,-123,-23,-24,159,160,-81,-83,-22,-97,-27,-78,-156,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,-118,-44,-19,-22,-97,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,-79,-8,-102,-93,-118,-19,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-82,-84,-85,-86,-110,-57,-127,-19,-50,-154,-41,-59,-128,-155,-41,-39,-119,-58,-38,-56,-111,-42,-60,-56,-54,-53,]),'END_S':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,20,21,22,23,24,27,28,29,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,58,59,60,70,71,72,73,74,75,77,78,79,80,82,83,84,96,106,108,109,110,111,112,115,116,117,118,119,120,121,122,123,124,129,130,144,145,146,147,148,149,150,151,152,154,156,157,159,160,165,166,168,169,170,171,172,173,174,175,176,178,179,181,182,183,184,185,186,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,211,214,216,217,218,219,220,221,222,223,225,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,],[-3,-4,-5,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-52,-122,-131,-134,-136,-98,-27,-152,-43,-44,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,-9,-2,-3,-118,-50,-68,-87,-98,-152,-28,-29,-19,-3,-123,-23,-24,-40,-118,-118,-78,-156,-118,-92,-118,-88,-89,-137,-138,-139,-140,-141,-142,-118,-44,-19,-25,-31,-32,-33,-34,-35,-36,-37,-104,-109,-153,-118,-79,-8,-27,211,-112,-118,-44,-114,-102,-18,218,221,-118,-44,-93,-118,-19,-64,-65,-66,-67,-20,-44,-138,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-118,230,-55,-110,-118,-121,-19,-57,-52,240,-127,242,-129,-19,-50,-154,244,-41,-118,-117,-118,-115,-116,249,-120,-20,253,-59,-118,-128,-155,-41,-39,-118,257,258,-119,259,-47,-118,-58,261,-38,262,-56,-111,-42,-19,-60,-56,-54,-53,]),'RANGE_INCL':([11,18,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,71,73,74,75,77,78,82,83,84,97,103,104,105,107,109,110,112,114,116,117,118,119,120,121,122,123,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,159,165,172,179,190,191,192,193,194,195,196,197,198,199,200,201,205,207,208,209,226,227,232,243,],[-87,62,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,62,-87,-98,-152,-28,-29,62,62,62,62,62,-97,-27,62,62,-156,-92,62,62,62,-137,-138,-139,-140,-141,-142,62,62,-97,-27,62,62,62,62,62,62,62,-104,62,62,-153,-79,-27,-102,-93,-138,62,62,62,62,62,62,62,62,62,-105,-106,62,62,62,62,62,-154,62,-155,]),'RANGE_EXCL':([11,18,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,71,73,74,75,77,78,82,83,84,97,103,104,105,107,109,110,112,114,116,117,118,119,120,121,122,123,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,159,165,172,179,190,191,192,193,194,195,196,197,198,199,200,201,205,207,208,209,226,227,232,243,],[-87,63,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,63,-87,-98,-152,-28,-29,63,63,63,63,63,-97,-27,63,63,-156,-92,63,63,63,-137,-138,-139,-140,-141,-142,63,63,-97,-27,63,63,63,63,63,63,63,-104,63,63,-153,-79,-27,-102,-93,-138,63,63,63,63,63,63,63,63,63,-105,-106,63,63,63,63,63,-154,63,-155,]),'PLUS':([11,18,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,71,73,74,75,77,78,82,83,84,97,103,104,105,107,109,110,112,114,116,117,118,119,120,121,122,123,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,159,165,172,179,190,191,192,193,194,195,196,197,198,199,200,201,205,207,208,209,226,227,232,243,],[-87,64,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,64,-87,-98,-152,-28,-29,64,64,64,64,64,-97,-27,64,64,-156,-92,64,64,64,-137,-138,-139,-140,-141,-142,64,64,-97,-27,64,64,64,64,64,64,64,-104,64,64,-153,-79,-27,-102,-93,-138,64,64,64,64,64,64,64,64,64,-105,-106,64,64,64,64,64,-154,64,-155,]),'MULT':([11,18,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,71,73,74,75,77,78,82,83,84,97,103,104,105,107,109,110,112,114,116,117,118,119,120,121,122,123,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,159,165,172,179,190,191,192,193,194,195,196,197,198,199,200,201,205,207,208,209,226,227,232,243,],[-87,66,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,66,-87,-98,-152,-28,-29,66,66,66,66,66,-97,-27,66,66,-156,-92,66,66,66,66,66,-139,-140,-141,-142,66,66,-97,-27,66,66,66,66,66,66,66,-104,66,66,-153,-79,-27,-102,-93,66,66,66,66,66,66,66,66,66,66,-105,-106,66,66,66,66,66,-154,66,-155,]),'DIV':([11,18,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,71,73,74,75,77,78,82,83,84,97,103,104,105,107,109,110,112,114,116,117,118,119,120,121,122,123,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,159,165,172,179,190,191,192,193,194,195,196,197,198,199,200,201,205,207,208,209,226,227,232,243,],[-87,67,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,67,-87,-98,-152,-28,-29,67,67,67,67,67,-97,-27,67,67,-156,-92,67,67,67,67,67,-139,-140,-141,-142,67,67,-97,-27,67,67,67,67,67,67,67,-104,67,67,-153,-79,-27,-102,-93,67,67,67,67,67,67,67,67,67,67,-105,-106,67,67,67,67,67,-154,67,-155,]),'MOD':([11,18,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,71,73,74,75,77,78,82,83,84,97,103,104,105,107,109,110,112,114,116,117,118,119,120,121,122,123,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,159,165,172,179,190,191,192,193,194,195,196,197,198,199,200,201,205,207,208,209,226,227,232,243,],[-87,68,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,68,-87,-98,-152,-28,-29,68,68,68,68,68,-97,-27,68,68,-156,-92,68,68,68,68,68,-139,-140,-141,-142,68,68,-97,-27,68,68,68,68,68,68,68,-104,68,68,-153,-79,-27,-102,-93,68,68,68,68,68,68,68,68,68,68,-105,-106,68,68,68,68,68,-154,68,-155,]),'POWER':([11,18,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,71,73,74,75,77,78,82,83,84,97,103,104,105,107,109,110,112,114,116,117,118,119,120,121,122,123,141,142,143,144,145,146,147,148,149,150,151,152,154,155,156,159,165,172,179,190,191,192,193,194,195,196,197,198,199,200,201,205,207,208,209,226,227,232,243,],[-87,69,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,69,-87,-98,-152,-28,-29,69,69,69,69,69,-97,-27,69,69,-156,-92,69,69,69,69,69,69,69,69,69,69,69,-97,-27,69,69,69,69,69,69,69,-104,69,69,-153,-79,-27,-102,-93,69,69,69,69,69,69,69,69,69,69,-105,-106,69,69,69,69,69,-154,69,-155,]),'ARROW':([11,27,28,29,39,40,41,43,44,45,46,47,48,49,51,52,53,54,56,57,73,74,75,77,78,103,104,105,109,110,112,116,117,118,119,120,121,122,123,141,142,143,152,156,159,172,179,200,201,227,243,],[-87,-98,-27,-152,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-28,-29,-26,-107,-103,-87,-98,-152,-28,-29,162,-97,-27,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,162,162,-97,-104,-153,-79,-102,-93,-105,-106,-154,-155,]),'EQLS':([27,28,29,39,40,41,43,44,47,48,51,52,53,54,56,57,104,105,112,143,152,156,165,172,179,200,201,227,235,243,],[85,-27,93,-101,-99,-100,-94,-95,-96,-97,-30,-28,-29,-26,-107,-103,-97,-27,-92,-97,-104,-153,210,-102,-93,-105,-106,-154,210,-155,]),'PLUSEQLS':([27,28,51,52,53,54,105,165,],[86,-27,-30,-28,-29,-26,-27,-27,]),'MINUSEQLS':([27,28,51,52,53,54,105,165,],[87,-27,-30,-28,-29,-26,-27,-27,]),'MULTEQLS':([27,28,51,52,53,54,105,165,],[88,-27,-30,-28,-29,-26,-27,-27,]),'DIVEQLS':([27,28,51,52,53,54,105,165,],[89,-27,-30,-28,-29,-26,-27,-27,]),'MODEQLS':([27,28,51,52,53,54,105,165,],[90,-27,-30,-28,-29,-26,-27,-27,]),'POWEREQLS':([27,28,51,52,53,54,105,165,],[91,-27,-30,-28,-29,-26,-27,-27,]),'DOT':([27,28,29,39,40,41,43,44,47,48,51,52,53,54,56,57,74,75,77,78,104,105,112,143,144,152,156,165,172,179,200,201,227,243,],[-98,-27,95,-101,-99,-100,-94,-95,-96,-97,-30,-28,-29,-26,-107,-103,-98,95,-28,-29,-97,-27,-92,-97,-27,-104,-153,-27,-102,-93,-105,-106,-154,-155,]),'LT':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,111,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,132,-87,-98,-152,-28,-29,132,-78,-156,177,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,132,-154,-155,]),'LE':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,133,-87,-98,-152,-28,-29,133,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,133,-154,-155,]),'GT':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,134,-87,-98,-152,-28,-29,134,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,134,-154,-155,]),'GE':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,135,-87,-98,-152,-28,-29,135,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,135,-154,-155,]),'EQ':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,136,-87,-98,-152,-28,-29,136,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,136,-154,-155,]),'NE':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,137,-87,-98,-152,-28,-29,137,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,137,-154,-155,]),'EQQ':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,138,-87,-98,-152,-28,-29,138,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,138,-154,-155,]),'MATCH':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,139,-87,-98,-152,-28,-29,139,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,139,-154,-155,]),'NMATCH':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,71,73,74,75,77,78,97,109,110,112,116,117,118,119,120,121,122,123,152,156,159,172,179,190,200,201,226,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,140,-87,-98,-152,-28,-29,140,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-138,-105,-106,140,-154,-155,]),'RPAREN':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,73,74,75,77,78,92,107,109,110,112,114,116,117,118,119,120,121,122,123,152,153,156,159,165,171,172,179,200,201,202,212,224,227,228,232,234,235,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,-87,-98,-152,-28,-29,152,172,-78,-156,-92,-90,-88,-89,-137,-138,-139,-140,-141,-142,-104,200,-153,-79,-27,-114,-102,-93,-105,-106,227,233,-91,-154,243,-117,-115,-116,-155,]),'COMMA':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,73,74,75,77,78,101,102,109,110,112,114,116,117,118,119,120,121,122,123,152,156,159,165,168,171,172,179,200,201,206,207,208,209,212,227,232,234,235,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,-87,-98,-152,-28,-29,161,-83,-78,-156,-92,180,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-116,213,-114,-102,-93,-105,-106,-82,-84,-85,-86,213,-154,-117,-115,-116,-155,]),'RBRACKET':([28,39,40,41,43,44,45,46,47,48,49,51,54,55,56,57,73,74,75,77,78,109,110,112,113,114,116,117,118,119,120,121,122,123,152,155,156,159,172,179,200,201,224,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,112,-107,-103,-87,-98,-152,-28,-29,-78,-156,-92,179,-90,-88,-89,-137,-138,-139,-140,-141,-142,-104,201,-153,-79,-102,-93,-105,-106,-91,-154,-155,]),'ANDAND':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,70,72,73,74,75,77,78,96,108,109,110,112,115,116,117,118,119,120,121,122,123,152,156,159,172,179,183,184,185,186,191,192,193,194,195,196,197,198,199,200,201,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,125,-68,-87,-98,-152,-28,-29,125,125,-78,-156,-92,125,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-64,125,-66,125,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-154,-155,]),'OROR':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,70,72,73,74,75,77,78,96,108,109,110,112,115,116,117,118,119,120,121,122,123,152,156,159,172,179,183,184,185,186,191,192,193,194,195,196,197,198,199,200,201,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,126,-68,-87,-98,-152,-28,-29,126,126,-78,-156,-92,126,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-64,-65,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-154,-155,]),'AND':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,70,72,73,74,75,77,78,96,108,109,110,112,115,116,117,118,119,120,121,122,123,152,156,159,172,179,183,184,185,186,191,192,193,194,195,196,197,198,199,200,201,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,127,-68,-87,-98,-152,-28,-29,127,127,-78,-156,-92,127,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-64,127,-66,127,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-154,-155,]),'OR':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,70,72,73,74,75,77,78,96,108,109,110,112,115,116,117,118,119,120,121,122,123,152,156,159,172,179,183,184,185,186,191,192,193,194,195,196,197,198,199,200,201,227,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,128,-68,-87,-98,-152,-28,-29,128,128,-78,-156,-92,128,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,-79,-102,-93,-64,-65,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-154,-155,]),'DO':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,72,73,74,75,77,78,96,109,110,112,116,117,118,119,120,121,122,123,152,156,157,159,172,179,183,184,185,186,191,192,193,194,195,196,197,198,199,200,201,205,227,231,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,-68,-87,-98,-152,-28,-29,-40,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,-104,-153,203,-79,-102,-93,-64,-65,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-105,-106,-55,-154,246,-155,]),'COLON':([28,39,40,41,43,44,45,46,47,48,49,51,54,56,57,73,74,75,77,78,104,105,106,109,110,112,116,117,118,119,120,121,122,123,143,152,156,159,165,168,169,170,171,172,179,200,201,227,232,234,235,243,],[-27,-101,-99,-100,-94,-95,-146,-147,-96,-97,-150,-30,-26,-107,-103,-87,-98,-152,-28,-29,163,164,-118,-78,-156,-92,-88,-89,-137,-138,-139,-140,-141,-142,163,-104,-153,-79,-116,-112,215,-113,-114,-102,-93,-105,-106,-154,-117,-115,-116,-155,]),'IN':([98,],[158,]),'TYPE':([215,],[237,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[2,58,58,58,100,58,58,58,100,58,166,58,58,58,58,204,58,58,58,58,58,58,58,229,58,236,58,58,58,58,58,58,247,248,58,58,58,256,58,58,58,58,58,58,]),'statement':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[3,59,60,80,3,59,80,60,3,59,3,80,80,80,60,3,59,80,60,60,80,80,60,3,59,3,60,80,60,60,80,59,3,3,59,60,80,3,59,59,80,60,59,60,]),'print_stmt':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'input_stmt':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'assignment':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'while_stmt':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'for_stmt':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'hash_literal':([0,2,15,19,20,21,25,26,30,32,34,35,38,42,55,58,61,62,63,64,65,66,67,68,69,71,76,79,81,85,86,87,88,89,90,91,92,93,94,100,106,108,111,124,125,126,127,128,130,131,132,133,134,135,136,137,138,139,140,157,158,161,162,163,164,166,167,173,174,175,176,180,181,182,187,202,203,204,210,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[11,11,11,73,11,73,73,73,73,11,73,73,73,73,73,11,73,73,73,73,73,73,73,73,73,11,73,11,11,73,73,73,73,73,73,73,73,73,73,11,11,11,11,11,73,73,73,73,11,73,73,73,73,73,73,73,73,73,73,11,73,73,73,73,73,11,73,11,11,11,11,73,11,11,73,73,11,11,73,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'function_def':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'if_stmt':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'optional_then':([0,2,15,20,32,58,70,71,79,81,100,106,108,111,115,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[14,14,14,14,14,14,124,14,14,14,14,14,173,14,181,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'stmt_block':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[15,15,15,79,15,15,130,15,15,15,15,174,175,182,15,15,15,217,15,15,222,225,15,15,15,15,15,239,15,15,130,15,15,15,15,15,254,15,15,15,260,15,15,15,]),'elsif_list':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,188,16,16,16,220,16,16,16,16,16,16,16,238,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'else_part':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,238,239,241,246,247,248,252,254,256,260,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,250,17,17,17,17,17,17,17,17,17,]),'expression':([0,2,15,19,20,21,25,26,30,32,34,35,38,42,55,58,61,62,63,64,65,66,67,68,69,71,76,79,81,85,86,87,88,89,90,91,92,93,94,100,106,108,111,124,125,126,127,128,130,131,132,133,134,135,136,137,138,139,140,157,158,161,162,163,164,166,167,173,174,175,176,180,181,182,187,202,203,204,210,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[18,18,18,71,18,82,83,84,97,103,107,97,109,110,114,18,97,116,117,118,119,120,121,122,123,18,141,18,142,145,146,147,148,149,150,151,114,154,155,18,18,18,18,18,97,97,97,97,18,190,191,192,193,194,195,196,197,198,199,18,205,141,207,208,209,18,107,18,18,18,18,114,18,18,226,114,18,18,232,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'class_def':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'property_decl':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'method_def':([0,2,15,20,32,58,71,79,81,100,106,108,111,124,130,157,166,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'variable':([0,2,15,19,20,21,25,26,30,32,34,35,38,42,55,58,61,62,63,64,65,66,67,68,69,71,76,79,81,85,86,87,88,89,90,91,92,93,94,100,106,108,111,124,125,126,127,128,130,131,132,133,134,135,136,137,138,139,140,157,158,161,162,163,164,166,167,173,174,175,176,180,181,182,187,202,203,204,210,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[27,27,27,74,27,74,74,74,74,27,74,74,74,74,74,27,74,74,74,74,74,74,74,74,74,27,74,27,27,74,74,74,74,74,74,74,74,74,74,27,27,27,27,27,74,74,74,74,27,74,74,74,74,74,74,74,74,74,74,27,74,74,74,74,74,27,74,27,27,27,27,74,27,27,74,74,27,27,74,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'expr_postfix':([0,2,15,19,20,21,25,26,30,32,34,35,38,42,55,58,61,62,63,64,65,66,67,68,69,71,76,79,81,85,86,87,88,89,90,91,92,93,94,100,106,108,111,124,125,126,127,128,130,131,132,133,134,135,136,137,138,139,140,157,158,161,162,163,164,166,167,173,174,175,176,180,181,182,187,202,203,204,210,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[29,29,29,75,29,75,75,75,75,29,75,75,75,75,75,29,75,75,75,75,75,75,75,75,75,29,75,29,29,75,75,75,75,75,75,75,75,75,75,29,29,29,29,29,75,75,75,75,29,75,75,75,75,75,75,75,75,75,75,29,75,75,75,75,75,29,75,29,29,29,29,75,29,29,75,75,29,29,75,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'empty':([0,2,15,20,32,58,70,71,79,81,100,106,108,111,115,124,130,157,166,169,173,174,175,176,181,182,203,204,214,217,219,222,225,226,229,231,233,236,238,239,241,246,247,248,252,254,256,260,],[37,37,37,37,37,37,129,37,37,37,37,170,37,178,129,37,189,37,37,216,37,189,37,37,37,37,37,37,37,189,37,37,37,37,37,37,37,37,251,37,37,37,37,37,37,37,37,37,]),'primary':([0,2,15,19,20,21,25,26,30,32,34,35,38,42,55,58,61,62,63,64,65,66,67,68,69,71,76,79,81,85,86,87,88,89,90,91,92,93,94,100,106,108,111,124,125,126,127,128,130,131,132,133,134,135,136,137,138,139,140,157,158,161,162,163,164,166,167,173,174,175,176,180,181,182,187,202,203,204,210,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'array_literal':([0,2,15,19,20,21,25,26,30,32,34,35,38,42,55,58,61,62,63,64,65,66,67,68,69,71,76,79,81,85,86,87,88,89,90,91,92,93,94,100,106,108,111,124,125,126,127,128,130,131,132,133,134,135,136,137,138,139,140,157,158,161,162,163,164,166,167,173,174,175,176,180,181,182,187,202,203,204,210,214,217,219,222,225,226,229,231,233,236,239,241,246,247,248,252,254,256,260,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'expression_logic':([19,30,35,61,125,126,127,128,187,],[70,96,108,115,183,184,185,186,70,]),'expression_compare':([19,30,35,61,125,126,127,128,187,],[72,72,72,72,72,72,72,72,72,]),'hash_pairs_opt':([32,76,81,],[99,99,99,]),'hash_pairs':([32,76,81,],[101,101,101,]),'hash_pair':([32,76,81,161,],[102,102,102,206,]),'expr_list':([55,92,180,202,],[113,153,224,228,]),'while_enter':([96,],[157,]),'param_list':([106,167,],[168,212,]),'optional_params':([106,],[169,]),'parameter':([106,167,213,],[171,171,234,]),'opt_inherit':([111,],[176,]),'optional_ret':([169,],[214,]),'for_enter':([205,],[231,]),'while_exit':([230,244,],[245,255,]),'for_exit':([257,262,],[263,264,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','main.py',224),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list_multi','main.py',229),
-  ('statement_list -> statement','statement_list',1,'p_statement_list_single','main.py',234),
-  ('statement -> BREAK','statement',1,'p_statement_break','main.py',240),
-  ('statement -> NEXT','statement',1,'p_statement_next','main.py',249),
-  ('stmt_block -> statement','stmt_block',1,'p_stmt_block_single','main.py',257),
-  ('stmt_block -> stmt_block statement','stmt_block',2,'p_stmt_block_multiple','main.py',262),
-  ('stmt_block -> LBRACE statement_list RBRACE','stmt_block',3,'p_stmt_block_multi','main.py',266),
-  ('stmt_block -> statement_list','stmt_block',1,'p_stmt_block_list','main.py',272),
-  ('statement -> print_stmt','statement',1,'p_statement','main.py',280),
-  ('statement -> input_stmt','statement',1,'p_statement','main.py',281),
-  ('statement -> assignment','statement',1,'p_statement','main.py',282),
-  ('statement -> while_stmt','statement',1,'p_statement','main.py',283),
-  ('statement -> for_stmt','statement',1,'p_statement','main.py',284),
-  ('statement -> hash_literal','statement',1,'p_statement','main.py',285),
-  ('statement -> function_def','statement',1,'p_statement','main.py',286),
-  ('statement -> if_stmt','statement',1,'p_statement','main.py',287),
-  ('statement -> optional_then','statement',1,'p_statement','main.py',288),
-  ('statement -> stmt_block','statement',1,'p_statement','main.py',289),
-  ('statement -> elsif_list','statement',1,'p_statement','main.py',290),
-  ('statement -> else_part','statement',1,'p_statement','main.py',291),
-  ('statement -> expression','statement',1,'p_statement','main.py',292),
-  ('print_stmt -> PRINT expression','print_stmt',2,'p_print_stmt','main.py',300),
-  ('print_stmt -> PUTS expression','print_stmt',2,'p_print_stmt','main.py',301),
-  ('input_stmt -> variable EQLS LOCAL_VAR','input_stmt',3,'p_input_stmt','main.py',311),
-  ('variable -> GLOBAL_VAR','variable',1,'p_variable','main.py',320),
-  ('variable -> LOCAL_VAR','variable',1,'p_variable','main.py',321),
-  ('variable -> INSTANCE_VAR','variable',1,'p_variable','main.py',322),
-  ('variable -> CLASS_VAR','variable',1,'p_variable','main.py',323),
-  ('variable -> CONSTANT','variable',1,'p_variable','main.py',324),
-  ('assignment -> variable EQLS expression','assignment',3,'p_assignment','main.py',329),
-  ('assignment -> variable PLUSEQLS expression','assignment',3,'p_assignment','main.py',330),
-  ('assignment -> variable MINUSEQLS expression','assignment',3,'p_assignment','main.py',331),
-  ('assignment -> variable MULTEQLS expression','assignment',3,'p_assignment','main.py',332),
-  ('assignment -> variable DIVEQLS expression','assignment',3,'p_assignment','main.py',333),
-  ('assignment -> variable MODEQLS expression','assignment',3,'p_assignment','main.py',334),
-  ('assignment -> variable POWEREQLS expression','assignment',3,'p_assignment','main.py',335),
-  ('while_stmt -> WHILE expression_logic while_enter DO statement_list END_S while_exit','while_stmt',7,'p_while_stmt','main.py',368),
-  ('while_stmt -> WHILE expression_logic while_enter statement_list END_S while_exit','while_stmt',6,'p_while_stmt','main.py',369),
-  ('while_enter -> <empty>','while_enter',0,'p_while_enter','main.py',374),
-  ('while_exit -> <empty>','while_exit',0,'p_while_exit','main.py',380),
-  ('if_stmt -> IF expression_logic optional_then stmt_block elsif_list else_part END_S','if_stmt',7,'p_if_stmt','main.py',426),
-  ('optional_then -> THEN','optional_then',1,'p_optional_then_present','main.py',439),
-  ('optional_then -> empty','optional_then',1,'p_optional_then_empty','main.py',444),
-  ('elsif_list -> empty','elsif_list',1,'p_elsif_list_empty','main.py',449),
-  ('elsif_list -> elsif_list ELSIF expression_logic optional_then stmt_block','elsif_list',5,'p_elsif_list_left_recursive','main.py',453),
-  ('else_part -> empty','else_part',1,'p_else_part_empty','main.py',459),
-  ('else_part -> ELSE stmt_block','else_part',2,'p_else_part','main.py',463),
-  ('statement -> ELSIF expression_logic optional_then stmt_block','statement',4,'p_statement_invalid_elsif_full','main.py',478),
-  ('statement -> ELSIF expression','statement',2,'p_statement_invalid_elsif_short','main.py',487),
-  ('statement -> ELSE stmt_block','statement',2,'p_statement_invalid_else_full','main.py',496),
-  ('statement -> ELSE','statement',1,'p_statement_invalid_else_short','main.py',505),
-  ('for_stmt -> FOR LOCAL_VAR IN expression for_enter DO statement_list END_S for_exit','for_stmt',9,'p_for_stmt','main.py',516),
-  ('for_stmt -> FOR LOCAL_VAR IN expression for_enter statement_list END_S for_exit','for_stmt',8,'p_for_stmt','main.py',517),
-  ('for_enter -> <empty>','for_enter',0,'p_for_enter','main.py',522),
-  ('for_exit -> <empty>','for_exit',0,'p_for_exit','main.py',528),
-  ('if_stmt -> IF expression_logic stmt_block END_S','if_stmt',4,'p_if_stmt_basic','main.py',535),
-  ('if_stmt -> IF expression_logic stmt_block ELSE stmt_block END_S','if_stmt',6,'p_if_stmt_else','main.py',540),
-  ('if_stmt -> IF expression_logic stmt_block elsif_list END_S','if_stmt',5,'p_if_stmt_elsif','main.py',545),
-  ('if_stmt -> IF expression_logic stmt_block elsif_list ELSE stmt_block END_S','if_stmt',7,'p_if_stmt_elsif_else','main.py',550),
-  ('elsif_list -> ELSIF expression stmt_block','elsif_list',3,'p_elsif_list_single','main.py',559),
-  ('elsif_list -> ELSIF expression stmt_block elsif_list','elsif_list',4,'p_elsif_list_more','main.py',564),
-  ('else_block -> ELSE stmt_block','else_block',2,'p_else_block','main.py',573),
-  ('expression_logic -> expression_logic ANDAND expression_logic','expression_logic',3,'p_expression_logic_chain','main.py',581),
-  ('expression_logic -> expression_logic OROR expression_logic','expression_logic',3,'p_expression_logic_chain','main.py',582),
-  ('expression_logic -> expression_logic AND expression_logic','expression_logic',3,'p_expression_logic_chain','main.py',583),
-  ('expression_logic -> expression_logic OR expression_logic','expression_logic',3,'p_expression_logic_chain','main.py',584),
-  ('expression_logic -> expression_compare','expression_logic',1,'p_expression_logic_simple','main.py',589),
-  ('expression_compare -> expression LT expression','expression_compare',3,'p_expression_compare','main.py',594),
-  ('expression_compare -> expression LE expression','expression_compare',3,'p_expression_compare','main.py',595),
-  ('expression_compare -> expression GT expression','expression_compare',3,'p_expression_compare','main.py',596),
-  ('expression_compare -> expression GE expression','expression_compare',3,'p_expression_compare','main.py',597),
-  ('expression_compare -> expression EQ expression','expression_compare',3,'p_expression_compare','main.py',598),
-  ('expression_compare -> expression NE expression','expression_compare',3,'p_expression_compare','main.py',599),
-  ('expression_compare -> expression EQQ expression','expression_compare',3,'p_expression_compare','main.py',600),
-  ('expression_compare -> expression MATCH expression','expression_compare',3,'p_expression_compare','main.py',601),
-  ('expression_compare -> expression NMATCH expression','expression_compare',3,'p_expression_compare','main.py',602),
-  ('expression -> NOT expression','expression',2,'p_expression_not','main.py',607),
-  ('hash_literal -> LBRACE hash_pairs_opt RBRACE','hash_literal',3,'p_hash_literal','main.py',617),
-  ('hash_pairs_opt -> <empty>','hash_pairs_opt',0,'p_hash_pairs_opt_empty','main.py',623),
-  ('hash_pairs_opt -> hash_pairs','hash_pairs_opt',1,'p_hash_pairs_opt_list','main.py',628),
-  ('hash_pairs -> hash_pairs COMMA hash_pair','hash_pairs',3,'p_hash_pairs_multi','main.py',633),
-  ('hash_pairs -> hash_pair','hash_pairs',1,'p_hash_pairs_one','main.py',638),
-  ('hash_pair -> expression ARROW expression','hash_pair',3,'p_hash_pair_arrow','main.py',643),
-  ('hash_pair -> SYMBOL COLON expression','hash_pair',3,'p_hash_pair_symbolstyle','main.py',649),
-  ('hash_pair -> LOCAL_VAR COLON expression','hash_pair',3,'p_hash_pair_keywordstyle','main.py',655),
-  ('expression -> hash_literal','expression',1,'p_expression_hash','main.py',660),
-  ('expression -> expression RANGE_INCL expression','expression',3,'p_expression_range','main.py',668),
-  ('expression -> expression RANGE_EXCL expression','expression',3,'p_expression_range','main.py',669),
-  ('expr_list -> expression','expr_list',1,'p_expr_list_single','main.py',678),
-  ('expr_list -> expression COMMA expr_list','expr_list',3,'p_expr_list_more','main.py',683),
-  ('array_literal -> LBRACKET RBRACKET','array_literal',2,'p_array_literal_empty','main.py',689),
-  ('array_literal -> LBRACKET expr_list RBRACKET','array_literal',3,'p_array_literal_elems','main.py',694),
-  ('primary -> INTEGER','primary',1,'p_primary','main.py',700),
-  ('primary -> FLOAT','primary',1,'p_primary','main.py',701),
-  ('primary -> STR','primary',1,'p_primary','main.py',702),
-  ('primary -> SYMBOL','primary',1,'p_primary','main.py',703),
-  ('primary -> variable','primary',1,'p_primary','main.py',704),
-  ('primary -> TRUE','primary',1,'p_primary','main.py',705),
-  ('primary -> FALSE','primary',1,'p_primary','main.py',706),
-  ('primary -> NIL','primary',1,'p_primary','main.py',707),
-  ('primary -> LPAREN expression RPAREN','primary',3,'p_primary','main.py',708),
-  ('primary -> array_literal','primary',1,'p_primary','main.py',709),
-  ('expr_postfix -> LOCAL_VAR LPAREN RPAREN','expr_postfix',3,'p_function_call_expression','main.py',719),
-  ('expr_postfix -> LOCAL_VAR LPAREN expr_list RPAREN','expr_postfix',4,'p_function_call_expression','main.py',720),
-  ('expr_postfix -> expr_postfix LBRACKET expression RBRACKET','expr_postfix',4,'p_expr_postfix_index','main.py',734),
-  ('expr_postfix -> primary','expr_postfix',1,'p_expr_postfix_primary','main.py',740),
-  ('expr_arith -> expr_postfix','expr_arith',1,'p_expr_arith_postfix','main.py',746),
-  ('assignment -> expr_postfix EQLS expression','assignment',3,'p_assignment_index','main.py',751),
-  ('function_def -> DEF LOCAL_VAR statement_list END_S','function_def',4,'p_function_def','main.py',762),
-  ('function_def -> DEF LOCAL_VAR LPAREN param_list RPAREN statement_list END_S','function_def',7,'p_function_def','main.py',763),
-  ('optional_params -> param_list','optional_params',1,'p_optional_params','main.py',774),
-  ('optional_params -> empty','optional_params',1,'p_optional_params','main.py',775),
-  ('param_list -> parameter','param_list',1,'p_param_list','main.py',780),
-  ('param_list -> param_list COMMA parameter','param_list',3,'p_param_list','main.py',781),
-  ('parameter -> LOCAL_VAR','parameter',1,'p_parameter','main.py',789),
-  ('parameter -> LOCAL_VAR EQLS expression','parameter',3,'p_parameter','main.py',790),
-  ('empty -> <empty>','empty',0,'p_empty','main.py',798),
-  ('function_def -> DEF LOCAL_VAR optional_params optional_ret statement_list END_S','function_def',6,'p_function_def_with_ret','main.py',907),
-  ('optional_ret -> COLON TYPE','optional_ret',2,'p_optional_ret','main.py',923),
-  ('optional_ret -> empty','optional_ret',1,'p_optional_ret','main.py',924),
-  ('statement -> RETURN','statement',1,'p_return_stmt','main.py',936),
-  ('statement -> RETURN expression','statement',2,'p_return_stmt','main.py',937),
-  ('expression -> NIL','expression',1,'p_expression_nil','main.py',964),
-  ('expression -> TRUE','expression',1,'p_expression_bool_true','main.py',969),
-  ('expression -> FALSE','expression',1,'p_expression_bool_false','main.py',974),
-  ('class_def -> CLASS CONSTANT stmt_block END_S','class_def',4,'p_class_def','main.py',983),
-  ('class_def -> CLASS CONSTANT opt_inherit stmt_block END_S','class_def',5,'p_class_def','main.py',984),
-  ('opt_inherit -> LT CONSTANT','opt_inherit',2,'p_opt_inherit','main.py',996),
-  ('opt_inherit -> empty','opt_inherit',1,'p_opt_inherit','main.py',997),
-  ('statement -> class_def','statement',1,'p_statement_class','main.py',1005),
-  ('property_decl -> INSTANCE_VAR','property_decl',1,'p_property_decl','main.py',1016),
-  ('property_decl -> CLASS_VAR','property_decl',1,'p_property_decl','main.py',1017),
-  ('statement -> property_decl','statement',1,'p_statement_property','main.py',1024),
-  ('method_def -> function_def','method_def',1,'p_method_from_def','main.py',1033),
-  ('statement -> method_def','statement',1,'p_statement_method','main.py',1044),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','main.py',1052),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','main.py',1053),
-  ('expression -> expression MULT expression','expression',3,'p_expression_binop','main.py',1054),
-  ('expression -> expression DIV expression','expression',3,'p_expression_binop','main.py',1055),
-  ('expression -> expression MOD expression','expression',3,'p_expression_binop','main.py',1056),
-  ('expression -> expression POWER expression','expression',3,'p_expression_binop','main.py',1057),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','main.py',1093),
-  ('expression -> INTEGER','expression',1,'p_expression_number','main.py',1098),
-  ('expression -> FLOAT','expression',1,'p_expression_number','main.py',1099),
-  ('expression -> RATIONAL','expression',1,'p_expression_number','main.py',1100),
-  ('expression -> COMPLEX','expression',1,'p_expression_number','main.py',1101),
-  ('expression -> STR','expression',1,'p_expression_literal','main.py',1106),
-  ('expression -> SYMBOL','expression',1,'p_expression_literal','main.py',1107),
-  ('expression -> REGEXP','expression',1,'p_expression_literal','main.py',1108),
-  ('expression -> variable','expression',1,'p_expression_variable','main.py',1113),
-  ('expression -> expr_postfix','expression',1,'p_expression_postfix','main.py',1118),
-  ('expr_postfix -> expr_postfix DOT LOCAL_VAR','expr_postfix',3,'p_method_call','main.py',1128),
-  ('expr_postfix -> expr_postfix DOT LOCAL_VAR LPAREN RPAREN','expr_postfix',5,'p_method_call','main.py',1129),
-  ('expr_postfix -> expr_postfix DOT LOCAL_VAR LPAREN expr_list RPAREN','expr_postfix',6,'p_method_call','main.py',1130),
-  ('expression -> MINUS expression','expression',2,'p_expression_uminus','main.py',1146),
-  ('valor -> INTEGER','valor',1,'p_valor_numero','main.py',1151),
-  ('valor -> LOCAL_VAR','valor',1,'p_valor_variable','main.py',1156),
-]
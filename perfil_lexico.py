@@ -0,0 +1,205 @@
+"""Perfil de las reglas del lexer (opcional).
+
+Cuenta cuántas veces se dispara cada regla t_* de lexico.py, cuántos
+caracteres consume y, para las reglas que son funciones (t_STR, t_HEREDOC,
+t_CONSTANT, t_error...), cuánto tiempo se pasa dentro de ellas. Sirve para ver
+qué regla hace lento el análisis de un archivo sin usar un profiler externo.
+
+Se trabaja sobre un clon del lexer de PLY con las tablas de reglas
+instrumentadas, así que el lexer original no se toca ni se hace más lento:
+
+    perfil = PerfilLexico()
+    perfil.tokenizar(codigo)
+    print(perfil.tabla(orden='tiempo'))
+    perfil.guardar_json('perfil.json')
+
+o desde la consola: `python perfil_lexico.py archivo.rb --orden aciertos`.
+
+El tiempo de emparejar la regex maestra no se puede repartir entre reglas
+(PLY las prueba todas juntas): aparece aparte como "regex y PLY".
+"""
+import argparse
+import json
+import time
+
+from ply import lex
+
+import lexico
+
+# Columnas por las que se puede ordenar la tabla (de mayor a menor, salvo regla)
+ORDENES = ('tiempo', 'aciertos', 'caracteres', 'regla')
+
+
+class LexerPerfilado(lex.Lexer):
+    """Lexer de PLY que además mide el tiempo total de token() en su perfil
+    (así se mide igual lo use BufferTokens, el modo incremental o el parser)."""
+
+    def token(self):
+        inicio = time.perf_counter()
+        tok = lex.Lexer.token(self)
+        perfil = self.perfil
+        perfil.segundos_total += time.perf_counter() - inicio
+        if tok is not None:
+            perfil.tokens += 1
+        return tok
+
+
+class PerfilLexico:
+    """Lexer instrumentado y sus estadísticas por regla.
+
+    `lexer` es un clon de `lexer_base` (por defecto lexico.lexer) que se usa
+    como cualquier lexer de PLY; las estadísticas se acumulan entre entradas
+    hasta llamar a reiniciar()."""
+
+    def __init__(self, lexer_base=None):
+        base = lexer_base if lexer_base is not None else lexico.lexer
+        if not hasattr(base, 'lexstatere'):
+            raise ValueError("el perfil léxico necesita el lexer de PLY (motor_lexico='ply')")
+        # regla -> [aciertos, segundos, caracteres]
+        self.estadisticas = {}
+        # reglas que son funciones (las demás son strings: no tienen tiempo propio)
+        self.funciones = set()
+        self.segundos_total = 0.0
+        self.tokens = 0
+
+        lx = base.clone()
+        lx.lexstatere = {}
+        for estado, maestras in base.lexstatere.items():
+            nombres = base.lexstaterenames[estado]
+            lx.lexstatere[estado] = [
+                (regex, [self._instrumentar(par, nombre) if par else par
+                         for par, nombre in zip(funciones, nombres_regex)])
+                for (regex, funciones), nombres_regex in zip(maestras, nombres)
+            ]
+        lx.lexstateerrorf = {estado: self._instrumentar((funcion, None), funcion.__name__)[0]
+                             for estado, funcion in base.lexstateerrorf.items()}
+        # recargar lexre y lexerrorf del estado actual con las tablas nuevas
+        lx.lexstatestack = list(base.lexstatestack)
+        lx.begin(base.lexstate)
+        lx.__class__ = LexerPerfilado
+        lx.perfil = self
+        self.lexer = lx
+
+    def _instrumentar(self, par, nombre):
+        """(función, tipo) de reemplazo para una regla de la tabla de PLY."""
+        funcion, tipo = par
+        estadistica = self.estadisticas.setdefault(nombre, [0, 0.0, 0])
+        reloj = time.perf_counter
+
+        if funcion is None:
+            # regla string: PLY no llama a nada, así que se cuenta aquí y se
+            # devuelve el token (o None si es t_ignore_*, y PLY sigue)
+            def regla(t):
+                estadistica[0] += 1
+                estadistica[2] += t.lexer.lexpos - t.lexpos
+                return t if tipo is not None else None
+            return regla, tipo
+
+        self.funciones.add(nombre)
+
+        def regla(t):
+            inicio = reloj()
+            resultado = funcion(t)
+            estadistica[1] += reloj() - inicio
+            estadistica[0] += 1
+            # la función puede mover lexpos (t_error lo salta, t_HEREDOC lo extiende)
+            estadistica[2] += t.lexer.lexpos - t.lexpos
+            return resultado
+        return regla, tipo
+
+    def tokenizar(self, codigo):
+        """lexico.BufferTokens de `codigo` hecho con el lexer instrumentado."""
+        return lexico.tokenizar(codigo, self.lexer)
+
+    def reiniciar(self):
+        for estadistica in self.estadisticas.values():
+            estadistica[:] = [0, 0.0, 0]
+        self.segundos_total = 0.0
+        self.tokens = 0
+
+    def filas(self, orden='tiempo', todas=False):
+        """Una fila (dict) por regla, ordenada por `orden` (ver ORDENES). Sin
+        `todas` se omiten las reglas que no se dispararon."""
+        if orden not in ORDENES:
+            raise ValueError(f"orden desconocido: {orden!r} (opciones: {', '.join(ORDENES)})")
+        filas = []
+        for nombre, (aciertos, segundos, caracteres) in self.estadisticas.items():
+            if not aciertos and not todas:
+                continue
+            es_funcion = nombre in self.funciones
+            filas.append({
+                'regla': nombre,
+                'aciertos': aciertos,
+                'segundos': segundos if es_funcion else None,
+                'caracteres': caracteres,
+                'funcion': es_funcion,
+            })
+        if orden == 'regla':
+            filas.sort(key=lambda fila: fila['regla'])
+        else:
+            clave = {'tiempo': 'segundos', 'aciertos': 'aciertos', 'caracteres': 'caracteres'}[orden]
+            filas.sort(key=lambda fila: (fila[clave] or 0, fila['aciertos']), reverse=True)
+        return filas
+
+    @property
+    def segundos_en_reglas(self):
+        return sum(self.estadisticas[nombre][1] for nombre in self.funciones)
+
+    def tabla(self, orden='tiempo', todas=False):
+        """Tabla de texto con las estadísticas, ordenada por `orden`."""
+        filas = self.filas(orden, todas)
+        lineas = [f"{'Regla':<24} {'Aciertos':>10} {'Tiempo (ms)':>12} {'% tiempo':>9} {'Caracteres':>12}"]
+        lineas.append('-' * len(lineas[0]))
+        total = self.segundos_total
+        for fila in filas:
+            if fila['funcion']:
+                ms = f"{fila['segundos'] * 1000:.3f}"
+                porcentaje = f"{fila['segundos'] / total:.1%}" if total else '-'
+            else:
+                ms = porcentaje = '-'
+            lineas.append(f"{fila['regla']:<24} {fila['aciertos']:>10} {ms:>12} {porcentaje:>9} {fila['caracteres']:>12}")
+        lineas.append('-' * len(lineas[0]))
+        resto = total - self.segundos_en_reglas
+        lineas.append(f"{'regex y PLY':<24} {'':>10} {resto * 1000:>12.3f} "
+                      f"{(f'{resto / total:.1%}' if total else '-'):>9}")
+        lineas.append(f"{'total':<24} {self.tokens:>10} {total * 1000:>12.3f}")
+        return '\n'.join(lineas)
+
+    def como_json(self, orden='tiempo'):
+        return {
+            'segundos_total': self.segundos_total,
+            'segundos_en_reglas': self.segundos_en_reglas,
+            'tokens': self.tokens,
+            'reglas': self.filas(orden, todas=True),
+        }
+
+    def guardar_json(self, ruta, orden='tiempo'):
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(self.como_json(orden), f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+
+def perfilar_archivos(rutas, encoding='utf-8'):
+    """PerfilLexico con las estadísticas de tokenizar los archivos `rutas`
+    (con un clon de lexico.lexer y su propia lista de errores)."""
+    lx = lexico.lexer.clone()
+    lx.errores_lexicos = []
+    perfil = PerfilLexico(lx)
+    for ruta in rutas:
+        with open(ruta, encoding=encoding) as f:
+            perfil.tokenizar(f.read())
+    return perfil
+
+
+if __name__ == '__main__':
+    argumentos = argparse.ArgumentParser(description='Perfil de las reglas del lexer sobre uno o más archivos.')
+    argumentos.add_argument('archivos', nargs='+', help='archivos Ruby a tokenizar')
+    argumentos.add_argument('--orden', choices=ORDENES, default='tiempo', help='columna por la que ordenar la tabla')
+    argumentos.add_argument('--todas', action='store_true', help='incluir las reglas que no se dispararon')
+    argumentos.add_argument('--json', metavar='RUTA', help='guardar además las estadísticas en JSON')
+    args = argumentos.parse_args()
+
+    perfil = perfilar_archivos(args.archivos)
+    print(perfil.tabla(args.orden, args.todas))
+    if args.json:
+        perfil.guardar_json(args.json, args.orden)
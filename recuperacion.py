@@ -0,0 +1,303 @@
+"""Recuperación de errores de sintaxis en modo pánico.
+
+Ante un error, el parser de PLY saca estados de su pila hasta el último
+punto donde puede seguir una sentencia (una statement_list o un stmt_block
+ya reducidos) y mete ahí el token especial `error`. La gramática sólo acepta
+`error SINCRONIA` después de una lista de sentencias (ver
+main.p_statement_list_error), y SINCRONIA es un token sintético que entrega
+Recuperacion: mientras tanto descarta tokens hasta el próximo punto de
+sincronía, que es
+
+  - el `end` que cierra el último bloque abandonado (los `if`, `while`,
+    `def`... que quedaron a medio armar en la pila o que se saltaron), o
+  - con todos esos bloques cerrados, un `end` o el primer token de una
+    sentencia al principio de una línea (o después de un `;`).
+
+Después de SINCRONIA el parser vuelve a recibir el token de sincronía y
+sigue como si la sentencia rota no hubiera estado: el AST conserva todo lo
+anterior y lo posterior, y cada error produce un solo mensaje en lugar de
+una cascada. Si la entrada termina con bloques abiertos se cierran con
+`end` sintéticos, así el programa igual llega a la pasada semántica.
+
+Cada parse tiene además un máximo de errores de sintaxis: al alcanzarlo se
+deja de parsear, la entrada queda rechazada (como con los errores léxicos)
+y el costo de una entrada hostil queda acotado.
+"""
+from ply import lex
+
+import lexico
+import nodos
+
+# Token sintético que cierra el tramo descartado
+SINCRONIA = 'SINCRONIA'
+
+# Máximo de errores de sintaxis por entrada (None: sin límite)
+MAX_ERRORES_SINTACTICOS = 50
+
+# Tras un error PLY no vuelve a llamar a p_error hasta desplazar
+# yacc.error_count tokens (3): los errores de en medio los resuelve por su
+# cuenta descartando tokens hasta que encaje alguno, y acá eso sería esperar
+# un SINCRONIA que nadie entrega. Sin tocar esa global del módulo (la
+# comparten todos los parsers del proceso, de cualquier hilo), Recuperacion
+# llama a parser.errok() en cuanto el parser desplaza un token después del
+# error: el siguiente error vuelve a pasar por p_error, como con
+# error_count = 1.
+
+# Palabras que abren un bloque terminado en `end`. IF, UNLESS, WHILE y UNTIL
+# sólo cuentan al principio de la sentencia (si no, son modificadores:
+# `x = 1 if y`), y el DO de un while/until/for en su misma línea es parte
+# del bucle, no otro bloque.
+APERTURAS = frozenset({'IF', 'UNLESS', 'WHILE', 'UNTIL', 'FOR', 'DEF', 'CLASS', 'MODULE', 'CASE', 'BEGIN_S', 'DO'})
+MODIFICADORES = frozenset({'IF', 'UNLESS', 'WHILE', 'UNTIL'})
+BUCLES = frozenset({'WHILE', 'UNTIL', 'FOR'})
+
+# Tokens con que empieza una sentencia: al principio de una línea son un
+# punto de sincronía. ELSIF y ELSE también, porque siguen a un cuerpo de if
+# (o son una rama suelta, que la gramática ya reconoce). RETORNO_CON_VALOR es
+# el `return valor` que marca main._retornos_con_valor.
+INICIO_SENTENCIA = frozenset({
+    'IF', 'UNLESS', 'WHILE', 'UNTIL', 'FOR', 'DEF', 'CLASS', 'MODULE', 'CASE', 'BEGIN_S',
+    'ELSIF', 'ELSE', 'RETURN', 'RETORNO_CON_VALOR', 'BREAK', 'NEXT', 'PRINT', 'PUTS',
+    'LOCAL_VAR', 'CONSTANT', 'INSTANCE_VAR', 'CLASS_VAR', 'GLOBAL_VAR',
+})
+
+
+def mensaje_error_sintactico(tok):
+    """Mensaje de un error de sintaxis en `tok` (None: al final de la entrada)."""
+    if tok is None:
+        return "Error de sintaxis al final de la entrada"
+    linea, columna = lexico.posicion_token(tok.lexer, tok)
+    return f"Error de sintaxis con el token '{tok.value}' en la línea {linea}, columna {columna}"
+
+
+def _sintetico(tipo, lexpos):
+    tok = lex.LexToken()
+    tok.type = tipo
+    tok.value = ''
+    tok.lineno = 0
+    tok.lexpos = lexpos
+    return tok
+
+
+class Recuperacion:
+    """Recuperación de errores de un parse de `sesion` (una por parse).
+
+    `fuente` es una función sin argumentos que devuelve el índice del código
+    (lexico.IndiceLineas o flujo.IndiceArchivo); sólo se pide si hay errores.
+    Los mensajes van a `sesion.errores_sintacticos` (y se imprimen si
+    `imprimir`); `reportados` guarda cada uno como (offset, token, mensaje),
+    con None al final de la entrada. Al llegar a `maximo`, contando los `previos` de
+    la misma entrada, se marca `sesion.rechazado` y el parse termina sin AST."""
+
+    def __init__(self, sesion, fuente, maximo=MAX_ERRORES_SINTACTICOS, previos=0, imprimir=True):
+        self.sesion = sesion
+        self.parser = sesion.parser
+        self.lexer = sesion.lexer
+        self.fuente = fuente
+        self.maximo = maximo
+        self.errores = previos
+        self.imprimir = imprimir
+        self.reportados = []
+        self.siguiente = None
+        # tokens a entregar antes de seguir con la entrada (el último primero)
+        self.pendientes = []
+        # token del último error: PLY lo vuelve a mostrar una vez antes de descartarlo
+        self.ultimo = None
+        self.fin_reportado = False
+        self.cierres = 0
+        self.cortado = False
+        # hubo un error y el parser todavía no desplazó un token después
+        self.recuperando = False
+
+    def parsear(self, tokenfunc):
+        """Corre el parser de la sesión sobre `tokenfunc` con esta recuperación.
+        Devuelve lo que devuelve PLY."""
+        return self.parser.parse(lexer=self.lexer, tokenfunc=self.tokenfunc(tokenfunc))
+
+    def tokenfunc(self, siguiente):
+        """Envuelve la función de tokens del parse para poder intercalar los
+        tokens sintéticos y salir del modo de recuperación de PLY (en el
+        camino sin errores sólo mira un flag y una lista vacía)."""
+        self.siguiente = siguiente
+        pendientes = self.pendientes
+
+        def token():
+            if self.recuperando:
+                self._desplazado()
+            if pendientes:
+                return pendientes.pop()
+            return self.siguiente()
+        return token
+
+    def _desplazado(self):
+        # PLY pide otro token después de desplazar uno o de descartar el
+        # que tenía. Si desplazó (arriba de la pila hay un token y no
+        # `error`, ni quedó sólo el estado inicial) ya salió del error: el
+        # próximo vuelve a pasar por p_error (ver el comentario del módulo).
+        parser = self.parser
+        if len(parser.statestack) > 1 and parser.symstack[-1].type != 'error':
+            parser.errok()
+            self.recuperando = False
+
+    def error(self, tok):
+        """p_error de la sesión: reporta y prepara la recuperación. Devuelve
+        el token con que sigue el parser si se llamó a errok() (los `end`
+        sintéticos del final), o None para que PLY haga su recuperación."""
+        if self.cortado:
+            return None
+        self.recuperando = True
+        if tok is None:
+            return self._fin_de_entrada()
+        if tok is self.ultimo:
+            if self.pendientes:
+                # el mismo token, visto de nuevo tras meter `error` en la pila
+                return None
+            # se volvió a entregar tras SINCRONIA y tampoco encaja (un `end`
+            # de más, un `begin` que la gramática no tiene): se salta
+            self._saltar(tok, candidato=False)
+            return None
+        self.ultimo = tok
+        if tok.type != 'END_S' or tok.value:
+            # los `end` sintéticos no son errores del código
+            self._reportar(mensaje_error_sintactico(tok), tok)
+            if self.cortado:
+                return None
+        if len(self.parser.statestack) <= 1:
+            # error en el primer token: PLY no mete `error`, descarta el token
+            # y vuelve a empezar con el que siga
+            self._saltar(tok, candidato=False, sincronia=False)
+        else:
+            self._saltar(tok, candidato=True)
+        return None
+
+    def _reportar(self, mensaje, tok):
+        offset = tok.lexpos if tok is not None else None
+        if self.imprimir:
+            print(mensaje)
+        errores = self.sesion.errores_sintacticos
+        errores.append(mensaje)
+        self.reportados.append((offset, tok, mensaje))
+        self.errores += 1
+        if self.maximo is not None and self.errores >= self.maximo:
+            aviso = f"Se alcanzó el máximo de {self.maximo} errores de sintaxis: se deja de analizar la entrada"
+            if self.imprimir:
+                print(aviso)
+            errores.append(aviso)
+            self.reportados.append((offset, tok, aviso))
+            self.cortado = True
+            self.sesion.rechazado = True
+            self.pendientes.clear()
+            self.siguiente = lambda: None
+
+    def _fin_de_entrada(self):
+        if not self.fin_reportado:
+            self.fin_reportado = True
+            self._reportar(mensaje_error_sintactico(None), None)
+            if self.cortado:
+                return None
+        # cada `end` sintético cierra un bloque o hace descartar parte de la
+        # pila, así que nunca hacen falta más que estados tenga la pila
+        if self.cierres >= len(self.parser.statestack):
+            return None
+        self.cierres += 1
+        self.parser.errok()
+        return _sintetico('END_S', self._fin_pila())
+
+    def _fin_pila(self):
+        """Offset donde termina lo último que leyó el parser."""
+        for simbolo in reversed(self.parser.symstack):
+            valor = simbolo.value
+            if isinstance(valor, list) and valor:
+                valor = valor[-1]
+            if isinstance(valor, nodos.Nodo):
+                return valor.fin
+            lexpos = getattr(simbolo, 'lexpos', None)
+            if lexpos is not None:
+                return lexpos + len(str(valor))
+        return 0
+
+    def _bloques_descartados(self):
+        """Cuántos bloques abiertos va a descartar PLY al buscar dónde meter
+        `error`, y la línea del bucle más interno de ellos si todavía no leyó
+        su DO. Repite sobre una copia de la pila lo que hará el parser:
+        reducir o sacar estados hasta uno que acepte `error`."""
+        parser = self.parser
+        acciones, ir_a = parser.action, parser.goto
+        producciones, por_defecto = parser.productions, parser.defaulted_states
+        estados = list(parser.statestack)
+        simbolos = [s.type for s in parser.symstack]
+        tokens = list(parser.symstack)
+        bloques = 0
+        linea_bucle = None
+        hay_do = False
+        while len(estados) > 1:
+            estado = estados[-1]
+            accion = por_defecto.get(estado)
+            if accion is None:
+                accion = acciones[estado].get('error')
+            if accion is None:
+                estados.pop()
+                tipo = simbolos.pop()
+                tok = tokens.pop()
+                if tipo == 'DO':
+                    hay_do = True
+                elif tipo in APERTURAS:
+                    if tipo in BUCLES and bloques == 0 and not hay_do:
+                        linea_bucle = self._linea(tok)
+                    bloques += 1
+                continue
+            if accion > 0:
+                break
+            produccion = producciones[-accion]
+            if produccion.len:
+                del estados[-produccion.len:], simbolos[-produccion.len:], tokens[-produccion.len:]
+            simbolos.append(produccion.name)
+            tokens.append(None)
+            estados.append(ir_a[estados[-1]][produccion.name])
+        return bloques, linea_bucle
+
+    def _linea(self, tok):
+        return lexico.posicion_token(self.lexer, tok)[0]
+
+    def _al_inicio(self, tok):
+        """True si `tok` es lo primero de su línea."""
+        _, columna = lexico.posicion_token(self.lexer, tok)
+        return not self.fuente().fragmento(tok.lexpos - columna + 1, tok.lexpos).strip()
+
+    def _saltar(self, tok, candidato, sincronia=True):
+        """Descarta tokens desde `tok` hasta el punto de sincronía y deja
+        SINCRONIA (si `sincronia`) y el token de sincronía en pendientes.
+        Con `candidato=False`, `tok` se descarta sin considerarlo."""
+        profundidad, linea_bucle = self._bloques_descartados() if candidato else (0, None)
+        linea = self._linea(tok)
+        # un token que se volvió a entregar era un punto de sincronía
+        inicio = self._al_inicio(tok) if candidato else True
+        siguiente = self.siguiente
+        while True:
+            tipo = tok.type
+            if candidato and profundidad == 0 and (tipo == 'END_S' or (inicio and tipo in INICIO_SENTENCIA)):
+                self.pendientes[:] = [tok, _sintetico(SINCRONIA, tok.lexpos)] if sincronia else [tok]
+                return
+            candidato = True
+            if tipo == 'END_S':
+                if profundidad > 0:
+                    profundidad -= 1
+                    if profundidad == 0:
+                        # se cerró el último bloque abandonado: se sigue después de su end
+                        break
+            elif tipo in APERTURAS:
+                if tipo == 'DO':
+                    if linea != linea_bucle:
+                        profundidad += 1
+                elif inicio or tipo not in MODIFICADORES:
+                    profundidad += 1
+                    if tipo in BUCLES:
+                        linea_bucle = linea
+            tok = siguiente()
+            if tok is None:
+                break
+            nueva = self._linea(tok)
+            inicio = nueva != linea or tipo == 'SEMICOLON'
+            linea = nueva
+        if sincronia:
+            self.pendientes[:] = [_sintetico(SINCRONIA, tok.lexpos if tok is not None else 0)]
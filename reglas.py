@@ -0,0 +1,168 @@
+"""Registro de las reglas de la pasada semántica.
+
+Cada comprobación de semantica.Verificador es una regla con nombre que se
+suscribe, con el decorador regla(), a las clases de nodo que le interesan.
+El Verificador arma con las reglas activas una tabla clase de nodo ->
+funciones y, al terminar cada nodo del recorrido, corre las de su clase:
+despachar cuesta una consulta al dict, sin cadenas de comparaciones.
+
+Qué reglas están activas y sus estadísticas son de cada sesión (Reglas, en
+main.SesionAnalisis.reglas). Se puede apagar una regla cara para un lote
+(`python main.py carpeta/ --sin-regla lecturas_sin_asignar`) y ver cuántas
+veces corrió cada una y cuánto tiempo llevó en total:
+
+    sesion = main.SesionAnalisis(reglas_inactivas=('castings_indebidos',))
+    sesion.analizar(codigo)
+    print(sesion.reglas.tabla())
+
+El tiempo de una regla es el de su función, medido alrededor de cada
+llamada. Armar los grafos de flujo (grafo.py), que sólo se arman si alguna
+regla activa los usa, aparece aparte. Las estadísticas se acumulan entre
+análisis hasta llamar a reiniciar(); un resultado tomado de la caché o las
+sentencias que el modo incremental no vuelve a verificar no las mueven.
+"""
+import time
+
+# nombre -> Regla, en orden de registro (el orden en que corren las de una misma clase)
+CATALOGO = {}
+
+# Columnas por las que se puede ordenar la tabla (de mayor a menor, salvo regla)
+ORDENES = ('tiempo', 'ejecuciones', 'regla')
+
+
+class Regla:
+    """Regla del catálogo: `funcion(verificador, nodo)` corre al terminar
+    cada nodo de alguna de las `clases`. Con `grafos` la regla usa los
+    grafos de flujo del recorrido (Verificador.grafos y .sueltos)."""
+    __slots__ = ('nombre', 'clases', 'funcion', 'descripcion', 'grafos')
+
+    def __init__(self, nombre, clases, funcion, descripcion='', grafos=False):
+        self.nombre = nombre
+        self.clases = clases
+        self.funcion = funcion
+        self.descripcion = descripcion
+        self.grafos = grafos
+
+    def __repr__(self):
+        return f"Regla({self.nombre!r}, {', '.join(clase.__name__ for clase in self.clases)})"
+
+
+def regla(nombre, *clases, grafos=False):
+    """Decorador: registra la función en CATALOGO como la regla `nombre`
+    para los nodos de `clases`. La descripción es la primera línea de su
+    docstring."""
+    def registrar(funcion):
+        descripcion = (funcion.__doc__ or '').strip().split('\n')[0]
+        CATALOGO[nombre] = Regla(nombre, clases, funcion, descripcion, grafos)
+        return funcion
+    return registrar
+
+
+def _validar(nombre):
+    if nombre not in CATALOGO:
+        raise ValueError(f"Regla desconocida: {nombre!r} (opciones: {', '.join(CATALOGO)})")
+
+
+class Reglas:
+    """Reglas activas de una sesión y sus estadísticas: por regla, cuántas
+    veces corrió y cuántos segundos llevó en total."""
+
+    def __init__(self, inactivas=()):
+        self.apagadas = set()
+        for nombre in inactivas:
+            self.desactivar(nombre)
+        # regla -> [ejecuciones, segundos]
+        self.estadisticas = {}
+        self.segundos_grafos = 0.0
+
+    # ---------- activas ----------
+    def activar(self, nombre):
+        _validar(nombre)
+        self.apagadas.discard(nombre)
+
+    def desactivar(self, nombre):
+        _validar(nombre)
+        self.apagadas.add(nombre)
+
+    def activa(self, nombre):
+        return nombre not in self.apagadas
+
+    def activas(self):
+        """Reglas activas del catálogo, en orden de registro."""
+        return [r for nombre, r in CATALOGO.items() if nombre not in self.apagadas]
+
+    def inactivas(self):
+        """Nombres de las reglas apagadas, ordenados (entra en la clave de la
+        caché y en el estado incremental: cambia los resultados)."""
+        return tuple(sorted(self.apagadas))
+
+    # ---------- medición ----------
+    def medida(self, regla, funcion):
+        """`funcion(nodo)` envuelta para sumar en las estadísticas de `regla`."""
+        estadistica = self.estadisticas.setdefault(regla.nombre, [0, 0.0])
+        reloj = time.perf_counter
+
+        def medida(nodo):
+            inicio = reloj()
+            funcion(nodo)
+            estadistica[1] += reloj() - inicio
+            estadistica[0] += 1
+        return medida
+
+    def reiniciar(self):
+        """Pone en cero las estadísticas (las reglas activas no cambian)."""
+        for estadistica in self.estadisticas.values():
+            estadistica[:] = [0, 0.0]
+        self.segundos_grafos = 0.0
+
+    def como_dict(self):
+        """Estadísticas como dict simple (regla -> [ejecuciones, segundos],
+        más 'grafos' -> segundos), para pasarlas entre procesos o a JSON."""
+        return {'reglas': {nombre: list(e) for nombre, e in self.estadisticas.items()},
+                'grafos': self.segundos_grafos}
+
+    def acumular(self, datos):
+        """Suma las estadísticas de un como_dict() (de otra sesión u otro proceso)."""
+        for nombre, (ejecuciones, segundos) in datos['reglas'].items():
+            estadistica = self.estadisticas.setdefault(nombre, [0, 0.0])
+            estadistica[0] += ejecuciones
+            estadistica[1] += segundos
+        self.segundos_grafos += datos['grafos']
+
+    # ---------- informe ----------
+    def filas(self, orden='tiempo'):
+        """Una fila (dict) por regla del catálogo, ordenada por `orden` (ver ORDENES)."""
+        if orden not in ORDENES:
+            raise ValueError(f"orden desconocido: {orden!r} (opciones: {', '.join(ORDENES)})")
+        filas = []
+        for nombre, r in CATALOGO.items():
+            ejecuciones, segundos = self.estadisticas.get(nombre, (0, 0.0))
+            filas.append({
+                'regla': nombre,
+                'activa': self.activa(nombre),
+                'ejecuciones': ejecuciones,
+                'segundos': segundos,
+                'descripcion': r.descripcion,
+            })
+        if orden == 'regla':
+            filas.sort(key=lambda fila: fila['regla'])
+        else:
+            clave = 'segundos' if orden == 'tiempo' else 'ejecuciones'
+            filas.sort(key=lambda fila: (fila[clave], fila['ejecuciones']), reverse=True)
+        return filas
+
+    def tabla(self, orden='tiempo'):
+        """Tabla de texto con las estadísticas, ordenada por `orden`."""
+        filas = self.filas(orden)
+        lineas = [f"{'Regla':<24} {'Activa':>6} {'Ejecuciones':>12} {'Tiempo (ms)':>12} {'% tiempo':>9}"]
+        lineas.append('-' * len(lineas[0]))
+        total = sum(fila['segundos'] for fila in filas) + self.segundos_grafos
+        for fila in filas:
+            porcentaje = f"{fila['segundos'] / total:.1%}" if total else '-'
+            lineas.append(f"{fila['regla']:<24} {'sí' if fila['activa'] else 'no':>6} {fila['ejecuciones']:>12} "
+                          f"{fila['segundos'] * 1000:>12.3f} {porcentaje:>9}")
+        lineas.append('-' * len(lineas[0]))
+        porcentaje = f"{self.segundos_grafos / total:.1%}" if total else '-'
+        lineas.append(f"{'grafos de flujo':<24} {'':>6} {'':>12} {self.segundos_grafos * 1000:>12.3f} {porcentaje:>9}")
+        lineas.append(f"{'total':<24} {'':>6} {sum(f['ejecuciones'] for f in filas):>12} {total * 1000:>12.3f}")
+        return '\n'.join(lineas)
@@ -0,0 +1,311 @@
+"""Reparseo incremental por sentencias de nivel superior.
+
+Después de una edición, incremental.relexer deja un BufferTokens cuyo
+`origen` dice qué tokens son los del buffer anterior: los de antes de la
+edición, iguales, y los de después, desplazados. Con eso y el Estado del
+último análisis de la sesión se vuelven a parsear sólo las sentencias de
+nivel superior (def, class, if, while, asignaciones...) que tocan la zona
+editada; el resto del programa se reutiliza con sus nodos (los posteriores
+a la edición se desplazan en el lugar, como los tokens).
+
+El tramo se parsea solo, como un programa aparte, desde el fin de la última
+sentencia que no depende de la edición hasta el fin de una sentencia vieja
+posterior a ella (la de control). Si el tramo termina en esa misma
+sentencia, con el mismo tipo y el mismo largo, el parser llegó a ella en el
+mismo estado que en el análisis anterior y tiene por delante los mismos
+tokens: lo que sigue se parsearía igual. Si no (la edición abrió un bloque,
+cambió dónde termina una expresión...) el tramo se agranda hasta que
+coincida o llegue al final de la entrada.
+
+Los errores de sintaxis anteriores al tramo se conservan y los posteriores
+se repiten en sus tokens desplazados. La sentencia de control nunca es una
+que redujo la recuperación de un error, que depende de lo que venía
+después; la primera del tramo tampoco sigue a una así. Si la entrada
+terminaba con bloques abiertos, el tramo va hasta el final.
+
+La pasada semántica también se retoma. La de las sentencias anteriores
+queda como estaba (semantica.Verificador anota en `puntos` cuántos
+diagnósticos y escrituras de la tabla de símbolos había al empezar cada
+sentencia), se verifican las del tramo y, si dejan la tabla de símbolos
+como antes y el código posterior sigue en las mismas líneas, se reutilizan
+también los resultados de las posteriores; si no, se verifican de nuevo.
+Sólo se imprimen los diagnósticos nuevos.
+"""
+import bisect
+from operator import attrgetter
+
+import nodos
+import recuperacion
+import semantica
+
+_lexpos = attrgetter('lexpos')
+_inicio = attrgetter('inicio')
+_fin = attrgetter('fin')
+
+# Veces que se agranda o se corre el tramo antes de parsear toda la entrada
+MAX_INTENTOS = 12
+
+
+class Estado:
+    """Último análisis incremental de una sesión (ver el módulo).
+
+    `sintacticos` son los errores de sintaxis como (offset, token, mensaje);
+    `puntos`, `diario`, `errores` y `advertencias`, lo que dejó la pasada
+    semántica (None mientras no se verifique el AST), y `reglas`, las reglas
+    que estaban inactivas en ella. `desde`, `nuevas`,
+    `reuso` y `anterior` describen el reparseo: las sentencias
+    [desde, desde + nuevas) son nuevas y las que siguen son las del Estado
+    `anterior` a partir de la `reuso`."""
+
+    def __init__(self, buffer, ast, sintacticos, cortado=False):
+        self.buffer = buffer
+        self.ast = ast
+        self.sintacticos = sintacticos
+        self.cortado = cortado
+        self.lineas = buffer.codigo.count('\n')
+        self.puntos = None
+        self.diario = None
+        self.errores = None
+        self.advertencias = None
+        self.reglas = None
+        self.desde = 0
+        self.nuevas = len(ast.sentencias) if ast is not None else 0
+        self.reuso = 0
+        self.anterior = None
+
+
+def _programa(sentencias):
+    # igual que main.p_program
+    inicio = sentencias[0].inicio if sentencias else 0
+    fin = sentencias[-1].fin if sentencias else 0
+    return nodos.Programa(sentencias, inicio, fin - inicio)
+
+
+def _tokenfunc(tokens):
+    siguiente = iter(tokens).__next__
+
+    def token():
+        try:
+            return siguiente()
+        except StopIteration:
+            return None
+    return token
+
+
+def _restaurar_sintacticos(sesion, estado):
+    sesion.errores_sintacticos[:] = [mensaje for _, _, mensaje in estado.sintacticos]
+    if estado.cortado:
+        sesion.rechazado = True
+
+
+def parsear(sesion, buffer):
+    """AST de `buffer`, reutilizando el análisis anterior de `sesion` si
+    `buffer` viene de editar su código. Deja el Estado nuevo en
+    `sesion.estado_incremental` y los errores de sintaxis en la sesión."""
+    anterior = sesion.estado_incremental
+    if anterior is not None and anterior.buffer is buffer:
+        # el mismo código: no hay nada que parsear ni que verificar
+        anterior.desde = anterior.reuso = anterior.nuevas = 0
+        if anterior.ast is not None:
+            anterior.desde = anterior.reuso = len(anterior.ast.sentencias)
+        anterior.anterior = anterior
+        _restaurar_sintacticos(sesion, anterior)
+        return anterior.ast
+    origen = buffer.origen
+    # el buffer anterior ya no hace falta: que no quede vivo por el nuevo
+    buffer.origen = None
+    estado = None
+    if origen is not None and anterior is not None and origen[0] is anterior.buffer \
+            and anterior.ast is not None:
+        estado = _reparsear(sesion, anterior, buffer, *origen[1:])
+    if estado is None:
+        sesion.errores_sintacticos.clear()
+        sesion.rechazado = False
+        recuperador = recuperacion.Recuperacion(sesion, lambda: buffer.indice, sesion.max_errores_sintacticos)
+        ast = sesion._parse(buffer.tokenfunc(), recuperador)
+        estado = Estado(buffer, ast, recuperador.reportados, recuperador.cortado)
+    sesion.estado_incremental = estado
+    return estado.ast
+
+
+def _cerrada_por_error(errores, sentencias, k):
+    """True si entre la sentencia `k` y la siguiente hubo un error de sintaxis."""
+    fin = sentencias[k].fin
+    siguiente = sentencias[k + 1].inicio if k + 1 < len(sentencias) else None
+    for offset, _, _ in errores:
+        if offset is None:
+            if siguiente is None:
+                return True
+        elif offset >= fin and (siguiente is None or offset < siguiente):
+            return True
+    return False
+
+
+def _control(errores, sentencias, q):
+    """Primera sentencia desde `q` que sirve de control: una que se redujo
+    con el token siguiente, no por la recuperación de un error."""
+    while q < len(sentencias) and _cerrada_por_error(errores, sentencias, q):
+        q += 1
+    return q
+
+
+def _reparsear(sesion, anterior, buffer, i0, i1, delta):
+    """Estado de `buffer` reparseando sólo el tramo editado, o None si no
+    se pudo acotar en MAX_INTENTOS (hay que parsear todo)."""
+    sentencias = anterior.ast.sentencias
+    n = len(sentencias)
+    tokens = buffer.tokens
+    errores = anterior.sintacticos
+    # la primera sentencia afectada es la que termina en el último token
+    # conservado o después: dónde termina dependía del token siguiente
+    ultimo = tokens[i0 - 1].lexpos if i0 else -1
+    p = bisect.bisect_right(sentencias, ultimo, key=_fin)
+    # el tramo empieza después de una sentencia que se redujo al llegar la
+    # siguiente; si la redujo la recuperación de un error posterior (o la
+    # cerraron los `end` sintéticos del final) el tramo la incluye
+    while p and _cerrada_por_error(errores, sentencias, p - 1):
+        p -= 1
+    # la de control, desde la primera vieja que empieza después de lo re-tokenizado
+    q = max(p, bisect.bisect_left(sentencias, tokens[i1].lexpos - delta, key=_inicio)) if i1 < len(tokens) else n
+    q = _control(errores, sentencias, q)
+    if any(offset is None for offset, _, _ in errores):
+        # la última sentencia la cerraron los `end` sintéticos del final de
+        # la entrada y su fin sale de la pila del parser, no de sus tokens:
+        # no se puede reutilizar desplazada, el tramo llega hasta el final
+        q = n
+    paso = 1
+    for _ in range(MAX_INTENTOS):
+        inicio_tramo = sentencias[p - 1].fin if p else 0
+        previos = [error for error in errores if error[0] is not None and error[0] < inicio_tramo]
+        a = bisect.bisect_left(tokens, inicio_tramo, key=_lexpos)
+        if q < n:
+            control = sentencias[q]
+            b = bisect.bisect_left(tokens, control.fin + delta, key=_lexpos)
+        else:
+            control = None
+            b = len(tokens)
+
+        sesion.errores_sintacticos[:] = [mensaje for _, _, mensaje in previos]
+        sesion.rechazado = False
+        recuperador = recuperacion.Recuperacion(sesion, lambda: buffer.indice, sesion.max_errores_sintacticos,
+                                                previos=len(previos), imprimir=False)
+        tramo = sesion._parse(_tokenfunc(tokens[a:b]), recuperador)
+        reportados = recuperador.reportados
+
+        if p and reportados and a < b and reportados[0][0] == tokens[a].lexpos:
+            # error en el primer token: solo, el parser lo descarta y empieza
+            # de nuevo; dentro del programa lo habría recuperado. Se empieza
+            # una sentencia antes.
+            p -= 1
+            while p and _cerrada_por_error(errores, sentencias, p - 1):
+                p -= 1
+            continue
+        posteriores = []
+        if control is not None and tramo is not None:
+            ultima = tramo.sentencias[-1] if tramo.sentencias else None
+            if ultima is None or type(ultima) is not type(control) or ultima.inicio != control.inicio + delta \
+                    or ultima.largo != control.largo or any(offset is None for offset, _, _ in reportados):
+                q = _control(errores, sentencias, min(q + paso, n))
+                paso *= 2
+                continue
+            # los errores posteriores se repetirían igual, en sus tokens desplazados
+            for offset, tok, _ in errores:
+                if offset is None:
+                    posteriores.append((None, None, recuperacion.mensaje_error_sintactico(None)))
+                elif offset >= control.fin:
+                    posteriores.append((offset + delta, tok, recuperacion.mensaje_error_sintactico(tok)))
+            maximo = sesion.max_errores_sintacticos
+            if maximo is not None and len(previos) + len(reportados) + len(posteriores) >= maximo:
+                # el máximo de errores cortaría el parse en otro lugar
+                return None
+        break
+    else:
+        return None
+
+    for _, _, mensaje in reportados:
+        print(mensaje)
+    sesion.errores_sintacticos.extend(mensaje for _, _, mensaje in posteriores)
+    if tramo is None:
+        # se alcanzó el máximo de errores de sintaxis dentro del tramo
+        return Estado(buffer, None, previos + reportados, cortado=True)
+    sufijo = sentencias[q + 1:]
+    if delta:
+        # sólo los offsets: las líneas salen de ellos (una edición del mismo
+        # largo que cambia la cantidad de líneas no toca el sufijo)
+        for sentencia in sufijo:
+            nodos.desplazar(sentencia, delta)
+    nuevas = tramo.sentencias
+    estado = Estado(buffer, _programa(sentencias[:p] + nuevas + sufijo), previos + reportados + posteriores)
+    estado.desde = p
+    estado.nuevas = len(nuevas)
+    estado.reuso = min(q + 1, n)
+    estado.anterior = anterior
+    # sólo hace falta el análisis inmediato anterior
+    anterior.anterior = None
+    return estado
+
+
+def _sufijo_reutilizable(estado, anterior, diario, fuente):
+    """True si la pasada semántica de las sentencias posteriores al tramo
+    daría lo mismo que en `anterior`: llegan a la misma tabla de símbolos
+    y sus mensajes no cambian de línea ni de columna."""
+    sentencias = estado.ast.sentencias
+    hasta = estado.desde + estado.nuevas
+    if estado.reuso >= len(anterior.puntos) - 1 or not estado.nuevas or hasta >= len(sentencias):
+        return False
+    if estado.lineas != anterior.lineas:
+        return False
+    if fuente.posicion(sentencias[hasta].inicio)[0] <= fuente.posicion(sentencias[hasta - 1].fin)[0]:
+        # la primera sentencia reutilizada comparte línea con el tramo editado
+        return False
+    # lo que escribieron en la tabla las sentencias reemplazadas y las nuevas
+    antes = dict(anterior.diario[anterior.puntos[estado.desde][2]:anterior.puntos[estado.reuso][2]])
+    ahora = dict(diario[anterior.puntos[estado.desde][2]:])
+    # las entradas sólo tienen tipos y valores resumidos (constantes.py): se comparan con ==
+    return antes == ahora
+
+
+def verificar(sesion, estado, fuente):
+    """Pasada semántica del AST de `estado`, retomada donde empieza el tramo
+    reparseado (ver el módulo). Reemplaza los diagnósticos semánticos y la
+    tabla de símbolos de la sesión."""
+    verificador = semantica.Verificador(sesion, fuente)
+    anterior = estado.anterior
+    estado.anterior = None
+    errores, advertencias, tabla = sesion.errores_semanticos, sesion.advertencias_semanticas, sesion.tabla_simbolos
+    inactivas = sesion.reglas.inactivas()
+    if anterior is None or anterior.puntos is None or anterior.reglas != inactivas:
+        # sin pasada anterior, o con otras reglas: no hay nada que retomar
+        errores.clear()
+        advertencias.clear()
+        tabla.clear()
+        puntos, diario = [], []
+        verificador.puntos, verificador.diario = puntos, diario
+        verificador.verificar(estado.ast)
+    else:
+        desde = estado.desde
+        hasta = desde + estado.nuevas
+        cant_errores, cant_advertencias, escrituras = anterior.puntos[desde]
+        puntos = anterior.puntos[:desde]
+        diario = anterior.diario[:escrituras]
+        errores[:] = anterior.errores[:cant_errores]
+        advertencias[:] = anterior.advertencias[:cant_advertencias]
+        tabla.clear()
+        tabla.update(diario)
+        verificador.puntos, verificador.diario = puntos, diario
+        verificador.verificar(estado.ast, desde, hasta)
+        if _sufijo_reutilizable(estado, anterior, diario, fuente):
+            e0, a0, d0 = anterior.puntos[estado.reuso]
+            e1, a1, d1 = puntos.pop()
+            puntos.extend((e - e0 + e1, a - a0 + a1, d - d0 + d1) for e, a, d in anterior.puntos[estado.reuso:])
+            escritas = anterior.diario[d0:]
+            diario.extend(escritas)
+            tabla.update(escritas)
+            errores.extend(anterior.errores[e0:])
+            advertencias.extend(anterior.advertencias[a0:])
+        else:
+            verificador.verificar(estado.ast, hasta)
+    estado.puntos, estado.diario = puntos, diario
+    estado.errores = list(errores)
+    estado.advertencias = list(advertencias)
+    estado.reglas = inactivas
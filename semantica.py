@@ -0,0 +1,587 @@
+"""Análisis semántico: una pasada sobre el AST ya construido.
+
+El parser (main.py) sólo arma el AST; las comprobaciones corren después,
+en Verificador. El recorrido es en orden posterior, el mismo en que el
+parser reduce las reglas, así que los diagnósticos salen en el orden del
+código. Los contextos de función y de clase se abren donde empieza el
+cuerpo del nodo y se cierran donde termina; con eso los return del cuerpo
+de un def se comparan con su anotación de retorno.
+
+Cada comprobación es una regla (reglas.py) suscrita a las clases de nodo
+que revisa; la sesión decide cuáles corren y lleva la cuenta de sus
+ejecuciones y su tiempo. Las que dependen del flujo de control (break y
+next fuera de un bucle, variables leídas antes de asignarse) usan los
+grafos de grafo.py, que se arman al empezar cada recorrido si alguna regla
+activa los necesita.
+
+Los diagnósticos y la tabla de símbolos quedan en la SesionAnalisis. La
+línea y la columna de cada mensaje se calculan recién al informarlo, con
+la `fuente` del código (ver Verificador).
+"""
+import re
+import time
+from functools import partial
+
+import constantes
+import grafo
+import nodos
+import reglas
+import simbolos
+
+
+def _con_posicion(msg, lineno=None, columna=None):
+    if lineno:
+        if columna:
+            return f"Línea {lineno}, columna {columna}: {msg}"
+        return f"Línea {lineno}: {msg}"
+    return msg
+
+
+# --------------------------------------------------
+# Tipos de las expresiones
+# --------------------------------------------------
+def es_string_numerico_entero(valor_str):
+    """Verifica si un string es 100% numérico entero (ej: '123', '-45').
+    Devuelve True/False."""
+    if not isinstance(valor_str, str):
+        return False
+    valor_limpio = valor_str.strip()
+    if not valor_limpio:
+        return False
+    # permitir signo negativo al inicio
+    if valor_limpio[0] in ('+', '-'):
+        valor_limpio = valor_limpio[1:]
+    return valor_limpio.isdigit()
+
+
+def es_string_numerico_flotante(valor_str):
+    """Verifica si un string es 100% numérico flotante (ej: '3.14', '-2.5', '1e-5').
+    Devuelve True/False."""
+    if not isinstance(valor_str, str):
+        return False
+    valor_limpio = valor_str.strip()
+    if not valor_limpio:
+        return False
+    try:
+        float(valor_limpio)
+        return True
+    except ValueError:
+        return False
+
+
+def obtener_valor_string(node, sesion):
+    """Extrae el valor de string de un nodo AST.
+    Devuelve el string sin comillas, o None si no es un string literal ni
+    una variable con un valor constante (ver constantes.py)."""
+    if node is None:
+        return None
+    if isinstance(node, str):
+        # Si es un string directo
+        return constantes.sin_comillas(node)
+    return constantes.texto(constantes.valor_de(node, sesion.tabla_simbolos))
+
+
+# Tipo de cada literal (ver nodos.py); los Numero dependen de su texto
+TIPOS_LITERALES = {
+    nodos.Entero: 'integer',
+    nodos.Flotante: 'float',
+    nodos.Cadena: 'string',
+    nodos.Simbolo: 'symbol',
+    nodos.Booleano: 'boolean',
+    nodos.Nulo: 'nil',
+    nodos.Regexp: 'string',
+    nodos.Arreglo: 'array',
+    nodos.Hash: 'hash',
+}
+
+
+# Conversiones cuyo tipo no depende del objeto
+TIPOS_CONVERSIONES = {
+    'to_i': 'integer', 'to_f': 'float',
+    'to_s': 'string', 'to_str': 'string',
+    'to_a': 'array', 'to_ary': 'array',
+    'to_h': 'hash', 'to_hash': 'hash',
+}
+
+
+def _operandos(node):
+    """Nodos cuyo tipo hace falta para inferir el de `node`."""
+    clase = type(node)
+    if clase is nodos.OperacionBinaria:
+        return (node.izquierda, node.derecha)
+    if clase is nodos.LlamadaMetodo and node.metodo not in TIPOS_CONVERSIONES:
+        return (node.objeto,)
+    return ()
+
+
+def inferir_tipo_nodo(node, sesion, tipos=None):
+    """Inferir tipo simple a partir del nodo AST usado por el parser.
+    Devuelve 'integer', 'float', 'string', 'symbol', 'boolean', 'nil', 'array', 'hash' o 'desconocido'.
+
+    `tipos` es la tabla id(nodo) -> tipo de los nodos ya inferidos (ver
+    Verificador.tipos): cada nodo se infiere una sola vez, de abajo hacia
+    arriba y sin recursión, aunque lo pidan varias reglas o varios nodos
+    que lo contienen. La inferencia no informa nada: los castings indebidos
+    son una regla de Verificador.
+    """
+    if tipos is None:
+        tipos = {}
+    clave = id(node)
+    tipo = tipos.get(clave)
+    if tipo is not None:
+        return tipo
+    clase = type(node)
+    if clase is not nodos.OperacionBinaria and clase is not nodos.LlamadaMetodo:
+        # sin operandos: lo más común, sin pasar por la pila
+        tipo = tipos[clave] = _tipo_nodo(node, sesion, tipos)
+        return tipo
+    pendientes = [node]
+    while pendientes:
+        actual = pendientes[-1]
+        faltan = [operando for operando in _operandos(actual) if id(operando) not in tipos]
+        if faltan:
+            pendientes.extend(reversed(faltan))
+            continue
+        pendientes.pop()
+        if id(actual) not in tipos:
+            tipos[id(actual)] = _tipo_nodo(actual, sesion, tipos)
+    return tipos[clave]
+
+
+def _tipo_nodo(node, sesion, tipos):
+    """Tipo de `node`, con los de sus _operandos ya en `tipos`."""
+    if node is None:
+        return 'nil'
+    clase = type(node)
+    tipo = TIPOS_LITERALES.get(clase)
+    if tipo is not None:
+        return tipo
+    inferir = _INFERENCIAS.get(clase)
+    if inferir is None:
+        # LlamadaFuncion y demás: habría que analizar la definición
+        return 'desconocido'
+    return inferir(node, sesion, tipos)
+
+
+def _tipo_numero(node, sesion, tipos):
+    # racionales y complejos: Numero(texto)
+    v = node.valor
+    if '.' in v or 'e' in v or 'E' in v:
+        return 'float'
+    # fallback: digits only
+    if v.isdigit():
+        return 'integer'
+    return 'desconocido'
+
+
+def _tipo_variable(node, sesion, tipos):
+    # consultar tabla de símbolos, en el ámbito actual
+    entrada = sesion.tabla_simbolos.buscar(node.nombre)
+    if entrada is not None:
+        return entrada.get('tipo', 'desconocido')
+    return 'desconocido'
+
+
+def _tipo_llamada_metodo(node, sesion, tipos):
+    # LlamadaMetodo(objeto, método, args): .to_i, .to_f, .to_s, .to_a, etc.
+    # (los castings indebidos los informa la regla castings_indebidos)
+    conversion = TIPOS_CONVERSIONES.get(node.metodo)
+    if conversion is not None:
+        return conversion
+    # fallback: devolver tipo del objeto si no es conversión conocida
+    return tipos[id(node.objeto)]
+
+
+def _tipo_operacion(node, sesion, tipos):
+    # inferir desde operandos: OperacionBinaria(op, izquierda, derecha)
+    l = tipos[id(node.izquierda)]
+    r = tipos[id(node.derecha)]
+    if l == 'string' and r == 'string':
+        return 'string'
+    if l in ('integer', 'float') and r in ('integer', 'float'):
+        return 'float' if 'float' in (l, r) else 'integer'
+    return 'desconocido'
+
+
+# Inferencia por clase de nodo, para lo que no es un literal de TIPOS_LITERALES
+_INFERENCIAS = {
+    nodos.Numero: _tipo_numero,
+    nodos.Variable: _tipo_variable,
+    nodos.LlamadaMetodo: _tipo_llamada_metodo,
+    nodos.OperacionBinaria: _tipo_operacion,
+}
+
+
+# --------------------------------------------------
+# Funciones y return (Elias Rubio)
+# --------------------------------------------------
+# pila para contexto de funciones (sesion.func_context_stack): cada elemento es
+# dict { 'name': str, 'expected_return': tipo|None, 'returns': [tipo|None] }
+
+
+# --- util: normalizar/inferrar tipos sencillos desde nodos AST de expresion/literales ---
+def infer_type_from_expr(expr):
+    # expr es un nodo de expresión (ver nodos.py); por ahora sólo se reconocen
+    # los números racionales/complejos (Numero) y las operaciones entre ellos
+    if expr is None:
+        return 'nil'
+    if isinstance(expr, nodos.Nodo):
+        if type(expr) is nodos.Numero:  # número literal
+            return 'number'
+        if type(expr) is nodos.OperacionBinaria:
+            # ejemplo simplificado: si ambos operandos son number => number; si uno unknown => unknown
+            lt = infer_type_from_expr(expr.izquierda)
+            rt = infer_type_from_expr(expr.derecha)
+            if lt == 'number' and rt == 'number':
+                return 'number'
+            # otras heurísticas mínimas:
+            if lt == 'string' or rt == 'string':
+                # concatenación u otras operaciones con strings no manejadas aquí
+                return 'string'
+            return 'unknown'
+    # por defecto
+    return 'unknown'
+
+
+# --- helpers de contexto ---
+def func_enter(sesion, name, expected_return_type=None):
+    sesion.func_context_stack.append({
+        'name': name,
+        'expected_return': expected_return_type,  # 'number','string','boolean','nil' o None
+        'returns': []  # lista de tipos inferidos de cada return en el cuerpo
+    })
+
+
+def func_exit(sesion):
+    pila = sesion.func_context_stack
+    ctx = pila.pop() if pila else None
+    return ctx
+
+
+def func_current(sesion):
+    pila = sesion.func_context_stack
+    return pila[-1] if pila else None
+
+
+def check_return_against_expected(sesion, ret_type, lineno=None, columna=None):
+    ctx = func_current(sesion)
+    if ctx is None:
+        # return fuera de función: podría ser un  semantico error
+        msg = "Error semántico: 'return' fuera de una función."
+        sesion.errores_semanticos.append(_con_posicion(msg, lineno, columna))
+        return
+
+    ctx['returns'].append(ret_type)
+
+    expected = ctx['expected_return']
+    if expected is None:
+        # si no hay anotación, intentamos inferir consistencia: si ya hay otros returns no-unknown,
+        # forzamos que coincidan entre sí
+        non_unknown = [t for t in ctx['returns'] if t and t != 'unknown']
+        if len(non_unknown) >= 2 and len(set(non_unknown)) > 1:
+            # tipos distintos inferidos entre distintos returns
+            msg = f"Error: tipos de retorno inconsistentes en función '{ctx['name']}'."
+            sesion.errores_semanticos.append(_con_posicion(msg, lineno, columna))
+    else:
+        #  comprobar compatibilidad básica
+        # permitimos que 'nil'
+        compatible = False
+        if ret_type == expected:
+            compatible = True
+        elif ret_type == 'unknown':
+
+            compatible = True
+        elif ret_type == 'nil' and expected != 'number' and expected != 'string':
+
+            compatible = True
+
+        if not compatible:
+            msg = f"Error: Tipo de retorno no coincide con expectativas {expected}."
+            sesion.errores_semanticos.append(_con_posicion(msg, lineno, columna))
+
+
+# --------------------------------------------------
+# Pasada semántica
+# --------------------------------------------------
+# Lo que puede haber entre el fin de un operando (o de la variable asignada)
+# y el operador que lo sigue: espacios, continuaciones de línea, comentarios
+# y los paréntesis que cierran el operando
+_ANTES_DEL_OPERADOR = re.compile(r'(?:\s|\\\n|#[^\n]*|\))*')
+
+
+def _offset_operador(fuente, izquierda, derecha, operador):
+    """Offset del operador entre dos nodos (los nodos no lo guardan)."""
+    texto = fuente.fragmento(izquierda.fin, derecha.inicio)
+    pos = _ANTES_DEL_OPERADOR.match(texto).end()
+    if not texto.startswith(operador, pos):
+        pos = max(texto.find(operador), 0)
+    return izquierda.fin + pos
+
+
+# Nodos sin hijos
+_HOJAS = nodos.HOJAS
+
+
+def _en_orden(funciones, nodo):
+    for funcion in funciones:
+        funcion(nodo)
+
+
+def _hijos(nodo):
+    """Nodos hijos, en orden: como Nodo.hijos(), pero en una lista."""
+    hijos = []
+    for campo in nodo.campos:
+        valor = getattr(nodo, campo)
+        if type(valor) is list:
+            hijos.extend(valor)
+        elif isinstance(valor, nodos.Nodo):
+            hijos.append(valor)
+    return hijos
+
+
+class Verificador:
+    """Comprobaciones semánticas de un AST, con los diagnósticos y la tabla
+    de símbolos en `sesion` (una main.SesionAnalisis). `fuente` resuelve las
+    posiciones de los mensajes: un lexico.IndiceLineas del código o un
+    flujo.IndiceArchivo."""
+
+    def __init__(self, sesion, fuente):
+        self.sesion = sesion
+        self.fuente = fuente
+        # Para retomar la pasada desde una sentencia de nivel superior (ver
+        # reparseo.py): `diario` anota cada (nombre, entrada) que se escribe
+        # en la tabla de símbolos y `puntos` el estado al empezar cada
+        # sentencia, (errores, advertencias, largo del diario). None: no se anota.
+        self.diario = None
+        self.puntos = None
+        # tipo de cada expresión ya inferida, id(nodo) -> tipo (ver inferir_tipo_nodo)
+        self.tipos = {}
+        # del recorrido en curso (ver grafo.construir): grafo de cada def,
+        # id(nodo) -> Grafo, e ids de los break y next sin bucle
+        self.grafos = {}
+        self.sueltos = set()
+        # lo que corre al terminar cada clase de nodo, una vez analizados sus
+        # hijos: las reglas activas de la sesión (reglas.py), en orden de
+        # registro, y después registrar las asignaciones en la tabla
+        self.reglas = sesion.reglas
+        activas = self.reglas.activas()
+        self._usa_grafos = any(r.grafos for r in activas)
+        funciones = {}
+        for r in activas:
+            medida = self.reglas.medida(r, partial(r.funcion, self))
+            for clase in r.clases:
+                funciones.setdefault(clase, []).append(medida)
+        funciones.setdefault(nodos.Asignacion, []).append(self._asignacion)
+        self._cierres = {clase: fs[0] if len(fs) == 1 else partial(_en_orden, tuple(fs))
+                         for clase, fs in funciones.items()}
+        # clases cuyo cuerpo abre un contexto: hijos con la entrada y la
+        # salida del contexto donde empieza y termina el cuerpo
+        self._contextos = {
+            nodos.Funcion: self._pasos_funcion,
+            nodos.Clase: self._pasos_clase,
+        }
+
+    def verificar(self, ast, desde=0, hasta=None):
+        """Comprueba `ast`. Si se anotan puntos, sólo sus sentencias
+        [desde, hasta) (el estado de la sesión tiene que ser el del punto
+        `desde`); al final queda anotado también el punto `hasta`."""
+        puntos = self.puntos
+        if puntos is None or type(ast) is not nodos.Programa:
+            self._recorrer(ast)
+            return
+        sesion = self.sesion
+        errores, advertencias, diario = sesion.errores_semanticos, sesion.advertencias_semanticas, self.diario
+        del puntos[desde:]
+        for sentencia in ast.sentencias[desde:hasta]:
+            puntos.append((len(errores), len(advertencias), len(diario)))
+            self._recorrer(sentencia)
+        puntos.append((len(errores), len(advertencias), len(diario)))
+
+    def _recorrer(self, ast):
+        # recorrido en orden posterior con una pila: una expresión larga
+        # (a + b + c + ...) anida tantos nodos como operandos. En la pila
+        # hay nodos por visitar y, por encima de sus hijos, lo que hay que
+        # hacer al terminarlos: su comprobación o la salida de un contexto.
+        cierres = self._cierres
+        contextos = self._contextos
+        if self._usa_grafos:
+            inicio = time.perf_counter()
+            grafos, sueltos = grafo.construir(ast)
+            self.grafos = {id(g.nodo): g for g in grafos if type(g.nodo) is nodos.Funcion}
+            self.sueltos = {id(salto) for salto in sueltos}
+            self.reglas.segundos_grafos += time.perf_counter() - inicio
+        pendientes = [ast]
+        while pendientes:
+            paso = pendientes.pop()
+            tipo = type(paso)
+            if tipo in _HOJAS:
+                cierre = cierres.get(tipo)
+                if cierre is not None:
+                    cierre(paso)
+            elif isinstance(paso, nodos.Nodo):
+                cierre = cierres.get(tipo)
+                if cierre is not None:
+                    pendientes.append(partial(cierre, paso))
+                pasos = contextos[tipo](paso) if tipo in contextos else _hijos(paso)
+                pendientes.extend(reversed(pasos))
+            else:
+                paso()
+
+    def _pasos_funcion(self, nodo):
+        # los return del cuerpo se comparan con la anotación del def; los
+        # valores por defecto de los parámetros ya son del ámbito del def
+        tabla = self.sesion.tabla_simbolos
+        return [partial(tabla.abrir, simbolos.AMBITO_FUNCION), *nodo.parametros,
+                partial(func_enter, self.sesion, nodo.nombre, nodo.retorno),
+                *nodo.cuerpo, partial(func_exit, self.sesion), tabla.cerrar]
+
+    def _pasos_clase(self, nodo):
+        tabla = self.sesion.tabla_simbolos
+        return [partial(tabla.abrir, simbolos.AMBITO_CLASE), *nodo.cuerpo, tabla.cerrar]
+
+    # Jusepere Validar el uso correcto de break y next dentro de bucles.
+    @reglas.regla('saltos_fuera_de_bucle', nodos.Break, nodos.Next, grafos=True)
+    def _salto(self, nodo):
+        """break y next sin un bucle que los contenga en su def o clase."""
+        if id(nodo) in self.sueltos:
+            linea, columna = self.fuente.posicion(nodo.inicio)
+            self.sesion.errores_semanticos.append(
+                f"Error: {nodo.etiqueta} fuera de estructura iterativa. (línea {linea}, columna {columna})")
+
+    @reglas.regla('ramas_sueltas', nodos.ErrorSemantico)
+    def _rama_suelta(self, nodo):
+        """elsif y else fuera de un if (invalid_branch en la gramática)."""
+        lineno, columna = self.fuente.posicion(nodo.inicio)
+        rama = 'elsif' if nodo.motivo == 'elsif_fuera_de_if' else 'else'
+        msg = f"Error semántico: '{rama}' fuera de un 'if'."
+        self.sesion.errores_semanticos.append(_con_posicion(msg, lineno, columna))
+
+    @reglas.regla('lecturas_sin_asignar', nodos.Funcion, grafos=True)
+    def _fin_funcion(self, nodo):
+        """Variables que un def lee sin haberlas asignado en todos los caminos."""
+        g = self.grafos.get(id(nodo))
+        if g is None:
+            return
+        sesion = self.sesion
+        for lectura in grafo.lecturas_sin_asignar(grafo.Efectos(g)):
+            linea, columna = self.fuente.posicion(lectura.inicio)
+            advertencia = (f"Advertencia semántica: La variable '{lectura.nombre}' puede usarse antes de "
+                           f"asignarse en línea {linea}, columna {columna}")
+            sesion.advertencias_semanticas.append(advertencia)
+            print(advertencia)
+
+    @reglas.regla('reasignacion_constante', nodos.Asignacion)
+    def _reasignacion_constante(self, nodo):
+        """Asignación a una constante ya definida en el mismo ámbito."""
+        var_node = nodo.variable
+        if type(var_node) is not nodos.Variable:
+            return
+        var_name = var_node.nombre
+        # Es una constante (mayúsculas o __CONSTANT__) que ya existe en este ámbito
+        if (var_name.isupper() or var_name.startswith('__') and var_name.endswith('__')) and \
+                self.sesion.tabla_simbolos.definida_en_ambito(var_name):
+            # Posición del operador de asignación
+            offset = _offset_operador(self.fuente, var_node, nodo.valor, nodo.operador)
+            linea, columna = self.fuente.posicion(offset)
+            advertencia = f"Advertencia semántica: Reasignación de constante '{var_name}' en línea {linea}, columna {columna}"
+            self.sesion.advertencias_semanticas.append(advertencia)
+            print(advertencia)
+
+    @reglas.regla('castings_indebidos', nodos.LlamadaMetodo)
+    def _casting(self, nodo):
+        """.to_i y .to_f sobre un string que no es 100% numérico."""
+        metodo = nodo.metodo
+        if metodo != 'to_i' and metodo != 'to_f':
+            return
+        sesion = self.sesion
+        obj = nodo.objeto
+        if inferir_tipo_nodo(obj, sesion, self.tipos) != 'string':
+            return
+        # Intentar extraer el valor del string
+        valor_string = obtener_valor_string(obj, sesion)
+        if valor_string is None:
+            return
+        if metodo == 'to_i':
+            if es_string_numerico_entero(valor_string):
+                return
+            aviso = f"Error semántico: Casting indebido - '{valor_string}' no es 100% numérico. .to_i convertirá a 0 o valor parcial"
+        else:
+            if es_string_numerico_flotante(valor_string):
+                return
+            aviso = f"Error semántico: Casting indebido - '{valor_string}' no es 100% numérico. .to_f convertirá a 0.0 o valor parcial"
+        sesion.errores_semanticos.append(aviso)
+        print(aviso)
+
+    def _asignacion(self, nodo):
+        # no es una regla: la tabla de símbolos se actualiza siempre
+        sesion = self.sesion
+        var_node = nodo.variable
+        if type(var_node) is not nodos.Variable:
+            return
+        var_name = var_node.nombre
+        tabla = sesion.tabla_simbolos
+
+        # Registrar tipo y valor en tabla de símbolos; tras `x += ...` el valor ya no es un literal
+        expr_tipo = inferir_tipo_nodo(nodo.valor, sesion, self.tipos)
+        if nodo.operador == '=':
+            valor = constantes.valor_de(nodo.valor, tabla)
+        else:
+            valor = constantes.VARIABLE
+        entrada = {
+            'tipo': expr_tipo,
+            'valor': valor,
+            'operador': nodo.operador
+        }
+        nivel = tabla.definir(var_name, entrada)
+        if self.diario is not None and nivel == 0:
+            # lo de un def o una class se libera al cerrarse: no llega a la próxima sentencia
+            self.diario.append((var_name, entrada))
+
+    @reglas.regla('operaciones_con_strings', nodos.OperacionBinaria)
+    def _operacion_binaria(self, nodo):
+        """Concatenaciones y operaciones aritméticas indebidas con strings."""
+        sesion = self.sesion
+        op = nodo.operador
+        left_t = inferir_tipo_nodo(nodo.izquierda, sesion, self.tipos)
+        right_t = inferir_tipo_nodo(nodo.derecha, sesion, self.tipos)
+        if op not in ('+', '-', '*', '/', '%', 'POWER') or 'string' not in (left_t, right_t):
+            return
+        linea, columna = self.fuente.posicion(_offset_operador(self.fuente, nodo.izquierda, nodo.derecha, op))
+        donde = f" (línea {linea}, columna {columna})"
+
+        # Regla: concatenación '+' sólo válida entre strings
+        if op == '+':
+            if left_t == 'string' and right_t == 'string':
+                pass  # válido
+            elif left_t == 'string' and right_t != 'string':
+                msg = f"Error semántico: No se puede concatenar String con {right_t}{donde}"
+                print(msg)
+                sesion.errores_semanticos.append(msg)
+            elif right_t == 'string' and left_t != 'string':
+                msg = f"Error semántico: No se puede concatenar {left_t} con String{donde}"
+                print(msg)
+                sesion.errores_semanticos.append(msg)
+
+        # Regla: operaciones aritméticas no válidas con strings
+        if op in ('-', '*', '/', '%', 'POWER'):
+            if left_t == 'string' or right_t == 'string':
+                msg = f"Error semántico: Operación '{op}' no permitida entre {left_t} y {right_t}{donde}"
+                print(msg)
+                sesion.errores_semanticos.append(msg)
+
+        # Regla: permitir conversiones numéricas implícitas entre integer y float
+        # No se hace nada aquí (aceptable): integer + float -> float
+        # Nota: conversiones explícitas (.to_i, .to_f) se revisan en _casting
+
+    @reglas.regla('tipos_de_retorno', nodos.Retorno)
+    def _retorno(self, nodo):
+        """return fuera de un def o con un tipo distinto del esperado."""
+        # return sin expresión => tipo 'nil' (ver infer_type_from_expr)
+        ret_type = infer_type_from_expr(nodo.valor)
+        lineno, columna = self.fuente.posicion(nodo.inicio)
+        check_return_against_expected(self.sesion, ret_type, lineno, columna)
+
+
+def verificar(ast, sesion, fuente):
+    """Pasada semántica sobre `ast` (ver Verificador)."""
+    Verificador(sesion, fuente).verificar(ast)
@@ -0,0 +1,201 @@
+"""Tabla de símbolos con ámbitos.
+
+Hay un marco por ámbito abierto: el del programa (nivel 0) y uno por cada
+`def` y cada `class` que se está verificando. Al cerrarse el ámbito se
+libera su marco con todo lo que se definió en él, así que durante la
+pasada la tabla sólo tiene lo visible desde el punto actual y al terminar
+queda sólo el ámbito del programa.
+
+Qué ve cada nombre sigue a Ruby:
+
+  - las variables locales (`x`) son del marco actual: `def` y `class` no
+    ven las de afuera. Los cuerpos de while, for e if no abren ámbito (en
+    Ruby una variable asignada dentro de un bucle sigue viva después);
+  - las globales (`$x`) son siempre del marco del programa;
+  - las de instancia y de clase (`@x`, `@@x`) son de la `class` más
+    interna, o del programa fuera de toda clase;
+  - las constantes (`X`) se definen en el marco actual y se ven desde
+    cualquier ámbito interior.
+
+Para que buscar() no tenga que recorrer los marcos, cada nombre tiene su
+pila de definiciones (nivel, entrada), la más interna al final: basta
+mirar esa última y comprobar que su nivel sea el que corresponde al tipo
+de nombre. Cada marco recuerda qué nombres definió para sacarlos al
+cerrarse. Los nombres se guardan internados (sys.intern).
+
+Como mapeo (in, [], get, items, update...) la tabla es el ámbito del
+programa, que es lo que queda al terminar la pasada y lo que anotan y
+reponen reparseo.py y la caché de resultados.
+"""
+import sys
+
+LOCAL = 'local'
+GLOBAL = 'global'
+INSTANCIA = 'instancia'
+CONSTANTE = 'constante'
+
+AMBITO_FUNCION = 'def'
+AMBITO_CLASE = 'class'
+
+
+def tipo_de_nombre(nombre):
+    """LOCAL, GLOBAL, INSTANCIA (@x y @@x) o CONSTANTE."""
+    inicial = nombre[:1]
+    if inicial == '$':
+        return GLOBAL
+    if inicial == '@':
+        return INSTANCIA
+    if inicial.isupper():
+        return CONSTANTE
+    return LOCAL
+
+
+class TablaSimbolos:
+    """Tabla de símbolos por ámbitos (ver el módulo). Las entradas son las
+    de semantica.Verificador: {'tipo', 'valor', 'operador'}."""
+
+    def __init__(self):
+        self.definiciones = {}
+        # nombres definidos en cada marco abierto; el 0 es el del programa
+        self.marcos = [[]]
+        # niveles de las `class` abiertas, la más interna al final
+        self.clases = []
+
+    # ---------- ámbitos ----------
+    def abrir(self, tipo):
+        """Abre el ámbito de un `def` (AMBITO_FUNCION) o de una `class`
+        (AMBITO_CLASE)."""
+        if tipo == AMBITO_CLASE:
+            self.clases.append(len(self.marcos))
+        self.marcos.append([])
+
+    def cerrar(self):
+        """Cierra el ámbito más interno y libera lo que se definió en él."""
+        nivel = len(self.marcos) - 1
+        if nivel == 0:
+            return
+        definiciones = self.definiciones
+        for nombre in self.marcos.pop():
+            pila = definiciones[nombre]
+            pila.pop()
+            if not pila:
+                del definiciones[nombre]
+        if self.clases and self.clases[-1] == nivel:
+            self.clases.pop()
+
+    @property
+    def nivel(self):
+        """Nivel del ámbito actual (0: el programa)."""
+        return len(self.marcos) - 1
+
+    def _nivel_de(self, tipo):
+        if tipo == LOCAL or tipo == CONSTANTE:
+            return len(self.marcos) - 1
+        if tipo == INSTANCIA and self.clases:
+            return self.clases[-1]
+        return 0
+
+    # ---------- nombres ----------
+    def buscar(self, nombre):
+        """Entrada de `nombre` visible desde el ámbito actual, o None."""
+        pila = self.definiciones.get(nombre)
+        if pila is None:
+            return None
+        nivel, entrada = pila[-1]
+        tipo = tipo_de_nombre(nombre)
+        if tipo == CONSTANTE or tipo == GLOBAL or nivel == self._nivel_de(tipo):
+            return entrada
+        return None
+
+    def definida_en_ambito(self, nombre):
+        """True si `nombre` ya está definido en el marco donde lo definiría
+        una asignación desde el ámbito actual (p. ej. una constante que se
+        vuelve a asignar en la misma clase)."""
+        pila = self.definiciones.get(nombre)
+        return pila is not None and pila[-1][0] == self._nivel_de(tipo_de_nombre(nombre))
+
+    def definir(self, nombre, entrada):
+        """Asigna `entrada` a `nombre` en el marco que le corresponde y
+        devuelve el nivel de ese marco."""
+        nivel = self._nivel_de(tipo_de_nombre(nombre))
+        pila = self.definiciones.get(nombre)
+        if pila is None:
+            nombre = sys.intern(nombre)
+            self.definiciones[nombre] = [(nivel, entrada)]
+            self.marcos[nivel].append(nombre)
+        elif pila[-1][0] == nivel:
+            pila[-1] = (nivel, entrada)
+        else:
+            # un marco más interno que el de la definición anterior
+            pila.append((nivel, entrada))
+            self.marcos[nivel].append(sys.intern(nombre))
+        return nivel
+
+    # ---------- el ámbito del programa como mapeo ----------
+    def _global(self, nombre):
+        pila = self.definiciones.get(nombre)
+        if pila is not None and pila[0][0] == 0:
+            return pila[0][1]
+        return None
+
+    def __contains__(self, nombre):
+        return self._global(nombre) is not None
+
+    def __getitem__(self, nombre):
+        entrada = self._global(nombre)
+        if entrada is None:
+            raise KeyError(nombre)
+        return entrada
+
+    def get(self, nombre, defecto=None):
+        entrada = self._global(nombre)
+        return defecto if entrada is None else entrada
+
+    def __setitem__(self, nombre, entrada):
+        # definición directa en el ámbito del programa (p. ej. al reponer la tabla)
+        pila = self.definiciones.get(nombre)
+        if pila is not None and pila[0][0] == 0:
+            pila[0] = (0, entrada)
+        else:
+            nombre = sys.intern(nombre)
+            self.definiciones.setdefault(nombre, []).insert(0, (0, entrada))
+            self.marcos[0].append(nombre)
+
+    def update(self, pares):
+        """Define en el ámbito del programa cada (nombre, entrada) de
+        `pares` (un dict o pares sueltos), en orden."""
+        if isinstance(pares, dict):
+            pares = pares.items()
+        for nombre, entrada in pares:
+            self[nombre] = entrada
+
+    def keys(self):
+        return list(self.marcos[0])
+
+    def items(self):
+        return [(nombre, self.definiciones[nombre][0][1]) for nombre in self.marcos[0]]
+
+    def values(self):
+        return [entrada for _, entrada in self.items()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.marcos[0])
+
+    def __eq__(self, otra):
+        if isinstance(otra, TablaSimbolos):
+            otra = dict(otra.items())
+        return isinstance(otra, dict) and dict(self.items()) == otra
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'TablaSimbolos({dict(self.items())!r})'
+
+    def clear(self):
+        """Vacía la tabla y cierra todos los ámbitos."""
+        self.definiciones.clear()
+        self.marcos[:] = [[]]
+        self.clases.clear()
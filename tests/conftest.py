@@ -0,0 +1,8 @@
+"""Configuración de pytest: los módulos del analizador están en la raíz del
+repositorio (no es un paquete), así que se agregan al sys.path."""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
@@ -0,0 +1,115 @@
+"""Caché de resultados (cache.py): serialización, aciertos en memoria y en
+disco, entradas adulteradas y poda dentro de su propia subcarpeta."""
+import contextlib
+import io
+import os
+
+import pytest
+
+import cache
+import main
+import nodos
+
+CODIGO = "x = 1\ndef f(a)\n  return a + y\nend\nputs f(x)\nbreak\n"
+
+
+def _resumen(sesion, ast):
+    return (nodos.como_tupla(ast, True), sesion.errores_lexicos, sesion.errores_sintacticos,
+            sesion.errores_semanticos, sesion.advertencias_semanticas, dict(sesion.tabla_simbolos.items()),
+            sesion.rechazado)
+
+
+def _analizar(codigo, almacen=None):
+    sesion = main.SesionAnalisis(cache=almacen)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = sesion.analizar(codigo)
+    return sesion, _resumen(sesion, ast)
+
+
+@pytest.fixture
+def directorio(tmp_path):
+    # permisos de una carpeta privada: con otros permisos la caché sólo usa memoria
+    os.chmod(tmp_path, 0o700)
+    return str(tmp_path)
+
+
+def test_a_bytes_y_desde_bytes():
+    sesion = main.SesionAnalisis()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = sesion.analizar(CODIGO)
+    resultado = cache.Resultado(ast, ['lexico'], ['sintactico'], list(sesion.errores_semanticos),
+                                list(sesion.advertencias_semanticas), {'x': 'int'}, False, 17, {'LOCAL_VAR': 5})
+    copia = cache.desde_bytes(cache.a_bytes(resultado))
+    assert nodos.como_tupla(copia.ast, True) == nodos.como_tupla(ast, True)
+    assert copia.ast is not ast
+    for campo in cache.Resultado.__slots__[1:]:
+        assert getattr(copia, campo) == getattr(resultado, campo)
+
+
+def test_acierto_en_memoria_y_en_disco(directorio):
+    _, esperado = _analizar(CODIGO)
+    almacen = cache.CacheResultados(directorio)
+    assert _analizar(CODIGO, almacen)[1] == esperado
+    assert (almacen.fallos, almacen.escrituras) == (1, 1)
+    sesion, resumen = _analizar(CODIGO, almacen)
+    assert resumen == esperado and sesion.desde_cache and almacen.aciertos_memoria == 1
+    # otra instancia (otro proceso): sólo tiene el disco
+    otro = cache.CacheResultados(directorio)
+    assert _analizar(CODIGO, otro)[1] == esperado
+    assert otro.aciertos_disco == 1
+
+
+def test_entrada_adulterada_es_un_fallo(directorio):
+    almacen = cache.CacheResultados(directorio)
+    _analizar(CODIGO, almacen)
+    (entrada,) = [nombre for nombre in os.listdir(almacen.carpeta) if nombre != cache.ARCHIVO_CLAVE]
+    ruta = os.path.join(almacen.carpeta, entrada)
+    with open(ruta, 'r+b') as f:
+        f.seek(-1, os.SEEK_END)
+        ultimo = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([ultimo[0] ^ 1]))
+    otro = cache.CacheResultados(directorio)
+    _analizar(CODIGO, otro)
+    assert otro.aciertos_disco == 0 and otro.fallos == 1
+
+
+def test_directorio_que_otros_pueden_escribir_queda_en_memoria(directorio):
+    raiz = os.path.join(directorio, cache.SUBCARPETA)
+    os.makedirs(raiz)
+    os.chmod(raiz, 0o777)
+    almacen = cache.CacheResultados(directorio)
+    _analizar(CODIGO, almacen)
+    # la caché corrige los permisos de su subcarpeta (es del usuario) o no usa el disco
+    assert os.stat(raiz).st_mode & 0o077 == 0 or not os.path.exists(almacen.carpeta)
+
+
+def test_podar_y_vaciar_no_tocan_lo_ajeno(directorio):
+    ajeno = os.path.join(directorio, 'otra-herramienta')
+    os.makedirs(ajeno)
+    with open(os.path.join(ajeno, 'datos'), 'w') as f:
+        f.write('no borrar')
+    almacen = cache.CacheResultados(directorio, max_bytes_disco=0)
+    raiz = almacen.raiz
+    # una versión vieja, y archivos que no son de la caché dentro de la subcarpeta
+    vieja = os.path.join(raiz, 'f' * 64)
+    os.makedirs(vieja)
+    with open(os.path.join(vieja, 'e' * 64), 'wb') as f:
+        f.write(b'entrada vieja')
+    with open(os.path.join(vieja, 'notas.txt'), 'w') as f:
+        f.write('no borrar')
+    os.makedirs(os.path.join(raiz, 'no-es-version'))
+    _analizar(CODIGO, almacen)
+    _analizar(CODIGO + "\n", almacen)
+    almacen.podar()
+
+    assert os.listdir(ajeno) == ['datos']
+    assert os.listdir(vieja) == ['notas.txt']
+    assert os.path.isdir(os.path.join(raiz, 'no-es-version'))
+    # con max_bytes_disco=0 se borran todas las entradas de esta versión
+    assert [nombre for nombre in os.listdir(almacen.carpeta) if cache._es_de_la_cache(nombre)] == []
+
+    almacen.vaciar()
+    assert os.listdir(ajeno) == ['datos']
+    assert os.listdir(vieja) == ['notas.txt']
+    assert sorted(os.listdir(directorio)) == sorted(['otra-herramienta', cache.SUBCARPETA])
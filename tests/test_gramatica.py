@@ -0,0 +1,133 @@
+"""Formas que acepta la gramática de main.py y el control de gramatica.py."""
+import contextlib
+import io
+
+import pytest
+
+import gramatica
+import lexico
+import main
+import nodos
+
+
+def _parsear(codigo):
+    sesion = main.SesionAnalisis()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = sesion.analizar(codigo)
+    return sesion, ast
+
+
+def _sentencias(codigo):
+    sesion, ast = _parsear(codigo)
+    assert sesion.errores_sintacticos == []
+    return nodos.como_tupla(ast)[1]
+
+
+def test_tablas_sin_conflictos_ni_limites_excedidos():
+    assert gramatica.excedidos(gramatica.metricas()) == []
+
+
+@pytest.mark.parametrize('codigo, parametros', [
+    ("def suma(a, b)\n  a + b\nend\n", [('a', None), ('b', None)]),
+    ("def suma a, b\n  a + b\nend\n", [('a', None), ('b', None)]),
+    ("def suma a, b = 2\n  a + b\nend\n", [('a', None), ('b', 2)]),
+    ("def suma a = 1, b\n  a + b\nend\n", [('a', 1), ('b', None)]),
+    ("def suma a, b: type\n  a + b\nend\n", [('a', None), ('b', None)]),
+    ("def nada()\nend\n", []),
+])
+def test_parametros_con_y_sin_parentesis(codigo, parametros):
+    (funcion,) = _sentencias(codigo)
+    assert funcion[0] == 'def' and funcion[2] == parametros
+
+
+def test_la_linea_siguiente_al_def_es_el_cuerpo():
+    (funcion,) = _sentencias("def foo\n  x = 1\n  x\nend\n")
+    assert funcion[2] == []
+    assert funcion[4] == [('assign', ('var', 'x'), '=', 1), ('var', 'x')]
+
+
+def test_parsear_dos_veces_no_cambia_los_tokens():
+    # _parametros_sueltos marca una copia: el buffer sigue con LOCAL_VAR
+    sesion = main.SesionAnalisis()
+    buffer = sesion.tokenizar("def suma a, b\n  a + b\nend\n")
+    with contextlib.redirect_stdout(io.StringIO()):
+        primero = nodos.como_tupla(sesion.parsear(buffer))
+        segundo = nodos.como_tupla(sesion.parsear(buffer))
+    assert primero == segundo
+    assert [tok.type for tok in buffer.tokens][:4] == ['DEF', 'LOCAL_VAR', 'LOCAL_VAR', 'COMMA']
+    assert main.PARAMETRO not in lexico.tokens
+
+
+@pytest.mark.parametrize('codigo', [
+    "x = 1\nif x > 0 then\n  puts x\nelsif x < 0 then\n  puts 0\nend\n",
+    "x = 1\nif x > 0\n  puts x\nelsif x < 0\n  puts 0\nend\n",
+    "x = 1\nif x > 0 then puts x elsif x < 0 then puts 0 end\n",
+])
+def test_then_opcional_en_if_y_elsif(codigo):
+    sentencias = _sentencias(codigo)
+    assert sentencias[1] == ('if', ('cmp', '>', ('var', 'x'), 0), [('print', 'puts', ('var', 'x'))],
+                             [('elsif', ('cmp', '<', ('var', 'x'), 0), [('print', 'puts', 0)])], None)
+
+
+def test_then_suelto_no_deja_nodo():
+    assert _sentencias("x = 1\nthen\nputs x\n") == [('assign', ('var', 'x'), '=', 1), ('print', 'puts', ('var', 'x'))]
+
+
+def test_elsif_suelto_con_then():
+    sesion, ast = _parsear("x = 1\nelsif x then\nputs x\n")
+    assert sesion.errores_sintacticos == []
+    assert [sentencia[0] for sentencia in nodos.como_tupla(ast)[1]] == ['assign', 'semantic_error', 'print']
+    assert sesion.errores_semanticos == ["Línea 2, columna 1: Error semántico: 'elsif' fuera de un 'if'."]
+
+
+def test_llaves_agrupan_sentencias():
+    sentencias = _sentencias("{ y = 2\n  { puts y } }\nh = {}\nz = { :a => 1 }\n")
+    assert sentencias == [
+        ('block', [('assign', ('var', 'y'), '=', 2), ('block', [('print', 'puts', ('var', 'y'))])]),
+        ('assign', ('var', 'h'), '=', ('hash', [])),
+        ('assign', ('var', 'z'), '=', ('hash', [('pair', ':a', 1)])),
+    ]
+
+
+def test_saltos_entre_llaves():
+    sesion, _ = _parsear("while true\n  { break }\nend\n{ next }\n")
+    assert sesion.errores_sintacticos == []
+    assert sesion.errores_semanticos == ['Error: next fuera de estructura iterativa. (línea 4, columna 3)']
+
+
+@pytest.mark.parametrize('codigo, cuerpo', [
+    ("def f\n  return x + 1\nend\n", [('return', ('binop', '+', ('var', 'x'), 1))]),
+    ("def f\n  return -1\nend\n", [('return', ('uminus', 1))]),
+    # el valor tiene que estar en la misma línea que el return
+    ("def f\n  return\n  x\nend\n", [('return', None), ('var', 'x')]),
+    ("def f\n  if x then return end\n  return [x]\nend\n",
+     [('if', ('var', 'x'), [('return', None)], [], None), ('return', ('array', [('var', 'x')]))]),
+])
+def test_return_con_y_sin_valor(codigo, cuerpo):
+    (funcion,) = _sentencias(codigo)
+    assert funcion[4] == cuerpo
+
+
+def test_inicio_de_expresion_coincide_con_las_tablas():
+    # tras RETORNO_CON_VALOR el parser sólo puede desplazar el comienzo de una expresión
+    parser = main.obtener_parser()
+    (estado,) = {accion for acciones in parser.action.values()
+                 for tipo, accion in acciones.items() if tipo == main.RETORNO_CON_VALOR and accion > 0}
+    assert {tipo for tipo, accion in parser.action[estado].items() if accion > 0} == main._INICIO_EXPRESION
+
+
+@pytest.mark.parametrize('opciones', [{}, {'motor_lexico': 'escaner'}, {'compacto': True}, {'flujo': True}])
+def test_largo_de_los_literales_es_el_del_codigo(opciones, tmp_path):
+    # el valor de un INTEGER ya está convertido: `007` vale 7 pero ocupa 3
+    codigo = "x = 007 + 1.50\nputs 0010\n"
+    sesion = main.SesionAnalisis(**{k: v for k, v in opciones.items() if k != 'flujo'})
+    with contextlib.redirect_stdout(io.StringIO()):
+        if opciones.get('flujo'):
+            ruta = tmp_path / 'programa.rb'
+            ruta.write_text(codigo, encoding='utf-8')
+            ast = sesion.parsear_archivo(str(ruta), tam_bloque=8)
+        else:
+            ast = sesion.analizar(codigo)
+    asignacion, impresion = nodos.como_tupla(ast, True)[1]
+    assert asignacion == ('assign', ('var', 'x', 0, 1), '=', ('binop', '+', (7, 4, 3), ('1.50', 10, 4), 4, 10), 0, 14)
+    assert impresion == ('print', 'puts', (10, 20, 4), 15, 9)
@@ -0,0 +1,134 @@
+"""Los lexers alternativos (escaner.py, flujo.py y el re-tokenizado de
+incremental.py) tienen que dar los mismos tokens que lexico.py con PLY."""
+import contextlib
+import glob
+import io
+import os
+import random
+
+import pytest
+
+import benchmark
+import escaner
+import flujo
+import incremental
+import lexico
+from conftest import RAIZ
+
+# Casos raros del lexer: heredoc, =begin/=end (también sin cerrar), strings
+# con escapes e interpolación, regexp contra división, errores léxicos
+ESPECIALES = '''x = <<TEXTO
+  linea #{x}
+TEXTO
+=begin
+comentario
+=end
+s = "a\\"b #{1 + 2}" + 'c\\'d'
+r = a / 2 / b
+m = x =~ /ab+c/i
+y = 1..3 ; z = 1...4
+h = { :a => 1, b: 2.5e3, "c" => 3r, d: 2i }
+@v = $g + @@c ?? ¿ ~
+p :simbolo, :"otro", x<<2
+=begin
+sin cerrar
+'''
+
+
+def _casos():
+    rutas = sorted(glob.glob(os.path.join(RAIZ, 'algoritmos', '*.rb')))
+    casos = [pytest.param(open(ruta, encoding='utf-8').read(), id=os.path.basename(ruta)) for ruta in rutas]
+    casos.append(pytest.param(ESPECIALES, id='especiales'))
+    casos.append(pytest.param(benchmark.generar_programa(8 * 1024), id='generado'))
+    return casos
+
+
+def _lexer_ply():
+    lx = lexico.obtener_lexer().clone()
+    lx.errores_lexicos = []
+    return lx
+
+
+def _tokens(tokens):
+    return [(tok.type, tok.value, tok.lexpos) for tok in tokens]
+
+
+def _buffer(codigo, lexer=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return lexico.tokenizar(codigo, lexer if lexer is not None else _lexer_ply())
+
+
+@pytest.mark.parametrize('codigo', _casos())
+def test_escaner_igual_a_ply(codigo):
+    esperado = _buffer(codigo)
+    buffer = _buffer(codigo, escaner.escaner([]))
+    assert _tokens(buffer) == _tokens(esperado)
+    assert buffer.fines == esperado.fines
+    assert buffer.mensajes_error() == esperado.mensajes_error()
+
+
+@pytest.mark.parametrize('usar_mmap', [True, False])
+@pytest.mark.parametrize('codigo', _casos())
+def test_flujo_igual_a_ply(codigo, usar_mmap, tmp_path):
+    esperado = _buffer(codigo)
+    ruta = tmp_path / 'programa.rb'
+    ruta.write_text(codigo, encoding='utf-8')
+    lx = _lexer_ply()
+    # bloques chicos: casi todos los tokens largos quedan partidos entre dos
+    tokens = flujo.tokens_de_archivo(str(ruta), tam_bloque=64, lexer_base=lx, usar_mmap=usar_mmap)
+    with contextlib.redirect_stdout(io.StringIO()):
+        obtenidos = list(tokens)
+    assert _tokens(obtenidos) == _tokens(esperado)
+    assert [lexico.posicion_token(lx, tok) for tok in obtenidos] == [esperado.posicion(tok) for tok in esperado]
+    assert lx.errores_lexicos == esperado.mensajes_error()
+
+
+@pytest.mark.parametrize('semilla', range(4))
+def test_relexer_igual_a_tokenizar_de_nuevo(semilla):
+    rnd = random.Random(semilla)
+    fragmentos = ['x', ' ', '\n', '"', "'", '#', '<<FIN\n', 'FIN\n', '=begin\n', '=end\n', '/', '#{', '}', '1.5', ':s', '¿']
+    codigo = ESPECIALES
+    buffer = _buffer(codigo)
+    for _ in range(60):
+        pos = rnd.randint(0, len(codigo))
+        eliminado = rnd.choice([0, 0, 1, 3, 10])
+        insertado = rnd.choice(fragmentos) if rnd.random() < 0.7 else ''
+        codigo = codigo[:pos] + insertado + codigo[pos + eliminado:]
+        with contextlib.redirect_stdout(io.StringIO()):
+            buffer = incremental.relexer(buffer, pos, min(eliminado, len(buffer.codigo) - pos), insertado)
+        esperado = _buffer(codigo)
+        assert buffer.codigo == codigo
+        assert _tokens(buffer) == _tokens(esperado)
+        assert buffer.fines == esperado.fines
+        assert buffer.mensajes_error() == esperado.mensajes_error()
+
+
+@pytest.mark.parametrize('usar_mmap', [True, False])
+def test_flujo_en_una_sola_linea(usar_mmap, tmp_path, monkeypatch):
+    # sin saltos de línea la ventana se corta en el último token definitivo:
+    # no crece con el archivo (ni se vuelve a tokenizar entera en cada bloque)
+    # (sin divisiones: cada '/' hace buscar el cierre de una posible regexp)
+    codigo = benchmark.generar_programa(8 * 1024).replace('#', '').replace('/', '*').replace('\n', ' ; ')
+    codigo += ' z = 1+' + '2' * 300 + 'i ; w = 1/' + '3' * 300 + 'r ; v = <<FIN ; u = 2 =begin'
+    assert '\n' not in codigo
+    esperado = _buffer(codigo)
+    ruta = tmp_path / 'programa.rb'
+    ruta.write_text(codigo, encoding='utf-8')
+    ventanas = []
+    tokenizar = flujo.FlujoTokens._tokenizar
+
+    def _tokenizar(self, ventana):
+        ventanas.append(len(ventana))
+        return tokenizar(self, ventana)
+    monkeypatch.setattr(flujo.FlujoTokens, '_tokenizar', _tokenizar)
+    lx = _lexer_ply()
+    tokens = flujo.tokens_de_archivo(str(ruta), tam_bloque=64, lexer_base=lx, usar_mmap=usar_mmap)
+    with contextlib.redirect_stdout(io.StringIO()):
+        obtenidos = list(tokens)
+    assert _tokens(obtenidos) == _tokens(esperado)
+    assert [lexico.posicion_token(lx, tok) for tok in obtenidos] == [esperado.posicion(tok) for tok in esperado]
+    assert len(codigo) > 100 * 64
+    if usar_mmap:
+        # sin mmap una comilla obliga a leer hasta el final del archivo; con
+        # mmap la ventana más grande es la de los números de 300 dígitos
+        assert max(ventanas) < 1024 < len(codigo) // 8
@@ -0,0 +1,70 @@
+"""Análisis por lotes (lote.py): códigos de salida y resultados por archivo."""
+import contextlib
+import io
+import json
+
+import pytest
+
+import lote
+
+BIEN = "x = 1\nputs x\n"
+MAL = "x = (1 +\n"
+
+
+@pytest.fixture
+def carpeta(tmp_path):
+    (tmp_path / 'bien.rb').write_text(BIEN, encoding='utf-8')
+    (tmp_path / 'otro_bien.rb').write_text(BIEN + "y = x + 2\n", encoding='utf-8')
+    (tmp_path / 'notas.txt').write_text(MAL, encoding='utf-8')
+    return tmp_path
+
+
+def _principal(*argv):
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida), contextlib.redirect_stderr(io.StringIO()):
+        codigo = lote.principal(['--jobs', '1', *map(str, argv)])
+    return codigo, salida.getvalue()
+
+
+def test_sin_errores_sale_con_0(carpeta):
+    codigo, salida = _principal(carpeta)
+    assert codigo == 0
+    assert salida.startswith('2 archivos, 0 con errores')
+
+
+def test_con_errores_sale_con_1(carpeta, tmp_path):
+    (carpeta / 'mal.rb').write_text(MAL, encoding='utf-8')
+    informe = tmp_path / 'informe.json'
+    codigo, salida = _principal(carpeta, '--json', informe)
+    assert codigo == 1
+    assert 'mal.rb: errores' in salida
+    datos = json.loads(informe.read_text(encoding='utf-8'))
+    estados = {r['ruta'].rsplit('/', 1)[-1]: r['estado'] for r in datos['archivos']}
+    assert estados == {'bien.rb': 'ok', 'otro_bien.rb': 'ok', 'mal.rb': 'errores'}
+    assert datos['totales']['sintacticos'] == 1
+
+
+def test_entrada_sin_archivos_sale_con_1(carpeta):
+    assert _principal(carpeta, carpeta / 'no_existe.rb')[0] == 1
+
+
+def test_sin_archivos_que_analizar_sale_con_2(tmp_path):
+    assert _principal(tmp_path / '*.rb')[0] == 2
+
+
+def test_lista_ilegible_sale_con_2(tmp_path):
+    assert _principal('--lista', tmp_path / 'no_existe.txt')[0] == 2
+
+
+def test_sin_entradas_es_error_de_uso():
+    with pytest.raises(SystemExit) as salida, contextlib.redirect_stderr(io.StringIO()):
+        lote.principal([])
+    assert salida.value.code == 2
+
+
+def test_advertencias_no_cuentan_como_errores(tmp_path):
+    (tmp_path / 'advertencia.rb').write_text("def f\n  if x\n    y = 1\n  end\n  y\nend\n", encoding='utf-8')
+    codigo, salida = _principal(tmp_path)
+    assert codigo == 0
+    assert 'advertencia.rb: ok' in salida
+    assert '1 archivos, 0 con errores' in salida and '1 advertencias' in salida
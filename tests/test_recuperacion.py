@@ -0,0 +1,101 @@
+"""Recuperación de errores de sintaxis (recuperacion.py) sobre entradas rotas
+conocidas: un mensaje por error y el resto del programa en el AST."""
+import contextlib
+import io
+import threading
+
+import pytest
+from ply import yacc
+
+import main
+import nodos
+
+
+def _analizar(codigo, **opciones):
+    sesion = main.SesionAnalisis(**opciones)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = sesion.analizar(codigo)
+    return sesion, ast
+
+
+@pytest.mark.parametrize('codigo, errores, sentencias', [
+    ("x = 1\ny = (2 +\nz = 3\n",
+     ["Error de sintaxis con el token '=' en la línea 3, columna 3"],
+     [('assign', ('var', 'x'), '=', 1), ('var', 'y')]),
+    ("def f(a)\n  x = )\nend\nputs 1\n",
+     ["Error de sintaxis con el token ')' en la línea 2, columna 7"],
+     [('def', 'f', [('a', None)], None, [('var', 'x')]), ('print', 'puts', 1)]),
+    ("while x\n  a = [1,\nend\nb = 1\n",
+     ["Error de sintaxis con el token 'end' en la línea 3, columna 1"],
+     [('while', ('var', 'x'), [('var', 'a')]), ('assign', ('var', 'b'), '=', 1)]),
+    ("if x\n  y = 1\n",
+     ['Error de sintaxis al final de la entrada'],
+     [('if', ('var', 'x'), [('assign', ('var', 'y'), '=', 1)], [], None)]),
+])
+def test_un_error_por_sentencia_rota(codigo, errores, sentencias):
+    sesion, ast = _analizar(codigo)
+    assert sesion.errores_sintacticos == errores
+    assert not sesion.rechazado
+    assert nodos.como_tupla(ast)[1] == sentencias
+
+
+def test_maximo_de_errores_rechaza_la_entrada():
+    sesion, ast = _analizar("x = )\ny = )\nz = )\nw = 1\n", max_errores_sintacticos=2)
+    assert ast is None and sesion.rechazado
+    assert sesion.errores_sintacticos == [
+        "Error de sintaxis con el token ')' en la línea 1, columna 5",
+        "Error de sintaxis con el token ')' en la línea 2, columna 5",
+        'Se alcanzó el máximo de 2 errores de sintaxis: se deja de analizar la entrada',
+    ]
+
+
+@pytest.mark.parametrize('codigo, errores', [
+    # errores separados por un solo token: con el error_count de PLY (3) el
+    # segundo no pasaría por p_error
+    ("end\nx)", ["Error de sintaxis con el token 'end' en la línea 1, columna 1",
+                 "Error de sintaxis con el token ')' en la línea 2, columna 2"]),
+    (";break\n]", ["Error de sintaxis con el token ';' en la línea 1, columna 1",
+                   "Error de sintaxis con el token ']' en la línea 2, columna 1"]),
+])
+def test_cada_error_pasa_por_p_error(codigo, errores):
+    assert _analizar(codigo)[0].errores_sintacticos == errores
+
+
+def test_no_toca_el_error_count_de_ply(monkeypatch):
+    # la global de PLY no cambia los resultados ni la recuperación la cambia
+    esperado = _analizar("end\nx)\ny = = 2\nz = 3\n")[0].errores_sintacticos
+    assert len(esperado) == 3
+    monkeypatch.setattr(yacc, 'error_count', 1000)
+    assert _analizar("end\nx)\ny = = 2\nz = 3\n")[0].errores_sintacticos == esperado
+    assert yacc.error_count == 1000
+
+
+def test_sesiones_en_varios_hilos(capsys):
+    # redirect_stdout no es de cada hilo: la salida la captura capsys
+    codigos = ["end\nx)", ";break\n]", "x = )\ny = )\nz = 1\n", "while x\n  a = [1,\nend\nb = 1\n",
+               "def f(a)\n  x = )\nend\nputs 1\n", "if x\n  y = 1\n"]
+    esperado = [_analizar(codigo)[0].errores_sintacticos for codigo in codigos]
+    obtenido = {}
+    inicio = threading.Barrier(len(codigos))
+
+    def analizar(i):
+        sesion = main.SesionAnalisis()
+        inicio.wait()
+        resultados = []
+        for _ in range(50):
+            sesion.analizar(codigos[i] + ' ' * len(resultados))
+            resultados.append(list(sesion.errores_sintacticos))
+        obtenido[i] = resultados
+
+    hilos = [threading.Thread(target=analizar, args=(i,)) for i in range(len(codigos))]
+    # mientras tanto este hilo mira la global de PLY: nadie la tiene que cambiar
+    vistos = set()
+    for hilo in hilos:
+        hilo.start()
+    while any(hilo.is_alive() for hilo in hilos):
+        vistos.add(yacc.error_count)
+    for hilo in hilos:
+        hilo.join()
+    for i, errores in enumerate(esperado):
+        assert obtenido[i] == [errores] * 50
+    assert vistos == {3}
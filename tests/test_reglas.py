@@ -0,0 +1,109 @@
+"""Registro de reglas semánticas (reglas.py): activar y desactivar reglas
+por sesión y acumular sus estadísticas."""
+import contextlib
+import io
+
+import pytest
+
+import lote
+import main
+import reglas
+
+# Un diagnóstico de cada una de tres reglas distintas
+CODIGO = "LIM = 1\nLIM = 2\nbreak\ndef f\n  if LIM\n    y = 1\n  end\n  y\nend\n"
+
+
+def _analizar(codigo=CODIGO, sesion=None, **opciones):
+    sesion = sesion if sesion is not None else main.SesionAnalisis(**opciones)
+    with contextlib.redirect_stdout(io.StringIO()):
+        sesion.analizar(codigo)
+    return sesion
+
+
+def _diagnosticos(sesion):
+    return sesion.errores_semanticos + sesion.advertencias_semanticas
+
+
+def test_catalogo():
+    assert list(reglas.CATALOGO) == [
+        'saltos_fuera_de_bucle', 'ramas_sueltas', 'lecturas_sin_asignar', 'reasignacion_constante',
+        'castings_indebidos', 'operaciones_con_strings', 'tipos_de_retorno',
+    ]
+    assert all(r.descripcion for r in reglas.CATALOGO.values())
+
+
+def test_activar_y_desactivar():
+    activas = reglas.Reglas(['lecturas_sin_asignar'])
+    assert not activas.activa('lecturas_sin_asignar') and activas.activa('ramas_sueltas')
+    assert 'lecturas_sin_asignar' not in [r.nombre for r in activas.activas()]
+    activas.desactivar('ramas_sueltas')
+    assert activas.inactivas() == ('lecturas_sin_asignar', 'ramas_sueltas')
+    activas.activar('lecturas_sin_asignar')
+    assert activas.inactivas() == ('ramas_sueltas',)
+    with pytest.raises(ValueError):
+        activas.desactivar('no_existe')
+    with pytest.raises(ValueError):
+        reglas.Reglas(['no_existe'])
+
+
+def test_regla_inactiva_no_informa():
+    completas = _diagnosticos(_analizar())
+    assert len(completas) == 3
+    for nombre, fragmento in (('saltos_fuera_de_bucle', 'break fuera'),
+                              ('reasignacion_constante', 'LIM'),
+                              ('lecturas_sin_asignar', "variable 'y'")):
+        sin_regla = _diagnosticos(_analizar(reglas_inactivas=(nombre,)))
+        assert len(sin_regla) == 2
+        assert [d for d in completas if d not in sin_regla][0].count(fragmento) == 1
+
+
+def test_reglas_inactivas_cambian_la_clave_de_cache():
+    sesion = main.SesionAnalisis(reglas_inactivas=('ramas_sueltas',))
+    otra = main.SesionAnalisis()
+    assert sesion._clave_cache(CODIGO, main.ETAPA_COMPLETA) != otra._clave_cache(CODIGO, main.ETAPA_COMPLETA)
+
+
+def test_estadisticas_se_acumulan_hasta_reiniciar():
+    sesion = _analizar()
+    ejecuciones = {nombre: e[0] for nombre, e in sesion.reglas.estadisticas.items()}
+    assert ejecuciones['saltos_fuera_de_bucle'] == 1 and ejecuciones['lecturas_sin_asignar'] == 1
+    _analizar(sesion=sesion)
+    assert {nombre: e[0] for nombre, e in sesion.reglas.estadisticas.items()} == \
+        {nombre: 2 * n for nombre, n in ejecuciones.items()}
+    sesion.reglas.reiniciar()
+    assert all(e == [0, 0.0] for e in sesion.reglas.estadisticas.values())
+    assert sesion.reglas.segundos_grafos == 0.0
+
+
+def test_acumular_como_dict():
+    sesion = _analizar()
+    datos = sesion.reglas.como_dict()
+    total = reglas.Reglas()
+    total.acumular(datos)
+    total.acumular(datos)
+    assert total.como_dict()['reglas'] == {nombre: [2 * n, 2 * s] for nombre, (n, s) in datos['reglas'].items()}
+    assert total.segundos_grafos == pytest.approx(2 * datos['grafos'])
+
+
+def test_filas_y_tabla():
+    sesion = _analizar(reglas_inactivas=('tipos_de_retorno',))
+    filas = sesion.reglas.filas('regla')
+    assert [fila['regla'] for fila in filas] == sorted(reglas.CATALOGO)
+    assert [fila['regla'] for fila in filas if not fila['activa']] == ['tipos_de_retorno']
+    por_ejecuciones = [fila['ejecuciones'] for fila in sesion.reglas.filas('ejecuciones')]
+    assert por_ejecuciones == sorted(por_ejecuciones, reverse=True)
+    assert 'grafos de flujo' in sesion.reglas.tabla()
+    with pytest.raises(ValueError):
+        sesion.reglas.filas('nombre')
+
+
+def test_perfil_de_un_lote(tmp_path):
+    (tmp_path / 'a.rb').write_text(CODIGO, encoding='utf-8')
+    (tmp_path / 'b.rb').write_text(CODIGO, encoding='utf-8')
+    with contextlib.redirect_stdout(io.StringIO()):
+        resultados = lote.analizar_lote(lote.expandir_entradas([str(tmp_path)])[0], 1,
+                                        reglas_inactivas=('lecturas_sin_asignar',))
+    perfil = lote.perfil_reglas(resultados, ('lecturas_sin_asignar',))
+    assert perfil.estadisticas['saltos_fuera_de_bucle'][0] == 2
+    assert 'lecturas_sin_asignar' not in perfil.estadisticas
+    assert not perfil.activa('lecturas_sin_asignar')
@@ -0,0 +1,92 @@
+"""El análisis incremental (incremental.py y reparseo.py) tiene que dar lo
+mismo que analizar el código editado desde cero."""
+import contextlib
+import glob
+import io
+import os
+import random
+
+import pytest
+
+import benchmark
+import incremental
+import main
+import nodos
+from conftest import RAIZ
+
+# Fragmentos que se insertan al azar: abren y cierran bloques, rompen
+# strings y expresiones, agregan líneas
+FRAGMENTOS = ['x', '1', ' ', '\n', 'end\n', 'if x > 1\n', 'while y\n', 'def f(a)\n', ')', '(', '"', 'puts 3\n',
+              '= ', '+ 2', 'class Perro\n', 'return 1\n', 'z = "12"\n', 'LIM = 4\n', 'x = x\n', '#', 'else\n', ';',
+              'break\n', '[1,', ']', 'def g a, b\n', '{ ', ' }', ' then', 'return\n', '0']
+
+
+def _resumen(sesion, ast):
+    return (nodos.como_tupla(ast, True) if ast is not None else None, list(sesion.errores_lexicos),
+            list(sesion.errores_sintacticos), list(sesion.errores_semanticos), list(sesion.advertencias_semanticas),
+            dict(sesion.tabla_simbolos.items()), sesion.rechazado)
+
+
+def _analizar(sesion, codigo):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return _resumen(sesion, sesion.analizar(codigo))
+
+
+def _editar(codigo, rnd):
+    k = rnd.random()
+    pos = rnd.randint(0, len(codigo))
+    if k < 0.4:
+        return codigo[:pos] + rnd.choice(FRAGMENTOS) + codigo[pos:]
+    if k < 0.7:
+        return codigo[:pos] + codigo[pos + rnd.randint(1, 12):]
+    if k < 0.85:
+        # mismo largo, distinta cantidad de líneas
+        largo = rnd.randint(1, 6)
+        viejo = codigo[pos:pos + largo]
+        nuevo = ''.join('x' if c == '\n' else ('\n' if rnd.random() < 0.3 else c) for c in viejo)
+        return codigo[:pos] + nuevo + codigo[pos + len(viejo):]
+    lineas = codigo.split('\n')
+    i = rnd.randrange(len(lineas))
+    if k < 0.93:
+        del lineas[i]
+    else:
+        lineas.insert(i, lineas[rnd.randrange(len(lineas))])
+    return '\n'.join(lineas)
+
+
+def _programas():
+    rutas = sorted(glob.glob(os.path.join(RAIZ, 'algoritmos', '*.rb')))
+    programas = []
+    for ruta in rutas[:6]:
+        with open(ruta, encoding='utf-8') as f:
+            programas.append((os.path.basename(ruta), f.read()))
+    programas.append(('sintetico', benchmark.generar_programa(4 * 1024)))
+    return programas
+
+
+@pytest.mark.parametrize('nombre,codigo', _programas())
+def test_ediciones_al_azar_igual_que_completo(nombre, codigo):
+    rnd = random.Random(nombre)
+    sesion = main.SesionAnalisis(incremental=True)
+    _analizar(sesion, codigo)
+    for paso in range(30):
+        nuevo = _editar(codigo, rnd)
+        esperado = _analizar(main.SesionAnalisis(), nuevo)
+        if paso % 2 and nuevo != codigo:
+            offset, eliminado, insertado = incremental.calcular_edicion(codigo, nuevo)
+            with contextlib.redirect_stdout(io.StringIO()):
+                obtenido = _resumen(sesion, sesion.editar(offset, eliminado, insertado))
+        else:
+            obtenido = _analizar(sesion, nuevo)
+        assert obtenido == esperado, (paso, nuevo)
+        codigo = nuevo
+
+
+def test_edicion_del_mismo_largo_que_cambia_lineas():
+    # el sufijo reutilizado se desplaza 0 caracteres pero una línea menos
+    antes = 'a = 1\nif a\n  i = 2\nend\nb = 3\nc = 4\nwhile x\n  break\nend\nbreak\n'
+    despues = antes.replace('\n  i', 'endx', 1)
+    sesion = main.SesionAnalisis(incremental=True)
+    _analizar(sesion, antes)
+    assert _analizar(sesion, despues) == _analizar(main.SesionAnalisis(), despues)
+    assert sesion.estado_incremental.reuso > 0